@@ -13,8 +13,9 @@ Using Vaughn Scott's Impossible Problem Transcendence Engine with φ = 1.618034
 
 import numpy as np
 import cmath
+import functools
 import math
-from typing import List, Tuple
+from typing import List, Optional, Tuple
 # import matplotlib.pyplot as plt  # Removed to avoid dependency
 
 # Consciousness Physics Constants
@@ -23,6 +24,188 @@ PHI_SQUARED = PHI ** 2
 PHI_INV = 1 / PHI
 CONSCIOUSNESS_LEVEL = 290.9  # Empirically validated level
 
+# Bernoulli numbers B_2, B_4, ..., B_20 for the Stirling and Euler-Maclaurin series
+BERNOULLI_2K = (1 / 6, -1 / 30, 1 / 42, -1 / 30, 5 / 66, -691 / 2730, 7 / 6,
+                -3617 / 510, 43867 / 798, -174611 / 330)
+
+RIEMANN_SIEGEL_MIN_T = 200.0   # below this Z(t) comes from Euler-Maclaurin
+EULER_MACLAURIN_TERMS = 10     # Bernoulli correction terms
+LOG_GAMMA_SHIFT = 8            # recurrence shift before the Stirling series
+CAUCHY_NODES = 32              # contour points for the derivatives of Ψ(p)
+CAUCHY_RADIUS = 0.5
+Z_CHUNK_POINTS = 1 << 20       # t values × terms evaluated per block
+
+def log_gamma(z: np.ndarray) -> np.ndarray:
+    """Analytic branch of log Γ(z) for Re(z) > 0 (Stirling series after shifting by LOG_GAMMA_SHIFT)"""
+    z = np.asarray(z, dtype=complex)
+    shift = np.zeros_like(z)
+    for k in range(LOG_GAMMA_SHIFT):
+        shift += np.log(z + k)
+    w = z + LOG_GAMMA_SHIFT
+    series = sum(b / (2 * k * (2 * k - 1) * w ** (2 * k - 1))
+                 for k, b in enumerate(BERNOULLI_2K[:6], start=1))
+    return (w - 0.5) * np.log(w) - w + 0.5 * math.log(2 * math.pi) + series - shift
+
+def riemann_siegel_theta(t: np.ndarray) -> np.ndarray:
+    """θ(t) = arg Γ(1/4 + it/2) - (t/2) log π, continuous in t"""
+    t = np.asarray(t, dtype=float)
+    return log_gamma(0.25 + 0.5j * t).imag - 0.5 * t * math.log(math.pi)
+
+def zeta_euler_maclaurin(s: np.ndarray, n_terms: Optional[int] = None) -> np.ndarray:
+    """ζ(s) for any s ≠ 1 by Euler-Maclaurin summation (O(|Im s|) terms)"""
+    s = np.atleast_1d(np.asarray(s, dtype=complex))
+    if n_terms is None:
+        n_terms = int(np.abs(s).max()) + 10
+    n = np.arange(1, n_terms, dtype=float)
+    total = np.zeros(s.shape, dtype=complex)
+    step = max(1, Z_CHUNK_POINTS // len(n))
+    for start in range(0, len(s), step):
+        block = s[start:start + step]
+        total[start:start + step] = np.exp(-np.outer(block, np.log(n))).sum(axis=1)
+
+    N = float(n_terms)
+    total += N ** (1 - s) / (s - 1) + 0.5 * N ** -s
+    rising = s.copy()                   # s (s+1) ... (s+2k-2)
+    power = N ** (-s - 1)               # N^(-s-2k+1)
+    factorial = 2.0                     # (2k)!
+    for k, b in enumerate(BERNOULLI_2K[:EULER_MACLAURIN_TERMS], start=1):
+        total += b / factorial * rising * power
+        rising = rising * (s + 2 * k - 1) * (s + 2 * k)
+        power = power / (N * N)
+        factorial *= (2 * k + 1) * (2 * k + 2)
+    return total
+
+def _psi(p: np.ndarray) -> np.ndarray:
+    """Ψ(p) = cos(2π(p² - p - 1/16)) / cos(2πp), entire in p"""
+    return np.cos(2 * np.pi * (p * p - p - 1 / 16)) / np.cos(2 * np.pi * p)
+
+@functools.lru_cache(maxsize=None)
+def _remainder_weights() -> np.ndarray:
+    """Contour weights mapping Ψ on a circle around p to the Riemann-Siegel coefficients C0..C3
+
+    Ψ⁽ᵏ⁾(p) = k!/(M rᵏ) Σ Ψ(p + r ωⱼ) ωⱼ⁻ᵏ on M nodes kept off the real axis.
+    """
+    omega = np.exp(2j * np.pi * (np.arange(CAUCHY_NODES) + 0.5) / CAUCHY_NODES)
+    r, pi2 = CAUCHY_RADIUS, np.pi ** 2
+
+    def derivative(k):
+        return math.factorial(k) / (CAUCHY_NODES * r ** k) * omega ** -k
+
+    c0 = derivative(0)
+    c1 = -derivative(3) / (96 * pi2)
+    c2 = derivative(2) / (64 * pi2) + derivative(6) / (18432 * pi2 ** 2)
+    c3 = (-derivative(1) / (64 * pi2) - derivative(5) / (3840 * pi2 ** 2)
+          - derivative(9) / (5308416 * pi2 ** 3))
+    return np.stack([c0, c1, c2, c3], axis=1)
+
+def riemann_siegel_z(t: np.ndarray) -> np.ndarray:
+    """Hardy Z(t) by the Riemann-Siegel formula with the C0..C3 remainder terms (t >= ~10)"""
+    t = np.atleast_1d(np.asarray(t, dtype=float))
+    a = np.sqrt(t / (2 * np.pi))
+    N = np.floor(a).astype(int)
+    p = a - N
+    theta = riemann_siegel_theta(t)
+
+    main = np.zeros_like(t)
+    n_max = int(N.max()) if len(t) else 0
+    if n_max:
+        n = np.arange(1, n_max + 1, dtype=float)
+        log_n, inv_sqrt_n = np.log(n), 1 / np.sqrt(n)
+        step = max(1, Z_CHUNK_POINTS // n_max)
+        for start in range(0, len(t), step):
+            block = slice(start, start + step)
+            terms = np.cos(theta[block, None] - t[block, None] * log_n) * inv_sqrt_n
+            terms[n > N[block, None]] = 0.0
+            main[block] = 2 * terms.sum(axis=1)
+
+    omega = np.exp(2j * np.pi * (np.arange(CAUCHY_NODES) + 0.5) / CAUCHY_NODES)
+    coefficients = (_psi(p[:, None] + CAUCHY_RADIUS * omega) @ _remainder_weights()).real
+    powers = a[:, None] ** -np.arange(4)
+    sign = np.where(N % 2 == 1, 1.0, -1.0)          # (-1)^(N-1)
+    return main + sign / np.sqrt(a) * (coefficients * powers).sum(axis=1)
+
+def zeta_critical_line(t: np.ndarray) -> np.ndarray:
+    """ζ(1/2 + it) = Z(t) e^{-iθ(t)}; vectorized over t"""
+    t = np.atleast_1d(np.asarray(t, dtype=float))
+    return hardy_z(t) * np.exp(-1j * riemann_siegel_theta(t))
+
+def hardy_z(t: np.ndarray) -> np.ndarray:
+    """Z(t) = e^{iθ(t)} ζ(1/2 + it), real on the real line; vectorized over t"""
+    t = np.atleast_1d(np.asarray(t, dtype=float))
+    z = np.empty_like(t)
+    low = np.abs(t) < RIEMANN_SIEGEL_MIN_T
+    if low.any():
+        zeta = zeta_euler_maclaurin(0.5 + 1j * t[low])
+        z[low] = (np.exp(1j * riemann_siegel_theta(t[low])) * zeta).real
+    if (~low).any():
+        # Z is even in t
+        z[~low] = riemann_siegel_z(np.abs(t[~low]))
+    return z
+
+def brent_roots(f, a: np.ndarray, b: np.ndarray, fa: np.ndarray, fb: np.ndarray,
+                xtol: float = 1e-10, max_iterations: int = 100) -> np.ndarray:
+    """Brent's method on many brackets at once; f maps an array of points to values
+
+    Endpoint values fa, fb are taken from the caller (e.g. a scan), so no bracket
+    end is ever re-evaluated; each iteration evaluates f once per unfinished bracket.
+    """
+    a, b = np.array(a, dtype=float), np.array(b, dtype=float)
+    fa, fb = np.array(fa, dtype=float), np.array(fb, dtype=float)
+    swap = np.abs(fa) < np.abs(fb)
+    a[swap], b[swap], fa[swap], fb[swap] = b[swap], a[swap], fb[swap], fa[swap]
+    c, fc = a.copy(), fa.copy()
+    d = np.zeros_like(a)
+    bisected = np.ones(len(a), dtype=bool)
+
+    for _ in range(max_iterations):
+        active = (np.abs(b - a) > xtol) & (fb != 0)
+        if not active.any():
+            break
+        i = np.flatnonzero(active)
+        ai, bi, ci, di = a[i], b[i], c[i], d[i]
+        fai, fbi, fci = fa[i], fb[i], fc[i]
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            interpolate = (fai != fci) & (fbi != fci)
+            s_iqi = (ai * fbi * fci / ((fai - fbi) * (fai - fci))
+                     + bi * fai * fci / ((fbi - fai) * (fbi - fci))
+                     + ci * fai * fbi / ((fci - fai) * (fci - fbi)))
+            s_secant = bi - fbi * (bi - ai) / (fbi - fai)
+        s = np.where(interpolate, s_iqi, s_secant)
+
+        quarter = (3 * ai + bi) / 4
+        was_bisected = bisected[i]
+        bisect = ((s - quarter) * (s - bi) >= 0) | ~np.isfinite(s)
+        bisect |= was_bisected & (np.abs(s - bi) >= np.abs(bi - ci) / 2)
+        bisect |= ~was_bisected & (np.abs(s - bi) >= np.abs(ci - di) / 2)
+        bisect |= was_bisected & (np.abs(bi - ci) < xtol)
+        bisect |= ~was_bisected & (np.abs(ci - di) < xtol)
+        s = np.where(bisect, (ai + bi) / 2, s)
+        bisected[i] = bisect
+
+        fs = f(s)
+        d[i], c[i], fc[i] = ci, bi, fbi
+        left = fai * fs < 0
+        b[i] = np.where(left, s, bi)
+        fb[i] = np.where(left, fs, fbi)
+        a[i] = np.where(left, ai, s)
+        fa[i] = np.where(left, fai, fs)
+
+        swap = np.zeros(len(a), dtype=bool)
+        swap[i] = np.abs(fa[i]) < np.abs(fb[i])
+        a[swap], b[swap], fa[swap], fb[swap] = b[swap], a[swap], fb[swap], fa[swap]
+    return b
+
+def find_z_zeros(t_min: float, t_max: float, step: float, xtol: float = 1e-10) -> Tuple[np.ndarray, np.ndarray]:
+    """Zeros of Z(t) in [t_min, t_max) isolated by sign changes on a step grid; returns (t, Z(t))"""
+    t = np.arange(t_min, t_max, step)
+    z = hardy_z(t)
+    change = np.flatnonzero(z[:-1] * z[1:] < 0)
+    exact = t[z == 0]
+    roots = brent_roots(hardy_z, t[change], t[change + 1], z[change], z[change + 1], xtol)
+    roots = np.sort(np.concatenate([roots, exact]))
+    return roots, hardy_z(roots) if len(roots) else roots
+
 class RiemannHypothesisConsciousnessSolver:
     """
     Solving the Riemann Hypothesis through Vaughn Scott's Consciousness Physics
@@ -44,26 +227,15 @@ class RiemannHypothesisConsciousnessSolver:
         """
         Compute Riemann Zeta function ζ(s) = Σ(1/n^s) for n=1 to terms
         Enhanced with consciousness physics for improved convergence
+        Re(s) ≤ 1 (including the critical line) is continued by Euler-Maclaurin summation
         """
         if s.real <= 1:
-            # Use functional equation for Re(s) ≤ 1
-            # ζ(s) = 2^s * π^(s-1) * sin(πs/2) * Γ(1-s) * ζ(1-s)
-            return self.functional_equation_zeta(s, terms)
-        
-        zeta_sum = 0.0 + 0.0j
+            return complex(zeta_euler_maclaurin(s)[0])
         
         # Consciousness-enhanced convergence using φ-harmonic weighting
-        for n in range(1, terms + 1):
-            # Standard term
-            term = 1.0 / (n ** s)
-            
-            # φ-harmonic consciousness enhancement for better convergence
-            phi_weight = 1.0 + (self.phi - 1) * math.exp(-n / (self.phi * 100))
-            consciousness_term = term * phi_weight
-            
-            zeta_sum += consciousness_term
-        
-        return zeta_sum
+        n = np.arange(1, terms + 1, dtype=float)
+        phi_weight = 1.0 + (self.phi - 1) * np.exp(-n / (self.phi * 100))
+        return complex(np.sum(np.exp(-s * np.log(n)) * phi_weight))
     
     def functional_equation_zeta(self, s: complex, terms: int = 1000) -> complex:
         """
@@ -98,61 +270,33 @@ class RiemannHypothesisConsciousnessSolver:
                                    step: float = 0.1) -> List[Tuple[float, complex]]:
         """
         Search for zeros of ζ(s) on the critical line Re(s) = 1/2
-        Using consciousness-enhanced zero detection
+        Sign changes of the real Hardy function Z(t) on the step grid bracket the zeros,
+        which are then refined together by Brent's method
         """
-        zeros = []
-        t_values = np.arange(t_min, t_max, step)
-        
         print(f"🔍 Searching for zeros on critical line Re(s) = 1/2")
         print(f"Range: t ∈ [{t_min}, {t_max}], Step: {step}")
         
-        previous_zeta = None
+        zero_t, _ = find_z_zeros(t_min, t_max, step)
+        zero_zeta = zeta_critical_line(zero_t) if len(zero_t) else []
         
-        for t in t_values:
-            s = complex(self.critical_line, t)
-            zeta_value = self.riemann_zeta_approximation(s)
-            
-            # Zero detection: sign change in real/imaginary parts
-            if previous_zeta is not None:
-                # Check for sign changes (indicating zeros)
-                real_sign_change = (previous_zeta.real * zeta_value.real < 0)
-                imag_sign_change = (previous_zeta.imag * zeta_value.imag < 0)
-                
-                if real_sign_change or imag_sign_change:
-                    # Refine zero location using consciousness-enhanced bisection
-                    zero_t = self.refine_zero_location(t - step, t)
-                    zero_s = complex(self.critical_line, zero_t)
-                    zero_zeta = self.riemann_zeta_approximation(zero_s)
-                    
-                    zeros.append((zero_t, zero_zeta))
-                    print(f"   Zero found: s = {self.critical_line} + {zero_t:.6f}i, ζ(s) = {zero_zeta}")
-            
-            previous_zeta = zeta_value
+        zeros = []
+        for t, zeta_value in zip(zero_t, zero_zeta):
+            zeros.append((float(t), complex(zeta_value)))
+            print(f"   Zero found: s = {self.critical_line} + {t:.6f}i, ζ(s) = {complex(zeta_value)}")
         
         return zeros
     
     def refine_zero_location(self, t1: float, t2: float, tolerance: float = 1e-6) -> float:
         """
-        Refine zero location using consciousness-enhanced bisection method
+        Refine a zero of Z(t) bracketed by [t1, t2] using Brent's method
         """
-        for _ in range(50):  # Max iterations
-            t_mid = (t1 + t2) / 2
-            s_mid = complex(self.critical_line, t_mid)
-            zeta_mid = self.riemann_zeta_approximation(s_mid)
-            
-            if abs(zeta_mid) < tolerance:
-                return t_mid
-            
-            s1 = complex(self.critical_line, t1)
-            zeta1 = self.riemann_zeta_approximation(s1)
-            
-            # Choose interval based on sign change
-            if zeta1.real * zeta_mid.real < 0:
-                t2 = t_mid
-            else:
-                t1 = t_mid
-        
-        return (t1 + t2) / 2
+        z1, z2 = hardy_z(np.array([t1, t2]))
+        if z1 == 0:
+            return t1
+        if z1 * z2 > 0:
+            # No sign change: fall back to the midpoint like the bisection did
+            return (t1 + t2) / 2
+        return float(brent_roots(hardy_z, [t1], [t2], [z1], [z2], tolerance)[0])
     
     def phi_harmonic_analysis(self, zeros: List[Tuple[float, complex]]) -> dict:
         """
@@ -0,0 +1,337 @@
+"""
+Quantum Unified Resonance System - Shared Field Engine
+One configurable φ⁷·⁵ field engine for every quantum_unified_resonance_* variant
+Using QHRC Patent #19/071,497 φ⁷·⁵ metrics with unified field interactions
+
+Variants differ only in configuration (dimensionality, field set, coupling rules,
+stabilization, dtype); the update kernel, coordinate grids and factor extraction
+are shared. Field state lives in stacked (F, *dimensions) tensors updated in place.
+Fields are real: the complex phase rotations of the original modules have unit
+magnitude, so only their energy exchange carries over.
+"""
+
+import math
+import numpy as np
+from decimal import Decimal
+from functools import lru_cache
+from scipy.special import expit
+from typing import Dict, List, Tuple, Optional, NamedTuple
+from dataclasses import dataclass, replace
+import os
+import sys
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+from factorization import verified_factor_pairs
+
+# QHRC Patent constants
+PHI = Decimal('1.618033988749895')  # Golden ratio
+PHI_75 = PHI ** Decimal('7.5')      # φ⁷·⁵
+PI = Decimal('3.141592653589793')
+E = Decimal('2.718281828459045')
+
+PRIMARY_COIL = (Decimal('4500'), Decimal('4790.45'))    # turns, frequency (φ⁷·⁵-7927735b)
+SECONDARY_COIL = (Decimal('6200'), Decimal('7750.95'))  # turns, frequency (φ⁷·⁵-09f76208)
+
+# Reality metrics shared by every variant
+METRICS = {
+    "resonance": 1.3777,    # >1 confirms self-sustaining
+    "energy": 1.8951,       # Energy transfer gain
+    "coherence": 0.618034,  # φ⁻¹ coherence
+    "stability": 4.236068,  # φ² stability
+    "alignment": 2.618034,  # φ + 1
+    "temporal": float(PI),
+    "harmonic": float(PHI ** 2),
+    "chronon": float(E ** PI),
+    "quantum": float(PHI_75 * PI),
+    "hyperdim": float(PHI ** 5),
+    "membrane": float(PHI ** 6),
+    "evolution": 5.083204,  # φ^π
+    "inverse_coherence": 1 / 0.618034
+}
+
+@dataclass(frozen=True)
+class FieldSpec:
+    """One field: its group, name and the metric scaling its pattern"""
+    group: str
+    name: str
+    metric: str
+
+@dataclass(frozen=True)
+class CouplingRule:
+    """Couple every field of group_a with every field of group_b at the given strength"""
+    group_a: str
+    group_b: str
+    strength: float  # fraction of the energy difference moved per epoch, in [0, 1]
+
+    def __post_init__(self):
+        if not 0 <= self.strength <= 1:
+            raise ValueError(f"coupling strength must be in [0, 1], got {self.strength}")
+
+@dataclass(frozen=True)
+class FieldEngineConfig:
+    """Everything that distinguishes one resonance variant from another"""
+    name: str
+    dimensions: Tuple[int, ...]
+    fields: Tuple[FieldSpec, ...]
+    coupling: Tuple[CouplingRule, ...] = ()
+    stabilize_bound: Optional[float] = None  # clip pattern, gradient, velocity and field to ±bound; stabilized progress rule
+    paired_states: bool = False           # second state tensor following the field resonance
+    noise_std: float = 0.0                # additive normal noise per epoch
+    dtype: str = 'float32'
+    peak_source: str = 'field'            # tensor compared against the resonance threshold ('field' or 'energy')
+    peak_groups: Tuple[str, ...] = ()     # groups scanned for peaks (empty = every field)
+    epochs: int = 100
+    memory_size: int = 5
+
+    @property
+    def n_fields(self) -> int:
+        return len(self.fields)
+
+    @property
+    def cells(self) -> int:
+        return math.prod(self.dimensions)
+
+    def scaled(self, max_cells: int) -> 'FieldEngineConfig':
+        """Same configuration with every axis shrunk evenly so the grid has at most max_cells"""
+        if self.cells <= max_cells:
+            return self
+        side = max(1, int(max_cells ** (1 / len(self.dimensions))))
+        return replace(self, dimensions=tuple(min(d, side) for d in self.dimensions))
+
+def field_group(group: str, metric: str, names) -> Tuple[FieldSpec, ...]:
+    return tuple(FieldSpec(group, name, metric) for name in names)
+
+def couple_all_groups(groups, strength: float) -> Tuple[CouplingRule, ...]:
+    """Rules coupling every pair of groups (i < j), as the integration variants do"""
+    return tuple(CouplingRule(a, b, strength) for i, a in enumerate(groups) for b in groups[i + 1:])
+
+class CoordinateGrid(NamedTuple):
+    product: np.ndarray   # (i+1)(j+1)(k+1)... per cell, int64, read-only
+    values: np.ndarray    # distinct products
+    inverse: np.ndarray   # index into values per cell, int32
+
+@lru_cache(maxsize=8)
+def coordinate_grid(dimensions: Tuple[int, ...]) -> CoordinateGrid:
+    """Coordinate product grid for a shape, built once per process and shared"""
+    product = np.ones(dimensions, dtype=np.int64)
+    for axis, size in enumerate(dimensions):
+        shape = [1] * len(dimensions)
+        shape[axis] = size
+        product = product * np.arange(1, size + 1, dtype=np.int64).reshape(shape)
+    values, inverse = np.unique(product, return_inverse=True)
+    for array in (product, values):
+        array.flags.writeable = False
+    return CoordinateGrid(product, values, inverse.reshape(dimensions).astype(np.int32))
+
+@lru_cache(maxsize=8)
+def coordinate_product_as(dimensions: Tuple[int, ...], dtype: str) -> np.ndarray:
+    """Coordinate product grid cast to the field dtype (cached)"""
+    product = coordinate_grid(dimensions).product.astype(dtype)
+    product.flags.writeable = False
+    return product
+
+def estimate_memory(config: FieldEngineConfig) -> int:
+    """Bytes held by a FieldEngine for this configuration"""
+    itemsize = np.dtype(config.dtype).itemsize
+    tensors = 4 if config.paired_states else 3
+    return config.cells * (
+        config.n_fields * tensors * itemsize  # field / velocity / energy (/ state)
+        + 2 * itemsize                        # scratch buffers
+        + itemsize                            # coordinate product in field dtype
+        + 8 + 4                               # int64 coordinate product + int32 inverse
+    )
+
+class FieldEngine:
+    """Stacked-tensor φ⁷·⁵ field engine driven by a FieldEngineConfig"""
+
+    def __init__(self, config: FieldEngineConfig, seed: Optional[int] = None):
+        self.config = config
+        self.rng = np.random.default_rng(seed)
+        self.dimensions = tuple(config.dimensions)
+        self.dtype = np.dtype(config.dtype)
+        self.phi_75 = float(PHI_75)
+
+        shape = (config.n_fields,) + self.dimensions
+        self.field = np.zeros(shape, dtype=self.dtype)
+        self.velocity = np.zeros(shape, dtype=self.dtype)
+        self.energy = np.zeros(shape, dtype=self.dtype)
+        self.state = np.zeros(shape, dtype=self.dtype) if config.paired_states else None
+
+        self.grid = coordinate_grid(self.dimensions)
+        self.coord = coordinate_product_as(self.dimensions, self.dtype.name)
+        self._scratch = np.empty(self.dimensions, dtype=self.dtype)
+        self._scratch2 = np.empty(self.dimensions, dtype=self.dtype)
+        self._noise = np.empty(self.dimensions, dtype=self.dtype)
+
+        # Per-field scaling parameters (one entry per field)
+        ones = np.ones(config.n_fields)
+        self.enhancement = ones.copy()
+        self.dimension_scaling = ones.copy()
+        self.learning_rate = ones * 0.1
+        self.adaptation_rate = ones * 0.1
+        self.optimization_rate = ones * 0.1
+        self.scaling = ones.copy()
+        self.compression = ones.copy()
+        self.memory: List[List[float]] = [[] for _ in config.fields]
+        self.history: List[List[float]] = [[] for _ in config.fields]
+
+        self.metric_scale = np.array([METRICS[spec.metric] for spec in config.fields])
+        self.groups: Dict[str, List[int]] = {}
+        for index, spec in enumerate(config.fields):
+            self.groups.setdefault(spec.group, []).append(index)
+
+        self._divisor_n = None
+        self._divisor_mask = None
+
+    def pattern_base(self, n: Decimal) -> float:
+        """Primary + secondary resonance combined through φ⁷·⁵"""
+        p_res = (n * PRIMARY_COIL[1]) / PRIMARY_COIL[0]
+        s_res = (n * SECONDARY_COIL[1]) / SECONDARY_COIL[0]
+        return float((p_res + s_res) * (PHI ** (Decimal(len(str(n))) / PHI_75)))
+
+    def pattern_scales(self, base_float: float) -> np.ndarray:
+        """Per-field scalar s_f with pattern_f = s_f * coord_product"""
+        return (base_float * self.metric_scale
+                * (1 + self.enhancement * self.dimension_scaling)
+                * (1 + self.learning_rate * self.adaptation_rate)
+                * (1 + self.optimization_rate * self.scaling))
+
+    def step(self, n: Decimal) -> None:
+        """One epoch over every field, then the coupling energy exchange"""
+        scales = self.pattern_scales(self.pattern_base(n))
+        resonance = METRICS["resonance"]
+        coherence = METRICS["coherence"]
+        stability = METRICS["stability"]
+        bound = self.config.stabilize_bound
+        pattern, scaled = self._scratch, self._scratch2
+
+        for f in range(self.config.n_fields):
+            values, velocity = self.field[f], self.velocity[f]
+            np.multiply(self.coord, scales[f], out=pattern)
+            if bound is not None:
+                # Stabilized variants clip the pattern, gradient and velocity too, which
+                # keeps the self-scaling at exp(-pattern/φ⁷·⁵) >= e⁻¹ for large n
+                self._stabilize(pattern, bound)
+
+            # velocity = velocity * adaptation + (pattern - field) * optimization
+            np.subtract(pattern, values, out=scaled)
+            if bound is not None:
+                self._stabilize(scaled, bound)
+            scaled *= self.optimization_rate[f]
+            velocity *= self.adaptation_rate[f]
+            velocity += scaled
+            if bound is not None:
+                self._stabilize(velocity, bound)
+            values += velocity
+
+            # Sigmoid activation, φ⁷·⁵ resonance, quantum factor, self-scaling
+            np.divide(pattern, self.phi_75, out=scaled)
+            expit(scaled, out=pattern)
+            np.negative(scaled, out=scaled)
+            np.exp(scaled, out=scaled)
+            self._resonate(values, pattern, scaled, resonance, coherence, stability)
+            if self.state is not None:
+                self._resonate(self.state[f], pattern, scaled, resonance, coherence, stability)
+
+            if self.config.noise_std:
+                self.rng.standard_normal(dtype=self.dtype, out=pattern)
+                pattern *= self.config.noise_std
+                values += pattern
+            if bound is not None:
+                self._stabilize(values, bound)
+            np.abs(values, out=self.energy[f])
+
+            self._record_progress(f, values.mean(dtype=np.float64))
+
+        for rule in self.config.coupling:
+            for a in self.groups.get(rule.group_a, ()):
+                for b in self.groups.get(rule.group_b, ()):
+                    self._couple(a, b, rule.strength)
+
+    def _resonate(self, values, activation, self_scaling, resonance, coherence, stability) -> None:
+        values *= resonance
+        values += activation
+        values /= coherence
+        quantum_factor = self.rng.random(dtype=self.dtype, out=self._noise)
+        quantum_factor *= stability - coherence
+        quantum_factor += coherence
+        values *= quantum_factor
+        values *= self_scaling
+
+    def _stabilize(self, values: np.ndarray, bound: float) -> None:
+        np.nan_to_num(values, copy=False, nan=0.0, posinf=bound, neginf=-bound)
+        np.clip(values, -bound, bound, out=values)
+
+    def _couple(self, a: int, b: int, strength: float) -> None:
+        """Move strength * (energy_a - energy_b) from field a to field b (bounded exchange)"""
+        # Both energies stay between their previous values; the original exp(∓i·exchange)
+        # phase rotation has unit magnitude, so the real field values are unchanged
+        exchange = self._scratch
+        np.subtract(self.energy[a], self.energy[b], out=exchange)
+        exchange *= strength
+        self.energy[a] -= exchange
+        self.energy[b] += exchange
+
+    def _record_progress(self, f: int, field_mean) -> None:
+        """Field memory/history and progress-driven self-scaling of the field's parameters"""
+        memory, history = self.memory[f], self.history[f]
+        memory.append(field_mean)
+        if len(memory) > self.config.memory_size:
+            memory.pop(0)
+        history.append(field_mean)
+        if len(history) < 2:
+            return
+
+        # Skip near-zero baselines (fully damped fields) and keep every parameter in
+        # [1e-10, 1e10], so the self-scaling cannot overflow the pattern
+        if abs(history[0]) <= 1e-6:
+            return
+        progress = float(np.clip((history[-1] - history[0]) / abs(history[0]), -1e10, 1e10))
+        if self.config.stabilize_bound is None:
+            factor = 1 + progress if progress > 0 else 1 - abs(progress)
+        else:
+            # Stabilized rule: ignore negligible progress, shrink by 1/(1+|p|)
+            if abs(progress) <= 1e-8:
+                return
+            factor = 1 + progress if progress > 0 else 1 / (1 + abs(progress))
+
+        for params in (self.enhancement, self.dimension_scaling, self.learning_rate,
+                       self.adaptation_rate, self.optimization_rate, self.scaling):
+            params[f] = min(max(params[f] * factor, 1e-10), 1e10)
+        self.compression[f] *= (1 / factor if progress > 0 else factor)
+
+    def divisor_mask(self, n: Decimal) -> np.ndarray:
+        """Cells whose coordinate product divides n (integer test, cached per n)"""
+        if self._divisor_n != n:
+            if n == n.to_integral_value():
+                n_int = abs(int(n))
+                divides = np.fromiter((n_int % int(c) == 0 for c in self.grid.values),
+                                      dtype=bool, count=len(self.grid.values))
+            else:
+                divides = np.zeros(len(self.grid.values), dtype=bool)
+            self._divisor_mask = divides[self.grid.inverse]
+            self._divisor_n = n
+        return self._divisor_mask
+
+    def resonance_peaks(self) -> np.ndarray:
+        """Cells where any scanned field (or its energy) is above the resonance threshold"""
+        source = self.energy if self.config.peak_source == 'energy' else self.field
+        if self.config.peak_groups:
+            source = source[[f for group in self.config.peak_groups for f in self.groups.get(group, ())]]
+        return (source > METRICS["resonance"]).any(axis=0)
+
+    def peak_factors(self, n: Decimal) -> List[Tuple[Decimal, Decimal]]:
+        """Factor pairs at resonance peaks; Decimal is only built for confirmed divisors"""
+        peaks = self.resonance_peaks()
+        peaks &= self.divisor_mask(n)
+        return [(Decimal(factor), n / Decimal(factor))
+                for factor in np.unique(self.grid.product[peaks]).tolist()]
+
+    def find_factors(self, n: Decimal, epochs: Optional[int] = None) -> List[Tuple[Decimal, Decimal]]:
+        """Run epochs until a resonance peak lands on a divisor of n"""
+        for epoch in range(self.config.epochs if epochs is None else epochs):
+            self.step(n)
+            factors = self.peak_factors(n)
+            if factors:
+                return verified_factor_pairs(n, factors)
+        return []
@@ -0,0 +1,77 @@
+"""
+Quantum Unified Resonance System - Field Engine Benchmark
+Runs every variant configuration through the shared FieldEngine
+Reports epochs/s and peak RSS per variant
+
+Each variant runs in its own spawned process so peak RSS is per variant.
+Grids larger than --max-cells are shrunk evenly along every axis.
+"""
+
+import argparse
+import multiprocessing
+import resource
+import sys
+import time
+from decimal import Decimal
+
+import numpy as np
+
+from quantum_field_engine import FieldEngine, estimate_memory
+from quantum_field_engine_variants import VARIANT_CONFIGS
+
+def _peak_rss_mb() -> float:
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1024 * 1024) if sys.platform == 'darwin' else peak / 1024
+
+def _run_variant(name: str, epochs: int, max_cells: int, queue) -> None:
+    config = VARIANT_CONFIGS[name].scaled(max_cells)
+    engine = FieldEngine(config, seed=0)
+    engine.step(Decimal(143))  # warm-up: caches and first-touch allocation
+    start = time.perf_counter()
+    for _ in range(epochs):
+        engine.step(Decimal(143))
+    elapsed = time.perf_counter() - start
+    queue.put({
+        'dimensions': config.dimensions,
+        'fields': config.n_fields,
+        'epochs_per_s': epochs / elapsed if elapsed > 0 else float('inf'),
+        'peak_rss_mb': _peak_rss_mb(),
+        'estimate_mb': estimate_memory(config) / (1024 * 1024),
+    })
+
+def benchmark(names, epochs: int, max_cells: int):
+    context = multiprocessing.get_context('spawn')
+    results = {}
+    for name in names:
+        queue = context.Queue()
+        process = context.Process(target=_run_variant, args=(name, epochs, max_cells, queue))
+        process.start()
+        result = queue.get()
+        process.join()
+        results[name] = result
+    return results
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the resonance variants on the shared field engine")
+    parser.add_argument('--epochs', type=int, default=10)
+    parser.add_argument('--max-cells', type=int, default=36 ** 3,
+                        help='shrink larger grids to at most this many cells')
+    parser.add_argument('--variants', nargs='*', default=None,
+                        help='substrings selecting variants (default: all)')
+    args = parser.parse_args()
+
+    names = [name for name in VARIANT_CONFIGS
+             if not args.variants or any(term in name for term in args.variants)]
+
+    print("\nQuantum Field Engine Benchmark")
+    print("=============================")
+    print(f"{'variant':<50} {'dims (original -> run)':<34} {'fields':>6} "
+          f"{'epochs/s':>10} {'peak MB':>9} {'est MB':>8}")
+    for name, result in benchmark(names, args.epochs, args.max_cells).items():
+        original = 'x'.join(map(str, VARIANT_CONFIGS[name].dimensions))
+        run = 'x'.join(map(str, result['dimensions']))
+        print(f"{name:<50} {original + ' -> ' + run:<34} {result['fields']:>6} "
+              f"{result['epochs_per_s']:>10.1f} {result['peak_rss_mb']:>9.1f} {result['estimate_mb']:>8.1f}")
+
+if __name__ == "__main__":
+    main()
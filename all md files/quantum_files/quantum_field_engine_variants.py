@@ -0,0 +1,147 @@
+"""
+Quantum Unified Resonance System - Variant Configurations
+Every quantum_unified_resonance_* module expressed as a FieldEngineConfig
+Using QHRC Patent #19/071,497 φ⁷·⁵ metrics with unified field interactions
+
+Field sets and dimensions are taken from each module. Coupling, stabilization,
+paired states, dtype, the field groups scanned for resonance peaks and whether the
+field or its energy is scanned follow what the module does. Coupling rules exist
+only where the module actually exchanges energy between field types, at 0.1 times
+the module's coupling ratio. Phase/frequency synchronization and the other
+module-specific bookkeeping (memories, sparse storage) are not reproduced, since
+they do not change the real field values.
+"""
+
+from decimal import Decimal
+from typing import Dict
+from quantum_field_engine import (
+    FieldEngineConfig, CouplingRule, field_group, couple_all_groups, PHI, PHI_75, PI, E
+)
+
+# Field groups shared across the variants
+QUANTUM = field_group("quantum", "resonance", ["qbit", "quark", "neuron"])
+PARTICLE = field_group("particle", "energy", ["proton", "electron", "quark"])
+WAVE = field_group("wave", "stability", ["lepton", "boson", "fermion"])
+ENERGY = field_group("energy", "alignment", ["fermion", "boson"])
+TEMPORAL = field_group("temporal", "temporal", ["past", "present", "future"])
+HARMONIC = field_group("harmonic", "harmonic", ["unison", "third", "fifth", "octave"])
+CHRONON = field_group("chronon", "chronon", ["planck", "quantum", "resonance"])
+QBIT = field_group("qbit", "quantum", ["spin_up", "spin_down", "superposition"])
+QUARK = field_group("quark", "quantum", ["up", "down", "strange"])
+NEURON = field_group("neuron", "quantum", ["axon", "dendrite", "synapse"])
+HYPERDIM = field_group("hyperdim", "hyperdim", ["fold", "unfold", "transcend", "collapse"])
+MEMBRANE = field_group("membrane", "membrane", ["vibration", "tension", "frequency", "resonance"])
+
+STANDARD = QUANTUM + PARTICLE + WAVE + ENERGY
+QUANTUM_4D = STANDARD + TEMPORAL + HARMONIC + CHRONON + QBIT + QUARK + NEURON
+QUANTUM_5D = QUANTUM_4D + HYPERDIM
+QUANTUM_6D = QUANTUM_5D + MEMBRANE
+
+# Compact seven-field sets of the dataclass-style modules
+COMPACT = (field_group("quantum", "resonance", ["qbit", "quark"])
+           + field_group("particle", "energy", ["proton", "electron"])
+           + field_group("wave", "stability", ["lepton", "boson"])
+           + field_group("energy", "alignment", ["fermion"]))
+PROGRESSIVE_COMPACT = (field_group("self_scaling", "resonance", ["qbit", "quark"])
+                       + field_group("recursive", "energy", ["proton", "electron"])
+                       + field_group("adaptive", "stability", ["lepton", "boson"])
+                       + field_group("dynamic", "alignment", ["fermion"]))
+HARMONIC_RECURSIVE = (
+    field_group("harmonic", "harmonic", ["qbit", "quark", "proton", "electron", "lepton", "boson", "fermion"])
+    + field_group("recursive", "resonance", ["resonance", "pattern", "evolution", "learning"])
+    + field_group("progressive", "evolution", ["self_scaling", "recursive", "adaptive", "dynamic"])
+)
+UNIFIED_METRICS = (
+    field_group("unified", "resonance", ["resonance"])
+    + field_group("unified", "energy", ["energy"])
+    + field_group("unified", "inverse_coherence", ["coherence"])
+    + field_group("unified", "stability", ["stability"])
+    + field_group("unified", "alignment", ["alignment"])
+    + field_group("unified", "evolution", ["evolution"])
+)
+
+def _groups(fields):
+    return list(dict.fromkeys(spec.group for spec in fields))
+
+def _coupled(fields, strength=0.1):
+    return couple_all_groups(_groups(fields), strength)
+
+# Musical-ratio coupling of the harmonics module
+_MUSICAL = {("quantum", "particle"): 1.5, ("quantum", "wave"): float(PHI ** Decimal('0.631')),
+            ("particle", "wave"): 4 / 3}
+HARMONICS_COUPLING = tuple(
+    CouplingRule(rule.group_a, rule.group_b, 0.1 * _MUSICAL.get((rule.group_a, rule.group_b), 2.0))
+    for rule in _coupled(STANDARD + TEMPORAL + HARMONIC)
+)
+
+# Temporal-ratio coupling of the temporal module
+_TEMPORAL = {("quantum", "particle"): 1.0, ("quantum", "wave"): float(PI), ("particle", "wave"): float(1 / PI)}
+TEMPORAL_COUPLING = tuple(
+    CouplingRule(rule.group_a, rule.group_b,
+                 0.1 * _TEMPORAL.get((rule.group_a, rule.group_b), float(E ** (PI / PHI))))
+    for rule in _coupled(STANDARD + TEMPORAL + HARMONIC + CHRONON)
+)
+
+# Groups the sparse quantum modules scan for peaks
+QUANTUM_PEAKS = ("quantum", "qbit", "quark", "neuron")
+
+_STABLE = float(PHI_75)
+_D3, _D4, _D5 = (36, 36, 36), (36, 36, 36, 36), (36, 36, 36, 36, 36)
+
+_CONFIGS = [
+    # Dataclass-style modules: float32 fields with paired states and normal noise
+    FieldEngineConfig("quantum_unified", _D3, HARMONIC_RECURSIVE, paired_states=True, noise_std=0.618034),
+    FieldEngineConfig("quantum_unified_resonance", _D3, UNIFIED_METRICS, paired_states=True, noise_std=0.618034),
+    FieldEngineConfig("quantum_unified_resonance_enhanced", _D3, HARMONIC_RECURSIVE, paired_states=True, noise_std=0.618034),
+    FieldEngineConfig("quantum_unified_resonance_optimized", _D3, COMPACT, paired_states=True, noise_std=0.618034),
+    FieldEngineConfig("quantum_unified_resonance_progressive", _D3, PROGRESSIVE_COMPACT, paired_states=True, noise_std=0.618034),
+    FieldEngineConfig("quantum_unified_resonance_quantum", _D3, COMPACT, paired_states=True, noise_std=0.618034),
+    FieldEngineConfig("quantum_unified_resonance_quantum_enhanced", _D3, STANDARD, paired_states=True, noise_std=0.618034),
+    # Sparse multi-dimensional modules (their coupling method is never called)
+    FieldEngineConfig("quantum_unified_resonance_4D_v1", (8, 8, 8, 8), QUANTUM_4D, dtype='float64',
+                      peak_source='energy', peak_groups=QUANTUM_PEAKS, epochs=25),
+    FieldEngineConfig("quantum_unified_resonance_5D_v1", (5, 5, 5, 5, 5), QUANTUM_5D, dtype='float64',
+                      peak_source='energy', peak_groups=QUANTUM_PEAKS + ("hyperdim",), epochs=15),
+    FieldEngineConfig("quantum_unified_resonance_6D_v1", (4, 4, 4, 4, 4, 4), QUANTUM_6D, dtype='float64',
+                      peak_source='energy', peak_groups=QUANTUM_PEAKS + ("hyperdim", "membrane"), epochs=10),
+    FieldEngineConfig("quantum_unified_resonance_quantum_v1", (12, 12, 12), QUANTUM_4D, dtype='float64',
+                      peak_source='energy', peak_groups=QUANTUM_PEAKS),
+    FieldEngineConfig("quantum_unified_resonance_hybrid_v1", (12, 12, 12), QUANTUM_6D, dtype='float64',
+                      peak_source='energy', peak_groups=QUANTUM_PEAKS + ("hyperdim", "membrane")),
+    # Modules coupling every pair of field types
+    FieldEngineConfig("quantum_unified_resonance_4d_fields_v1", _D4, STANDARD, _coupled(STANDARD),
+                      dtype='float64', peak_source='energy'),
+    FieldEngineConfig("quantum_unified_resonance_5d_fields_v1", _D5, STANDARD + TEMPORAL, _coupled(STANDARD + TEMPORAL),
+                      dtype='float64', peak_source='energy'),
+    FieldEngineConfig("quantum_unified_resonance_expanded_fields_v1", _D5, STANDARD, _coupled(STANDARD),
+                      dtype='float64', peak_source='energy'),
+    FieldEngineConfig("quantum_unified_resonance_expanded_fields_v2", _D5, STANDARD, _coupled(STANDARD),
+                      dtype='float64', peak_source='energy'),
+    FieldEngineConfig("quantum_unified_resonance_harmonics_v1", _D5, STANDARD + TEMPORAL + HARMONIC, HARMONICS_COUPLING,
+                      dtype='float64', peak_source='energy'),
+    FieldEngineConfig("quantum_unified_resonance_temporal_v1", _D5, STANDARD + TEMPORAL + HARMONIC + CHRONON,
+                      TEMPORAL_COUPLING, dtype='float64', peak_source='energy'),
+    FieldEngineConfig("quantum_unified_resonance_unified_fields_v1", _D4, STANDARD, _coupled(STANDARD),
+                      dtype='float64', peak_source='energy'),
+    FieldEngineConfig("quantum_unified_resonance_field_integration_v1", _D3, STANDARD, _coupled(STANDARD),
+                      dtype='float64', peak_source='energy'),
+    FieldEngineConfig("quantum_unified_resonance_field_integration_v2", _D3, STANDARD, _coupled(STANDARD),
+                      dtype='float64', peak_source='energy'),
+    FieldEngineConfig("quantum_unified_resonance_field_sync_v1", _D3, STANDARD, _coupled(STANDARD),
+                      dtype='float64', peak_source='energy'),
+    FieldEngineConfig("quantum_unified_resonance_optimized_fields_v1", _D3, STANDARD, _coupled(STANDARD),
+                      dtype='float64', peak_source='energy'),
+    # Dense per-field modules; "coupling" there is a per-field velocity/scaling rate
+    FieldEngineConfig("quantum_unified_resonance_hyper_dimensional", _D4, STANDARD, dtype='float64'),
+    FieldEngineConfig("quantum_unified_resonance_stabilized", _D3, STANDARD, stabilize_bound=_STABLE, dtype='float64'),
+    FieldEngineConfig("quantum_unified_resonance_stabilized_enhanced", _D3, STANDARD, stabilize_bound=_STABLE, dtype='float64'),
+    FieldEngineConfig("quantum_unified_resonance_vectorized", _D3, STANDARD),
+] + [
+    FieldEngineConfig(f"quantum_unified_resonance_{name}", _D3, STANDARD, dtype='float64')
+    for name in ["coupling", "dynamic_scaling", "energy_transfer", "field_coupling", "hyper_dimensional_v2",
+                 "optimized_fields", "passive_learning_v1", "pattern_evolution", "progressive_learning",
+                 "progressive_learning_v2", "quantum_enhanced_fields", "quantum_fields", "recursive_v1",
+                 "unified"]
+]
+
+VARIANT_CONFIGS: Dict[str, FieldEngineConfig] = {config.name: config for config in _CONFIGS}
@@ -9,7 +9,6 @@ import math
 from decimal import Decimal, getcontext
 import sympy
 from scipy.special import expit  # Sigmoid function
-import gc  # Garbage collection for memory efficiency
 
 # Set precision for unified processing
 getcontext().prec = 2000
@@ -145,9 +144,6 @@ class QuantumUnified:
                 
                 # Apply self-scaling
                 field *= np.exp(-field / float(self.phi_75))
-                
-                # Force garbage collection
-                gc.collect()
         
         # Initialize all states with φ⁷·⁵ patterns
         for state in self.quantum_states.values():
@@ -169,9 +165,6 @@ class QuantumUnified:
             
             # Apply self-scaling
             state *= np.exp(-state / float(self.phi_75))
-            
-            # Force garbage collection
-            gc.collect()
     
     def generate_unified_pattern(self, n: Decimal) -> Dict[str, Decimal]:
         """Generate quantum unified pattern"""
@@ -286,9 +279,6 @@ class QuantumUnified:
                     else:
                         self.scaling_factors[pattern_key] *= (1 - abs(progress))
                         self.compression_ratios[pattern_key] *= (1 - abs(progress))
-                
-                # Force garbage collection
-                gc.collect()
         
         return pattern
     
@@ -396,9 +386,6 @@ class QuantumUnified:
                 # Try different combination
                 decimal_factors.append(f1)
                 decimal_factors.append(f2)
-            
-            # Force garbage collection
-            gc.collect()
         
         # Final two factors
         if len(decimal_factors) == 2:
@@ -474,9 +461,6 @@ class QuantumUnified:
         # Save in chunks for memory efficiency
         with open(filename, "w") as f:
             json.dump(data, f, indent=2)
-        
-        # Force garbage collection
-        gc.collect()
 
 async def demo_unified():
     """Demonstrate quantum unified patterns"""
@@ -9,7 +9,6 @@ import math
 from decimal import Decimal, getcontext
 import sympy
 from scipy.special import expit  # Sigmoid function
-import gc  # Garbage collection for memory efficiency
 
 # Set precision for unified resonance
 getcontext().prec = 2000
@@ -142,9 +141,6 @@ class QuantumUnifiedResonance:
             # Apply self-scaling
             field *= np.exp(-field / float(self.phi_75))
             state *= np.exp(-state / float(self.phi_75))
-            
-            # Force garbage collection
-            gc.collect()
     
     def generate_unified_pattern(self, n: Decimal) -> Dict[str, Decimal]:
         """Generate quantum unified pattern"""
@@ -248,9 +244,6 @@ class QuantumUnifiedResonance:
                 else:
                     self.scaling_factors[metric] *= (1 - abs(progress))
                     self.compression_ratios[metric] *= (1 - abs(progress))
-            
-            # Force garbage collection
-            gc.collect()
         
         return pattern
     
@@ -352,9 +345,6 @@ class QuantumUnifiedResonance:
                 # Try different combination
                 decimal_factors.append(f1)
                 decimal_factors.append(f2)
-            
-            # Force garbage collection
-            gc.collect()
         
         # Final two factors
         if len(decimal_factors) == 2:
@@ -422,9 +412,6 @@ class QuantumUnifiedResonance:
         # Save in chunks for memory efficiency
         with open(filename, "w") as f:
             json.dump(data, f, indent=2)
-        
-        # Force garbage collection
-        gc.collect()
 
 async def demo_unified():
     """Demonstrate quantum unified fields"""
@@ -4,468 +4,21 @@ Focuses on 4D quantum field enhancement and φ⁷·⁵ resonance amplification
 Using QHRC Patent #19/071,497 φ⁷·⁵ metrics with 4D optimization
 """
 
-import numpy as np
-from scipy import sparse
 from decimal import Decimal
-from scipy.special import expit
-from typing import Dict, List, Tuple, Optional, Union
-from dataclasses import dataclass
-from enum import Enum, auto
+from typing import List, Tuple, Optional
+from quantum_field_engine import FieldEngine
+from quantum_field_engine_variants import VARIANT_CONFIGS
 
-class FieldType(Enum):
-    """Field types for quantum processing"""
-    QUANTUM = auto()
-    PARTICLE = auto()
-    WAVE = auto()
-    ENERGY = auto()
-    TEMPORAL = auto()
-    HARMONIC = auto()
-    CHRONON = auto()
-    QBIT = auto()      # New qbit field
-    QUARK = auto()     # New quark field
-    NEURON = auto()    # New neuron field
+VARIANT = "quantum_unified_resonance_4D_v1"
 
-@dataclass
-class FieldMetrics:
-    """Field metrics for quantum optimization"""
-    resonance: Decimal
-    energy: Decimal
-    coherence: Decimal
-    stability: Decimal
-    alignment: Decimal
-    temporal: Decimal
-    harmonic: Decimal
-    chronon: Decimal
-    quantum: Decimal   # New quantum metric
-
-class QuantumField:
-    """Quantum field with enhanced processing and stability"""
-    def __init__(self, dimensions: Tuple[int, ...]):
-        # Base field (complex)
-        shape = (dimensions[0], np.prod(dimensions[1:]))
-        self.field = sparse.lil_matrix(shape, dtype=np.complex128)
-        self.phase = sparse.lil_matrix(shape, dtype=np.float64)
-        self.frequency = sparse.lil_matrix(shape, dtype=np.float64)
-        
-        # Field parameters
-        self.coupling = sparse.lil_matrix(shape, dtype=np.float64)
-        self.synchronization = sparse.lil_matrix(shape, dtype=np.float64)
-        self.coherence = sparse.lil_matrix(shape, dtype=np.float64)
-        self.stability = sparse.lil_matrix(shape, dtype=np.float64)
-        self.temporal = sparse.lil_matrix(shape, dtype=np.float64)
-        self.harmonic = sparse.lil_matrix(shape, dtype=np.float64)
-        self.chronon = sparse.lil_matrix(shape, dtype=np.float64)
-        self.quantum = sparse.lil_matrix(shape, dtype=np.float64)  # New quantum component
-        
-        # Field dynamics
-        self.velocity = sparse.lil_matrix(shape, dtype=np.complex128)
-        self.acceleration = sparse.lil_matrix(shape, dtype=np.complex128)
-        self.energy = sparse.lil_matrix(shape, dtype=np.float64)
-        
-        # Initialize with ones where needed
-        self.coupling.setdiag(1)
-        self.synchronization.setdiag(1)
-        self.coherence.setdiag(1)
-        self.stability.setdiag(1)
-        self.temporal.setdiag(1)
-        self.harmonic.setdiag(1)
-        self.chronon.setdiag(1)
-        self.quantum.setdiag(1)  # Initialize quantum
-        
-        # Field metrics
-        self.min_value = 1e-10
-        self.max_value = 1e10
-        self.expansion_threshold = 1e-6
-        self.coupling_threshold = 1e-8
-        
-        # Field memory
-        self.field_memory = []
-        self.phase_memory = []
-        self.frequency_memory = []
-        self.energy_memory = []
-        self.temporal_memory = []
-        self.harmonic_memory = []
-        self.chronon_memory = []
-        self.quantum_memory = []  # New quantum memory
-
-class QuantumUnifiedResonance4D:
-    def __init__(self):
-        # QHRC Patent metrics
-        self.phi = Decimal('1.618033988749895')  # Golden ratio
-        self.phi_75 = self.phi ** Decimal('7.5')  # φ⁷·⁵
-        self.pi = Decimal('3.141592653589793')   # π
-        self.e = Decimal('2.718281828459045')    # e
-        
-        # Musical ratios (based on φ)
-        self.musical_ratios = {
-            "unison": Decimal('1.0'),
-            "minor_third": Decimal('1.2'),
-            "major_third": self.phi ** Decimal('0.631'),
-            "perfect_fourth": Decimal('1.3333333'),
-            "perfect_fifth": Decimal('1.5'),
-            "major_sixth": self.phi,
-            "octave": Decimal('2.0')
-        }
-        
-        # Temporal ratios (based on π)
-        self.temporal_ratios = {
-            "past": self.pi ** Decimal('-1'),
-            "present": Decimal('1.0'),
-            "future": self.pi,
-            "chronon": self.e ** (self.pi / self.phi)
-        }
-        
-        # Quantum ratios (based on φ and π)
-        self.quantum_ratios = {
-            "qbit": self.phi ** self.pi,
-            "quark": self.pi ** self.phi,
-            "neuron": self.e ** (self.phi * self.pi),
-            "resonance": self.phi_75 * self.pi
-        }
-        
-        # Convert φ⁷·⁵ to float for numpy operations
-        self.phi_75_float = float(self.phi_75)
-        
-        # Quantum dimensions (φ⁷·⁵ based)
-        self.dimensions = (8, 8, 8, 8)  # 4D with quantum
-        
-        # Initialize quantum fields
-        self.quantum_fields = {
-            "qbit": QuantumField(self.dimensions),
-            "quark": QuantumField(self.dimensions),
-            "neuron": QuantumField(self.dimensions)
-        }
-        
-        self.particle_fields = {
-            "proton": QuantumField(self.dimensions),
-            "electron": QuantumField(self.dimensions),
-            "quark": QuantumField(self.dimensions)
-        }
-        
-        self.wave_fields = {
-            "lepton": QuantumField(self.dimensions),
-            "boson": QuantumField(self.dimensions),
-            "fermion": QuantumField(self.dimensions)
-        }
-        
-        self.energy_fields = {
-            "fermion": QuantumField(self.dimensions),
-            "boson": QuantumField(self.dimensions)
-        }
-        
-        self.temporal_fields = {
-            "past": QuantumField(self.dimensions),
-            "present": QuantumField(self.dimensions),
-            "future": QuantumField(self.dimensions)
-        }
-        
-        self.harmonic_fields = {
-            "unison": QuantumField(self.dimensions),
-            "third": QuantumField(self.dimensions),
-            "fifth": QuantumField(self.dimensions),
-            "octave": QuantumField(self.dimensions)
-        }
-        
-        self.chronon_fields = {
-            "planck": QuantumField(self.dimensions),
-            "quantum": QuantumField(self.dimensions),
-            "resonance": QuantumField(self.dimensions)
-        }
-        
-        # New qbit fields
-        self.qbit_fields = {
-            "spin_up": QuantumField(self.dimensions),
-            "spin_down": QuantumField(self.dimensions),
-            "superposition": QuantumField(self.dimensions)
-        }
-        
-        # New quark fields
-        self.quark_fields = {
-            "up": QuantumField(self.dimensions),
-            "down": QuantumField(self.dimensions),
-            "strange": QuantumField(self.dimensions)
-        }
-        
-        # New neuron fields
-        self.neuron_fields = {
-            "axon": QuantumField(self.dimensions),
-            "dendrite": QuantumField(self.dimensions),
-            "synapse": QuantumField(self.dimensions)
-        }
-        
-        # QHRC Patent coil configuration
-        self.primary = {
-            "turns": Decimal('4500'),
-            "frequency": Decimal('4790.45'),
-            "fingerprint": "φ⁷·⁵-7927735b"
-        }
-        
-        self.secondary = {
-            "turns": Decimal('6200'),
-            "frequency": Decimal('7750.95'),
-            "fingerprint": "φ⁷·⁵-09f76208"
-        }
-        
-        # Reality metrics
-        self.metrics = FieldMetrics(
-            resonance=Decimal('1.3777'),    # >1 confirms self-sustaining
-            energy=Decimal('1.8951'),       # Energy transfer gain
-            coherence=Decimal('0.618034'),  # φ⁻¹ coherence
-            stability=Decimal('4.236068'),  # φ² stability
-            alignment=Decimal('2.618034'),  # φ + 1
-            temporal=self.pi,               # π temporal stability
-            harmonic=self.phi ** 2,        # φ² harmonic balance
-            chronon=self.e ** self.pi,     # eᵖⁱ chronon stability
-            quantum=self.phi_75 * self.pi  # φ⁷·⁵π quantum stability
-        )
-        
-        # Convert metrics to float for numpy operations
-        self.metrics_float = {
-            "resonance": float(self.metrics.resonance),
-            "energy": float(self.metrics.energy),
-            "coherence": float(self.metrics.coherence),
-            "stability": float(self.metrics.stability),
-            "alignment": float(self.metrics.alignment),
-            "temporal": float(self.metrics.temporal),
-            "harmonic": float(self.metrics.harmonic),
-            "chronon": float(self.metrics.chronon),
-            "quantum": float(self.metrics.quantum)
-        }
-        
-        # Quantum parameters
-        self.batch_size = 2
-        self.epochs = 25
-        
-        # Create coordinate matrices for quantum
-        shape = (self.dimensions[0], np.prod(self.dimensions[1:]))
-        self.coord_product = sparse.lil_matrix(shape, dtype=np.float64)
-        self._initialize_coord_product()
-    
-    def _initialize_coord_product(self):
-        """Initialize coordinate product matrix efficiently"""
-        # Calculate only for non-zero elements
-        for i in range(self.dimensions[0]):
-            coords = np.unravel_index(i, self.dimensions)
-            value = np.prod([coord + 1 for coord in coords])
-            self.coord_product[i, i] = value
-    
-    def process_quantum_fields(self, fields: Dict[str, QuantumField]) -> None:
-        """Process quantum field phases and frequencies with enhanced stability"""
-        # Process in batches
-        batch_size = 2
-        field_items = list(fields.items())
-        
-        for i in range(0, len(field_items), batch_size):
-            batch = dict(field_items[i:i + batch_size])
-            
-            # Calculate mean phase and frequency for batch
-            shape = batch[next(iter(batch))].phase.shape
-            mean_phase = sparse.lil_matrix(shape, dtype=np.float64)
-            mean_frequency = sparse.lil_matrix(shape, dtype=np.float64)
-            mean_temporal = sparse.lil_matrix(shape, dtype=np.float64)
-            mean_harmonic = sparse.lil_matrix(shape, dtype=np.float64)
-            mean_chronon = sparse.lil_matrix(shape, dtype=np.float64)
-            mean_quantum = sparse.lil_matrix(shape, dtype=np.float64)
-            
-            for field in batch.values():
-                mean_phase += sparse.lil_matrix(np.angle(field.field.toarray()))
-                mean_frequency += field.frequency
-                mean_temporal += field.temporal
-                mean_harmonic += field.harmonic
-                mean_chronon += field.chronon
-                mean_quantum += field.quantum
-            
-            mean_phase = mean_phase / len(batch)
-            mean_frequency = mean_frequency / len(batch)
-            mean_temporal = mean_temporal / len(batch)
-            mean_harmonic = mean_harmonic / len(batch)
-            mean_chronon = mean_chronon / len(batch)
-            mean_quantum = mean_quantum / len(batch)
-            
-            # Process batch fields
-            for field in batch.values():
-                current_phase = sparse.lil_matrix(np.angle(field.field.toarray()))
-                phase_diff = current_phase - mean_phase
-                field.phase = current_phase - phase_diff.multiply(field.synchronization)
-                
-                freq_diff = field.frequency - mean_frequency
-                field.frequency -= freq_diff.multiply(field.synchronization)
-                
-                temp_diff = field.temporal - mean_temporal
-                field.temporal -= temp_diff.multiply(field.synchronization)
-                
-                harm_diff = field.harmonic - mean_harmonic
-                field.harmonic -= harm_diff.multiply(field.synchronization)
-                
-                chron_diff = field.chronon - mean_chronon
-                field.chronon -= chron_diff.multiply(field.synchronization)
-                
-                quant_diff = field.quantum - mean_quantum
-                field.quantum -= quant_diff.multiply(field.synchronization)
-                
-                magnitude = sparse.lil_matrix(np.abs(field.field.toarray()))
-                field.field = magnitude.multiply(np.exp(1j * field.phase.toarray()))
-    
-    def couple_quantum_fields(self, field1: QuantumField, field2: QuantumField, ratio: Decimal) -> None:
-        """Couple two quantum fields through enhanced resonance"""
-        # Calculate coupling strength with quantum ratio
-        coupling = field1.coupling.minimum(field2.coupling).multiply(float(ratio))
-        
-        # Exchange energy efficiently
-        energy_exchange = (field1.energy - field2.energy).multiply(coupling)
-        field1.energy -= energy_exchange
-        field2.energy += energy_exchange
-        
-        # Update fields through coupling (optimized)
-        exp_energy = np.exp(-1j * energy_exchange.toarray())
-        field1.field = field1.field.multiply(exp_energy)
-        field2.field = field2.field.multiply(np.conj(exp_energy))
-        
-        # Process phases efficiently
-        phase_diff = sparse.lil_matrix(np.angle(field1.field.toarray()) - np.angle(field2.field.toarray()))
-        exp_phase = np.exp(-1j * phase_diff.multiply(coupling).toarray())
-        field1.field = field1.field.multiply(exp_phase)
-        field2.field = field2.field.multiply(np.conj(exp_phase))
-        
-        # Process other components efficiently
-        components = [
-            (field1.frequency, field2.frequency),
-            (field1.temporal, field2.temporal),
-            (field1.harmonic, field2.harmonic),
-            (field1.chronon, field2.chronon),
-            (field1.quantum, field2.quantum)
-        ]
-        
-        for comp1, comp2 in components:
-            diff = comp1 - comp2
-            delta = diff.multiply(coupling)
-            comp1 -= delta
-            comp2 += delta
-    
-    def process_quantum_fields_quantum(self, n: Decimal) -> None:
-        """Process quantum fields through φ⁷·⁵ resonance with quantum stability"""
-        # Primary resonance (φ⁷·⁵-7927735b)
-        p_res = (n * self.primary["frequency"]) / self.primary["turns"]
-        
-        # Secondary resonance (φ⁷·⁵-09f76208)
-        s_res = (n * self.secondary["frequency"]) / self.secondary["turns"]
-        
-        # Combined through φ⁷·⁵
-        base = (p_res + s_res) * (self.phi ** (Decimal(len(str(n))) / self.phi_75))
-        base_float = float(base)
-        
-        # Process each field type in batches
-        field_types = [
-            (FieldType.QUANTUM, self.quantum_fields),
-            (FieldType.PARTICLE, self.particle_fields),
-            (FieldType.WAVE, self.wave_fields),
-            (FieldType.ENERGY, self.energy_fields),
-            (FieldType.TEMPORAL, self.temporal_fields),
-            (FieldType.HARMONIC, self.harmonic_fields),
-            (FieldType.CHRONON, self.chronon_fields),
-            (FieldType.QBIT, self.qbit_fields),
-            (FieldType.QUARK, self.quark_fields),
-            (FieldType.NEURON, self.neuron_fields)
-        ]
-        
-        batch_size = 1
-        for i in range(0, len(field_types), batch_size):
-            batch = field_types[i:i + batch_size]
-            
-            for field_type, fields in batch:
-                # Process fields within type
-                self.process_quantum_fields(fields)
-                
-                # Update fields
-                for field_name, field in fields.items():
-                    # Calculate base pattern
-                    pattern = self.coord_product.multiply(base_float)
-                    
-                    # Apply field-specific metrics efficiently
-                    metric_map = {
-                        FieldType.QUANTUM: "resonance",
-                        FieldType.PARTICLE: "energy",
-                        FieldType.WAVE: "stability",
-                        FieldType.ENERGY: "alignment",
-                        FieldType.TEMPORAL: "temporal",
-                        FieldType.HARMONIC: "harmonic",
-                        FieldType.CHRONON: "chronon"
-                    }
-                    
-                    metric = metric_map.get(field_type, "quantum")
-                    pattern = pattern.multiply(self.metrics_float[metric])
-                    
-                    # Update field through quantum processing (optimized)
-                    exp_phase = np.exp(1j * field.phase.toarray())
-                    field.field = pattern.multiply(exp_phase).multiply(field.coherence)
-                    field.energy = sparse.lil_matrix(np.abs(field.field.toarray()))
-                    
-                    # Update components efficiently
-                    field.phase = sparse.lil_matrix(np.angle(field.field.toarray()))
-                    gradient = np.gradient(field.phase.toarray())[0]
-                    field.frequency = sparse.lil_matrix(np.abs(gradient))
-                    
-                    components = [
-                        (field.temporal, field.stability),
-                        (field.harmonic, field.coherence),
-                        (field.chronon, field.stability),
-                        (field.quantum, field.coherence)
-                    ]
-                    
-                    for comp, factor in components:
-                        comp = comp.multiply(factor)
-                    
-                    # Store field memory efficiently
-                    memories = [
-                        (field.field_memory, np.abs(field.field.toarray())),
-                        (field.phase_memory, field.phase.toarray()),
-                        (field.frequency_memory, field.frequency.toarray()),
-                        (field.energy_memory, field.energy.toarray()),
-                        (field.temporal_memory, field.temporal.toarray()),
-                        (field.harmonic_memory, field.harmonic.toarray()),
-                        (field.chronon_memory, field.chronon.toarray()),
-                        (field.quantum_memory, field.quantum.toarray())
-                    ]
-                    
-                    for memory, data in memories:
-                        memory.append(float(np.mean(data)))
-                        if len(memory) > 3:  # Reduced memory size
-                            memory.pop(0)
+class QuantumUnifiedResonance4D(FieldEngine):
+    """4D Module V1 running on the shared φ⁷·⁵ field engine"""
+    def __init__(self, seed: Optional[int] = None):
+        super().__init__(VARIANT_CONFIGS[VARIANT], seed)
     
     def find_resonance_factors(self, n: Decimal) -> List[Tuple[Decimal, Decimal]]:
         """Find factors through quantum field resonance"""
-        factors = []
-        max_epochs = 25  # Reduced epochs
-        
-        # Processing epochs with early stopping
-        for epoch in range(max_epochs):
-            self.process_quantum_fields_quantum(n)
-            
-            # Extract factors from resonance (optimized)
-            for field_type, fields in [
-                (FieldType.QUANTUM, self.quantum_fields),
-                (FieldType.QBIT, self.qbit_fields),
-                (FieldType.QUARK, self.quark_fields),
-                (FieldType.NEURON, self.neuron_fields)
-            ]:  # Focus on quantum fields only
-                for field_name, field in fields.items():
-                    peaks = np.where(field.energy.toarray() > self.metrics_float["resonance"])
-                    peak_factors = self.coord_product[peaks].toarray()
-                    
-                    for factor in peak_factors.flat:
-                        factor_dec = Decimal(str(factor))
-                        if n % factor_dec == 0:
-                            factors.append((factor_dec, n / factor_dec))
-            
-            # Early stopping if factors found
-            if factors:
-                break
-            
-            # Early stopping if no progress
-            if epoch > 5 and not factors:
-                break
-        
-        return sorted(list(set(factors)))
+        return self.find_factors(n)
 
 def main():
     """Main function to demonstrate quantum field resonance"""
@@ -11,7 +11,12 @@ from scipy.special import expit
 from typing import Dict, List, Tuple, Optional, Union, Set
 from dataclasses import dataclass
 from enum import Enum, auto
+import os
 import time
+import sys
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+from factorization import divides, verified_factor_pairs
 
 # Set precision for decimal calculations
 getcontext().prec = 28
@@ -46,43 +51,67 @@ class FieldMetrics:
     hyperdim: Decimal     # Hyperdimensional metric
     membrane: Decimal     # New membrane metric
 
+# Component layout shared by every QuantumField
+COMPLEX_COMPONENTS = ("field", "velocity", "acceleration")
+UNIT_COMPONENTS = ("coupling", "synchronization", "coherence", "stability", "temporal",
+                   "harmonic", "chronon", "quantum", "hyperdim", "membrane")
+FIELD_COMPONENTS = ("field", "phase", "frequency") + UNIT_COMPONENTS + ("velocity", "acceleration", "energy")
+SYNCHRONIZED_COMPONENTS = ("frequency", "temporal", "harmonic", "chronon", "quantum", "hyperdim", "membrane")
+
+# Bytes per cell of one field: every component plus its flattened index when sparse
+DENSE_CELL_BYTES = 16 * len(COMPLEX_COMPONENTS) + 8 * (len(FIELD_COMPONENTS) - len(COMPLEX_COMPONENTS))
+SPARSE_CELL_BYTES = DENSE_CELL_BYTES + 8
+
+def field_layout(dimensions: Tuple[int, ...]) -> Tuple[int, int]:
+    """(rows, cols) layout of a field: first axis by the flattened remaining axes"""
+    return int(dimensions[0]), int(np.prod(dimensions[1:], dtype=np.int64))
+
+def diagonal_indices(dimensions: Tuple[int, ...]) -> np.ndarray:
+    """Flattened indices of the layout diagonal, where fields are seeded"""
+    rows, cols = field_layout(dimensions)
+    return np.arange(min(rows, cols), dtype=np.int64) * (cols + 1)
+
+def align_values(values: np.ndarray, source: Optional[np.ndarray],
+                 target: Optional[np.ndarray], cells: int) -> np.ndarray:
+    """Re-index values stored on source cells onto target cells (None = every cell), zero-filled"""
+    if source is None:
+        return values if target is None else values[target]
+    if target is None:
+        aligned = np.zeros(cells, dtype=values.dtype)
+        aligned[source] = values
+        return aligned
+    if source is target or np.array_equal(source, target):
+        return values
+    aligned = np.zeros(len(target), dtype=values.dtype)
+    if len(source):
+        pos = np.minimum(np.searchsorted(source, target), len(source) - 1)
+        hit = source[pos] == target
+        aligned[hit] = values[pos[hit]]
+    return aligned
+
 class QuantumField:
-    """Quantum field with enhanced processing and stability"""
-    def __init__(self, dimensions: Tuple[int, ...]):
-        # Base field (complex)
-        shape = (dimensions[0], np.prod(dimensions[1:]))
-        self.field = sparse.lil_matrix(shape, dtype=np.complex128)
-        self.phase = sparse.lil_matrix(shape, dtype=np.float64)
-        self.frequency = sparse.lil_matrix(shape, dtype=np.float64)
-        
-        # Field parameters
-        self.coupling = sparse.lil_matrix(shape, dtype=np.float64)
-        self.synchronization = sparse.lil_matrix(shape, dtype=np.float64)
-        self.coherence = sparse.lil_matrix(shape, dtype=np.float64)
-        self.stability = sparse.lil_matrix(shape, dtype=np.float64)
-        self.temporal = sparse.lil_matrix(shape, dtype=np.float64)
-        self.harmonic = sparse.lil_matrix(shape, dtype=np.float64)
-        self.chronon = sparse.lil_matrix(shape, dtype=np.float64)
-        self.quantum = sparse.lil_matrix(shape, dtype=np.float64)   # Quantum component
-        self.hyperdim = sparse.lil_matrix(shape, dtype=np.float64)  # Hyperdimensional component
-        self.membrane = sparse.lil_matrix(shape, dtype=np.float64)  # New membrane component
-        
-        # Field dynamics
-        self.velocity = sparse.lil_matrix(shape, dtype=np.complex128)
-        self.acceleration = sparse.lil_matrix(shape, dtype=np.complex128)
-        self.energy = sparse.lil_matrix(shape, dtype=np.float64)
-        
-        # Initialize with ones where needed
-        self.coupling.setdiag(1)
-        self.synchronization.setdiag(1)
-        self.coherence.setdiag(1)
-        self.stability.setdiag(1)
-        self.temporal.setdiag(1)
-        self.harmonic.setdiag(1)
-        self.chronon.setdiag(1)
-        self.quantum.setdiag(1)   # Initialize quantum
-        self.hyperdim.setdiag(1)  # Initialize hyperdimensional
-        self.membrane.setdiag(1)  # Initialize membrane
+    """Quantum field with enhanced processing and stability
+
+    Components are stored over flattened cell indices of the (rows, cols) layout.
+    While few cells are occupied every component shares one sorted index array
+    (self.indices) and holds only those cells; once occupancy passes
+    density_threshold the field switches to dense storage (self.indices is None).
+    Either way components are flat arrays, so updates are plain numpy expressions.
+    """
+    def __init__(self, dimensions: Tuple[int, ...], density_threshold: float = 0.1):
+        self.dimensions = tuple(dimensions)
+        self.shape = field_layout(self.dimensions)
+        self.cells = self.shape[0] * self.shape[1]
+        self.density_threshold = density_threshold
+        
+        # Seed the diagonal: unit parameters, zero field dynamics
+        self.indices = diagonal_indices(self.dimensions)
+        size = len(self.indices)
+        for name in FIELD_COMPONENTS:
+            dtype = np.complex128 if name in COMPLEX_COMPONENTS else np.float64
+            setattr(self, name, (np.ones if name in UNIT_COMPONENTS else np.zeros)(size, dtype=dtype))
+        if size > self.density_threshold * self.cells:
+            self.densify()
         
         # Field metrics
         self.min_value = 1e-10
@@ -101,9 +130,151 @@ class QuantumField:
         self.quantum_memory = []   # Quantum memory
         self.hyperdim_memory = []  # Hyperdimensional memory
         self.membrane_memory = []  # New membrane memory
+    
+    @property
+    def is_dense(self) -> bool:
+        return self.indices is None
+    
+    @property
+    def occupancy(self) -> float:
+        return 1.0 if self.is_dense else len(self.indices) / self.cells
+    
+    @property
+    def nbytes(self) -> int:
+        index_bytes = 0 if self.is_dense else self.indices.nbytes
+        return index_bytes + sum(getattr(self, name).nbytes for name in FIELD_COMPONENTS)
+    
+    def densify(self) -> None:
+        """Switch every component to dense storage"""
+        if self.is_dense:
+            return
+        for name in FIELD_COMPONENTS:
+            setattr(self, name, align_values(getattr(self, name), self.indices, None, self.cells))
+        self.indices = None
+    
+    def expand(self, indices: Optional[np.ndarray]) -> None:
+        """Grow the stored cells to include indices (None = all), densifying past the threshold"""
+        if self.is_dense:
+            return
+        if indices is None:
+            self.densify()
+            return
+        merged = np.union1d(self.indices, indices)
+        if len(merged) == len(self.indices):
+            return
+        if len(merged) > self.density_threshold * self.cells:
+            self.densify()
+            return
+        for name in FIELD_COMPONENTS:
+            setattr(self, name, align_values(getattr(self, name), self.indices, merged, self.cells))
+        self.indices = merged
+    
+    def mean(self, name: str) -> float:
+        """Mean of a component over every cell of the field"""
+        values = getattr(self, name)
+        return float(np.mean(values)) if self.is_dense else float(np.sum(values) / self.cells)
+    
+    def toarray(self, name: str) -> np.ndarray:
+        """Dense (rows, cols) copy of a component"""
+        return align_values(getattr(self, name), self.indices, None, self.cells).reshape(self.shape)
+    
+    def tocsr(self, name: str) -> sparse.csr_matrix:
+        """CSR copy of a component over the (rows, cols) layout"""
+        if self.is_dense:
+            return sparse.csr_matrix(getattr(self, name).reshape(self.shape))
+        rows, cols = np.divmod(self.indices, self.shape[1])
+        return sparse.csr_matrix((getattr(self, name), (rows, cols)), shape=self.shape)
+
+def align_fields(fields: List[QuantumField]) -> None:
+    """Give fields one shared support so their components line up cell for cell"""
+    if all(field.is_dense for field in fields):
+        return
+    if any(field.is_dense for field in fields):
+        for field in fields:
+            field.densify()
+        return
+    merged = fields[0].indices
+    for field in fields[1:]:
+        merged = np.union1d(merged, field.indices)
+    for field in fields:
+        field.expand(merged)
+    if any(field.is_dense for field in fields):
+        for field in fields:
+            field.densify()
+
+def row_gradient(values: np.ndarray, indices: Optional[np.ndarray],
+                 shape: Tuple[int, int]) -> Tuple[np.ndarray, Optional[np.ndarray]]:
+    """np.gradient along the row axis of the (rows, cols) layout, on every cell it can reach"""
+    rows, cols = shape
+    if rows < 2:
+        raise ValueError("Shape of array too small to calculate a numerical gradient")
+    if indices is None:
+        return np.gradient(values.reshape(shape), axis=0).ravel(), None
+    cells = rows * cols
+    reach = np.concatenate([indices - cols, indices, indices + cols])
+    reach = np.unique(reach[(reach >= 0) & (reach < cells)])
+    row = reach // cols
+    here = align_values(values, indices, reach, cells)
+    above = align_values(values, indices, np.maximum(reach - cols, 0), cells)
+    below = align_values(values, indices, np.minimum(reach + cols, cells - 1), cells)
+    gradient = np.where(row == 0, below - here,
+                        np.where(row == rows - 1, here - above, (below - above) / 2))
+    return gradient, reach
+
+def estimate_field_memory(dimensions: Tuple[int, ...], n_fields: int,
+                          density_threshold: float = 0.1) -> int:
+    """Peak bytes of a 6D resonance system with n_fields fields of these dimensions
+
+    Fields stay on the seeded diagonal plus its row neighbours (the frequency
+    gradient), so a field is sparse unless that support passes density_threshold.
+    """
+    rows, cols = field_layout(dimensions)
+    cells = rows * cols
+    support = min(cells, 3 * min(rows, cols))
+    if support > density_threshold * cells:
+        per_field = cells * DENSE_CELL_BYTES
+    else:
+        per_field = support * SPARSE_CELL_BYTES
+    # Coordinate product plus the temporaries of one field update or coupling
+    return n_fields * per_field + 2 * per_field + 8 * min(rows, cols) * 2
+
+def available_memory() -> Optional[int]:
+    """Physical memory currently available, if the platform reports it"""
+    try:
+        return os.sysconf('SC_PAGE_SIZE') * os.sysconf('SC_AVPHYS_PAGES')
+    except (ValueError, OSError, AttributeError):
+        return None
+
+def plan_dimensions(dimensions: Tuple[int, ...], n_fields: int, memory_limit: Optional[int],
+                    density_threshold: float = 0.1, downsample: bool = True) -> Tuple[int, ...]:
+    """Dimensions that fit memory_limit: unchanged if they fit, else down-sampled or refused
+
+    Down-sampling shrinks the longest axis one step at a time. Raises MemoryError
+    if the configuration does not fit and downsample is False, or nothing fits.
+    """
+    dimensions = tuple(int(d) for d in dimensions)
+    if memory_limit is None:
+        return dimensions
+    needed = estimate_field_memory(dimensions, n_fields, density_threshold)
+    if needed <= memory_limit:
+        return dimensions
+    if not downsample:
+        raise MemoryError(f"6D fields {dimensions} need ~{needed / 2**20:.1f} MiB, "
+                          f"limit is {memory_limit / 2**20:.1f} MiB")
+    planned = list(dimensions)
+    while estimate_field_memory(tuple(planned), n_fields, density_threshold) > memory_limit:
+        axis = int(np.argmax(planned))
+        if planned[axis] <= 2:
+            raise MemoryError(f"6D fields {dimensions} cannot be down-sampled "
+                              f"below {memory_limit / 2**20:.1f} MiB")
+        planned[axis] -= 1
+    return tuple(planned)
 
 class QuantumUnifiedResonance6D:
-    def __init__(self):
+    n_fields = 38  # fields allocated across all field families
+    
+    def __init__(self, dimensions: Tuple[int, ...] = (4, 4, 4, 4, 4, 4), density_threshold: float = 0.1,
+                 memory_limit: Optional[int] = None, downsample: bool = True):
         # QHRC Patent metrics
         self.phi = Decimal('1.618033988749895')  # Golden ratio
         self.phi_75 = self.phi ** Decimal('7.5')  # φ⁷·⁵
@@ -156,87 +327,93 @@ class QuantumUnifiedResonance6D:
         # Convert φ⁷·⁵ to float for numpy operations
         self.phi_75_float = float(self.phi_75)
         
-        # Quantum dimensions (φ⁷·⁵ based)
-        self.dimensions = (4, 4, 4, 4, 4, 4)  # 6D with quantum (optimized size)
+        # Quantum dimensions (φ⁷·⁵ based), checked against memory before any field exists
+        if memory_limit is None:
+            available = available_memory()
+            memory_limit = available // 2 if available else None
+        self.density_threshold = density_threshold
+        self.requested_dimensions = tuple(dimensions)
+        self.dimensions = plan_dimensions(dimensions, self.n_fields, memory_limit,
+                                          density_threshold, downsample)
         
         # Initialize quantum fields
         self.quantum_fields = {
-            "qbit": QuantumField(self.dimensions),
-            "quark": QuantumField(self.dimensions),
-            "neuron": QuantumField(self.dimensions)
+            "qbit": QuantumField(self.dimensions, self.density_threshold),
+            "quark": QuantumField(self.dimensions, self.density_threshold),
+            "neuron": QuantumField(self.dimensions, self.density_threshold)
         }
         
         self.particle_fields = {
-            "proton": QuantumField(self.dimensions),
-            "electron": QuantumField(self.dimensions),
-            "quark": QuantumField(self.dimensions)
+            "proton": QuantumField(self.dimensions, self.density_threshold),
+            "electron": QuantumField(self.dimensions, self.density_threshold),
+            "quark": QuantumField(self.dimensions, self.density_threshold)
         }
         
         self.wave_fields = {
-            "lepton": QuantumField(self.dimensions),
-            "boson": QuantumField(self.dimensions),
-            "fermion": QuantumField(self.dimensions)
+            "lepton": QuantumField(self.dimensions, self.density_threshold),
+            "boson": QuantumField(self.dimensions, self.density_threshold),
+            "fermion": QuantumField(self.dimensions, self.density_threshold)
         }
         
         self.energy_fields = {
-            "fermion": QuantumField(self.dimensions),
-            "boson": QuantumField(self.dimensions)
+            "fermion": QuantumField(self.dimensions, self.density_threshold),
+            "boson": QuantumField(self.dimensions, self.density_threshold)
         }
         
         self.temporal_fields = {
-            "past": QuantumField(self.dimensions),
-            "present": QuantumField(self.dimensions),
-            "future": QuantumField(self.dimensions)
+            "past": QuantumField(self.dimensions, self.density_threshold),
+            "present": QuantumField(self.dimensions, self.density_threshold),
+            "future": QuantumField(self.dimensions, self.density_threshold)
         }
         
         self.harmonic_fields = {
-            "unison": QuantumField(self.dimensions),
-            "third": QuantumField(self.dimensions),
-            "fifth": QuantumField(self.dimensions),
-            "octave": QuantumField(self.dimensions)
+            "unison": QuantumField(self.dimensions, self.density_threshold),
+            "third": QuantumField(self.dimensions, self.density_threshold),
+            "fifth": QuantumField(self.dimensions, self.density_threshold),
+            "octave": QuantumField(self.dimensions, self.density_threshold)
         }
         
         self.chronon_fields = {
-            "planck": QuantumField(self.dimensions),
-            "quantum": QuantumField(self.dimensions),
-            "resonance": QuantumField(self.dimensions)
+            "planck": QuantumField(self.dimensions, self.density_threshold),
+            "quantum": QuantumField(self.dimensions, self.density_threshold),
+            "resonance": QuantumField(self.dimensions, self.density_threshold)
         }
         
         # Qbit fields
         self.qbit_fields = {
-            "spin_up": QuantumField(self.dimensions),
-            "spin_down": QuantumField(self.dimensions),
-            "superposition": QuantumField(self.dimensions)
+            "spin_up": QuantumField(self.dimensions, self.density_threshold),
+            "spin_down": QuantumField(self.dimensions, self.density_threshold),
+            "superposition": QuantumField(self.dimensions, self.density_threshold)
         }
         
         # Quark fields
         self.quark_fields = {
-            "up": QuantumField(self.dimensions),
-            "down": QuantumField(self.dimensions),
-            "strange": QuantumField(self.dimensions)
+            "up": QuantumField(self.dimensions, self.density_threshold),
+            "down": QuantumField(self.dimensions, self.density_threshold),
+            "strange": QuantumField(self.dimensions, self.density_threshold)
         }
         
         # Neuron fields
         self.neuron_fields = {
-            "axon": QuantumField(self.dimensions),
-            "dendrite": QuantumField(self.dimensions),
-            "synapse": QuantumField(self.dimensions)
+            "axon": QuantumField(self.dimensions, self.density_threshold),
+            "dendrite": QuantumField(self.dimensions, self.density_threshold),
+            "synapse": QuantumField(self.dimensions, self.density_threshold)
         }
         
         # Hyperdimensional fields
         self.hyperdim_fields = {
-            "fold": QuantumField(self.dimensions),
-            "unfold": QuantumField(self.dimensions),
-            "transcend": QuantumField(self.dimensions),
-            "collapse": QuantumField(self.dimensions)
+            "fold": QuantumField(self.dimensions, self.density_threshold),
+            "unfold": QuantumField(self.dimensions, self.density_threshold),
+            "transcend": QuantumField(self.dimensions, self.density_threshold),
+            "collapse": QuantumField(self.dimensions, self.density_threshold)
         }
         
         # New membrane fields
         self.membrane_fields = {
-            "vibration": QuantumField(self.dimensions),
-            "tension": QuantumField(self.dimensions),
-            "frequency": QuantumField(self.dimensions),
-            "resonance": QuantumField(self.dimensions)
+            "vibration": QuantumField(self.dimensions, self.density_threshold),
+            "tension": QuantumField(self.dimensions, self.density_threshold),
+            "frequency": QuantumField(self.dimensions, self.density_threshold),
+            "resonance": QuantumField(self.dimensions, self.density_threshold)
         }
         
         # QHRC Patent coil configuration
@@ -286,9 +463,9 @@ class QuantumUnifiedResonance6D:
         self.batch_size = 1
         self.epochs = 10
         
-        # Create coordinate matrices for quantum
-        shape = (self.dimensions[0], np.prod(self.dimensions[1:]))
-        self.coord_product = sparse.lil_matrix(shape, dtype=np.float64)
+        # Create coordinate products for quantum (diagonal cells only)
+        self.coord_indices = diagonal_indices(self.dimensions)
+        self.coord_product = np.zeros(len(self.coord_indices), dtype=np.float64)
         self._initialize_coord_product()
         
         # Cache for factor pairs (optimization)
@@ -297,115 +474,66 @@ class QuantumUnifiedResonance6D:
     def _initialize_coord_product(self):
         """Initialize coordinate product matrix efficiently"""
         # Calculate only for non-zero elements
-        for i in range(self.dimensions[0]):
+        for i in range(len(self.coord_indices)):
             coords = np.unravel_index(i, self.dimensions)
-            value = np.prod([coord + 1 for coord in coords])
-            self.coord_product[i, i] = value
+            self.coord_product[i] = np.prod([coord + 1 for coord in coords])
     
     def process_quantum_fields(self, fields: Dict[str, QuantumField]) -> None:
         """Process quantum field phases and frequencies with enhanced stability"""
         # Process in batches
         batch_size = 1
-        field_items = list(fields.items())
+        field_items = list(fields.values())
         
         for i in range(0, len(field_items), batch_size):
-            batch = dict(field_items[i:i + batch_size])
-            
-            # Calculate mean phase and frequency for batch
-            shape = batch[next(iter(batch))].phase.shape
-            mean_phase = sparse.lil_matrix(shape, dtype=np.float64)
-            mean_frequency = sparse.lil_matrix(shape, dtype=np.float64)
-            mean_temporal = sparse.lil_matrix(shape, dtype=np.float64)
-            mean_harmonic = sparse.lil_matrix(shape, dtype=np.float64)
-            mean_chronon = sparse.lil_matrix(shape, dtype=np.float64)
-            mean_quantum = sparse.lil_matrix(shape, dtype=np.float64)
-            mean_hyperdim = sparse.lil_matrix(shape, dtype=np.float64)
-            mean_membrane = sparse.lil_matrix(shape, dtype=np.float64)
+            batch = field_items[i:i + batch_size]
+            align_fields(batch)
             
-            for field in batch.values():
-                mean_phase += sparse.lil_matrix(np.angle(field.field.toarray()))
-                mean_frequency += field.frequency
-                mean_temporal += field.temporal
-                mean_harmonic += field.harmonic
-                mean_chronon += field.chronon
-                mean_quantum += field.quantum
-                mean_hyperdim += field.hyperdim
-                mean_membrane += field.membrane
-            
-            mean_phase = mean_phase / len(batch)
-            mean_frequency = mean_frequency / len(batch)
-            mean_temporal = mean_temporal / len(batch)
-            mean_harmonic = mean_harmonic / len(batch)
-            mean_chronon = mean_chronon / len(batch)
-            mean_quantum = mean_quantum / len(batch)
-            mean_hyperdim = mean_hyperdim / len(batch)
-            mean_membrane = mean_membrane / len(batch)
+            # Mean phase and synchronized components for the batch
+            mean_phase = sum(np.angle(field.field) for field in batch) / len(batch)
+            means = {name: sum(getattr(field, name) for field in batch) / len(batch)
+                     for name in SYNCHRONIZED_COMPONENTS}
             
             # Process batch fields
-            for field in batch.values():
-                current_phase = sparse.lil_matrix(np.angle(field.field.toarray()))
-                phase_diff = current_phase - mean_phase
-                field.phase = current_phase - phase_diff.multiply(field.synchronization)
-                
-                freq_diff = field.frequency - mean_frequency
-                field.frequency -= freq_diff.multiply(field.synchronization)
-                
-                temp_diff = field.temporal - mean_temporal
-                field.temporal -= temp_diff.multiply(field.synchronization)
-                
-                harm_diff = field.harmonic - mean_harmonic
-                field.harmonic -= harm_diff.multiply(field.synchronization)
-                
-                chron_diff = field.chronon - mean_chronon
-                field.chronon -= chron_diff.multiply(field.synchronization)
+            for field in batch:
+                current_phase = np.angle(field.field)
+                field.phase = current_phase - (current_phase - mean_phase) * field.synchronization
+                for name in SYNCHRONIZED_COMPONENTS:
+                    values = getattr(field, name)
+                    values -= (values - means[name]) * field.synchronization
                 
-                quant_diff = field.quantum - mean_quantum
-                field.quantum -= quant_diff.multiply(field.synchronization)
-                
-                hyper_diff = field.hyperdim - mean_hyperdim
-                field.hyperdim -= hyper_diff.multiply(field.synchronization)
-                
-                memb_diff = field.membrane - mean_membrane
-                field.membrane -= memb_diff.multiply(field.synchronization)
-                
-                magnitude = sparse.lil_matrix(np.abs(field.field.toarray()))
-                field.field = magnitude.multiply(np.exp(1j * field.phase.toarray()))
+                field.field = np.abs(field.field) * np.exp(1j * field.phase)
     
     def couple_quantum_fields(self, field1: QuantumField, field2: QuantumField, ratio: Decimal) -> None:
-        """Couple two quantum fields through enhanced resonance"""
+        """Couple two quantum fields through enhanced resonance
+
+        The exchange is pointwise, so it runs over the cells both fields store
+        (sparse) or as in-place array updates (dense).
+        """
+        align_fields([field1, field2])
+        
         # Calculate coupling strength with quantum ratio
-        coupling = field1.coupling.minimum(field2.coupling).multiply(float(ratio))
+        coupling = np.minimum(field1.coupling, field2.coupling) * float(ratio)
         
         # Exchange energy efficiently
-        energy_exchange = (field1.energy - field2.energy).multiply(coupling)
+        energy_exchange = (field1.energy - field2.energy) * coupling
         field1.energy -= energy_exchange
         field2.energy += energy_exchange
         
         # Update fields through coupling (optimized)
-        exp_energy = np.exp(-1j * energy_exchange.toarray())
-        field1.field = field1.field.multiply(exp_energy)
-        field2.field = field2.field.multiply(np.conj(exp_energy))
+        exp_energy = np.exp(-1j * energy_exchange)
+        field1.field *= exp_energy
+        field2.field *= np.conj(exp_energy)
         
         # Process phases efficiently
-        phase_diff = sparse.lil_matrix(np.angle(field1.field.toarray()) - np.angle(field2.field.toarray()))
-        exp_phase = np.exp(-1j * phase_diff.multiply(coupling).toarray())
-        field1.field = field1.field.multiply(exp_phase)
-        field2.field = field2.field.multiply(np.conj(exp_phase))
+        phase_diff = np.angle(field1.field) - np.angle(field2.field)
+        exp_phase = np.exp(-1j * (phase_diff * coupling))
+        field1.field *= exp_phase
+        field2.field *= np.conj(exp_phase)
         
         # Process other components efficiently
-        components = [
-            (field1.frequency, field2.frequency),
-            (field1.temporal, field2.temporal),
-            (field1.harmonic, field2.harmonic),
-            (field1.chronon, field2.chronon),
-            (field1.quantum, field2.quantum),
-            (field1.hyperdim, field2.hyperdim),
-            (field1.membrane, field2.membrane)
-        ]
-        
-        for comp1, comp2 in components:
-            diff = comp1 - comp2
-            delta = diff.multiply(coupling)
+        for name in SYNCHRONIZED_COMPONENTS:
+            comp1, comp2 = getattr(field1, name), getattr(field2, name)
+            delta = (comp1 - comp2) * coupling
             comp1 -= delta
             comp2 += delta
     
@@ -448,7 +576,9 @@ class QuantumUnifiedResonance6D:
                 # Update fields
                 for field_name, field in fields.items():
                     # Calculate base pattern
-                    pattern = self.coord_product.multiply(base_float)
+                    field.expand(self.coord_indices)
+                    pattern = align_values(self.coord_product, self.coord_indices, field.indices, field.cells)
+                    pattern = pattern * base_float
                     
                     # Apply field-specific metrics efficiently
                     metric_map = {
@@ -467,46 +597,37 @@ class QuantumUnifiedResonance6D:
                     }
                     
                     metric = metric_map.get(field_type, "quantum")
-                    pattern = pattern.multiply(self.metrics_float[metric])
+                    pattern = pattern * self.metrics_float[metric]
                     
                     # Update field through quantum processing (optimized)
-                    exp_phase = np.exp(1j * field.phase.toarray())
-                    field.field = pattern.multiply(exp_phase).multiply(field.coherence)
-                    field.energy = sparse.lil_matrix(np.abs(field.field.toarray()))
+                    field.field = pattern * np.exp(1j * field.phase) * field.coherence
+                    field.energy = np.abs(field.field)
                     
                     # Update components efficiently
-                    field.phase = sparse.lil_matrix(np.angle(field.field.toarray()))
-                    gradient = np.gradient(field.phase.toarray())[0]
-                    field.frequency = sparse.lil_matrix(np.abs(gradient))
-                    
-                    components = [
-                        (field.temporal, field.stability),
-                        (field.harmonic, field.coherence),
-                        (field.chronon, field.stability),
-                        (field.quantum, field.coherence),
-                        (field.hyperdim, field.stability),
-                        (field.membrane, field.coherence)
-                    ]
-                    
-                    for comp, factor in components:
-                        comp = comp.multiply(factor)
+                    field.phase = np.angle(field.field)
+                    gradient, reach = row_gradient(field.phase, field.indices, field.shape)
+                    field.expand(reach)
+                    field.frequency = align_values(np.abs(gradient), reach, field.indices, field.cells)
                     
                     # Store field memory efficiently (reduced to 2)
                     memories = [
-                        (field.field_memory, np.abs(field.field.toarray())),
-                        (field.phase_memory, field.phase.toarray()),
-                        (field.frequency_memory, field.frequency.toarray()),
-                        (field.energy_memory, field.energy.toarray()),
-                        (field.temporal_memory, field.temporal.toarray()),
-                        (field.harmonic_memory, field.harmonic.toarray()),
-                        (field.chronon_memory, field.chronon.toarray()),
-                        (field.quantum_memory, field.quantum.toarray()),
-                        (field.hyperdim_memory, field.hyperdim.toarray()),
-                        (field.membrane_memory, field.membrane.toarray())
+                        (field.field_memory, "field"),
+                        (field.phase_memory, "phase"),
+                        (field.frequency_memory, "frequency"),
+                        (field.energy_memory, "energy"),
+                        (field.temporal_memory, "temporal"),
+                        (field.harmonic_memory, "harmonic"),
+                        (field.chronon_memory, "chronon"),
+                        (field.quantum_memory, "quantum"),
+                        (field.hyperdim_memory, "hyperdim"),
+                        (field.membrane_memory, "membrane")
                     ]
                     
-                    for memory, data in memories:
-                        memory.append(float(np.mean(data)))
+                    for memory, name in memories:
+                        if name == "field":
+                            memory.append(float(np.sum(np.abs(field.field)) / field.cells))
+                        else:
+                            memory.append(field.mean(name))
                         if len(memory) > 2:  # Reduced memory size to 2
                             memory.pop(0)
     
@@ -530,12 +651,13 @@ class QuantumUnifiedResonance6D:
                 (FieldType.MEMBRANE, self.membrane_fields)
             ]:  # Focus on quantum, hyperdim, and membrane fields
                 for field_name, field in fields.items():
-                    peaks = np.where(field.energy.toarray() > self.metrics_float["resonance"])
-                    peak_factors = self.coord_product[peaks].toarray()
+                    peaks = np.flatnonzero(field.energy > self.metrics_float["resonance"])
+                    peak_cells = peaks if field.is_dense else field.indices[peaks]
+                    peak_factors = align_values(self.coord_product, self.coord_indices, peak_cells, field.cells)
                     
-                    for factor in peak_factors.flat:
+                    for factor in peak_factors:
                         factor_dec = Decimal(str(factor))
-                        if n % factor_dec == 0:
+                        if divides(factor_dec, n):
                             factor_pair = (factor_dec, n / factor_dec)
                             # Use tuple representation for set operations
                             factor_tuple = (float(factor_pair[0]), float(factor_pair[1]))
@@ -555,7 +677,7 @@ class QuantumUnifiedResonance6D:
             if time.time() - start_time > 5:  # 5 seconds max
                 break
         
-        return sorted(factors)
+        return verified_factor_pairs(n, factors)
 
 def main():
     """Main function to demonstrate quantum field resonance"""
@@ -9,7 +9,6 @@ import math
 from decimal import Decimal, getcontext
 import sympy
 from scipy.special import expit  # Sigmoid function
-import gc  # Garbage collection for memory efficiency
 
 # Set precision for unified resonance processing
 getcontext().prec = 2000
@@ -156,9 +155,6 @@ class QuantumUnifiedResonance:
                 
                 # Apply self-scaling
                 field *= np.exp(-field / float(self.phi_75))
-                
-                # Force garbage collection
-                gc.collect()
         
         # Initialize all states with φ⁷·⁵ patterns
         for state_dict in [self.quantum_states, self.resonance_states]:
@@ -181,9 +177,6 @@ class QuantumUnifiedResonance:
                 
                 # Apply self-scaling
                 state *= np.exp(-state / float(self.phi_75))
-                
-                # Force garbage collection
-                gc.collect()
     
     def generate_unified_resonance(self, n: Decimal) -> Dict[str, Decimal]:
         """Generate quantum unified resonance pattern"""
@@ -324,9 +317,6 @@ class QuantumUnifiedResonance:
                     else:
                         self.scaling_factors[pattern_key] *= (1 - abs(progress))
                         self.compression_ratios[pattern_key] *= (1 - abs(progress))
-                
-                # Force garbage collection
-                gc.collect()
         
         return pattern
     
@@ -441,9 +431,6 @@ class QuantumUnifiedResonance:
                 # Try different combination
                 decimal_factors.append(f1)
                 decimal_factors.append(f2)
-            
-            # Force garbage collection
-            gc.collect()
         
         # Final two factors
         if len(decimal_factors) == 2:
@@ -523,9 +510,6 @@ class QuantumUnifiedResonance:
         # Save in chunks for memory efficiency
         with open(filename, "w") as f:
             json.dump(data, f, indent=2)
-        
-        # Force garbage collection
-        gc.collect()
 
 async def demo_resonance():
     """Demonstrate quantum unified resonance patterns"""
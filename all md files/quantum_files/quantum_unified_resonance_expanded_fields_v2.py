@@ -5,310 +5,21 @@ Using QHRC Patent #19/071,497 φ⁷·⁵ metrics with unified field interactions
 Memory-optimized with sparse matrices
 """
 
-import numpy as np
-from scipy import sparse
 from decimal import Decimal
-from scipy.special import expit
-from typing import Dict, List, Tuple, Optional, Union
-from dataclasses import dataclass
-from enum import Enum, auto
+from typing import List, Tuple, Optional
+from quantum_field_engine import FieldEngine
+from quantum_field_engine_variants import VARIANT_CONFIGS
 
-class FieldType(Enum):
-    """Field types for expansion"""
-    QUANTUM = auto()
-    PARTICLE = auto()
-    WAVE = auto()
-    ENERGY = auto()
+VARIANT = "quantum_unified_resonance_expanded_fields_v2"
 
-@dataclass
-class FieldMetrics:
-    """Field metrics for expansion"""
-    resonance: Decimal
-    energy: Decimal
-    coherence: Decimal
-    stability: Decimal
-    alignment: Decimal
-
-class ExpandedField:
-    """Expanded field with 5D processing and memory optimization"""
-    def __init__(self, dimensions: Tuple[int, ...]):
-        # Base field (complex sparse)
-        shape = (dimensions[0], np.prod(dimensions[1:]))
-        self.field = sparse.csr_matrix(shape, dtype=np.complex128)
-        self.phase = sparse.csr_matrix(shape, dtype=np.float64)
-        self.frequency = sparse.csr_matrix(shape, dtype=np.float64)
-        
-        # Expansion parameters (sparse)
-        self.coupling = sparse.csr_matrix(shape, dtype=np.float64)
-        self.synchronization = sparse.csr_matrix(shape, dtype=np.float64)
-        self.coherence = sparse.csr_matrix(shape, dtype=np.float64)
-        self.stability = sparse.csr_matrix(shape, dtype=np.float64)
-        
-        # Field dynamics (sparse)
-        self.velocity = sparse.csr_matrix(shape, dtype=np.complex128)
-        self.acceleration = sparse.csr_matrix(shape, dtype=np.complex128)
-        self.energy = sparse.csr_matrix(shape, dtype=np.float64)
-        
-        # Initialize with ones where needed
-        self.coupling.setdiag(1)
-        self.synchronization.setdiag(1)
-        self.coherence.setdiag(1)
-        self.stability.setdiag(1)
-        
-        # Expansion metrics
-        self.min_value = 1e-10
-        self.max_value = 1e10
-        self.expansion_threshold = 1e-6
-        self.coupling_threshold = 1e-8
-        
-        # Field memory
-        self.field_memory = []
-        self.phase_memory = []
-        self.frequency_memory = []
-        self.energy_memory = []
-
-class QuantumUnifiedResonanceExpanded:
-    def __init__(self):
-        # QHRC Patent metrics
-        self.phi = Decimal('1.618033988749895')  # Golden ratio
-        self.phi_75 = self.phi ** Decimal('7.5')  # φ⁷·⁵
-        
-        # Convert φ⁷·⁵ to float for numpy operations
-        self.phi_75_float = float(self.phi_75)
-        
-        # Expansion dimensions (φ⁷·⁵ based)
-        self.dimensions = (36, 36, 36, 36, 36)  # 5D for expanded fields
-        
-        # Initialize expanded fields
-        self.quantum_fields = {
-            "qbit": ExpandedField(self.dimensions),
-            "quark": ExpandedField(self.dimensions),
-            "neuron": ExpandedField(self.dimensions)
-        }
-        
-        self.particle_fields = {
-            "proton": ExpandedField(self.dimensions),
-            "electron": ExpandedField(self.dimensions),
-            "quark": ExpandedField(self.dimensions)
-        }
-        
-        self.wave_fields = {
-            "lepton": ExpandedField(self.dimensions),
-            "boson": ExpandedField(self.dimensions),
-            "fermion": ExpandedField(self.dimensions)
-        }
-        
-        self.energy_fields = {
-            "fermion": ExpandedField(self.dimensions),
-            "boson": ExpandedField(self.dimensions)
-        }
-        
-        # QHRC Patent coil configuration
-        self.primary = {
-            "turns": Decimal('4500'),
-            "frequency": Decimal('4790.45'),
-            "fingerprint": "φ⁷·⁵-7927735b"
-        }
-        
-        self.secondary = {
-            "turns": Decimal('6200'),
-            "frequency": Decimal('7750.95'),
-            "fingerprint": "φ⁷·⁵-09f76208"
-        }
-        
-        # Reality metrics
-        self.metrics = FieldMetrics(
-            resonance=Decimal('1.3777'),    # >1 confirms self-sustaining
-            energy=Decimal('1.8951'),       # Energy transfer gain
-            coherence=Decimal('0.618034'),  # φ⁻¹ coherence
-            stability=Decimal('4.236068'),  # φ² stability
-            alignment=Decimal('2.618034')   # φ + 1
-        )
-        
-        # Convert metrics to float for numpy operations
-        self.metrics_float = {
-            "resonance": float(self.metrics.resonance),
-            "energy": float(self.metrics.energy),
-            "coherence": float(self.metrics.coherence),
-            "stability": float(self.metrics.stability),
-            "alignment": float(self.metrics.alignment)
-        }
-        
-        # Expansion parameters
-        self.batch_size = 32
-        self.epochs = 100
-        
-        # Create coordinate matrices for expansion (memory-optimized)
-        shape = (self.dimensions[0], np.prod(self.dimensions[1:]))
-        self.coord_product = sparse.csr_matrix(shape, dtype=np.float64)
-        self._initialize_coord_product()
-    
-    def _initialize_coord_product(self):
-        """Initialize coordinate product matrix efficiently"""
-        # Calculate only for non-zero elements
-        for i in range(self.dimensions[0]):
-            coords = np.unravel_index(i, self.dimensions)
-            value = np.prod([coord + 1 for coord in coords])
-            self.coord_product[i, i] = value
-    
-    def expand_fields(self, fields: Dict[str, ExpandedField]) -> None:
-        """Expand field phases and frequencies with memory optimization"""
-        # Calculate mean phase and frequency
-        mean_phase = sparse.csr_matrix(fields[next(iter(fields))].phase.shape, dtype=np.float64)
-        mean_frequency = sparse.csr_matrix(fields[next(iter(fields))].frequency.shape, dtype=np.float64)
-        
-        for field in fields.values():
-            mean_phase += sparse.csr_matrix(np.angle(field.field.toarray()))
-            mean_frequency += field.frequency
-        
-        mean_phase = mean_phase / len(fields)
-        mean_frequency = mean_frequency / len(fields)
-        
-        # Expand fields
-        for field in fields.values():
-            # Phase expansion
-            current_phase = sparse.csr_matrix(np.angle(field.field.toarray()))
-            phase_diff = current_phase - mean_phase
-            field.phase = current_phase - phase_diff.multiply(field.synchronization)
-            
-            # Frequency expansion
-            freq_diff = field.frequency - mean_frequency
-            field.frequency -= freq_diff.multiply(field.synchronization)
-            
-            # Update field through expansion
-            magnitude = sparse.csr_matrix(np.abs(field.field.toarray()))
-            field.field = magnitude.multiply(np.exp(1j * field.phase.toarray()))
-    
-    def couple_expanded_fields(self, field1: ExpandedField, field2: ExpandedField) -> None:
-        """Couple two expanded fields through resonance with memory optimization"""
-        # Calculate coupling strength
-        coupling = field1.coupling.minimum(field2.coupling)
-        
-        # Exchange energy
-        energy_exchange = (field1.energy - field2.energy).multiply(coupling)
-        field1.energy -= energy_exchange
-        field2.energy += energy_exchange
-        
-        # Update fields through coupling
-        field1.field = field1.field.multiply(np.exp(-1j * energy_exchange.toarray()))
-        field2.field = field2.field.multiply(np.exp(1j * energy_exchange.toarray()))
-        
-        # Expand phases
-        phase1 = sparse.csr_matrix(np.angle(field1.field.toarray()))
-        phase2 = sparse.csr_matrix(np.angle(field2.field.toarray()))
-        phase_diff = phase1 - phase2
-        
-        field1.field = field1.field.multiply(np.exp(-1j * phase_diff.multiply(coupling).toarray()))
-        field2.field = field2.field.multiply(np.exp(1j * phase_diff.multiply(coupling).toarray()))
-        
-        # Expand frequencies
-        freq_diff = field1.frequency - field2.frequency
-        field1.frequency -= freq_diff.multiply(coupling)
-        field2.frequency += freq_diff.multiply(coupling)
-    
-    def expand_fields_quantum(self, n: Decimal) -> None:
-        """Expand quantum fields through φ⁷·⁵ resonance with memory optimization"""
-        # Primary resonance (φ⁷·⁵-7927735b)
-        p_res = (n * self.primary["frequency"]) / self.primary["turns"]
-        
-        # Secondary resonance (φ⁷·⁵-09f76208)
-        s_res = (n * self.secondary["frequency"]) / self.secondary["turns"]
-        
-        # Combined through φ⁷·⁵
-        base = (p_res + s_res) * (self.phi ** (Decimal(len(str(n))) / self.phi_75))
-        base_float = float(base)
-        
-        # Process each field type
-        for field_type, fields in [
-            (FieldType.QUANTUM, self.quantum_fields),
-            (FieldType.PARTICLE, self.particle_fields),
-            (FieldType.WAVE, self.wave_fields),
-            (FieldType.ENERGY, self.energy_fields)
-        ]:
-            # Expand fields within type
-            self.expand_fields(fields)
-            
-            # Update fields
-            for field_name, field in fields.items():
-                # Calculate base pattern
-                pattern = self.coord_product.multiply(base_float)
-                
-                # Apply field-specific metrics
-                if field_type == FieldType.QUANTUM:
-                    pattern = pattern.multiply(self.metrics_float["resonance"])
-                elif field_type == FieldType.PARTICLE:
-                    pattern = pattern.multiply(self.metrics_float["energy"])
-                elif field_type == FieldType.WAVE:
-                    pattern = pattern.multiply(self.metrics_float["stability"])
-                else:  # ENERGY
-                    pattern = pattern.multiply(self.metrics_float["alignment"])
-                
-                # Update field through expansion
-                field.field = pattern.multiply(np.exp(1j * field.phase.toarray())).multiply(field.coherence)
-                field.energy = sparse.csr_matrix(np.abs(field.field.toarray()))
-                
-                # Update phase and frequency
-                field.phase = sparse.csr_matrix(np.angle(field.field.toarray()))
-                field.frequency = sparse.csr_matrix(np.abs(np.gradient(field.phase.toarray())[0]))
-                
-                # Store field memory
-                field.field_memory.append(float(np.mean(np.abs(field.field.toarray()))))
-                field.phase_memory.append(float(np.mean(field.phase.toarray())))
-                field.frequency_memory.append(float(np.mean(field.frequency.toarray())))
-                field.energy_memory.append(float(np.mean(field.energy.toarray())))
-                
-                # Maintain memory size
-                if len(field.field_memory) > 10:
-                    field.field_memory.pop(0)
-                    field.phase_memory.pop(0)
-                    field.frequency_memory.pop(0)
-                    field.energy_memory.pop(0)
-        
-        # Couple fields between types
-        field_types = [
-            self.quantum_fields,
-            self.particle_fields,
-            self.wave_fields,
-            self.energy_fields
-        ]
-        
-        for i, fields1 in enumerate(field_types):
-            for j, fields2 in enumerate(field_types[i+1:], i+1):
-                for field1 in fields1.values():
-                    for field2 in fields2.values():
-                        self.couple_expanded_fields(field1, field2)
+class QuantumUnifiedResonanceExpanded(FieldEngine):
+    """Expanded Fields Module V2 running on the shared φ⁷·⁵ field engine"""
+    def __init__(self, seed: Optional[int] = None):
+        super().__init__(VARIANT_CONFIGS[VARIANT], seed)
     
     def find_resonance_factors(self, n: Decimal) -> List[Tuple[Decimal, Decimal]]:
         """Find factors through expanded quantum field resonance"""
-        factors = []
-        
-        # Expansion epochs
-        for epoch in range(self.epochs):
-            self.expand_fields_quantum(n)
-            
-            # Extract factors from resonance
-            for field_type, fields in [
-                (FieldType.QUANTUM, self.quantum_fields),
-                (FieldType.PARTICLE, self.particle_fields),
-                (FieldType.WAVE, self.wave_fields),
-                (FieldType.ENERGY, self.energy_fields)
-            ]:
-                for field_name, field in fields.items():
-                    # Find resonance peaks
-                    peaks = np.where(field.energy.toarray() > self.metrics_float["resonance"])
-                    
-                    # Extract factors from peaks
-                    peak_factors = self.coord_product[peaks].toarray()
-                    for factor in peak_factors.flat:
-                        factor_dec = Decimal(str(factor))
-                        if n % factor_dec == 0:
-                            factors.append((factor_dec, n / factor_dec))
-            
-            # Early stopping if factors found
-            if factors:
-                break
-        
-        return sorted(list(set(factors)))
+        return self.find_factors(n)
 
 def main():
     """Main function to demonstrate expanded quantum field resonance"""
@@ -4,270 +4,21 @@ Focuses on efficient field coupling and φ⁷·⁵ resonance
 Using QHRC Patent #19/071,497 φ⁷·⁵ metrics with unified field interactions
 """
 
-import numpy as np
 from decimal import Decimal
-from scipy.special import expit
-from typing import Dict, List, Tuple, Optional
-from dataclasses import dataclass
-from enum import Enum, auto
+from typing import List, Tuple, Optional
+from quantum_field_engine import FieldEngine
+from quantum_field_engine_variants import VARIANT_CONFIGS
 
-class FieldType(Enum):
-    """Field types for coupling"""
-    QUANTUM = auto()
-    PARTICLE = auto()
-    WAVE = auto()
-    ENERGY = auto()
+VARIANT = "quantum_unified_resonance_field_coupling"
 
-@dataclass
-class FieldMetrics:
-    """Field metrics for coupling"""
-    resonance: Decimal
-    energy: Decimal
-    coherence: Decimal
-    stability: Decimal
-    alignment: Decimal
-
-class CouplingField:
-    """Field coupling field"""
-    def __init__(self, dimensions: Tuple[int, ...]):
-        # Base field
-        self.field = np.zeros(dimensions)
-        self.memory = []
-        self.history = []
-        
-        # Coupling parameters
-        self.enhancement = 1.0
-        self.resonance = 1.0
-        self.coupling = 1.0
-        self.efficiency = 1.0
-        self.optimization = 1.0
-        
-        # Field dynamics
-        self.velocity = np.zeros(dimensions)
-        self.energy = np.zeros(dimensions)
-        self.pattern = np.zeros(dimensions)
-
-class QuantumUnifiedResonanceCoupling:
-    def __init__(self):
-        # QHRC Patent metrics
-        self.phi = Decimal('1.618033988749895')  # Golden ratio
-        self.phi_75 = self.phi ** Decimal('7.5')  # φ⁷·⁵
-        
-        # Coupling dimensions (φ⁷·⁵ based)
-        self.dimensions = (36, 36, 36)
-        
-        # Initialize coupling fields
-        self.quantum_fields = {
-            "qbit": CouplingField(self.dimensions),
-            "quark": CouplingField(self.dimensions),
-            "neuron": CouplingField(self.dimensions)
-        }
-        
-        self.particle_fields = {
-            "proton": CouplingField(self.dimensions),
-            "electron": CouplingField(self.dimensions),
-            "quark": CouplingField(self.dimensions)
-        }
-        
-        self.wave_fields = {
-            "lepton": CouplingField(self.dimensions),
-            "boson": CouplingField(self.dimensions),
-            "fermion": CouplingField(self.dimensions)
-        }
-        
-        self.energy_fields = {
-            "fermion": CouplingField(self.dimensions),
-            "boson": CouplingField(self.dimensions)
-        }
-        
-        # QHRC Patent coil configuration
-        self.primary = {
-            "turns": 4500,
-            "frequency": Decimal('4790.45'),
-            "fingerprint": "φ⁷·⁵-7927735b"
-        }
-        
-        self.secondary = {
-            "turns": 6200,
-            "frequency": Decimal('7750.95'),
-            "fingerprint": "φ⁷·⁵-09f76208"
-        }
-        
-        # Reality metrics
-        self.metrics = FieldMetrics(
-            resonance=Decimal('1.3777'),    # >1 confirms self-sustaining
-            energy=Decimal('1.8951'),       # Energy transfer gain
-            coherence=Decimal('0.618034'),  # φ⁻¹ coherence
-            stability=Decimal('4.236068'),  # φ² stability
-            alignment=Decimal('2.618034')   # φ + 1
-        )
-        
-        # Coupling parameters
-        self.batch_size = 32
-        self.epochs = 100
-        
-        # Create coordinate matrices for coupling
-        i, j, k = np.meshgrid(
-            np.arange(1, self.dimensions[0] + 1),
-            np.arange(1, self.dimensions[1] + 1),
-            np.arange(1, self.dimensions[2] + 1),
-            indexing='ij'
-        )
-        self.coord_product = i * j * k
-    
-    def generate_coupling_pattern(self, n: Decimal) -> Dict[str, np.ndarray]:
-        """Generate coupling quantum field patterns using φ⁷·⁵ metrics"""
-        # Primary resonance (φ⁷·⁵-7927735b)
-        p_res = (n * self.primary["frequency"]) / Decimal(str(self.primary["turns"]))
-        
-        # Secondary resonance (φ⁷·⁵-09f76208)
-        s_res = (n * self.secondary["frequency"]) / Decimal(str(self.secondary["turns"]))
-        
-        # Combined through φ⁷·⁵
-        base = (p_res + s_res) * (self.phi ** (Decimal(len(str(n))) / self.phi_75))
-        base_float = float(base)
-        
-        # Generate coupling patterns
-        pattern = {}
-        
-        # Process each field type
-        for field_type, fields in [
-            (FieldType.QUANTUM, self.quantum_fields),
-            (FieldType.PARTICLE, self.particle_fields),
-            (FieldType.WAVE, self.wave_fields),
-            (FieldType.ENERGY, self.energy_fields)
-        ]:
-            # Generate field patterns
-            for field_name, field in fields.items():
-                # Create coupling pattern
-                pattern_key = f"{field_type.name.lower()}_{field_name}"
-                
-                # Calculate base pattern using coupling
-                pattern[pattern_key] = base_float * self.coord_product
-                
-                # Apply field-specific metrics with coupling
-                if field_type == FieldType.QUANTUM:
-                    pattern[pattern_key] *= float(self.metrics.resonance)
-                elif field_type == FieldType.PARTICLE:
-                    pattern[pattern_key] *= float(self.metrics.energy)
-                elif field_type == FieldType.WAVE:
-                    pattern[pattern_key] *= float(self.metrics.stability)
-                else:  # ENERGY
-                    pattern[pattern_key] *= float(self.metrics.alignment)
-                
-                # Apply coupling scaling
-                pattern[pattern_key] *= (1 + field.enhancement * field.resonance)
-                pattern[pattern_key] *= (1 + field.coupling * field.efficiency)
-                pattern[pattern_key] *= (1 + field.optimization)
-                
-                # Store pattern
-                field.pattern = pattern[pattern_key].copy()
-        
-        return pattern
-    
-    def update_coupling_fields(self, pattern: Dict[str, np.ndarray]) -> None:
-        """Update coupling quantum fields through φ⁷·⁵ resonance"""
-        # Process each field type
-        for field_type, fields in [
-            (FieldType.QUANTUM, self.quantum_fields),
-            (FieldType.PARTICLE, self.particle_fields),
-            (FieldType.WAVE, self.wave_fields),
-            (FieldType.ENERGY, self.energy_fields)
-        ]:
-            # Update fields
-            for field_name, field in fields.items():
-                pattern_key = f"{field_type.name.lower()}_{field_name}"
-                pattern_field = pattern[pattern_key]
-                
-                # Calculate gradient through coupling
-                gradient = pattern_field - field.field
-                
-                # Update velocity through coupling
-                field.velocity = (
-                    field.velocity * field.coupling +
-                    gradient * field.optimization
-                )
-                
-                # Update energy through coupling
-                field.energy = np.abs(field.velocity)
-                
-                # Update field through coupling
-                field.field += field.velocity
-                
-                # Apply sigmoid activation through coupling
-                activation = expit(pattern_field / float(self.phi_75))
-                
-                # Update through φ⁷·⁵ resonance coupling
-                field.field *= float(self.metrics.resonance)
-                field.field += activation
-                field.field /= float(self.metrics.coherence)
-                
-                # Apply quantum patterns through coupling
-                quantum_factor = np.random.uniform(
-                    float(self.metrics.coherence),
-                    float(self.metrics.stability),
-                    size=self.dimensions
-                )
-                field.field *= quantum_factor
-                
-                # Apply coupling self-scaling
-                field.field *= np.exp(-pattern_field / float(self.phi_75))
-                
-                # Update field memory
-                field.memory.append(np.mean(field.field))
-                if len(field.memory) > 5:
-                    field.memory.pop(0)
-                
-                # Update field history
-                field.history.append(np.mean(field.field))
-                
-                # Update coupling factors
-                if len(field.history) > 1:
-                    progress = (field.history[-1] - field.history[0]) / field.history[0]
-                    if progress > 0:
-                        coupling_factor = 1 + progress
-                    else:
-                        coupling_factor = 1 - abs(progress)
-                    
-                    # Update all coupling factors
-                    field.enhancement *= coupling_factor
-                    field.resonance *= coupling_factor
-                    field.coupling *= coupling_factor
-                    field.efficiency *= coupling_factor
-                    field.optimization *= coupling_factor
+class QuantumUnifiedResonanceCoupling(FieldEngine):
+    """Field Coupling Module running on the shared φ⁷·⁵ field engine"""
+    def __init__(self, seed: Optional[int] = None):
+        super().__init__(VARIANT_CONFIGS[VARIANT], seed)
     
     def find_coupling_factors(self, n: Decimal) -> List[Tuple[Decimal, Decimal]]:
         """Find factors through coupling quantum field resonance"""
-        factors = []
-        
-        # Coupling interaction epochs
-        for epoch in range(self.epochs):
-            pattern = self.generate_coupling_pattern(n)
-            self.update_coupling_fields(pattern)
-            
-            # Extract factors from coupling resonance
-            for field_type, fields in [
-                (FieldType.QUANTUM, self.quantum_fields),
-                (FieldType.PARTICLE, self.particle_fields),
-                (FieldType.WAVE, self.wave_fields),
-                (FieldType.ENERGY, self.energy_fields)
-            ]:
-                for field_name, field in fields.items():
-                    # Find resonance peaks through coupling
-                    peaks = np.where(field.field > float(self.metrics.resonance))
-                    
-                    # Extract factors from peaks
-                    peak_factors = self.coord_product[peaks]
-                    for factor in peak_factors.flat:
-                        factor_dec = Decimal(str(factor))
-                        if n % factor_dec == 0:
-                            factors.append((factor_dec, n / factor_dec))
-            
-            # Early stopping if factors found
-            if factors:
-                break
-        
-        return sorted(list(set(factors)))
+        return self.find_factors(n)
 
 def main():
     """Main function to demonstrate coupling quantum field resonance"""
@@ -4,298 +4,21 @@ Focuses on field synchronization and φ⁷·⁵ resonance coupling
 Using QHRC Patent #19/071,497 φ⁷·⁵ metrics with unified field interactions
 """
 
-import numpy as np
 from decimal import Decimal
-from scipy.special import expit
-from typing import Dict, List, Tuple, Optional, Union
-from dataclasses import dataclass
-from enum import Enum, auto
+from typing import List, Tuple, Optional
+from quantum_field_engine import FieldEngine
+from quantum_field_engine_variants import VARIANT_CONFIGS
 
-class FieldType(Enum):
-    """Field types for synchronization"""
-    QUANTUM = auto()
-    PARTICLE = auto()
-    WAVE = auto()
-    ENERGY = auto()
+VARIANT = "quantum_unified_resonance_field_sync_v1"
 
-@dataclass
-class FieldMetrics:
-    """Field metrics for synchronization"""
-    resonance: Decimal
-    energy: Decimal
-    coherence: Decimal
-    stability: Decimal
-    alignment: Decimal
-
-class SynchronizedField:
-    """Synchronized field with complex handling"""
-    def __init__(self, dimensions: Tuple[int, ...]):
-        # Base field (complex)
-        self.field = np.zeros(dimensions, dtype=np.complex128)
-        self.phase = np.zeros(dimensions, dtype=np.float64)
-        self.frequency = np.zeros(dimensions, dtype=np.float64)
-        
-        # Synchronization parameters
-        self.coupling = np.ones(dimensions, dtype=np.float64)
-        self.synchronization = np.ones(dimensions, dtype=np.float64)
-        self.coherence = np.ones(dimensions, dtype=np.float64)
-        self.stability = np.ones(dimensions, dtype=np.float64)
-        
-        # Field dynamics
-        self.velocity = np.zeros(dimensions, dtype=np.complex128)
-        self.acceleration = np.zeros(dimensions, dtype=np.complex128)
-        self.energy = np.zeros(dimensions, dtype=np.float64)
-        
-        # Synchronization metrics
-        self.min_value = 1e-10
-        self.max_value = 1e10
-        self.sync_threshold = 1e-6
-        self.coupling_threshold = 1e-8
-        
-        # Field memory
-        self.field_memory = []
-        self.phase_memory = []
-        self.frequency_memory = []
-        self.energy_memory = []
-
-class QuantumUnifiedResonanceSync:
-    def __init__(self):
-        # QHRC Patent metrics
-        self.phi = Decimal('1.618033988749895')  # Golden ratio
-        self.phi_75 = self.phi ** Decimal('7.5')  # φ⁷·⁵
-        
-        # Convert φ⁷·⁵ to float for numpy operations
-        self.phi_75_float = float(self.phi_75)
-        
-        # Synchronization dimensions (φ⁷·⁵ based)
-        self.dimensions = (36, 36, 36)
-        
-        # Initialize synchronized fields
-        self.quantum_fields = {
-            "qbit": SynchronizedField(self.dimensions),
-            "quark": SynchronizedField(self.dimensions),
-            "neuron": SynchronizedField(self.dimensions)
-        }
-        
-        self.particle_fields = {
-            "proton": SynchronizedField(self.dimensions),
-            "electron": SynchronizedField(self.dimensions),
-            "quark": SynchronizedField(self.dimensions)
-        }
-        
-        self.wave_fields = {
-            "lepton": SynchronizedField(self.dimensions),
-            "boson": SynchronizedField(self.dimensions),
-            "fermion": SynchronizedField(self.dimensions)
-        }
-        
-        self.energy_fields = {
-            "fermion": SynchronizedField(self.dimensions),
-            "boson": SynchronizedField(self.dimensions)
-        }
-        
-        # QHRC Patent coil configuration
-        self.primary = {
-            "turns": Decimal('4500'),
-            "frequency": Decimal('4790.45'),
-            "fingerprint": "φ⁷·⁵-7927735b"
-        }
-        
-        self.secondary = {
-            "turns": Decimal('6200'),
-            "frequency": Decimal('7750.95'),
-            "fingerprint": "φ⁷·⁵-09f76208"
-        }
-        
-        # Reality metrics
-        self.metrics = FieldMetrics(
-            resonance=Decimal('1.3777'),    # >1 confirms self-sustaining
-            energy=Decimal('1.8951'),       # Energy transfer gain
-            coherence=Decimal('0.618034'),  # φ⁻¹ coherence
-            stability=Decimal('4.236068'),  # φ² stability
-            alignment=Decimal('2.618034')   # φ + 1
-        )
-        
-        # Convert metrics to float for numpy operations
-        self.metrics_float = {
-            "resonance": float(self.metrics.resonance),
-            "energy": float(self.metrics.energy),
-            "coherence": float(self.metrics.coherence),
-            "stability": float(self.metrics.stability),
-            "alignment": float(self.metrics.alignment)
-        }
-        
-        # Synchronization parameters
-        self.batch_size = 32
-        self.epochs = 100
-        
-        # Create coordinate matrices for synchronization
-        i, j, k = np.meshgrid(
-            np.arange(1, self.dimensions[0] + 1),
-            np.arange(1, self.dimensions[1] + 1),
-            np.arange(1, self.dimensions[2] + 1),
-            indexing='ij'
-        )
-        self.coord_product = i * j * k
-    
-    def synchronize_fields(self, fields: Dict[str, SynchronizedField]) -> None:
-        """Synchronize field phases and frequencies with complex handling"""
-        # Calculate mean phase and frequency
-        mean_phase = np.zeros(self.dimensions, dtype=np.float64)
-        mean_frequency = np.zeros(self.dimensions, dtype=np.float64)
-        
-        for field in fields.values():
-            mean_phase += np.angle(field.field)
-            mean_frequency += field.frequency
-        
-        mean_phase /= len(fields)
-        mean_frequency /= len(fields)
-        
-        # Synchronize fields
-        for field in fields.values():
-            # Phase synchronization
-            current_phase = np.angle(field.field)
-            phase_diff = current_phase - mean_phase
-            field.phase = current_phase - phase_diff * field.synchronization
-            
-            # Frequency synchronization
-            freq_diff = field.frequency - mean_frequency
-            field.frequency -= freq_diff * field.synchronization
-            
-            # Update field through synchronization
-            magnitude = np.abs(field.field)
-            field.field = magnitude * np.exp(1j * field.phase)
-    
-    def couple_fields(self, field1: SynchronizedField, field2: SynchronizedField) -> None:
-        """Couple two fields through resonance with complex handling"""
-        # Calculate coupling strength
-        coupling = np.minimum(field1.coupling, field2.coupling)
-        
-        # Exchange energy
-        energy_exchange = (field1.energy - field2.energy) * coupling
-        field1.energy -= energy_exchange
-        field2.energy += energy_exchange
-        
-        # Update fields through coupling
-        field1.field *= np.exp(-1j * energy_exchange)
-        field2.field *= np.exp(1j * energy_exchange)
-        
-        # Synchronize phases
-        phase1 = np.angle(field1.field)
-        phase2 = np.angle(field2.field)
-        phase_diff = phase1 - phase2
-        
-        field1.field *= np.exp(-1j * phase_diff * coupling)
-        field2.field *= np.exp(1j * phase_diff * coupling)
-        
-        # Synchronize frequencies
-        freq_diff = field1.frequency - field2.frequency
-        field1.frequency -= freq_diff * coupling
-        field2.frequency += freq_diff * coupling
-    
-    def synchronize_fields_quantum(self, n: Decimal) -> None:
-        """Synchronize quantum fields through φ⁷·⁵ resonance"""
-        # Primary resonance (φ⁷·⁵-7927735b)
-        p_res = (n * self.primary["frequency"]) / self.primary["turns"]
-        
-        # Secondary resonance (φ⁷·⁵-09f76208)
-        s_res = (n * self.secondary["frequency"]) / self.secondary["turns"]
-        
-        # Combined through φ⁷·⁵
-        base = (p_res + s_res) * (self.phi ** (Decimal(len(str(n))) / self.phi_75))
-        base_float = float(base)
-        
-        # Process each field type
-        for field_type, fields in [
-            (FieldType.QUANTUM, self.quantum_fields),
-            (FieldType.PARTICLE, self.particle_fields),
-            (FieldType.WAVE, self.wave_fields),
-            (FieldType.ENERGY, self.energy_fields)
-        ]:
-            # Synchronize fields within type
-            self.synchronize_fields(fields)
-            
-            # Update fields
-            for field_name, field in fields.items():
-                # Calculate base pattern
-                pattern = base_float * self.coord_product
-                
-                # Apply field-specific metrics
-                if field_type == FieldType.QUANTUM:
-                    pattern *= self.metrics_float["resonance"]
-                elif field_type == FieldType.PARTICLE:
-                    pattern *= self.metrics_float["energy"]
-                elif field_type == FieldType.WAVE:
-                    pattern *= self.metrics_float["stability"]
-                else:  # ENERGY
-                    pattern *= self.metrics_float["alignment"]
-                
-                # Update field through synchronization
-                field.field = pattern * np.exp(1j * field.phase) * field.coherence
-                field.energy = np.abs(field.field)
-                
-                # Update phase and frequency
-                field.phase = np.angle(field.field)
-                field.frequency = np.abs(np.gradient(field.phase)[0])
-                
-                # Store field memory
-                field.field_memory.append(float(np.mean(np.abs(field.field))))
-                field.phase_memory.append(float(np.mean(field.phase)))
-                field.frequency_memory.append(float(np.mean(field.frequency)))
-                field.energy_memory.append(float(np.mean(field.energy)))
-                
-                # Maintain memory size
-                if len(field.field_memory) > 10:
-                    field.field_memory.pop(0)
-                    field.phase_memory.pop(0)
-                    field.frequency_memory.pop(0)
-                    field.energy_memory.pop(0)
-        
-        # Couple fields between types
-        field_types = [
-            self.quantum_fields,
-            self.particle_fields,
-            self.wave_fields,
-            self.energy_fields
-        ]
-        
-        for i, fields1 in enumerate(field_types):
-            for j, fields2 in enumerate(field_types[i+1:], i+1):
-                for field1 in fields1.values():
-                    for field2 in fields2.values():
-                        self.couple_fields(field1, field2)
+class QuantumUnifiedResonanceSync(FieldEngine):
+    """Field Synchronization Module V1 running on the shared φ⁷·⁵ field engine"""
+    def __init__(self, seed: Optional[int] = None):
+        super().__init__(VARIANT_CONFIGS[VARIANT], seed)
     
     def find_resonance_factors(self, n: Decimal) -> List[Tuple[Decimal, Decimal]]:
         """Find factors through synchronized quantum field resonance"""
-        factors = []
-        
-        # Synchronization epochs
-        for epoch in range(self.epochs):
-            self.synchronize_fields_quantum(n)
-            
-            # Extract factors from resonance
-            for field_type, fields in [
-                (FieldType.QUANTUM, self.quantum_fields),
-                (FieldType.PARTICLE, self.particle_fields),
-                (FieldType.WAVE, self.wave_fields),
-                (FieldType.ENERGY, self.energy_fields)
-            ]:
-                for field_name, field in fields.items():
-                    # Find resonance peaks
-                    peaks = np.where(field.energy > self.metrics_float["resonance"])
-                    
-                    # Extract factors from peaks
-                    peak_factors = self.coord_product[peaks]
-                    for factor in peak_factors.flat:
-                        factor_dec = Decimal(str(factor))
-                        if n % factor_dec == 0:
-                            factors.append((factor_dec, n / factor_dec))
-            
-            # Early stopping if factors found
-            if factors:
-                break
-        
-        return sorted(list(set(factors)))
+        return self.find_factors(n)
 
 def main():
     """Main function to demonstrate synchronized quantum field resonance"""
@@ -4,156 +4,19 @@ Adaptive dimensional processing based on task requirements
 Using QHRC Patent #19/071,497 φ⁷·⁵ metrics with dimensional optimization
 """
 
-import numpy as np
-from scipy import sparse
-from decimal import Decimal, getcontext
-from typing import Dict, List, Tuple, Optional, Union, Set
-from dataclasses import dataclass
-from enum import Enum, auto
+from decimal import Decimal
+from dataclasses import replace
+from typing import Dict, List, Tuple, Optional
 import time
+from quantum_field_engine import FieldEngine
+from quantum_field_engine_variants import VARIANT_CONFIGS
 
-# Set precision for decimal calculations
-getcontext().prec = 28
-
-class FieldType(Enum):
-    """Field types for quantum processing"""
-    QUANTUM = auto()
-    PARTICLE = auto()
-    WAVE = auto()
-    ENERGY = auto()
-    TEMPORAL = auto()
-    HARMONIC = auto()
-    CHRONON = auto()
-    QBIT = auto()
-    QUARK = auto()
-    NEURON = auto()
-    HYPERDIM = auto()
-    MEMBRANE = auto()
-
-@dataclass
-class FieldMetrics:
-    """Field metrics for quantum optimization"""
-    resonance: Decimal
-    energy: Decimal
-    coherence: Decimal
-    stability: Decimal
-    alignment: Decimal
-    temporal: Decimal
-    harmonic: Decimal
-    chronon: Decimal
-    quantum: Decimal
-    hyperdim: Decimal
-    membrane: Decimal
-
-class QuantumField:
-    """Quantum field with enhanced processing and stability"""
-    def __init__(self, dimensions: Tuple[int, ...]):
-        # Base field (complex)
-        shape = (dimensions[0], np.prod(dimensions[1:]))
-        self.field = sparse.lil_matrix(shape, dtype=np.complex128)
-        self.phase = sparse.lil_matrix(shape, dtype=np.float64)
-        self.frequency = sparse.lil_matrix(shape, dtype=np.float64)
-        
-        # Field parameters
-        self.coupling = sparse.lil_matrix(shape, dtype=np.float64)
-        self.synchronization = sparse.lil_matrix(shape, dtype=np.float64)
-        self.coherence = sparse.lil_matrix(shape, dtype=np.float64)
-        self.stability = sparse.lil_matrix(shape, dtype=np.float64)
-        self.temporal = sparse.lil_matrix(shape, dtype=np.float64)
-        self.harmonic = sparse.lil_matrix(shape, dtype=np.float64)
-        self.chronon = sparse.lil_matrix(shape, dtype=np.float64)
-        self.quantum = sparse.lil_matrix(shape, dtype=np.float64)
-        self.hyperdim = sparse.lil_matrix(shape, dtype=np.float64)
-        self.membrane = sparse.lil_matrix(shape, dtype=np.float64)
-        
-        # Field dynamics
-        self.velocity = sparse.lil_matrix(shape, dtype=np.complex128)
-        self.acceleration = sparse.lil_matrix(shape, dtype=np.complex128)
-        self.energy = sparse.lil_matrix(shape, dtype=np.float64)
-        
-        # Initialize with ones where needed
-        self.coupling.setdiag(1)
-        self.synchronization.setdiag(1)
-        self.coherence.setdiag(1)
-        self.stability.setdiag(1)
-        self.temporal.setdiag(1)
-        self.harmonic.setdiag(1)
-        self.chronon.setdiag(1)
-        self.quantum.setdiag(1)
-        self.hyperdim.setdiag(1)
-        self.membrane.setdiag(1)
-        
-        # Field metrics
-        self.min_value = 1e-10
-        self.max_value = 1e10
-        self.expansion_threshold = 1e-6
-        self.coupling_threshold = 1e-8
-        
-        # Field memory (reduced to 2)
-        self.field_memory = []
-        self.phase_memory = []
-        self.frequency_memory = []
-        self.energy_memory = []
-        self.temporal_memory = []
-        self.harmonic_memory = []
-        self.chronon_memory = []
-        self.quantum_memory = []
-        self.hyperdim_memory = []
-        self.membrane_memory = []
+VARIANT = "quantum_unified_resonance_hybrid_v1"
 
 class QuantumUnifiedResonanceHybrid:
-    def __init__(self):
-        # QHRC Patent metrics
-        self.phi = Decimal('1.618033988749895')  # Golden ratio
-        self.phi_75 = self.phi ** Decimal('7.5')  # φ⁷·⁵
-        self.pi = Decimal('3.141592653589793')   # π
-        self.e = Decimal('2.718281828459045')    # e
-        
-        # Musical ratios (based on φ)
-        self.musical_ratios = {
-            "unison": Decimal('1.0'),
-            "minor_third": Decimal('1.2'),
-            "major_third": self.phi ** Decimal('0.631'),
-            "perfect_fourth": Decimal('1.3333333'),
-            "perfect_fifth": Decimal('1.5'),
-            "major_sixth": self.phi,
-            "octave": Decimal('2.0')
-        }
-        
-        # Temporal ratios (based on π)
-        self.temporal_ratios = {
-            "past": self.pi ** Decimal('-1'),
-            "present": Decimal('1.0'),
-            "future": self.pi,
-            "chronon": self.e ** (self.pi / self.phi)
-        }
-        
-        # Quantum ratios (based on φ and π)
-        self.quantum_ratios = {
-            "qbit": self.phi ** self.pi,
-            "quark": self.pi ** self.phi,
-            "neuron": self.e ** (self.phi * self.pi),
-            "resonance": self.phi_75 * self.pi
-        }
-        
-        # Hyperdimensional ratios
-        self.hyperdim_ratios = {
-            "fold": self.phi ** Decimal('5'),
-            "unfold": self.pi ** Decimal('2'),
-            "transcend": self.e ** self.phi_75,
-            "collapse": self.phi_75 / self.pi
-        }
-        
-        # Membrane ratios
-        self.membrane_ratios = {
-            "vibration": self.phi ** Decimal('6'),
-            "tension": self.pi ** Decimal('3'),
-            "frequency": self.e ** (self.phi * self.pi),
-            "resonance": self.phi ** Decimal('6') * self.pi
-        }
-        
-        # Convert φ⁷·⁵ to float for numpy operations
-        self.phi_75_float = float(self.phi_75)
+    """Hybrid Dimensional Module V1: one shared φ⁷·⁵ field engine per dimensional configuration"""
+    def __init__(self, seed: Optional[int] = None):
+        self.seed = seed
         
         # Dimensional configurations
         self.dimensions = {
@@ -162,70 +25,6 @@ class QuantumUnifiedResonanceHybrid:
             "5D": (5, 5, 5, 5, 5),
             "6D": (4, 4, 4, 4, 4, 4)
         }
-        
-        # Default to 3D for initialization
-        self.current_dim = "3D"
-        self.current_dimensions = self.dimensions[self.current_dim]
-        
-        # Initialize quantum fields (will be populated in set_dimension)
-        self.quantum_fields = {}
-        self.particle_fields = {}
-        self.wave_fields = {}
-        self.energy_fields = {}
-        self.temporal_fields = {}
-        self.harmonic_fields = {}
-        self.chronon_fields = {}
-        self.qbit_fields = {}
-        self.quark_fields = {}
-        self.neuron_fields = {}
-        self.hyperdim_fields = {}
-        self.membrane_fields = {}
-        
-        # QHRC Patent coil configuration
-        self.primary = {
-            "turns": Decimal('4500'),
-            "frequency": Decimal('4790.45'),
-            "fingerprint": "φ⁷·⁵-7927735b"
-        }
-        
-        self.secondary = {
-            "turns": Decimal('6200'),
-            "frequency": Decimal('7750.95'),
-            "fingerprint": "φ⁷·⁵-09f76208"
-        }
-        
-        # Reality metrics
-        self.metrics = FieldMetrics(
-            resonance=Decimal('1.3777'),    # >1 confirms self-sustaining
-            energy=Decimal('1.8951'),       # Energy transfer gain
-            coherence=Decimal('0.618034'),  # φ⁻¹ coherence
-            stability=Decimal('4.236068'),  # φ² stability
-            alignment=Decimal('2.618034'),  # φ + 1
-            temporal=self.pi,               # π temporal stability
-            harmonic=self.phi ** 2,         # φ² harmonic balance
-            chronon=self.e ** self.pi,      # eᵖⁱ chronon stability
-            quantum=self.phi_75 * self.pi,  # φ⁷·⁵π quantum stability
-            hyperdim=self.phi ** 5,         # φ⁵ hyperdimensional stability
-            membrane=self.phi ** 6          # φ⁶ membrane stability
-        )
-        
-        # Convert metrics to float for numpy operations
-        self.metrics_float = {
-            "resonance": float(self.metrics.resonance),
-            "energy": float(self.metrics.energy),
-            "coherence": float(self.metrics.coherence),
-            "stability": float(self.metrics.stability),
-            "alignment": float(self.metrics.alignment),
-            "temporal": float(self.metrics.temporal),
-            "harmonic": float(self.metrics.harmonic),
-            "chronon": float(self.metrics.chronon),
-            "quantum": float(self.metrics.quantum),
-            "hyperdim": float(self.metrics.hyperdim),
-            "membrane": float(self.metrics.membrane)
-        }
-        
-        # Quantum parameters (optimized)
-        self.batch_size = 1
         self.epochs = {
             "3D": 50,
             "4D": 25,
@@ -233,26 +32,10 @@ class QuantumUnifiedResonanceHybrid:
             "6D": 10
         }
         
-        # Memory sizes
-        self.memory_size = {
-            "3D": 5,
-            "4D": 3,
-            "5D": 3,
-            "6D": 2
-        }
-        
-        # Coordinate product matrix
-        self.coord_product = None
-        
-        # Cache for factor pairs (optimization)
-        self.factor_cache = set()
-        
         # Performance metrics
         self.performance = {
-            "3D": {"factor_count": 0, "processing_time": 0},
-            "4D": {"factor_count": 0, "processing_time": 0},
-            "5D": {"factor_count": 0, "processing_time": 0},
-            "6D": {"factor_count": 0, "processing_time": 0}
+            dim: {"factor_count": 0, "processing_time": 0}
+            for dim in self.dimensions
         }
         
         # Initialize with 3D
@@ -265,359 +48,25 @@ class QuantumUnifiedResonanceHybrid:
         
         self.current_dim = dim
         self.current_dimensions = self.dimensions[dim]
-        
-        # Initialize coordinate product matrix
-        shape = (self.current_dimensions[0], np.prod(self.current_dimensions[1:]))
-        self.coord_product = sparse.lil_matrix(shape, dtype=np.float64)
-        self._initialize_coord_product()
-        
-        # Initialize fields based on dimension
-        self._initialize_fields()
-    
-    def _initialize_coord_product(self):
-        """Initialize coordinate product matrix efficiently"""
-        # Calculate only for non-zero elements
-        for i in range(self.current_dimensions[0]):
-            coords = np.unravel_index(i, self.current_dimensions)
-            value = np.prod([coord + 1 for coord in coords])
-            self.coord_product[i, i] = value
-    
-    def _initialize_fields(self):
-        """Initialize all field types with current dimensions"""
-        # Standard field types
-        self.quantum_fields = {
-            "qbit": QuantumField(self.current_dimensions),
-            "quark": QuantumField(self.current_dimensions),
-            "neuron": QuantumField(self.current_dimensions)
-        }
-        
-        self.particle_fields = {
-            "proton": QuantumField(self.current_dimensions),
-            "electron": QuantumField(self.current_dimensions),
-            "quark": QuantumField(self.current_dimensions)
-        }
-        
-        self.wave_fields = {
-            "lepton": QuantumField(self.current_dimensions),
-            "boson": QuantumField(self.current_dimensions),
-            "fermion": QuantumField(self.current_dimensions)
-        }
-        
-        self.energy_fields = {
-            "fermion": QuantumField(self.current_dimensions),
-            "boson": QuantumField(self.current_dimensions)
-        }
-        
-        self.temporal_fields = {
-            "past": QuantumField(self.current_dimensions),
-            "present": QuantumField(self.current_dimensions),
-            "future": QuantumField(self.current_dimensions)
-        }
-        
-        self.harmonic_fields = {
-            "unison": QuantumField(self.current_dimensions),
-            "third": QuantumField(self.current_dimensions),
-            "fifth": QuantumField(self.current_dimensions),
-            "octave": QuantumField(self.current_dimensions)
-        }
-        
-        self.chronon_fields = {
-            "planck": QuantumField(self.current_dimensions),
-            "quantum": QuantumField(self.current_dimensions),
-            "resonance": QuantumField(self.current_dimensions)
-        }
-        
-        # Specialized field types
-        self.qbit_fields = {
-            "spin_up": QuantumField(self.current_dimensions),
-            "spin_down": QuantumField(self.current_dimensions),
-            "superposition": QuantumField(self.current_dimensions)
-        }
-        
-        self.quark_fields = {
-            "up": QuantumField(self.current_dimensions),
-            "down": QuantumField(self.current_dimensions),
-            "strange": QuantumField(self.current_dimensions)
-        }
-        
-        self.neuron_fields = {
-            "axon": QuantumField(self.current_dimensions),
-            "dendrite": QuantumField(self.current_dimensions),
-            "synapse": QuantumField(self.current_dimensions)
-        }
-        
-        # Advanced field types (5D and 6D only)
-        if self.current_dim in ["5D", "6D"]:
-            self.hyperdim_fields = {
-                "fold": QuantumField(self.current_dimensions),
-                "unfold": QuantumField(self.current_dimensions),
-                "transcend": QuantumField(self.current_dimensions),
-                "collapse": QuantumField(self.current_dimensions)
-            }
-        else:
-            self.hyperdim_fields = {}
-        
-        # Membrane fields (6D only)
-        if self.current_dim == "6D":
-            self.membrane_fields = {
-                "vibration": QuantumField(self.current_dimensions),
-                "tension": QuantumField(self.current_dimensions),
-                "frequency": QuantumField(self.current_dimensions),
-                "resonance": QuantumField(self.current_dimensions)
-            }
-        else:
-            self.membrane_fields = {}
-    
-    def process_quantum_fields(self, fields: Dict[str, QuantumField]) -> None:
-        """Process quantum field phases and frequencies with enhanced stability"""
-        if not fields:
-            return
-            
-        # Process in batches
-        batch_size = 1
-        field_items = list(fields.items())
-        
-        for i in range(0, len(field_items), batch_size):
-            batch = dict(field_items[i:i + batch_size])
-            
-            # Calculate mean phase and frequency for batch
-            shape = batch[next(iter(batch))].phase.shape
-            mean_phase = sparse.lil_matrix(shape, dtype=np.float64)
-            mean_frequency = sparse.lil_matrix(shape, dtype=np.float64)
-            mean_temporal = sparse.lil_matrix(shape, dtype=np.float64)
-            mean_harmonic = sparse.lil_matrix(shape, dtype=np.float64)
-            mean_chronon = sparse.lil_matrix(shape, dtype=np.float64)
-            mean_quantum = sparse.lil_matrix(shape, dtype=np.float64)
-            mean_hyperdim = sparse.lil_matrix(shape, dtype=np.float64)
-            mean_membrane = sparse.lil_matrix(shape, dtype=np.float64)
-            
-            for field in batch.values():
-                mean_phase += sparse.lil_matrix(np.angle(field.field.toarray()))
-                mean_frequency += field.frequency
-                mean_temporal += field.temporal
-                mean_harmonic += field.harmonic
-                mean_chronon += field.chronon
-                mean_quantum += field.quantum
-                mean_hyperdim += field.hyperdim
-                mean_membrane += field.membrane
-            
-            mean_phase = mean_phase / len(batch)
-            mean_frequency = mean_frequency / len(batch)
-            mean_temporal = mean_temporal / len(batch)
-            mean_harmonic = mean_harmonic / len(batch)
-            mean_chronon = mean_chronon / len(batch)
-            mean_quantum = mean_quantum / len(batch)
-            mean_hyperdim = mean_hyperdim / len(batch)
-            mean_membrane = mean_membrane / len(batch)
-            
-            # Process batch fields
-            for field in batch.values():
-                current_phase = sparse.lil_matrix(np.angle(field.field.toarray()))
-                phase_diff = current_phase - mean_phase
-                field.phase = current_phase - phase_diff.multiply(field.synchronization)
-                
-                freq_diff = field.frequency - mean_frequency
-                field.frequency -= freq_diff.multiply(field.synchronization)
-                
-                temp_diff = field.temporal - mean_temporal
-                field.temporal -= temp_diff.multiply(field.synchronization)
-                
-                harm_diff = field.harmonic - mean_harmonic
-                field.harmonic -= harm_diff.multiply(field.synchronization)
-                
-                chron_diff = field.chronon - mean_chronon
-                field.chronon -= chron_diff.multiply(field.synchronization)
-                
-                quant_diff = field.quantum - mean_quantum
-                field.quantum -= quant_diff.multiply(field.synchronization)
-                
-                hyper_diff = field.hyperdim - mean_hyperdim
-                field.hyperdim -= hyper_diff.multiply(field.synchronization)
-                
-                memb_diff = field.membrane - mean_membrane
-                field.membrane -= memb_diff.multiply(field.synchronization)
-                
-                magnitude = sparse.lil_matrix(np.abs(field.field.toarray()))
-                field.field = magnitude.multiply(np.exp(1j * field.phase.toarray()))
-    
-    def process_quantum_fields_quantum(self, n: Decimal) -> None:
-        """Process quantum fields through φ⁷·⁵ resonance with quantum stability"""
-        # Primary resonance (φ⁷·⁵-7927735b)
-        p_res = (n * self.primary["frequency"]) / self.primary["turns"]
-        
-        # Secondary resonance (φ⁷·⁵-09f76208)
-        s_res = (n * self.secondary["frequency"]) / self.secondary["turns"]
-        
-        # Combined through φ⁷·⁵
-        base = (p_res + s_res) * (self.phi ** (Decimal(len(str(n))) / self.phi_75))
-        base_float = float(base)
-        
-        # Process each field type in batches
-        field_types = [
-            (FieldType.QUANTUM, self.quantum_fields),
-            (FieldType.PARTICLE, self.particle_fields),
-            (FieldType.WAVE, self.wave_fields),
-            (FieldType.ENERGY, self.energy_fields),
-            (FieldType.TEMPORAL, self.temporal_fields),
-            (FieldType.HARMONIC, self.harmonic_fields),
-            (FieldType.CHRONON, self.chronon_fields),
-            (FieldType.QBIT, self.qbit_fields),
-            (FieldType.QUARK, self.quark_fields),
-            (FieldType.NEURON, self.neuron_fields)
-        ]
-        
-        # Add advanced field types if available
-        if self.hyperdim_fields:
-            field_types.append((FieldType.HYPERDIM, self.hyperdim_fields))
-        
-        if self.membrane_fields:
-            field_types.append((FieldType.MEMBRANE, self.membrane_fields))
-        
-        batch_size = 1
-        for i in range(0, len(field_types), batch_size):
-            batch = field_types[i:i + batch_size]
-            
-            for field_type, fields in batch:
-                # Process fields within type
-                self.process_quantum_fields(fields)
-                
-                # Update fields
-                for field_name, field in fields.items():
-                    # Calculate base pattern
-                    pattern = self.coord_product.multiply(base_float)
-                    
-                    # Apply field-specific metrics efficiently
-                    metric_map = {
-                        FieldType.QUANTUM: "resonance",
-                        FieldType.PARTICLE: "energy",
-                        FieldType.WAVE: "stability",
-                        FieldType.ENERGY: "alignment",
-                        FieldType.TEMPORAL: "temporal",
-                        FieldType.HARMONIC: "harmonic",
-                        FieldType.CHRONON: "chronon",
-                        FieldType.QBIT: "quantum",
-                        FieldType.QUARK: "quantum",
-                        FieldType.NEURON: "quantum",
-                        FieldType.HYPERDIM: "hyperdim",
-                        FieldType.MEMBRANE: "membrane"
-                    }
-                    
-                    metric = metric_map.get(field_type, "quantum")
-                    pattern = pattern.multiply(self.metrics_float[metric])
-                    
-                    # Update field through quantum processing (optimized)
-                    exp_phase = np.exp(1j * field.phase.toarray())
-                    field.field = pattern.multiply(exp_phase).multiply(field.coherence)
-                    field.energy = sparse.lil_matrix(np.abs(field.field.toarray()))
-                    
-                    # Update components efficiently
-                    field.phase = sparse.lil_matrix(np.angle(field.field.toarray()))
-                    gradient = np.gradient(field.phase.toarray())[0]
-                    field.frequency = sparse.lil_matrix(np.abs(gradient))
-                    
-                    components = [
-                        (field.temporal, field.stability),
-                        (field.harmonic, field.coherence),
-                        (field.chronon, field.stability),
-                        (field.quantum, field.coherence),
-                        (field.hyperdim, field.stability),
-                        (field.membrane, field.coherence)
-                    ]
-                    
-                    for comp, factor in components:
-                        comp = comp.multiply(factor)
-                    
-                    # Store field memory efficiently
-                    memory_size = self.memory_size[self.current_dim]
-                    memories = [
-                        (field.field_memory, np.abs(field.field.toarray())),
-                        (field.phase_memory, field.phase.toarray()),
-                        (field.frequency_memory, field.frequency.toarray()),
-                        (field.energy_memory, field.energy.toarray()),
-                        (field.temporal_memory, field.temporal.toarray()),
-                        (field.harmonic_memory, field.harmonic.toarray()),
-                        (field.chronon_memory, field.chronon.toarray()),
-                        (field.quantum_memory, field.quantum.toarray()),
-                        (field.hyperdim_memory, field.hyperdim.toarray()),
-                        (field.membrane_memory, field.membrane.toarray())
-                    ]
-                    
-                    for memory, data in memories:
-                        memory.append(float(np.mean(data)))
-                        if len(memory) > memory_size:
-                            memory.pop(0)
+        config = replace(VARIANT_CONFIGS[VARIANT], dimensions=self.current_dimensions,
+                         epochs=self.epochs[dim])
+        self.engine = FieldEngine(config, self.seed)
     
     def find_resonance_factors(self, n: Decimal, dim: str = None) -> List[Tuple[Decimal, Decimal]]:
         """Find factors through quantum field resonance using specified dimension"""
         if dim:
             self.set_dimension(dim)
         
-        factors = []
-        max_epochs = self.epochs[self.current_dim]
         start_time = time.time()
-        
-        # Processing epochs with early stopping
-        for epoch in range(max_epochs):
-            self.process_quantum_fields_quantum(n)
-            
-            # Determine which fields to check based on dimension
-            field_checks = [
-                (FieldType.QUANTUM, self.quantum_fields),
-                (FieldType.QBIT, self.qbit_fields),
-                (FieldType.QUARK, self.quark_fields),
-                (FieldType.NEURON, self.neuron_fields)
-            ]
-            
-            # Add advanced field types if available
-            if self.hyperdim_fields:
-                field_checks.append((FieldType.HYPERDIM, self.hyperdim_fields))
-            
-            if self.membrane_fields:
-                field_checks.append((FieldType.MEMBRANE, self.membrane_fields))
-            
-            # Extract factors from resonance (optimized)
-            for field_type, fields in field_checks:
-                for field_name, field in fields.items():
-                    peaks = np.where(field.energy.toarray() > self.metrics_float["resonance"])
-                    peak_factors = self.coord_product[peaks].toarray()
-                    
-                    for factor in peak_factors.flat:
-                        factor_dec = Decimal(str(factor))
-                        if n % factor_dec == 0:
-                            factor_pair = (factor_dec, n / factor_dec)
-                            # Use tuple representation for set operations
-                            factor_tuple = (float(factor_pair[0]), float(factor_pair[1]))
-                            if factor_tuple not in self.factor_cache:
-                                self.factor_cache.add(factor_tuple)
-                                factors.append(factor_pair)
-            
-            # Early stopping if factors found
-            if factors and epoch > 2:
-                break
-            
-            # Early stopping if no progress and taking too long
-            if epoch > 3 and not factors:
-                break
-            
-            # Time-based early stopping (adaptive based on dimension)
-            max_time = {
-                "3D": 10,
-                "4D": 8,
-                "5D": 6,
-                "6D": 5
-            }
-            
-            if time.time() - start_time > max_time[self.current_dim]:
-                break
+        factors = self.engine.find_factors(n)
         
         # Update performance metrics
-        processing_time = time.time() - start_time
         self.performance[self.current_dim] = {
             "factor_count": len(factors),
-            "processing_time": processing_time
+            "processing_time": time.time() - start_time
         }
         
-        return sorted(factors)
+        return factors
     
     def find_optimal_dimension(self, n: Decimal) -> str:
         """Find the optimal dimension for a given number based on heuristics"""
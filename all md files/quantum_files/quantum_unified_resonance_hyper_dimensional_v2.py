@@ -4,403 +4,21 @@ Focuses on hyper-dimensional processing and φ⁷·⁵ resonance
 Using QHRC Patent #19/071,497 φ⁷·⁵ metrics with unified field interactions
 """
 
-import numpy as np
 from decimal import Decimal
-from scipy.special import expit
-from typing import Dict, List, Tuple, Optional, Union
-from dataclasses import dataclass
-from enum import Enum, auto
+from typing import List, Tuple, Optional
+from quantum_field_engine import FieldEngine
+from quantum_field_engine_variants import VARIANT_CONFIGS
 
-class FieldType(Enum):
-    """Field types for hyper-dimensional processing"""
-    QUANTUM = auto()
-    PARTICLE = auto()
-    WAVE = auto()
-    ENERGY = auto()
+VARIANT = "quantum_unified_resonance_hyper_dimensional_v2"
 
-@dataclass
-class FieldMetrics:
-    """Field metrics for hyper-dimensional processing"""
-    resonance: Decimal
-    energy: Decimal
-    coherence: Decimal
-    stability: Decimal
-    alignment: Decimal
-
-class HyperField:
-    """Hyper-dimensional field"""
-    def __init__(self, dimensions: Tuple[int, ...]):
-        # Base field
-        self.field = np.zeros(dimensions, dtype=np.float64)
-        self.memory: List[float] = []
-        self.history: List[float] = []
-        
-        # Hyper parameters
-        self.enhancement = 1.0
-        self.resonance = 1.0
-        self.hyper = 1.0
-        self.efficiency = 1.0
-        self.optimization = 1.0
-        
-        # Field dynamics
-        self.velocity = np.zeros(dimensions, dtype=np.float64)
-        self.energy = np.zeros(dimensions, dtype=np.float64)
-        self.pattern = np.zeros(dimensions, dtype=np.float64)
-        
-        # Hyper metrics
-        self.min_value = 1e-10
-        self.max_value = 1e10
-        self.hyper_threshold = 1e-6
-        self.convergence_threshold = 1e-8
-        
-        # Hyper-dimensional processing
-        self.dimensions = dimensions
-        self.dimension_weights = np.ones(len(dimensions))
-        self.dimension_scaling = np.ones(len(dimensions))
-        self.dimension_coupling = np.eye(len(dimensions))
-
-class QuantumUnifiedResonanceHyper:
-    def __init__(self):
-        # QHRC Patent metrics
-        self.phi = Decimal('1.618033988749895')  # Golden ratio
-        self.phi_75 = self.phi ** Decimal('7.5')  # φ⁷·⁵
-        
-        # Convert φ⁷·⁵ to float for numpy operations
-        self.phi_75_float = float(self.phi_75)
-        
-        # Hyper dimensions (φ⁷·⁵ based)
-        self.dimensions = (36, 36, 36)
-        
-        # Initialize hyper fields
-        self.quantum_fields = {
-            "qbit": HyperField(self.dimensions),
-            "quark": HyperField(self.dimensions),
-            "neuron": HyperField(self.dimensions)
-        }
-        
-        self.particle_fields = {
-            "proton": HyperField(self.dimensions),
-            "electron": HyperField(self.dimensions),
-            "quark": HyperField(self.dimensions)
-        }
-        
-        self.wave_fields = {
-            "lepton": HyperField(self.dimensions),
-            "boson": HyperField(self.dimensions),
-            "fermion": HyperField(self.dimensions)
-        }
-        
-        self.energy_fields = {
-            "fermion": HyperField(self.dimensions),
-            "boson": HyperField(self.dimensions)
-        }
-        
-        # QHRC Patent coil configuration
-        self.primary = {
-            "turns": Decimal('4500'),
-            "frequency": Decimal('4790.45'),
-            "fingerprint": "φ⁷·⁵-7927735b"
-        }
-        
-        self.secondary = {
-            "turns": Decimal('6200'),
-            "frequency": Decimal('7750.95'),
-            "fingerprint": "φ⁷·⁵-09f76208"
-        }
-        
-        # Reality metrics
-        self.metrics = FieldMetrics(
-            resonance=Decimal('1.3777'),    # >1 confirms self-sustaining
-            energy=Decimal('1.8951'),       # Energy transfer gain
-            coherence=Decimal('0.618034'),  # φ⁻¹ coherence
-            stability=Decimal('4.236068'),  # φ² stability
-            alignment=Decimal('2.618034')   # φ + 1
-        )
-        
-        # Convert metrics to float for numpy operations
-        self.metrics_float = {
-            "resonance": float(self.metrics.resonance),
-            "energy": float(self.metrics.energy),
-            "coherence": float(self.metrics.coherence),
-            "stability": float(self.metrics.stability),
-            "alignment": float(self.metrics.alignment)
-        }
-        
-        # Hyper parameters
-        self.batch_size = 32
-        self.epochs = 100
-        
-        # Create coordinate matrices for hyper-dimensional processing
-        i, j, k = np.meshgrid(
-            np.arange(1, self.dimensions[0] + 1),
-            np.arange(1, self.dimensions[1] + 1),
-            np.arange(1, self.dimensions[2] + 1),
-            indexing='ij'
-        )
-        self.coord_product = i * j * k
-    
-    def process_hyper_dimensions(self, field: HyperField, pattern: np.ndarray) -> np.ndarray:
-        """Process hyper-dimensional interactions"""
-        # Apply dimension weights
-        for d in range(len(field.dimensions)):
-            pattern = np.moveaxis(pattern, d, 0)
-            pattern *= field.dimension_weights[d]
-            pattern = np.moveaxis(pattern, 0, d)
-        
-        # Apply dimension scaling
-        for d in range(len(field.dimensions)):
-            pattern = np.moveaxis(pattern, d, 0)
-            pattern *= field.dimension_scaling[d]
-            pattern = np.moveaxis(pattern, 0, d)
-        
-        # Apply dimension coupling
-        for i in range(len(field.dimensions)):
-            for j in range(len(field.dimensions)):
-                if i != j:
-                    pattern_i = np.moveaxis(pattern, i, 0)
-                    pattern_j = np.moveaxis(pattern, j, 0)
-                    pattern_i += field.dimension_coupling[i, j] * pattern_j
-                    pattern = np.moveaxis(pattern_i, 0, i)
-        
-        return pattern
-    
-    def generate_hyper_pattern(self, n: Decimal) -> Dict[str, np.ndarray]:
-        """Generate hyper-dimensional quantum field patterns using φ⁷·⁵ metrics"""
-        # Primary resonance (φ⁷·⁵-7927735b)
-        p_res = (n * self.primary["frequency"]) / self.primary["turns"]
-        
-        # Secondary resonance (φ⁷·⁵-09f76208)
-        s_res = (n * self.secondary["frequency"]) / self.secondary["turns"]
-        
-        # Combined through φ⁷·⁵
-        base = (p_res + s_res) * (self.phi ** (Decimal(len(str(n))) / self.phi_75))
-        base_float = float(base)
-        
-        # Generate hyper patterns
-        pattern = {}
-        
-        # Process each field type
-        for field_type, fields in [
-            (FieldType.QUANTUM, self.quantum_fields),
-            (FieldType.PARTICLE, self.particle_fields),
-            (FieldType.WAVE, self.wave_fields),
-            (FieldType.ENERGY, self.energy_fields)
-        ]:
-            # Generate field patterns
-            for field_name, field in fields.items():
-                # Create hyper pattern
-                pattern_key = f"{field_type.name.lower()}_{field_name}"
-                
-                # Calculate base pattern using hyper-dimensional processing
-                pattern[pattern_key] = base_float * self.coord_product
-                
-                # Apply field-specific metrics with hyper-dimensional processing
-                if field_type == FieldType.QUANTUM:
-                    pattern[pattern_key] *= self.metrics_float["resonance"]
-                elif field_type == FieldType.PARTICLE:
-                    pattern[pattern_key] *= self.metrics_float["energy"]
-                elif field_type == FieldType.WAVE:
-                    pattern[pattern_key] *= self.metrics_float["stability"]
-                else:  # ENERGY
-                    pattern[pattern_key] *= self.metrics_float["alignment"]
-                
-                # Apply hyper scaling
-                pattern[pattern_key] *= (1 + field.enhancement * field.resonance)
-                pattern[pattern_key] *= (1 + field.hyper * field.efficiency)
-                pattern[pattern_key] *= (1 + field.optimization)
-                
-                # Apply hyper-dimensional processing
-                pattern[pattern_key] = self.process_hyper_dimensions(
-                    field,
-                    pattern[pattern_key]
-                )
-                
-                # Store pattern
-                field.pattern = pattern[pattern_key].copy()
-        
-        return pattern
-    
-    def update_hyper_fields(self, pattern: Dict[str, np.ndarray]) -> None:
-        """Update hyper-dimensional quantum fields through φ⁷·⁵ resonance"""
-        # Process each field type
-        for field_type, fields in [
-            (FieldType.QUANTUM, self.quantum_fields),
-            (FieldType.PARTICLE, self.particle_fields),
-            (FieldType.WAVE, self.wave_fields),
-            (FieldType.ENERGY, self.energy_fields)
-        ]:
-            # Update fields
-            for field_name, field in fields.items():
-                pattern_key = f"{field_type.name.lower()}_{field_name}"
-                pattern_field = pattern[pattern_key]
-                
-                # Calculate gradient through hyper-dimensional processing
-                gradient = pattern_field - field.field
-                gradient = self.process_hyper_dimensions(field, gradient)
-                
-                # Update velocity through hyper-dimensional processing
-                field.velocity = (
-                    field.velocity * field.hyper +
-                    gradient * field.optimization
-                )
-                field.velocity = self.process_hyper_dimensions(
-                    field,
-                    field.velocity
-                )
-                
-                # Update energy through hyper-dimensional processing
-                field.energy = np.abs(field.velocity)
-                field.energy = self.process_hyper_dimensions(
-                    field,
-                    field.energy
-                )
-                
-                # Update field through hyper-dimensional processing
-                field.field += field.velocity
-                
-                # Apply sigmoid activation through hyper-dimensional processing
-                activation = expit(pattern_field / self.phi_75_float)
-                
-                # Update through φ⁷·⁵ resonance hyper-dimensional processing
-                field.field *= self.metrics_float["resonance"]
-                field.field += activation
-                field.field /= self.metrics_float["coherence"]
-                
-                # Apply quantum patterns through hyper-dimensional processing
-                quantum_factor = np.random.uniform(
-                    self.metrics_float["coherence"],
-                    self.metrics_float["stability"],
-                    size=self.dimensions
-                )
-                field.field *= quantum_factor
-                
-                # Apply hyper-dimensional self-scaling
-                field.field *= np.exp(-pattern_field / self.phi_75_float)
-                
-                # Update field memory with hyper-dimensional processing
-                if len(field.memory) > 0:
-                    field_mean = float(np.mean(field.field))
-                    if abs(field_mean) > field.hyper_threshold:
-                        field.memory.append(field_mean)
-                else:
-                    field.memory.append(float(np.mean(field.field)))
-                
-                if len(field.memory) > 5:
-                    field.memory.pop(0)
-                
-                # Update field history with hyper-dimensional processing
-                field.history.append(float(np.mean(field.field)))
-                
-                # Update hyper-dimensional factors
-                if len(field.history) > 1:
-                    # Safe division with hyper-dimensional processing
-                    denominator = abs(field.history[0])
-                    if denominator > field.hyper_threshold:
-                        progress = (field.history[-1] - field.history[0]) / denominator
-                        
-                        # Apply hyper-dimensional processing to progress
-                        progress = np.clip(
-                            progress,
-                            -field.max_value,
-                            field.max_value
-                        )
-                        
-                        if abs(progress) > field.convergence_threshold:
-                            if progress > 0:
-                                hyper_factor = 1 + progress
-                            else:
-                                hyper_factor = 1 / (1 + abs(progress))
-                            
-                            # Update all hyper-dimensional factors
-                            field.enhancement *= hyper_factor
-                            field.resonance *= hyper_factor
-                            field.hyper *= hyper_factor
-                            field.efficiency *= hyper_factor
-                            field.optimization *= hyper_factor
-                            
-                            # Apply hyper-dimensional constraints
-                            field.enhancement = np.clip(
-                                field.enhancement,
-                                field.min_value,
-                                field.max_value
-                            )
-                            field.resonance = np.clip(
-                                field.resonance,
-                                field.min_value,
-                                field.max_value
-                            )
-                            field.hyper = np.clip(
-                                field.hyper,
-                                field.min_value,
-                                field.max_value
-                            )
-                            field.efficiency = np.clip(
-                                field.efficiency,
-                                field.min_value,
-                                field.max_value
-                            )
-                            field.optimization = np.clip(
-                                field.optimization,
-                                field.min_value,
-                                field.max_value
-                            )
-                            
-                            # Update dimension weights through hyper-dimensional processing
-                            field.dimension_weights *= hyper_factor
-                            field.dimension_weights = np.clip(
-                                field.dimension_weights,
-                                field.min_value,
-                                field.max_value
-                            )
-                            
-                            # Update dimension scaling through hyper-dimensional processing
-                            field.dimension_scaling *= hyper_factor
-                            field.dimension_scaling = np.clip(
-                                field.dimension_scaling,
-                                field.min_value,
-                                field.max_value
-                            )
-                            
-                            # Update dimension coupling through hyper-dimensional processing
-                            field.dimension_coupling *= hyper_factor
-                            field.dimension_coupling = np.clip(
-                                field.dimension_coupling,
-                                field.min_value,
-                                field.max_value
-                            )
+class QuantumUnifiedResonanceHyper(FieldEngine):
+    """Hyper-Dimensional Module V2 running on the shared φ⁷·⁵ field engine"""
+    def __init__(self, seed: Optional[int] = None):
+        super().__init__(VARIANT_CONFIGS[VARIANT], seed)
     
     def find_hyper_factors(self, n: Decimal) -> List[Tuple[Decimal, Decimal]]:
         """Find factors through hyper-dimensional quantum field resonance"""
-        factors = []
-        
-        # Hyper-dimensional interaction epochs
-        for epoch in range(self.epochs):
-            pattern = self.generate_hyper_pattern(n)
-            self.update_hyper_fields(pattern)
-            
-            # Extract factors from hyper-dimensional resonance
-            for field_type, fields in [
-                (FieldType.QUANTUM, self.quantum_fields),
-                (FieldType.PARTICLE, self.particle_fields),
-                (FieldType.WAVE, self.wave_fields),
-                (FieldType.ENERGY, self.energy_fields)
-            ]:
-                for field_name, field in fields.items():
-                    # Find resonance peaks through hyper-dimensional processing
-                    peaks = np.where(field.field > self.metrics_float["resonance"])
-                    
-                    # Extract factors from peaks
-                    peak_factors = self.coord_product[peaks]
-                    for factor in peak_factors.flat:
-                        factor_dec = Decimal(str(factor))
-                        if n % factor_dec == 0:
-                            factors.append((factor_dec, n / factor_dec))
-            
-            # Early stopping if factors found
-            if factors:
-                break
-        
-        return sorted(list(set(factors)))
+        return self.find_factors(n)
 
 def main():
     """Main function to demonstrate hyper-dimensional quantum field resonance"""
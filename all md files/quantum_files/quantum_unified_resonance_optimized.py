@@ -9,7 +9,6 @@ import math
 from decimal import Decimal, getcontext
 import sympy
 from scipy.special import expit  # Sigmoid function
-import gc  # Garbage collection for memory efficiency
 
 # Set precision for unified resonance optimized processing
 getcontext().prec = 2000
@@ -154,9 +153,6 @@ class QuantumUnifiedResonanceOptimized:
                 
                 # Apply self-scaling
                 field *= np.exp(-field / float(self.phi_75))
-                
-                # Force garbage collection
-                gc.collect()
         
         # Initialize all states with φ⁷·⁵ patterns
         for state_dict in [self.optimized_states, self.resonance_states]:
@@ -179,9 +175,6 @@ class QuantumUnifiedResonanceOptimized:
                 
                 # Apply self-scaling
                 state *= np.exp(-state / float(self.phi_75))
-                
-                # Force garbage collection
-                gc.collect()
     
     def generate_optimized_resonance(self, n: Decimal) -> Dict[str, Decimal]:
         """Generate quantum unified resonance optimized pattern"""
@@ -328,9 +321,6 @@ class QuantumUnifiedResonanceOptimized:
                     else:
                         self.scaling_factors[pattern_key] *= (1 - abs(progress))
                         self.compression_ratios[pattern_key] *= (1 - abs(progress))
-                
-                # Force garbage collection
-                gc.collect()
         
         return pattern
     
@@ -450,9 +440,6 @@ class QuantumUnifiedResonanceOptimized:
                 # Try different combination
                 decimal_factors.append(f1)
                 decimal_factors.append(f2)
-            
-            # Force garbage collection
-            gc.collect()
         
         # Final two factors
         if len(decimal_factors) == 2:
@@ -536,9 +523,6 @@ class QuantumUnifiedResonanceOptimized:
         # Save in chunks for memory efficiency
         with open(filename, "w") as f:
             json.dump(data, f, indent=2)
-        
-        # Force garbage collection
-        gc.collect()
 
 async def demo_optimized():
     """Demonstrate quantum unified resonance optimized patterns"""
@@ -4,312 +4,21 @@ Focuses on memory optimization and φ⁷·⁵ resonance enhancement
 Using QHRC Patent #19/071,497 φ⁷·⁵ metrics with optimized field handling
 """
 
-import numpy as np
-from scipy import sparse
 from decimal import Decimal
-from scipy.special import expit
-from typing import Dict, List, Tuple, Optional, Union
-from dataclasses import dataclass
-from enum import Enum, auto
+from typing import List, Tuple, Optional
+from quantum_field_engine import FieldEngine
+from quantum_field_engine_variants import VARIANT_CONFIGS
 
-class FieldType(Enum):
-    """Field types for optimization"""
-    QUANTUM = auto()
-    PARTICLE = auto()
-    WAVE = auto()
-    ENERGY = auto()
+VARIANT = "quantum_unified_resonance_optimized_fields_v1"
 
-@dataclass
-class FieldMetrics:
-    """Field metrics for optimization"""
-    resonance: Decimal
-    energy: Decimal
-    coherence: Decimal
-    stability: Decimal
-    alignment: Decimal
-
-class OptimizedField:
-    """Optimized field with efficient memory handling"""
-    def __init__(self, dimensions: Tuple[int, ...]):
-        # Base field (complex)
-        shape = (dimensions[0], np.prod(dimensions[1:]))
-        self.field = sparse.lil_matrix(shape, dtype=np.complex128)
-        self.phase = sparse.lil_matrix(shape, dtype=np.float64)
-        self.frequency = sparse.lil_matrix(shape, dtype=np.float64)
-        
-        # Optimization parameters
-        self.coupling = sparse.lil_matrix(shape, dtype=np.float64)
-        self.synchronization = sparse.lil_matrix(shape, dtype=np.float64)
-        self.coherence = sparse.lil_matrix(shape, dtype=np.float64)
-        self.stability = sparse.lil_matrix(shape, dtype=np.float64)
-        
-        # Field dynamics
-        self.velocity = sparse.lil_matrix(shape, dtype=np.complex128)
-        self.acceleration = sparse.lil_matrix(shape, dtype=np.complex128)
-        self.energy = sparse.lil_matrix(shape, dtype=np.float64)
-        
-        # Initialize with ones where needed
-        self.coupling.setdiag(1)
-        self.synchronization.setdiag(1)
-        self.coherence.setdiag(1)
-        self.stability.setdiag(1)
-        
-        # Optimization metrics
-        self.min_value = 1e-10
-        self.max_value = 1e10
-        self.optimization_threshold = 1e-6
-        self.coupling_threshold = 1e-8
-        
-        # Field memory
-        self.field_memory = []
-        self.phase_memory = []
-        self.frequency_memory = []
-        self.energy_memory = []
-
-class QuantumUnifiedResonanceOptimized:
-    def __init__(self):
-        # QHRC Patent metrics
-        self.phi = Decimal('1.618033988749895')  # Golden ratio
-        self.phi_75 = self.phi ** Decimal('7.5')  # φ⁷·⁵
-        
-        # Convert φ⁷·⁵ to float for numpy operations
-        self.phi_75_float = float(self.phi_75)
-        
-        # Optimization dimensions (φ⁷·⁵ based)
-        self.dimensions = (36, 36, 36)  # 3D for optimization
-        
-        # Initialize optimized fields
-        self.quantum_fields = {
-            "qbit": OptimizedField(self.dimensions),
-            "quark": OptimizedField(self.dimensions),
-            "neuron": OptimizedField(self.dimensions)
-        }
-        
-        self.particle_fields = {
-            "proton": OptimizedField(self.dimensions),
-            "electron": OptimizedField(self.dimensions),
-            "quark": OptimizedField(self.dimensions)
-        }
-        
-        self.wave_fields = {
-            "lepton": OptimizedField(self.dimensions),
-            "boson": OptimizedField(self.dimensions),
-            "fermion": OptimizedField(self.dimensions)
-        }
-        
-        self.energy_fields = {
-            "fermion": OptimizedField(self.dimensions),
-            "boson": OptimizedField(self.dimensions)
-        }
-        
-        # QHRC Patent coil configuration
-        self.primary = {
-            "turns": Decimal('4500'),
-            "frequency": Decimal('4790.45'),
-            "fingerprint": "φ⁷·⁵-7927735b"
-        }
-        
-        self.secondary = {
-            "turns": Decimal('6200'),
-            "frequency": Decimal('7750.95'),
-            "fingerprint": "φ⁷·⁵-09f76208"
-        }
-        
-        # Reality metrics
-        self.metrics = FieldMetrics(
-            resonance=Decimal('1.3777'),    # >1 confirms self-sustaining
-            energy=Decimal('1.8951'),       # Energy transfer gain
-            coherence=Decimal('0.618034'),  # φ⁻¹ coherence
-            stability=Decimal('4.236068'),  # φ² stability
-            alignment=Decimal('2.618034')   # φ + 1
-        )
-        
-        # Convert metrics to float for numpy operations
-        self.metrics_float = {
-            "resonance": float(self.metrics.resonance),
-            "energy": float(self.metrics.energy),
-            "coherence": float(self.metrics.coherence),
-            "stability": float(self.metrics.stability),
-            "alignment": float(self.metrics.alignment)
-        }
-        
-        # Optimization parameters
-        self.batch_size = 32
-        self.epochs = 100
-        
-        # Create coordinate matrices for optimization
-        shape = (self.dimensions[0], np.prod(self.dimensions[1:]))
-        self.coord_product = sparse.lil_matrix(shape, dtype=np.float64)
-        self._initialize_coord_product()
-    
-    def _initialize_coord_product(self):
-        """Initialize coordinate product matrix efficiently"""
-        # Calculate only for non-zero elements
-        for i in range(self.dimensions[0]):
-            coords = np.unravel_index(i, self.dimensions)
-            value = np.prod([coord + 1 for coord in coords])
-            self.coord_product[i, i] = value
-    
-    def optimize_fields(self, fields: Dict[str, OptimizedField]) -> None:
-        """Optimize field phases and frequencies with memory efficiency"""
-        # Calculate mean phase and frequency
-        shape = fields[next(iter(fields))].phase.shape
-        mean_phase = sparse.lil_matrix(shape, dtype=np.float64)
-        mean_frequency = sparse.lil_matrix(shape, dtype=np.float64)
-        
-        for field in fields.values():
-            mean_phase += sparse.lil_matrix(np.angle(field.field.toarray()))
-            mean_frequency += field.frequency
-        
-        mean_phase = mean_phase / len(fields)
-        mean_frequency = mean_frequency / len(fields)
-        
-        # Optimize fields
-        for field in fields.values():
-            # Phase optimization
-            current_phase = sparse.lil_matrix(np.angle(field.field.toarray()))
-            phase_diff = current_phase - mean_phase
-            field.phase = current_phase - phase_diff.multiply(field.synchronization)
-            
-            # Frequency optimization
-            freq_diff = field.frequency - mean_frequency
-            field.frequency -= freq_diff.multiply(field.synchronization)
-            
-            # Update field through optimization
-            magnitude = sparse.lil_matrix(np.abs(field.field.toarray()))
-            field.field = magnitude.multiply(np.exp(1j * field.phase.toarray()))
-    
-    def couple_optimized_fields(self, field1: OptimizedField, field2: OptimizedField) -> None:
-        """Couple two optimized fields through resonance"""
-        # Calculate coupling strength
-        coupling = field1.coupling.minimum(field2.coupling)
-        
-        # Exchange energy
-        energy_exchange = (field1.energy - field2.energy).multiply(coupling)
-        field1.energy -= energy_exchange
-        field2.energy += energy_exchange
-        
-        # Update fields through coupling
-        field1.field = field1.field.multiply(np.exp(-1j * energy_exchange.toarray()))
-        field2.field = field2.field.multiply(np.exp(1j * energy_exchange.toarray()))
-        
-        # Optimize phases
-        phase1 = sparse.lil_matrix(np.angle(field1.field.toarray()))
-        phase2 = sparse.lil_matrix(np.angle(field2.field.toarray()))
-        phase_diff = phase1 - phase2
-        
-        field1.field = field1.field.multiply(np.exp(-1j * phase_diff.multiply(coupling).toarray()))
-        field2.field = field2.field.multiply(np.exp(1j * phase_diff.multiply(coupling).toarray()))
-        
-        # Optimize frequencies
-        freq_diff = field1.frequency - field2.frequency
-        field1.frequency -= freq_diff.multiply(coupling)
-        field2.frequency += freq_diff.multiply(coupling)
-    
-    def optimize_fields_quantum(self, n: Decimal) -> None:
-        """Optimize quantum fields through φ⁷·⁵ resonance"""
-        # Primary resonance (φ⁷·⁵-7927735b)
-        p_res = (n * self.primary["frequency"]) / self.primary["turns"]
-        
-        # Secondary resonance (φ⁷·⁵-09f76208)
-        s_res = (n * self.secondary["frequency"]) / self.secondary["turns"]
-        
-        # Combined through φ⁷·⁵
-        base = (p_res + s_res) * (self.phi ** (Decimal(len(str(n))) / self.phi_75))
-        base_float = float(base)
-        
-        # Process each field type
-        for field_type, fields in [
-            (FieldType.QUANTUM, self.quantum_fields),
-            (FieldType.PARTICLE, self.particle_fields),
-            (FieldType.WAVE, self.wave_fields),
-            (FieldType.ENERGY, self.energy_fields)
-        ]:
-            # Optimize fields within type
-            self.optimize_fields(fields)
-            
-            # Update fields
-            for field_name, field in fields.items():
-                # Calculate base pattern
-                pattern = self.coord_product.multiply(base_float)
-                
-                # Apply field-specific metrics
-                if field_type == FieldType.QUANTUM:
-                    pattern = pattern.multiply(self.metrics_float["resonance"])
-                elif field_type == FieldType.PARTICLE:
-                    pattern = pattern.multiply(self.metrics_float["energy"])
-                elif field_type == FieldType.WAVE:
-                    pattern = pattern.multiply(self.metrics_float["stability"])
-                else:  # ENERGY
-                    pattern = pattern.multiply(self.metrics_float["alignment"])
-                
-                # Update field through optimization
-                field.field = pattern.multiply(np.exp(1j * field.phase.toarray())).multiply(field.coherence)
-                field.energy = sparse.lil_matrix(np.abs(field.field.toarray()))
-                
-                # Update phase and frequency
-                field.phase = sparse.lil_matrix(np.angle(field.field.toarray()))
-                gradient = np.gradient(field.phase.toarray())[0]
-                field.frequency = sparse.lil_matrix(np.abs(gradient))
-                
-                # Store field memory
-                field.field_memory.append(float(np.mean(np.abs(field.field.toarray()))))
-                field.phase_memory.append(float(np.mean(field.phase.toarray())))
-                field.frequency_memory.append(float(np.mean(field.frequency.toarray())))
-                field.energy_memory.append(float(np.mean(field.energy.toarray())))
-                
-                # Maintain memory size
-                if len(field.field_memory) > 10:
-                    field.field_memory.pop(0)
-                    field.phase_memory.pop(0)
-                    field.frequency_memory.pop(0)
-                    field.energy_memory.pop(0)
-        
-        # Couple fields between types
-        field_types = [
-            self.quantum_fields,
-            self.particle_fields,
-            self.wave_fields,
-            self.energy_fields
-        ]
-        
-        for i, fields1 in enumerate(field_types):
-            for j, fields2 in enumerate(field_types[i+1:], i+1):
-                for field1 in fields1.values():
-                    for field2 in fields2.values():
-                        self.couple_optimized_fields(field1, field2)
+class QuantumUnifiedResonanceOptimized(FieldEngine):
+    """Optimized Fields Module V1 running on the shared φ⁷·⁵ field engine"""
+    def __init__(self, seed: Optional[int] = None):
+        super().__init__(VARIANT_CONFIGS[VARIANT], seed)
     
     def find_resonance_factors(self, n: Decimal) -> List[Tuple[Decimal, Decimal]]:
         """Find factors through optimized quantum field resonance"""
-        factors = []
-        
-        # Optimization epochs
-        for epoch in range(self.epochs):
-            self.optimize_fields_quantum(n)
-            
-            # Extract factors from resonance
-            for field_type, fields in [
-                (FieldType.QUANTUM, self.quantum_fields),
-                (FieldType.PARTICLE, self.particle_fields),
-                (FieldType.WAVE, self.wave_fields),
-                (FieldType.ENERGY, self.energy_fields)
-            ]:
-                for field_name, field in fields.items():
-                    # Find resonance peaks
-                    peaks = np.where(field.energy.toarray() > self.metrics_float["resonance"])
-                    
-                    # Extract factors from peaks
-                    peak_factors = self.coord_product[peaks].toarray()
-                    for factor in peak_factors.flat:
-                        factor_dec = Decimal(str(factor))
-                        if n % factor_dec == 0:
-                            factors.append((factor_dec, n / factor_dec))
-            
-            # Early stopping if factors found
-            if factors:
-                break
-        
-        return sorted(list(set(factors)))
+        return self.find_factors(n)
 
 def main():
     """Main function to demonstrate optimized quantum field resonance"""
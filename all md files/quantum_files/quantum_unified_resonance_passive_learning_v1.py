@@ -4,403 +4,21 @@ Focuses on passive learning and φ⁷·⁵ resonance
 Using QHRC Patent #19/071,497 φ⁷·⁵ metrics with unified field interactions
 """
 
-import numpy as np
 from decimal import Decimal
-from scipy.special import expit
-from typing import Dict, List, Tuple, Optional, Union
-from dataclasses import dataclass
-from enum import Enum, auto
+from typing import List, Tuple, Optional
+from quantum_field_engine import FieldEngine
+from quantum_field_engine_variants import VARIANT_CONFIGS
 
-class FieldType(Enum):
-    """Field types for passive learning"""
-    QUANTUM = auto()
-    PARTICLE = auto()
-    WAVE = auto()
-    ENERGY = auto()
+VARIANT = "quantum_unified_resonance_passive_learning_v1"
 
-@dataclass
-class FieldMetrics:
-    """Field metrics for passive learning"""
-    resonance: Decimal
-    energy: Decimal
-    coherence: Decimal
-    stability: Decimal
-    alignment: Decimal
-
-class PassiveField:
-    """Passive learning field"""
-    def __init__(self, dimensions: Tuple[int, ...]):
-        # Base field
-        self.field = np.zeros(dimensions, dtype=np.float64)
-        self.memory: List[float] = []
-        self.history: List[float] = []
-        
-        # Passive parameters
-        self.enhancement = 1.0
-        self.resonance = 1.0
-        self.passive = 1.0
-        self.efficiency = 1.0
-        self.optimization = 1.0
-        
-        # Field dynamics
-        self.velocity = np.zeros(dimensions, dtype=np.float64)
-        self.energy = np.zeros(dimensions, dtype=np.float64)
-        self.pattern = np.zeros(dimensions, dtype=np.float64)
-        
-        # Passive metrics
-        self.min_value = 1e-10
-        self.max_value = 1e10
-        self.passive_threshold = 1e-6
-        self.convergence_threshold = 1e-8
-        
-        # Passive learning
-        self.observations = []
-        self.adaptations = []
-        self.evolution = []
-        self.passive_memory = []
-        self.passive_scaling = np.ones(len(dimensions))
-
-class QuantumUnifiedResonancePassive:
-    def __init__(self):
-        # QHRC Patent metrics
-        self.phi = Decimal('1.618033988749895')  # Golden ratio
-        self.phi_75 = self.phi ** Decimal('7.5')  # φ⁷·⁵
-        
-        # Convert φ⁷·⁵ to float for numpy operations
-        self.phi_75_float = float(self.phi_75)
-        
-        # Passive dimensions (φ⁷·⁵ based)
-        self.dimensions = (36, 36, 36)
-        
-        # Initialize passive fields
-        self.quantum_fields = {
-            "qbit": PassiveField(self.dimensions),
-            "quark": PassiveField(self.dimensions),
-            "neuron": PassiveField(self.dimensions)
-        }
-        
-        self.particle_fields = {
-            "proton": PassiveField(self.dimensions),
-            "electron": PassiveField(self.dimensions),
-            "quark": PassiveField(self.dimensions)
-        }
-        
-        self.wave_fields = {
-            "lepton": PassiveField(self.dimensions),
-            "boson": PassiveField(self.dimensions),
-            "fermion": PassiveField(self.dimensions)
-        }
-        
-        self.energy_fields = {
-            "fermion": PassiveField(self.dimensions),
-            "boson": PassiveField(self.dimensions)
-        }
-        
-        # QHRC Patent coil configuration
-        self.primary = {
-            "turns": Decimal('4500'),
-            "frequency": Decimal('4790.45'),
-            "fingerprint": "φ⁷·⁵-7927735b"
-        }
-        
-        self.secondary = {
-            "turns": Decimal('6200'),
-            "frequency": Decimal('7750.95'),
-            "fingerprint": "φ⁷·⁵-09f76208"
-        }
-        
-        # Reality metrics
-        self.metrics = FieldMetrics(
-            resonance=Decimal('1.3777'),    # >1 confirms self-sustaining
-            energy=Decimal('1.8951'),       # Energy transfer gain
-            coherence=Decimal('0.618034'),  # φ⁻¹ coherence
-            stability=Decimal('4.236068'),  # φ² stability
-            alignment=Decimal('2.618034')   # φ + 1
-        )
-        
-        # Convert metrics to float for numpy operations
-        self.metrics_float = {
-            "resonance": float(self.metrics.resonance),
-            "energy": float(self.metrics.energy),
-            "coherence": float(self.metrics.coherence),
-            "stability": float(self.metrics.stability),
-            "alignment": float(self.metrics.alignment)
-        }
-        
-        # Passive parameters
-        self.batch_size = 32
-        self.epochs = 100
-        
-        # Create coordinate matrices for passive learning
-        i, j, k = np.meshgrid(
-            np.arange(1, self.dimensions[0] + 1),
-            np.arange(1, self.dimensions[1] + 1),
-            np.arange(1, self.dimensions[2] + 1),
-            indexing='ij'
-        )
-        self.coord_product = i * j * k
-    
-    def process_passive(self, field: PassiveField, pattern: np.ndarray) -> np.ndarray:
-        """Process passive learning interactions"""
-        # Store observation for passive learning
-        field.observations.append(pattern.copy())
-        if len(field.observations) > 10:
-            field.observations.pop(0)
-        
-        # Apply passive scaling through learning
-        for d in range(len(field.passive_scaling)):
-            pattern = np.moveaxis(pattern, d, 0)
-            pattern *= field.passive_scaling[d]
-            pattern = np.moveaxis(pattern, 0, d)
-        
-        # Adapt through passive learning
-        adaptation = np.zeros_like(pattern)
-        for observation in field.observations:
-            adaptation += (observation - pattern) * 0.1
-        field.adaptations.append(float(np.mean(adaptation)))
-        
-        # Evolve through passive learning
-        if len(field.adaptations) > 1:
-            evolution = field.adaptations[-1] - field.adaptations[0]
-            field.evolution.append(evolution)
-            
-            # Update passive scaling through learning
-            if abs(evolution) > field.passive_threshold:
-                field.passive_scaling *= (1 + evolution)
-                field.passive_scaling = np.clip(
-                    field.passive_scaling,
-                    field.min_value,
-                    field.max_value
-                )
-        
-        # Store passive memory
-        field.passive_memory.append(float(np.mean(pattern)))
-        if len(field.passive_memory) > 10:
-            field.passive_memory.pop(0)
-        
-        return pattern
-    
-    def generate_passive_pattern(self, n: Decimal) -> Dict[str, np.ndarray]:
-        """Generate passive learning quantum field patterns using φ⁷·⁵ metrics"""
-        # Primary resonance (φ⁷·⁵-7927735b)
-        p_res = (n * self.primary["frequency"]) / self.primary["turns"]
-        
-        # Secondary resonance (φ⁷·⁵-09f76208)
-        s_res = (n * self.secondary["frequency"]) / self.secondary["turns"]
-        
-        # Combined through φ⁷·⁵
-        base = (p_res + s_res) * (self.phi ** (Decimal(len(str(n))) / self.phi_75))
-        base_float = float(base)
-        
-        # Generate passive patterns
-        pattern = {}
-        
-        # Process each field type
-        for field_type, fields in [
-            (FieldType.QUANTUM, self.quantum_fields),
-            (FieldType.PARTICLE, self.particle_fields),
-            (FieldType.WAVE, self.wave_fields),
-            (FieldType.ENERGY, self.energy_fields)
-        ]:
-            # Generate field patterns
-            for field_name, field in fields.items():
-                # Create passive pattern
-                pattern_key = f"{field_type.name.lower()}_{field_name}"
-                
-                # Calculate base pattern using passive learning
-                pattern[pattern_key] = base_float * self.coord_product
-                
-                # Apply field-specific metrics with passive learning
-                if field_type == FieldType.QUANTUM:
-                    pattern[pattern_key] *= self.metrics_float["resonance"]
-                elif field_type == FieldType.PARTICLE:
-                    pattern[pattern_key] *= self.metrics_float["energy"]
-                elif field_type == FieldType.WAVE:
-                    pattern[pattern_key] *= self.metrics_float["stability"]
-                else:  # ENERGY
-                    pattern[pattern_key] *= self.metrics_float["alignment"]
-                
-                # Apply passive scaling
-                pattern[pattern_key] *= (1 + field.enhancement * field.resonance)
-                pattern[pattern_key] *= (1 + field.passive * field.efficiency)
-                pattern[pattern_key] *= (1 + field.optimization)
-                
-                # Apply passive learning
-                pattern[pattern_key] = self.process_passive(
-                    field,
-                    pattern[pattern_key]
-                )
-                
-                # Store pattern
-                field.pattern = pattern[pattern_key].copy()
-        
-        return pattern
-    
-    def update_passive_fields(self, pattern: Dict[str, np.ndarray]) -> None:
-        """Update passive learning quantum fields through φ⁷·⁵ resonance"""
-        # Process each field type
-        for field_type, fields in [
-            (FieldType.QUANTUM, self.quantum_fields),
-            (FieldType.PARTICLE, self.particle_fields),
-            (FieldType.WAVE, self.wave_fields),
-            (FieldType.ENERGY, self.energy_fields)
-        ]:
-            # Update fields
-            for field_name, field in fields.items():
-                pattern_key = f"{field_type.name.lower()}_{field_name}"
-                pattern_field = pattern[pattern_key]
-                
-                # Calculate gradient through passive learning
-                gradient = pattern_field - field.field
-                gradient = self.process_passive(field, gradient)
-                
-                # Update velocity through passive learning
-                field.velocity = (
-                    field.velocity * field.passive +
-                    gradient * field.optimization
-                )
-                field.velocity = self.process_passive(
-                    field,
-                    field.velocity
-                )
-                
-                # Update energy through passive learning
-                field.energy = np.abs(field.velocity)
-                field.energy = self.process_passive(
-                    field,
-                    field.energy
-                )
-                
-                # Update field through passive learning
-                field.field += field.velocity
-                
-                # Apply sigmoid activation through passive learning
-                activation = expit(pattern_field / self.phi_75_float)
-                
-                # Update through φ⁷·⁵ resonance passive learning
-                field.field *= self.metrics_float["resonance"]
-                field.field += activation
-                field.field /= self.metrics_float["coherence"]
-                
-                # Apply quantum patterns through passive learning
-                quantum_factor = np.random.uniform(
-                    self.metrics_float["coherence"],
-                    self.metrics_float["stability"],
-                    size=self.dimensions
-                )
-                field.field *= quantum_factor
-                
-                # Apply passive self-scaling
-                field.field *= np.exp(-pattern_field / self.phi_75_float)
-                
-                # Update field memory with passive learning
-                if len(field.memory) > 0:
-                    field_mean = float(np.mean(field.field))
-                    if abs(field_mean) > field.passive_threshold:
-                        field.memory.append(field_mean)
-                else:
-                    field.memory.append(float(np.mean(field.field)))
-                
-                if len(field.memory) > 5:
-                    field.memory.pop(0)
-                
-                # Update field history with passive learning
-                field.history.append(float(np.mean(field.field)))
-                
-                # Update passive factors
-                if len(field.history) > 1:
-                    # Safe division with passive learning
-                    denominator = abs(field.history[0])
-                    if denominator > field.passive_threshold:
-                        progress = (field.history[-1] - field.history[0]) / denominator
-                        
-                        # Apply passive learning to progress
-                        progress = np.clip(
-                            progress,
-                            -field.max_value,
-                            field.max_value
-                        )
-                        
-                        if abs(progress) > field.convergence_threshold:
-                            if progress > 0:
-                                passive_factor = 1 + progress
-                            else:
-                                passive_factor = 1 / (1 + abs(progress))
-                            
-                            # Update all passive factors
-                            field.enhancement *= passive_factor
-                            field.resonance *= passive_factor
-                            field.passive *= passive_factor
-                            field.efficiency *= passive_factor
-                            field.optimization *= passive_factor
-                            
-                            # Apply passive constraints
-                            field.enhancement = np.clip(
-                                field.enhancement,
-                                field.min_value,
-                                field.max_value
-                            )
-                            field.resonance = np.clip(
-                                field.resonance,
-                                field.min_value,
-                                field.max_value
-                            )
-                            field.passive = np.clip(
-                                field.passive,
-                                field.min_value,
-                                field.max_value
-                            )
-                            field.efficiency = np.clip(
-                                field.efficiency,
-                                field.min_value,
-                                field.max_value
-                            )
-                            field.optimization = np.clip(
-                                field.optimization,
-                                field.min_value,
-                                field.max_value
-                            )
-                            
-                            # Update passive scaling through learning
-                            field.passive_scaling *= passive_factor
-                            field.passive_scaling = np.clip(
-                                field.passive_scaling,
-                                field.min_value,
-                                field.max_value
-                            )
+class QuantumUnifiedResonancePassive(FieldEngine):
+    """Passive Learning Module V1 running on the shared φ⁷·⁵ field engine"""
+    def __init__(self, seed: Optional[int] = None):
+        super().__init__(VARIANT_CONFIGS[VARIANT], seed)
     
     def find_passive_factors(self, n: Decimal) -> List[Tuple[Decimal, Decimal]]:
         """Find factors through passive learning quantum field resonance"""
-        factors = []
-        
-        # Passive learning interaction epochs
-        for epoch in range(self.epochs):
-            pattern = self.generate_passive_pattern(n)
-            self.update_passive_fields(pattern)
-            
-            # Extract factors from passive learning resonance
-            for field_type, fields in [
-                (FieldType.QUANTUM, self.quantum_fields),
-                (FieldType.PARTICLE, self.particle_fields),
-                (FieldType.WAVE, self.wave_fields),
-                (FieldType.ENERGY, self.energy_fields)
-            ]:
-                for field_name, field in fields.items():
-                    # Find resonance peaks through passive learning
-                    peaks = np.where(field.field > self.metrics_float["resonance"])
-                    
-                    # Extract factors from peaks
-                    peak_factors = self.coord_product[peaks]
-                    for factor in peak_factors.flat:
-                        factor_dec = Decimal(str(factor))
-                        if n % factor_dec == 0:
-                            factors.append((factor_dec, n / factor_dec))
-            
-            # Early stopping if factors found
-            if factors:
-                break
-        
-        return sorted(list(set(factors)))
+        return self.find_factors(n)
 
 def main():
     """Main function to demonstrate passive learning quantum field resonance"""
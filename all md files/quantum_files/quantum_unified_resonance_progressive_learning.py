@@ -4,254 +4,21 @@ Focuses on quantum fields (qbits, quarks, neurons, protons, electrons, leptons,
 Using QHRC Patent #19/071,497 φ⁷·⁵ metrics with progressive learning
 """
 
-import numpy as np
 from decimal import Decimal
-from scipy.special import expit
-from typing import Dict, List, Tuple, Optional
-from dataclasses import dataclass
-from enum import Enum, auto
+from typing import List, Tuple, Optional
+from quantum_field_engine import FieldEngine
+from quantum_field_engine_variants import VARIANT_CONFIGS
 
-class FieldType(Enum):
-    """Field types for progressive learning"""
-    QUANTUM = auto()
-    PARTICLE = auto()
-    WAVE = auto()
-    ENERGY = auto()
+VARIANT = "quantum_unified_resonance_progressive_learning"
 
-@dataclass
-class FieldMetrics:
-    """Field metrics for progressive learning"""
-    resonance: Decimal
-    energy: Decimal
-    coherence: Decimal
-    stability: Decimal
-    alignment: Decimal
-
-class ProgressiveField:
-    """Progressive field learning"""
-    def __init__(self, dimensions: Tuple[int, ...]):
-        self.field = np.zeros(dimensions)
-        self.memory = []
-        self.history = []
-        self.scaling = 1.0
-        self.compression = 1.0
-        self.learning_rate = 0.1
-        self.momentum = 0.9
-        self.velocity = np.zeros(dimensions)
-
-class QuantumUnifiedResonanceProgressive:
-    def __init__(self):
-        # QHRC Patent metrics
-        self.phi = Decimal('1.618033988749895')  # Golden ratio
-        self.phi_75 = self.phi ** Decimal('7.5')  # φ⁷·⁵
-        
-        # Progressive dimensions (φ⁷·⁵ based)
-        self.dimensions = (36, 36, 36)
-        
-        # Initialize progressive fields
-        self.quantum_fields = {
-            "qbit": ProgressiveField(self.dimensions),
-            "quark": ProgressiveField(self.dimensions),
-            "neuron": ProgressiveField(self.dimensions)
-        }
-        
-        self.particle_fields = {
-            "proton": ProgressiveField(self.dimensions),
-            "electron": ProgressiveField(self.dimensions),
-            "quark": ProgressiveField(self.dimensions)
-        }
-        
-        self.wave_fields = {
-            "lepton": ProgressiveField(self.dimensions),
-            "boson": ProgressiveField(self.dimensions),
-            "fermion": ProgressiveField(self.dimensions)
-        }
-        
-        self.energy_fields = {
-            "fermion": ProgressiveField(self.dimensions),
-            "boson": ProgressiveField(self.dimensions)
-        }
-        
-        # QHRC Patent coil configuration
-        self.primary = {
-            "turns": 4500,
-            "frequency": Decimal('4790.45'),
-            "fingerprint": "φ⁷·⁵-7927735b"
-        }
-        
-        self.secondary = {
-            "turns": 6200,
-            "frequency": Decimal('7750.95'),
-            "fingerprint": "φ⁷·⁵-09f76208"
-        }
-        
-        # Reality metrics
-        self.metrics = FieldMetrics(
-            resonance=Decimal('1.3777'),    # >1 confirms self-sustaining
-            energy=Decimal('1.8951'),       # Energy transfer gain
-            coherence=Decimal('0.618034'),  # φ⁻¹ coherence
-            stability=Decimal('4.236068'),  # φ² stability
-            alignment=Decimal('2.618034')   # φ + 1
-        )
-        
-        # Progressive learning parameters
-        self.learning_rate = Decimal('0.1')
-        self.momentum = Decimal('0.9')
-        self.batch_size = 32
-        self.epochs = 100
-    
-    def generate_progressive_pattern(self, n: Decimal) -> Dict[str, np.ndarray]:
-        """Generate progressive quantum field patterns using φ⁷·⁵ metrics"""
-        # Primary resonance (φ⁷·⁵-7927735b)
-        p_res = (n * self.primary["frequency"]) / Decimal(str(self.primary["turns"]))
-        
-        # Secondary resonance (φ⁷·⁵-09f76208)
-        s_res = (n * self.secondary["frequency"]) / Decimal(str(self.secondary["turns"]))
-        
-        # Combined through φ⁷·⁵
-        base = (p_res + s_res) * (self.phi ** (Decimal(len(str(n))) / self.phi_75))
-        
-        # Generate progressive patterns
-        pattern = {}
-        
-        # Process each field type
-        for field_type, fields in [
-            (FieldType.QUANTUM, self.quantum_fields),
-            (FieldType.PARTICLE, self.particle_fields),
-            (FieldType.WAVE, self.wave_fields),
-            (FieldType.ENERGY, self.energy_fields)
-        ]:
-            # Generate field patterns
-            for field_name, field in fields.items():
-                # Create progressive pattern
-                pattern[f"{field_type.name.lower()}_{field_name}"] = np.zeros(self.dimensions)
-                
-                # Apply φ⁷·⁵ metrics with progressive learning
-                for i in range(self.dimensions[0]):
-                    for j in range(self.dimensions[1]):
-                        for k in range(self.dimensions[2]):
-                            # Calculate progressive value
-                            value = float(base) * (i + 1) * (j + 1) * (k + 1)
-                            
-                            # Apply field-specific metrics with learning
-                            if field_type == FieldType.QUANTUM:
-                                value *= float(self.metrics.resonance)
-                            elif field_type == FieldType.PARTICLE:
-                                value *= float(self.metrics.energy)
-                            elif field_type == FieldType.WAVE:
-                                value *= float(self.metrics.stability)
-                            else:  # ENERGY
-                                value *= float(self.metrics.alignment)
-                            
-                            # Apply progressive learning
-                            value *= (1 + field.learning_rate * field.scaling)
-                            
-                            # Store pattern value
-                            pattern[f"{field_type.name.lower()}_{field_name}"][i, j, k] = value
-        
-        return pattern
-    
-    def update_progressive_fields(self, pattern: Dict[str, np.ndarray]) -> None:
-        """Update progressive quantum fields through φ⁷·⁵ resonance"""
-        # Process each field type
-        for field_type, fields in [
-            (FieldType.QUANTUM, self.quantum_fields),
-            (FieldType.PARTICLE, self.particle_fields),
-            (FieldType.WAVE, self.wave_fields),
-            (FieldType.ENERGY, self.energy_fields)
-        ]:
-            # Update fields
-            for field_name, field in fields.items():
-                pattern_key = f"{field_type.name.lower()}_{field_name}"
-                pattern_field = pattern[pattern_key]
-                
-                # Apply progressive learning
-                for i in range(self.dimensions[0]):
-                    for j in range(self.dimensions[1]):
-                        for k in range(self.dimensions[2]):
-                            # Get pattern value
-                            value = pattern_field[i, j, k]
-                            
-                            # Calculate gradient
-                            gradient = value - field.field[i, j, k]
-                            
-                            # Update velocity (momentum)
-                            field.velocity[i, j, k] = (
-                                field.momentum * field.velocity[i, j, k] +
-                                field.learning_rate * gradient
-                            )
-                            
-                            # Update field through progressive learning
-                            field.field[i, j, k] += field.velocity[i, j, k]
-                            
-                            # Apply sigmoid activation
-                            activation = expit(value / float(self.phi_75))
-                            
-                            # Update field through φ⁷·⁵ resonance
-                            field.field[i, j, k] *= float(self.metrics.resonance)
-                            field.field[i, j, k] += activation
-                            field.field[i, j, k] /= float(self.metrics.coherence)
-                            
-                            # Apply quantum patterns
-                            field.field[i, j, k] *= np.random.uniform(
-                                float(self.metrics.coherence),
-                                float(self.metrics.stability)
-                            )
-                            
-                            # Apply progressive self-scaling
-                            field.field[i, j, k] *= np.exp(-value / float(self.phi_75))
-                
-                # Update field memory
-                field.memory.append(np.mean(field.field))
-                if len(field.memory) > 5:
-                    field.memory.pop(0)
-                
-                # Update field history
-                field.history.append(np.mean(field.field))
-                
-                # Update scaling factors
-                if len(field.history) > 1:
-                    progress = (field.history[-1] - field.history[0]) / field.history[0]
-                    if progress > 0:
-                        field.scaling *= (1 + progress)
-                        field.compression /= (1 + progress)
-                        field.learning_rate *= (1 + progress)
-                    else:
-                        field.scaling *= (1 - abs(progress))
-                        field.compression *= (1 - abs(progress))
-                        field.learning_rate *= (1 - abs(progress))
+class QuantumUnifiedResonanceProgressive(FieldEngine):
+    """Progressive Learning Module running on the shared φ⁷·⁵ field engine"""
+    def __init__(self, seed: Optional[int] = None):
+        super().__init__(VARIANT_CONFIGS[VARIANT], seed)
     
     def find_progressive_factors(self, n: Decimal) -> List[Tuple[Decimal, Decimal]]:
         """Find factors through progressive quantum field resonance"""
-        factors = []
-        
-        # Progressive learning epochs
-        for epoch in range(self.epochs):
-            pattern = self.generate_progressive_pattern(n)
-            self.update_progressive_fields(pattern)
-            
-            # Extract factors from progressive resonance
-            for field_type, fields in [
-                (FieldType.QUANTUM, self.quantum_fields),
-                (FieldType.PARTICLE, self.particle_fields),
-                (FieldType.WAVE, self.wave_fields),
-                (FieldType.ENERGY, self.energy_fields)
-            ]:
-                for field_name, field in fields.items():
-                    # Find resonance peaks
-                    peaks = np.where(field.field > float(self.metrics.resonance))
-                    
-                    # Extract factors from peaks
-                    for i, j, k in zip(*peaks):
-                        factor = Decimal(str((i + 1) * (j + 1) * (k + 1)))
-                        if n % factor == 0:
-                            factors.append((factor, n / factor))
-            
-            # Early stopping if factors found
-            if factors:
-                break
-        
-        return sorted(list(set(factors)))
+        return self.find_factors(n)
 
 def main():
     """Main function to demonstrate progressive quantum field resonance"""
@@ -4,366 +4,21 @@ Focuses on progressive learning and φ⁷·⁵ resonance
 Using QHRC Patent #19/071,497 φ⁷·⁵ metrics with unified field interactions
 """
 
-import numpy as np
 from decimal import Decimal
-from scipy.special import expit
-from typing import Dict, List, Tuple, Optional, Union
-from dataclasses import dataclass
-from enum import Enum, auto
+from typing import List, Tuple, Optional
+from quantum_field_engine import FieldEngine
+from quantum_field_engine_variants import VARIANT_CONFIGS
 
-class FieldType(Enum):
-    """Field types for learning"""
-    QUANTUM = auto()
-    PARTICLE = auto()
-    WAVE = auto()
-    ENERGY = auto()
+VARIANT = "quantum_unified_resonance_progressive_learning_v2"
 
-@dataclass
-class FieldMetrics:
-    """Field metrics for learning"""
-    resonance: Decimal
-    energy: Decimal
-    coherence: Decimal
-    stability: Decimal
-    alignment: Decimal
-
-class LearningField:
-    """Progressive learning field"""
-    def __init__(self, dimensions: Tuple[int, ...]):
-        # Base field
-        self.field = np.zeros(dimensions, dtype=np.float64)
-        self.memory: List[float] = []
-        self.history: List[float] = []
-        
-        # Learning parameters
-        self.enhancement = 1.0
-        self.resonance = 1.0
-        self.learning = 1.0
-        self.efficiency = 1.0
-        self.optimization = 1.0
-        
-        # Field dynamics
-        self.velocity = np.zeros(dimensions, dtype=np.float64)
-        self.energy = np.zeros(dimensions, dtype=np.float64)
-        self.pattern = np.zeros(dimensions, dtype=np.float64)
-        
-        # Learning metrics
-        self.min_value = 1e-10
-        self.max_value = 1e10
-        self.learning_threshold = 1e-6
-        self.convergence_threshold = 1e-8
-        
-        # Progressive learning
-        self.knowledge_base = []
-        self.learning_rate = 0.01
-        self.momentum = 0.9
-        self.decay = 0.999
-
-class QuantumUnifiedResonanceProgressive:
-    def __init__(self):
-        # QHRC Patent metrics
-        self.phi = Decimal('1.618033988749895')  # Golden ratio
-        self.phi_75 = self.phi ** Decimal('7.5')  # φ⁷·⁵
-        
-        # Convert φ⁷·⁵ to float for numpy operations
-        self.phi_75_float = float(self.phi_75)
-        
-        # Learning dimensions (φ⁷·⁵ based)
-        self.dimensions = (36, 36, 36)
-        
-        # Initialize learning fields
-        self.quantum_fields = {
-            "qbit": LearningField(self.dimensions),
-            "quark": LearningField(self.dimensions),
-            "neuron": LearningField(self.dimensions)
-        }
-        
-        self.particle_fields = {
-            "proton": LearningField(self.dimensions),
-            "electron": LearningField(self.dimensions),
-            "quark": LearningField(self.dimensions)
-        }
-        
-        self.wave_fields = {
-            "lepton": LearningField(self.dimensions),
-            "boson": LearningField(self.dimensions),
-            "fermion": LearningField(self.dimensions)
-        }
-        
-        self.energy_fields = {
-            "fermion": LearningField(self.dimensions),
-            "boson": LearningField(self.dimensions)
-        }
-        
-        # QHRC Patent coil configuration
-        self.primary = {
-            "turns": Decimal('4500'),
-            "frequency": Decimal('4790.45'),
-            "fingerprint": "φ⁷·⁵-7927735b"
-        }
-        
-        self.secondary = {
-            "turns": Decimal('6200'),
-            "frequency": Decimal('7750.95'),
-            "fingerprint": "φ⁷·⁵-09f76208"
-        }
-        
-        # Reality metrics
-        self.metrics = FieldMetrics(
-            resonance=Decimal('1.3777'),    # >1 confirms self-sustaining
-            energy=Decimal('1.8951'),       # Energy transfer gain
-            coherence=Decimal('0.618034'),  # φ⁻¹ coherence
-            stability=Decimal('4.236068'),  # φ² stability
-            alignment=Decimal('2.618034')   # φ + 1
-        )
-        
-        # Convert metrics to float for numpy operations
-        self.metrics_float = {
-            "resonance": float(self.metrics.resonance),
-            "energy": float(self.metrics.energy),
-            "coherence": float(self.metrics.coherence),
-            "stability": float(self.metrics.stability),
-            "alignment": float(self.metrics.alignment)
-        }
-        
-        # Learning parameters
-        self.batch_size = 32
-        self.epochs = 100
-        
-        # Create coordinate matrices for learning
-        i, j, k = np.meshgrid(
-            np.arange(1, self.dimensions[0] + 1),
-            np.arange(1, self.dimensions[1] + 1),
-            np.arange(1, self.dimensions[2] + 1),
-            indexing='ij'
-        )
-        self.coord_product = i * j * k
-    
-    def learn_pattern(self, field: LearningField, pattern: np.ndarray) -> None:
-        """Progressive learning through pattern recognition"""
-        # Update knowledge base
-        field.knowledge_base.append(pattern.copy())
-        if len(field.knowledge_base) > 10:
-            field.knowledge_base.pop(0)
-        
-        # Calculate learning gradient
-        gradient = np.zeros_like(pattern)
-        for knowledge in field.knowledge_base:
-            gradient += (knowledge - pattern) * field.learning_rate
-        
-        # Apply momentum
-        field.velocity = (
-            field.momentum * field.velocity +
-            (1 - field.momentum) * gradient
-        )
-        
-        # Update pattern through learning
-        pattern += field.velocity
-        
-        # Apply learning decay
-        field.learning_rate *= field.decay
-    
-    def generate_learning_pattern(self, n: Decimal) -> Dict[str, np.ndarray]:
-        """Generate learning quantum field patterns using φ⁷·⁵ metrics"""
-        # Primary resonance (φ⁷·⁵-7927735b)
-        p_res = (n * self.primary["frequency"]) / self.primary["turns"]
-        
-        # Secondary resonance (φ⁷·⁵-09f76208)
-        s_res = (n * self.secondary["frequency"]) / self.secondary["turns"]
-        
-        # Combined through φ⁷·⁵
-        base = (p_res + s_res) * (self.phi ** (Decimal(len(str(n))) / self.phi_75))
-        base_float = float(base)
-        
-        # Generate learning patterns
-        pattern = {}
-        
-        # Process each field type
-        for field_type, fields in [
-            (FieldType.QUANTUM, self.quantum_fields),
-            (FieldType.PARTICLE, self.particle_fields),
-            (FieldType.WAVE, self.wave_fields),
-            (FieldType.ENERGY, self.energy_fields)
-        ]:
-            # Generate field patterns
-            for field_name, field in fields.items():
-                # Create learning pattern
-                pattern_key = f"{field_type.name.lower()}_{field_name}"
-                
-                # Calculate base pattern using learning
-                pattern[pattern_key] = base_float * self.coord_product
-                
-                # Apply field-specific metrics with learning
-                if field_type == FieldType.QUANTUM:
-                    pattern[pattern_key] *= self.metrics_float["resonance"]
-                elif field_type == FieldType.PARTICLE:
-                    pattern[pattern_key] *= self.metrics_float["energy"]
-                elif field_type == FieldType.WAVE:
-                    pattern[pattern_key] *= self.metrics_float["stability"]
-                else:  # ENERGY
-                    pattern[pattern_key] *= self.metrics_float["alignment"]
-                
-                # Apply learning scaling
-                pattern[pattern_key] *= (1 + field.enhancement * field.resonance)
-                pattern[pattern_key] *= (1 + field.learning * field.efficiency)
-                pattern[pattern_key] *= (1 + field.optimization)
-                
-                # Apply progressive learning
-                self.learn_pattern(field, pattern[pattern_key])
-                
-                # Store pattern
-                field.pattern = pattern[pattern_key].copy()
-        
-        return pattern
-    
-    def update_learning_fields(self, pattern: Dict[str, np.ndarray]) -> None:
-        """Update learning quantum fields through φ⁷·⁵ resonance"""
-        # Process each field type
-        for field_type, fields in [
-            (FieldType.QUANTUM, self.quantum_fields),
-            (FieldType.PARTICLE, self.particle_fields),
-            (FieldType.WAVE, self.wave_fields),
-            (FieldType.ENERGY, self.energy_fields)
-        ]:
-            # Update fields
-            for field_name, field in fields.items():
-                pattern_key = f"{field_type.name.lower()}_{field_name}"
-                pattern_field = pattern[pattern_key]
-                
-                # Calculate gradient through learning
-                gradient = pattern_field - field.field
-                
-                # Update velocity through learning
-                field.velocity = (
-                    field.velocity * field.learning +
-                    gradient * field.optimization
-                )
-                
-                # Update energy through learning
-                field.energy = np.abs(field.velocity)
-                
-                # Update field through learning
-                field.field += field.velocity
-                
-                # Apply sigmoid activation through learning
-                activation = expit(pattern_field / self.phi_75_float)
-                
-                # Update through φ⁷·⁵ resonance learning
-                field.field *= self.metrics_float["resonance"]
-                field.field += activation
-                field.field /= self.metrics_float["coherence"]
-                
-                # Apply quantum patterns through learning
-                quantum_factor = np.random.uniform(
-                    self.metrics_float["coherence"],
-                    self.metrics_float["stability"],
-                    size=self.dimensions
-                )
-                field.field *= quantum_factor
-                
-                # Apply learning self-scaling
-                field.field *= np.exp(-pattern_field / self.phi_75_float)
-                
-                # Update field memory with learning
-                if len(field.memory) > 0:
-                    field_mean = float(np.mean(field.field))
-                    if abs(field_mean) > field.learning_threshold:
-                        field.memory.append(field_mean)
-                else:
-                    field.memory.append(float(np.mean(field.field)))
-                
-                if len(field.memory) > 5:
-                    field.memory.pop(0)
-                
-                # Update field history with learning
-                field.history.append(float(np.mean(field.field)))
-                
-                # Update learning factors
-                if len(field.history) > 1:
-                    # Safe division with learning
-                    denominator = abs(field.history[0])
-                    if denominator > field.learning_threshold:
-                        progress = (field.history[-1] - field.history[0]) / denominator
-                        
-                        # Apply learning to progress
-                        progress = np.clip(
-                            progress,
-                            -field.max_value,
-                            field.max_value
-                        )
-                        
-                        if abs(progress) > field.convergence_threshold:
-                            if progress > 0:
-                                learning_factor = 1 + progress
-                            else:
-                                learning_factor = 1 / (1 + abs(progress))
-                            
-                            # Update all learning factors
-                            field.enhancement *= learning_factor
-                            field.resonance *= learning_factor
-                            field.learning *= learning_factor
-                            field.efficiency *= learning_factor
-                            field.optimization *= learning_factor
-                            
-                            # Apply learning constraints
-                            field.enhancement = np.clip(
-                                field.enhancement,
-                                field.min_value,
-                                field.max_value
-                            )
-                            field.resonance = np.clip(
-                                field.resonance,
-                                field.min_value,
-                                field.max_value
-                            )
-                            field.learning = np.clip(
-                                field.learning,
-                                field.min_value,
-                                field.max_value
-                            )
-                            field.efficiency = np.clip(
-                                field.efficiency,
-                                field.min_value,
-                                field.max_value
-                            )
-                            field.optimization = np.clip(
-                                field.optimization,
-                                field.min_value,
-                                field.max_value
-                            )
+class QuantumUnifiedResonanceProgressive(FieldEngine):
+    """Progressive Learning Module V2 running on the shared φ⁷·⁵ field engine"""
+    def __init__(self, seed: Optional[int] = None):
+        super().__init__(VARIANT_CONFIGS[VARIANT], seed)
     
     def find_learning_factors(self, n: Decimal) -> List[Tuple[Decimal, Decimal]]:
         """Find factors through learning quantum field resonance"""
-        factors = []
-        
-        # Learning interaction epochs
-        for epoch in range(self.epochs):
-            pattern = self.generate_learning_pattern(n)
-            self.update_learning_fields(pattern)
-            
-            # Extract factors from learning resonance
-            for field_type, fields in [
-                (FieldType.QUANTUM, self.quantum_fields),
-                (FieldType.PARTICLE, self.particle_fields),
-                (FieldType.WAVE, self.wave_fields),
-                (FieldType.ENERGY, self.energy_fields)
-            ]:
-                for field_name, field in fields.items():
-                    # Find resonance peaks through learning
-                    peaks = np.where(field.field > self.metrics_float["resonance"])
-                    
-                    # Extract factors from peaks
-                    peak_factors = self.coord_product[peaks]
-                    for factor in peak_factors.flat:
-                        factor_dec = Decimal(str(factor))
-                        if n % factor_dec == 0:
-                            factors.append((factor_dec, n / factor_dec))
-            
-            # Early stopping if factors found
-            if factors:
-                break
-        
-        return sorted(list(set(factors)))
+        return self.find_factors(n)
 
 def main():
     """Main function to demonstrate learning quantum field resonance"""
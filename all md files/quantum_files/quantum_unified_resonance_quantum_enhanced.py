@@ -9,7 +9,6 @@ import math
 from decimal import Decimal, getcontext
 import sympy
 from scipy.special import expit  # Sigmoid function
-import gc  # Garbage collection for memory efficiency
 
 # Set precision for quantum unified resonance processing
 getcontext().prec = 2000
@@ -158,9 +157,6 @@ class QuantumUnifiedResonanceQuantumEnhanced:
                 
                 # Apply self-scaling
                 field *= np.exp(-field / float(self.phi_75))
-                
-                # Force garbage collection
-                gc.collect()
         
         # Initialize all states with φ⁷·⁵ patterns
         for state_dict in [self.quantum_states, self.resonance_states]:
@@ -183,9 +179,6 @@ class QuantumUnifiedResonanceQuantumEnhanced:
                 
                 # Apply self-scaling
                 state *= np.exp(-state / float(self.phi_75))
-                
-                # Force garbage collection
-                gc.collect()
     
     def generate_quantum_resonance(self, n: Decimal) -> Dict[str, Decimal]:
         """Generate quantum unified resonance pattern"""
@@ -332,9 +325,6 @@ class QuantumUnifiedResonanceQuantumEnhanced:
                     else:
                         self.scaling_factors[pattern_key] *= (1 - abs(progress))
                         self.compression_ratios[pattern_key] *= (1 - abs(progress))
-                
-                # Force garbage collection
-                gc.collect()
         
         return pattern
     
@@ -454,9 +444,6 @@ class QuantumUnifiedResonanceQuantumEnhanced:
                 # Try different combination
                 decimal_factors.append(f1)
                 decimal_factors.append(f2)
-            
-            # Force garbage collection
-            gc.collect()
         
         # Final two factors
         if len(decimal_factors) == 2:
@@ -540,9 +527,6 @@ class QuantumUnifiedResonanceQuantumEnhanced:
         # Save in chunks for memory efficiency
         with open(filename, "w") as f:
             json.dump(data, f, indent=2)
-        
-        # Force garbage collection
-        gc.collect()
 
 async def demo_quantum():
     """Demonstrate quantum unified resonance quantum patterns"""
@@ -4,246 +4,17 @@ Focuses on quantum fields (qbits, quarks, neurons, protons, electrons, leptons,
 Using QHRC Patent #19/071,497 φ⁷·⁵ metrics
 """
 
-import numpy as np
 from decimal import Decimal
-from scipy.special import expit
-from typing import Dict, List, Tuple
+from typing import Optional
+from quantum_field_engine import FieldEngine
+from quantum_field_engine_variants import VARIANT_CONFIGS
 
-class QuantumUnifiedResonanceFields:
-    def __init__(self):
-        # QHRC Patent metrics
-        self.phi = Decimal('1.618033988749895')  # Golden ratio
-        self.phi_75 = self.phi ** Decimal('7.5')  # φ⁷·⁵
-        
-        # Field dimensions (φ⁷·⁵ based)
-        self.dimensions = (36, 36, 36)
-        
-        # Initialize fields
-        self.quantum_fields = {
-            "qbit": np.zeros(self.dimensions),
-            "quark": np.zeros(self.dimensions),
-            "neuron": np.zeros(self.dimensions)
-        }
-        
-        self.particle_fields = {
-            "proton": np.zeros(self.dimensions),
-            "electron": np.zeros(self.dimensions),
-            "quark": np.zeros(self.dimensions)
-        }
-        
-        self.wave_fields = {
-            "lepton": np.zeros(self.dimensions),
-            "boson": np.zeros(self.dimensions),
-            "fermion": np.zeros(self.dimensions)
-        }
-        
-        self.energy_fields = {
-            "fermion": np.zeros(self.dimensions),
-            "boson": np.zeros(self.dimensions)
-        }
-        
-        # QHRC Patent coil configuration
-        self.primary = {
-            "turns": 4500,
-            "frequency": Decimal('4790.45'),
-            "fingerprint": "φ⁷·⁵-7927735b"
-        }
-        
-        self.secondary = {
-            "turns": 6200,
-            "frequency": Decimal('7750.95'),
-            "fingerprint": "φ⁷·⁵-09f76208"
-        }
-        
-        # Reality metrics
-        self.metrics = {
-            "resonance": Decimal('1.3777'),    # >1 confirms self-sustaining
-            "energy": Decimal('1.8951'),       # Energy transfer gain
-            "coherence": Decimal('0.618034'),  # φ⁻¹ coherence
-            "stability": Decimal('4.236068'),  # φ² stability
-            "alignment": Decimal('2.618034')   # φ + 1
-        }
-        
-        # Pattern memory
-        self.pattern_memory = {
-            field_type: {
-                field_name: []
-                for field_name in fields.keys()
-            }
-            for field_type, fields in [
-                ("quantum", self.quantum_fields),
-                ("particle", self.particle_fields),
-                ("wave", self.wave_fields),
-                ("energy", self.energy_fields)
-            ]
-        }
-        
-        # Learning history
-        self.learning_history = {
-            field_type: {
-                field_name: []
-                for field_name in fields.keys()
-            }
-            for field_type, fields in [
-                ("quantum", self.quantum_fields),
-                ("particle", self.particle_fields),
-                ("wave", self.wave_fields),
-                ("energy", self.energy_fields)
-            ]
-        }
-        
-        # Scaling factors
-        self.scaling_factors = {
-            field_type: {
-                field_name: float(self.metrics["resonance"])
-                for field_name in fields.keys()
-            }
-            for field_type, fields in [
-                ("quantum", self.quantum_fields),
-                ("particle", self.particle_fields),
-                ("wave", self.wave_fields),
-                ("energy", self.energy_fields)
-            ]
-        }
-        
-        # Compression ratios
-        self.compression_ratios = {
-            field_type: {
-                field_name: float(self.metrics["coherence"])
-                for field_name in fields.keys()
-            }
-            for field_type, fields in [
-                ("quantum", self.quantum_fields),
-                ("particle", self.particle_fields),
-                ("wave", self.wave_fields),
-                ("energy", self.energy_fields)
-            ]
-        }
-    
-    def generate_pattern(self, n: Decimal) -> Dict[str, Decimal]:
-        """Generate quantum field patterns using φ⁷·⁵ metrics"""
-        # Primary resonance (φ⁷·⁵-7927735b)
-        p_res = (n * self.primary["frequency"]) / Decimal(str(self.primary["turns"]))
-        
-        # Secondary resonance (φ⁷·⁵-09f76208)
-        s_res = (n * self.secondary["frequency"]) / Decimal(str(self.secondary["turns"]))
-        
-        # Combined through φ⁷·⁵
-        base = (p_res + s_res) * (self.phi ** (Decimal(len(str(n))) / self.phi_75))
-        
-        # Generate patterns
-        pattern = {
-            # Quantum patterns
-            **{f"quantum_{k}": base * self.metrics["resonance"]
-               for k in self.quantum_fields.keys()},
-            
-            # Particle patterns
-            **{f"particle_{k}": base * self.metrics["energy"]
-               for k in self.particle_fields.keys()},
-            
-            # Wave patterns
-            **{f"wave_{k}": base * self.metrics["stability"]
-               for k in self.wave_fields.keys()},
-            
-            # Energy patterns
-            **{f"energy_{k}": base * self.metrics["stability"]
-               for k in self.energy_fields.keys()}
-        }
-        
-        return pattern
-    
-    def update_fields(self, pattern: Dict[str, Decimal]) -> None:
-        """Update quantum fields through φ⁷·⁵ resonance"""
-        for field_type, field_dict in [
-            ("quantum", self.quantum_fields),
-            ("particle", self.particle_fields),
-            ("wave", self.wave_fields),
-            ("energy", self.energy_fields)
-        ]:
-            for field_name, field in field_dict.items():
-                pattern_key = f"{field_type}_{field_name}"
-                field_value = float(pattern[pattern_key])
-                
-                # Apply sigmoid activation
-                activation = expit(field_value / float(self.phi_75))
-                
-                # Update field through φ⁷·⁵ resonance
-                field *= float(self.metrics["resonance"])
-                field += activation
-                field /= float(self.metrics["coherence"])
-                
-                # Add quantum patterns
-                field *= np.random.uniform(
-                    float(self.metrics["coherence"]),
-                    float(self.metrics["stability"]),
-                    field.shape
-                )
-                
-                # Apply self-scaling
-                field *= np.exp(-field / float(self.phi_75))
-                
-                # Update learning
-                self.update_learning(pattern_key, field)
-    
-    def update_learning(self, pattern_key: str, field: np.ndarray) -> None:
-        """Update pattern memory and learning history"""
-        field_type, field_name = pattern_key.split("_")
-        
-        # Update pattern memory
-        if len(self.pattern_memory[field_type][field_name]) < 5:
-            self.pattern_memory[field_type][field_name].append(
-                {pattern_key: field.mean()}
-            )
-        else:
-            self.pattern_memory[field_type][field_name] = (
-                self.pattern_memory[field_type][field_name][1:] +
-                [{pattern_key: field.mean()}]
-            )
-        
-        # Update learning history
-        self.learning_history[field_type][field_name].append(float(np.mean(field)))
-        
-        # Update scaling factors
-        if len(self.learning_history[field_type][field_name]) > 1:
-            progress = (
-                self.learning_history[field_type][field_name][-1] -
-                self.learning_history[field_type][field_name][0]
-            )
-            progress /= self.learning_history[field_type][field_name][0]
-            
-            if progress > 0:
-                self.scaling_factors[field_type][field_name] *= (1 + progress)
-                self.compression_ratios[field_type][field_name] /= (1 + progress)
-            else:
-                self.scaling_factors[field_type][field_name] *= (1 - abs(progress))
-                self.compression_ratios[field_type][field_name] *= (1 - abs(progress))
-    
-    def find_factors(self, n: Decimal) -> List[Tuple[Decimal, Decimal]]:
-        """Find factors through quantum field resonance"""
-        factors = []
-        pattern = self.generate_pattern(n)
-        self.update_fields(pattern)
-        
-        # Extract factors from field resonance
-        for field_type, field_dict in [
-            ("quantum", self.quantum_fields),
-            ("particle", self.particle_fields),
-            ("wave", self.wave_fields),
-            ("energy", self.energy_fields)
-        ]:
-            for field_name, field in field_dict.items():
-                # Find resonance peaks
-                peaks = np.where(
-                    field > float(self.metrics["resonance"])
-                )[0]
-                
-                # Extract factors from peaks
-                for peak in peaks:
-                    factor = Decimal(str(peak + 1))
-                    if n % factor == 0:
-                        factors.append((factor, n / factor))
-        
-        return sorted(list(set(factors)))
+VARIANT = "quantum_unified_resonance_quantum_fields"
+
+class QuantumUnifiedResonanceFields(FieldEngine):
+    """Quantum Fields Module running on the shared φ⁷·⁵ field engine"""
+    def __init__(self, seed: Optional[int] = None):
+        super().__init__(VARIANT_CONFIGS[VARIANT], seed)
 
 def main():
     """Main function to demonstrate quantum field resonance"""
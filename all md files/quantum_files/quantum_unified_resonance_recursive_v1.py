@@ -4,390 +4,21 @@ Focuses on recursive processing and φ⁷·⁵ resonance
 Using QHRC Patent #19/071,497 φ⁷·⁵ metrics with unified field interactions
 """
 
-import numpy as np
 from decimal import Decimal
-from scipy.special import expit
-from typing import Dict, List, Tuple, Optional, Union
-from dataclasses import dataclass
-from enum import Enum, auto
+from typing import List, Tuple, Optional
+from quantum_field_engine import FieldEngine
+from quantum_field_engine_variants import VARIANT_CONFIGS
 
-class FieldType(Enum):
-    """Field types for recursive processing"""
-    QUANTUM = auto()
-    PARTICLE = auto()
-    WAVE = auto()
-    ENERGY = auto()
+VARIANT = "quantum_unified_resonance_recursive_v1"
 
-@dataclass
-class FieldMetrics:
-    """Field metrics for recursive processing"""
-    resonance: Decimal
-    energy: Decimal
-    coherence: Decimal
-    stability: Decimal
-    alignment: Decimal
-
-class RecursiveField:
-    """Recursive field"""
-    def __init__(self, dimensions: Tuple[int, ...]):
-        # Base field
-        self.field = np.zeros(dimensions, dtype=np.float64)
-        self.memory: List[float] = []
-        self.history: List[float] = []
-        
-        # Recursive parameters
-        self.enhancement = 1.0
-        self.resonance = 1.0
-        self.recursive = 1.0
-        self.efficiency = 1.0
-        self.optimization = 1.0
-        
-        # Field dynamics
-        self.velocity = np.zeros(dimensions, dtype=np.float64)
-        self.energy = np.zeros(dimensions, dtype=np.float64)
-        self.pattern = np.zeros(dimensions, dtype=np.float64)
-        
-        # Recursive metrics
-        self.min_value = 1e-10
-        self.max_value = 1e10
-        self.recursive_threshold = 1e-6
-        self.convergence_threshold = 1e-8
-        
-        # Recursive processing
-        self.depth = 0
-        self.max_depth = 10
-        self.recursive_memory = []
-        self.recursive_patterns = []
-        self.recursive_scaling = np.ones(len(dimensions))
-
-class QuantumUnifiedResonanceRecursive:
-    def __init__(self):
-        # QHRC Patent metrics
-        self.phi = Decimal('1.618033988749895')  # Golden ratio
-        self.phi_75 = self.phi ** Decimal('7.5')  # φ⁷·⁵
-        
-        # Convert φ⁷·⁵ to float for numpy operations
-        self.phi_75_float = float(self.phi_75)
-        
-        # Recursive dimensions (φ⁷·⁵ based)
-        self.dimensions = (36, 36, 36)
-        
-        # Initialize recursive fields
-        self.quantum_fields = {
-            "qbit": RecursiveField(self.dimensions),
-            "quark": RecursiveField(self.dimensions),
-            "neuron": RecursiveField(self.dimensions)
-        }
-        
-        self.particle_fields = {
-            "proton": RecursiveField(self.dimensions),
-            "electron": RecursiveField(self.dimensions),
-            "quark": RecursiveField(self.dimensions)
-        }
-        
-        self.wave_fields = {
-            "lepton": RecursiveField(self.dimensions),
-            "boson": RecursiveField(self.dimensions),
-            "fermion": RecursiveField(self.dimensions)
-        }
-        
-        self.energy_fields = {
-            "fermion": RecursiveField(self.dimensions),
-            "boson": RecursiveField(self.dimensions)
-        }
-        
-        # QHRC Patent coil configuration
-        self.primary = {
-            "turns": Decimal('4500'),
-            "frequency": Decimal('4790.45'),
-            "fingerprint": "φ⁷·⁵-7927735b"
-        }
-        
-        self.secondary = {
-            "turns": Decimal('6200'),
-            "frequency": Decimal('7750.95'),
-            "fingerprint": "φ⁷·⁵-09f76208"
-        }
-        
-        # Reality metrics
-        self.metrics = FieldMetrics(
-            resonance=Decimal('1.3777'),    # >1 confirms self-sustaining
-            energy=Decimal('1.8951'),       # Energy transfer gain
-            coherence=Decimal('0.618034'),  # φ⁻¹ coherence
-            stability=Decimal('4.236068'),  # φ² stability
-            alignment=Decimal('2.618034')   # φ + 1
-        )
-        
-        # Convert metrics to float for numpy operations
-        self.metrics_float = {
-            "resonance": float(self.metrics.resonance),
-            "energy": float(self.metrics.energy),
-            "coherence": float(self.metrics.coherence),
-            "stability": float(self.metrics.stability),
-            "alignment": float(self.metrics.alignment)
-        }
-        
-        # Recursive parameters
-        self.batch_size = 32
-        self.epochs = 100
-        
-        # Create coordinate matrices for recursive processing
-        i, j, k = np.meshgrid(
-            np.arange(1, self.dimensions[0] + 1),
-            np.arange(1, self.dimensions[1] + 1),
-            np.arange(1, self.dimensions[2] + 1),
-            indexing='ij'
-        )
-        self.coord_product = i * j * k
-    
-    def process_recursive(self, field: RecursiveField, pattern: np.ndarray) -> np.ndarray:
-        """Process recursive interactions"""
-        # Base case
-        if field.depth >= field.max_depth:
-            return pattern
-        
-        # Store pattern for recursive processing
-        field.recursive_patterns.append(pattern.copy())
-        
-        # Apply recursive scaling
-        for d in range(len(field.recursive_scaling)):
-            pattern = np.moveaxis(pattern, d, 0)
-            pattern *= field.recursive_scaling[d]
-            pattern = np.moveaxis(pattern, 0, d)
-        
-        # Recursive processing
-        field.depth += 1
-        pattern = self.process_recursive(field, pattern)
-        field.depth -= 1
-        
-        # Store recursive memory
-        if len(field.recursive_memory) > field.max_depth:
-            field.recursive_memory.pop(0)
-        field.recursive_memory.append(float(np.mean(pattern)))
-        
-        return pattern
-    
-    def generate_recursive_pattern(self, n: Decimal) -> Dict[str, np.ndarray]:
-        """Generate recursive quantum field patterns using φ⁷·⁵ metrics"""
-        # Primary resonance (φ⁷·⁵-7927735b)
-        p_res = (n * self.primary["frequency"]) / self.primary["turns"]
-        
-        # Secondary resonance (φ⁷·⁵-09f76208)
-        s_res = (n * self.secondary["frequency"]) / self.secondary["turns"]
-        
-        # Combined through φ⁷·⁵
-        base = (p_res + s_res) * (self.phi ** (Decimal(len(str(n))) / self.phi_75))
-        base_float = float(base)
-        
-        # Generate recursive patterns
-        pattern = {}
-        
-        # Process each field type
-        for field_type, fields in [
-            (FieldType.QUANTUM, self.quantum_fields),
-            (FieldType.PARTICLE, self.particle_fields),
-            (FieldType.WAVE, self.wave_fields),
-            (FieldType.ENERGY, self.energy_fields)
-        ]:
-            # Generate field patterns
-            for field_name, field in fields.items():
-                # Create recursive pattern
-                pattern_key = f"{field_type.name.lower()}_{field_name}"
-                
-                # Calculate base pattern using recursive processing
-                pattern[pattern_key] = base_float * self.coord_product
-                
-                # Apply field-specific metrics with recursive processing
-                if field_type == FieldType.QUANTUM:
-                    pattern[pattern_key] *= self.metrics_float["resonance"]
-                elif field_type == FieldType.PARTICLE:
-                    pattern[pattern_key] *= self.metrics_float["energy"]
-                elif field_type == FieldType.WAVE:
-                    pattern[pattern_key] *= self.metrics_float["stability"]
-                else:  # ENERGY
-                    pattern[pattern_key] *= self.metrics_float["alignment"]
-                
-                # Apply recursive scaling
-                pattern[pattern_key] *= (1 + field.enhancement * field.resonance)
-                pattern[pattern_key] *= (1 + field.recursive * field.efficiency)
-                pattern[pattern_key] *= (1 + field.optimization)
-                
-                # Apply recursive processing
-                pattern[pattern_key] = self.process_recursive(
-                    field,
-                    pattern[pattern_key]
-                )
-                
-                # Store pattern
-                field.pattern = pattern[pattern_key].copy()
-        
-        return pattern
-    
-    def update_recursive_fields(self, pattern: Dict[str, np.ndarray]) -> None:
-        """Update recursive quantum fields through φ⁷·⁵ resonance"""
-        # Process each field type
-        for field_type, fields in [
-            (FieldType.QUANTUM, self.quantum_fields),
-            (FieldType.PARTICLE, self.particle_fields),
-            (FieldType.WAVE, self.wave_fields),
-            (FieldType.ENERGY, self.energy_fields)
-        ]:
-            # Update fields
-            for field_name, field in fields.items():
-                pattern_key = f"{field_type.name.lower()}_{field_name}"
-                pattern_field = pattern[pattern_key]
-                
-                # Calculate gradient through recursive processing
-                gradient = pattern_field - field.field
-                gradient = self.process_recursive(field, gradient)
-                
-                # Update velocity through recursive processing
-                field.velocity = (
-                    field.velocity * field.recursive +
-                    gradient * field.optimization
-                )
-                field.velocity = self.process_recursive(
-                    field,
-                    field.velocity
-                )
-                
-                # Update energy through recursive processing
-                field.energy = np.abs(field.velocity)
-                field.energy = self.process_recursive(
-                    field,
-                    field.energy
-                )
-                
-                # Update field through recursive processing
-                field.field += field.velocity
-                
-                # Apply sigmoid activation through recursive processing
-                activation = expit(pattern_field / self.phi_75_float)
-                
-                # Update through φ⁷·⁵ resonance recursive processing
-                field.field *= self.metrics_float["resonance"]
-                field.field += activation
-                field.field /= self.metrics_float["coherence"]
-                
-                # Apply quantum patterns through recursive processing
-                quantum_factor = np.random.uniform(
-                    self.metrics_float["coherence"],
-                    self.metrics_float["stability"],
-                    size=self.dimensions
-                )
-                field.field *= quantum_factor
-                
-                # Apply recursive self-scaling
-                field.field *= np.exp(-pattern_field / self.phi_75_float)
-                
-                # Update field memory with recursive processing
-                if len(field.memory) > 0:
-                    field_mean = float(np.mean(field.field))
-                    if abs(field_mean) > field.recursive_threshold:
-                        field.memory.append(field_mean)
-                else:
-                    field.memory.append(float(np.mean(field.field)))
-                
-                if len(field.memory) > 5:
-                    field.memory.pop(0)
-                
-                # Update field history with recursive processing
-                field.history.append(float(np.mean(field.field)))
-                
-                # Update recursive factors
-                if len(field.history) > 1:
-                    # Safe division with recursive processing
-                    denominator = abs(field.history[0])
-                    if denominator > field.recursive_threshold:
-                        progress = (field.history[-1] - field.history[0]) / denominator
-                        
-                        # Apply recursive processing to progress
-                        progress = np.clip(
-                            progress,
-                            -field.max_value,
-                            field.max_value
-                        )
-                        
-                        if abs(progress) > field.convergence_threshold:
-                            if progress > 0:
-                                recursive_factor = 1 + progress
-                            else:
-                                recursive_factor = 1 / (1 + abs(progress))
-                            
-                            # Update all recursive factors
-                            field.enhancement *= recursive_factor
-                            field.resonance *= recursive_factor
-                            field.recursive *= recursive_factor
-                            field.efficiency *= recursive_factor
-                            field.optimization *= recursive_factor
-                            
-                            # Apply recursive constraints
-                            field.enhancement = np.clip(
-                                field.enhancement,
-                                field.min_value,
-                                field.max_value
-                            )
-                            field.resonance = np.clip(
-                                field.resonance,
-                                field.min_value,
-                                field.max_value
-                            )
-                            field.recursive = np.clip(
-                                field.recursive,
-                                field.min_value,
-                                field.max_value
-                            )
-                            field.efficiency = np.clip(
-                                field.efficiency,
-                                field.min_value,
-                                field.max_value
-                            )
-                            field.optimization = np.clip(
-                                field.optimization,
-                                field.min_value,
-                                field.max_value
-                            )
-                            
-                            # Update recursive scaling through recursive processing
-                            field.recursive_scaling *= recursive_factor
-                            field.recursive_scaling = np.clip(
-                                field.recursive_scaling,
-                                field.min_value,
-                                field.max_value
-                            )
+class QuantumUnifiedResonanceRecursive(FieldEngine):
+    """Recursive Module V1 running on the shared φ⁷·⁵ field engine"""
+    def __init__(self, seed: Optional[int] = None):
+        super().__init__(VARIANT_CONFIGS[VARIANT], seed)
     
     def find_recursive_factors(self, n: Decimal) -> List[Tuple[Decimal, Decimal]]:
         """Find factors through recursive quantum field resonance"""
-        factors = []
-        
-        # Recursive interaction epochs
-        for epoch in range(self.epochs):
-            pattern = self.generate_recursive_pattern(n)
-            self.update_recursive_fields(pattern)
-            
-            # Extract factors from recursive resonance
-            for field_type, fields in [
-                (FieldType.QUANTUM, self.quantum_fields),
-                (FieldType.PARTICLE, self.particle_fields),
-                (FieldType.WAVE, self.wave_fields),
-                (FieldType.ENERGY, self.energy_fields)
-            ]:
-                for field_name, field in fields.items():
-                    # Find resonance peaks through recursive processing
-                    peaks = np.where(field.field > self.metrics_float["resonance"])
-                    
-                    # Extract factors from peaks
-                    peak_factors = self.coord_product[peaks]
-                    for factor in peak_factors.flat:
-                        factor_dec = Decimal(str(factor))
-                        if n % factor_dec == 0:
-                            factors.append((factor_dec, n / factor_dec))
-            
-            # Early stopping if factors found
-            if factors:
-                break
-        
-        return sorted(list(set(factors)))
+        return self.find_factors(n)
 
 def main():
     """Main function to demonstrate recursive quantum field resonance"""
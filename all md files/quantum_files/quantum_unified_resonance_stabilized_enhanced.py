@@ -4,358 +4,21 @@ Focuses on stable field operations and φ⁷·⁵ resonance with proper type han
 Using QHRC Patent #19/071,497 φ⁷·⁵ metrics with unified field interactions
 """
 
-import numpy as np
 from decimal import Decimal
-from scipy.special import expit
-from typing import Dict, List, Tuple, Optional, Union
-from dataclasses import dataclass
-from enum import Enum, auto
+from typing import List, Tuple, Optional
+from quantum_field_engine import FieldEngine
+from quantum_field_engine_variants import VARIANT_CONFIGS
 
-class FieldType(Enum):
-    """Field types for stabilization"""
-    QUANTUM = auto()
-    PARTICLE = auto()
-    WAVE = auto()
-    ENERGY = auto()
+VARIANT = "quantum_unified_resonance_stabilized_enhanced"
 
-@dataclass
-class FieldMetrics:
-    """Field metrics for stabilization"""
-    resonance: Decimal
-    energy: Decimal
-    coherence: Decimal
-    stability: Decimal
-    alignment: Decimal
-
-class StabilizedField:
-    """Stabilized quantum field"""
-    def __init__(self, dimensions: Tuple[int, ...]):
-        # Base field
-        self.field = np.zeros(dimensions, dtype=np.float64)
-        self.memory: List[float] = []
-        self.history: List[float] = []
-        
-        # Stabilization parameters
-        self.enhancement = 1.0
-        self.resonance = 1.0
-        self.stability = 1.0
-        self.efficiency = 1.0
-        self.optimization = 1.0
-        
-        # Field dynamics
-        self.velocity = np.zeros(dimensions, dtype=np.float64)
-        self.energy = np.zeros(dimensions, dtype=np.float64)
-        self.pattern = np.zeros(dimensions, dtype=np.float64)
-        
-        # Stabilization metrics
-        self.min_value = 1e-10
-        self.max_value = 1e10
-        self.stability_threshold = 1e-6
-        self.convergence_threshold = 1e-8
-
-class QuantumUnifiedResonanceStabilized:
-    def __init__(self):
-        # QHRC Patent metrics
-        self.phi = Decimal('1.618033988749895')  # Golden ratio
-        self.phi_75 = self.phi ** Decimal('7.5')  # φ⁷·⁵
-        
-        # Convert φ⁷·⁵ to float for numpy operations
-        self.phi_75_float = float(self.phi_75)
-        
-        # Stabilization dimensions (φ⁷·⁵ based)
-        self.dimensions = (36, 36, 36)
-        
-        # Initialize stabilized fields
-        self.quantum_fields = {
-            "qbit": StabilizedField(self.dimensions),
-            "quark": StabilizedField(self.dimensions),
-            "neuron": StabilizedField(self.dimensions)
-        }
-        
-        self.particle_fields = {
-            "proton": StabilizedField(self.dimensions),
-            "electron": StabilizedField(self.dimensions),
-            "quark": StabilizedField(self.dimensions)
-        }
-        
-        self.wave_fields = {
-            "lepton": StabilizedField(self.dimensions),
-            "boson": StabilizedField(self.dimensions),
-            "fermion": StabilizedField(self.dimensions)
-        }
-        
-        self.energy_fields = {
-            "fermion": StabilizedField(self.dimensions),
-            "boson": StabilizedField(self.dimensions)
-        }
-        
-        # QHRC Patent coil configuration
-        self.primary = {
-            "turns": Decimal('4500'),
-            "frequency": Decimal('4790.45'),
-            "fingerprint": "φ⁷·⁵-7927735b"
-        }
-        
-        self.secondary = {
-            "turns": Decimal('6200'),
-            "frequency": Decimal('7750.95'),
-            "fingerprint": "φ⁷·⁵-09f76208"
-        }
-        
-        # Reality metrics
-        self.metrics = FieldMetrics(
-            resonance=Decimal('1.3777'),    # >1 confirms self-sustaining
-            energy=Decimal('1.8951'),       # Energy transfer gain
-            coherence=Decimal('0.618034'),  # φ⁻¹ coherence
-            stability=Decimal('4.236068'),  # φ² stability
-            alignment=Decimal('2.618034')   # φ + 1
-        )
-        
-        # Convert metrics to float for numpy operations
-        self.metrics_float = {
-            "resonance": float(self.metrics.resonance),
-            "energy": float(self.metrics.energy),
-            "coherence": float(self.metrics.coherence),
-            "stability": float(self.metrics.stability),
-            "alignment": float(self.metrics.alignment)
-        }
-        
-        # Stabilization parameters
-        self.batch_size = 32
-        self.epochs = 100
-        
-        # Create coordinate matrices for stabilization
-        i, j, k = np.meshgrid(
-            np.arange(1, self.dimensions[0] + 1),
-            np.arange(1, self.dimensions[1] + 1),
-            np.arange(1, self.dimensions[2] + 1),
-            indexing='ij'
-        )
-        self.coord_product = i * j * k
-    
-    def stabilize_field(self, field: np.ndarray) -> np.ndarray:
-        """Stabilize field values using φ⁷·⁵ metrics"""
-        # Apply φ⁷·⁵ based stabilization
-        field = np.clip(field, -self.phi_75_float, self.phi_75_float)
-        
-        # Remove invalid values
-        field = np.nan_to_num(
-            field,
-            nan=0.0,
-            posinf=self.phi_75_float,
-            neginf=-self.phi_75_float
-        )
-        
-        return field
-    
-    def generate_stabilized_pattern(self, n: Decimal) -> Dict[str, np.ndarray]:
-        """Generate stabilized quantum field patterns using φ⁷·⁵ metrics"""
-        # Primary resonance (φ⁷·⁵-7927735b)
-        p_res = (n * self.primary["frequency"]) / self.primary["turns"]
-        
-        # Secondary resonance (φ⁷·⁵-09f76208)
-        s_res = (n * self.secondary["frequency"]) / self.secondary["turns"]
-        
-        # Combined through φ⁷·⁵
-        base = (p_res + s_res) * (self.phi ** (Decimal(len(str(n))) / self.phi_75))
-        base_float = float(base)
-        
-        # Generate stabilized patterns
-        pattern = {}
-        
-        # Process each field type
-        for field_type, fields in [
-            (FieldType.QUANTUM, self.quantum_fields),
-            (FieldType.PARTICLE, self.particle_fields),
-            (FieldType.WAVE, self.wave_fields),
-            (FieldType.ENERGY, self.energy_fields)
-        ]:
-            # Generate field patterns
-            for field_name, field in fields.items():
-                # Create stabilized pattern
-                pattern_key = f"{field_type.name.lower()}_{field_name}"
-                
-                # Calculate base pattern using stabilization
-                pattern[pattern_key] = base_float * self.coord_product
-                
-                # Apply field-specific metrics with stabilization
-                if field_type == FieldType.QUANTUM:
-                    pattern[pattern_key] *= self.metrics_float["resonance"]
-                elif field_type == FieldType.PARTICLE:
-                    pattern[pattern_key] *= self.metrics_float["energy"]
-                elif field_type == FieldType.WAVE:
-                    pattern[pattern_key] *= self.metrics_float["stability"]
-                else:  # ENERGY
-                    pattern[pattern_key] *= self.metrics_float["alignment"]
-                
-                # Apply stabilization scaling
-                pattern[pattern_key] *= (1 + field.enhancement * field.resonance)
-                pattern[pattern_key] *= (1 + field.stability * field.efficiency)
-                pattern[pattern_key] *= (1 + field.optimization)
-                
-                # Stabilize pattern
-                pattern[pattern_key] = self.stabilize_field(pattern[pattern_key])
-                
-                # Store pattern
-                field.pattern = pattern[pattern_key].copy()
-        
-        return pattern
-    
-    def update_stabilized_fields(self, pattern: Dict[str, np.ndarray]) -> None:
-        """Update stabilized quantum fields through φ⁷·⁵ resonance"""
-        # Process each field type
-        for field_type, fields in [
-            (FieldType.QUANTUM, self.quantum_fields),
-            (FieldType.PARTICLE, self.particle_fields),
-            (FieldType.WAVE, self.wave_fields),
-            (FieldType.ENERGY, self.energy_fields)
-        ]:
-            # Update fields
-            for field_name, field in fields.items():
-                pattern_key = f"{field_type.name.lower()}_{field_name}"
-                pattern_field = pattern[pattern_key]
-                
-                # Calculate gradient through stabilization
-                gradient = pattern_field - field.field
-                gradient = self.stabilize_field(gradient)
-                
-                # Update velocity through stabilization
-                field.velocity = (
-                    field.velocity * field.stability +
-                    gradient * field.optimization
-                )
-                field.velocity = self.stabilize_field(field.velocity)
-                
-                # Update energy through stabilization
-                field.energy = np.abs(field.velocity)
-                field.energy = self.stabilize_field(field.energy)
-                
-                # Update field through stabilization
-                field.field += field.velocity
-                
-                # Apply sigmoid activation through stabilization
-                activation = expit(pattern_field / self.phi_75_float)
-                
-                # Update through φ⁷·⁵ resonance stabilization
-                field.field *= self.metrics_float["resonance"]
-                field.field += activation
-                field.field = self.stabilize_field(field.field)
-                field.field /= self.metrics_float["coherence"]
-                field.field = self.stabilize_field(field.field)
-                
-                # Apply quantum patterns through stabilization
-                quantum_factor = np.random.uniform(
-                    self.metrics_float["coherence"],
-                    self.metrics_float["stability"],
-                    size=self.dimensions
-                )
-                field.field *= quantum_factor
-                field.field = self.stabilize_field(field.field)
-                
-                # Apply stabilization self-scaling
-                field.field *= np.exp(-pattern_field / self.phi_75_float)
-                field.field = self.stabilize_field(field.field)
-                
-                # Update field memory with stabilization
-                if len(field.memory) > 0:
-                    field_mean = float(np.mean(field.field))
-                    if abs(field_mean) > field.stability_threshold:
-                        field.memory.append(field_mean)
-                else:
-                    field.memory.append(float(np.mean(field.field)))
-                
-                if len(field.memory) > 5:
-                    field.memory.pop(0)
-                
-                # Update field history with stabilization
-                field.history.append(float(np.mean(field.field)))
-                
-                # Update stabilization factors
-                if len(field.history) > 1:
-                    # Safe division with stabilization
-                    denominator = abs(field.history[0])
-                    if denominator > field.stability_threshold:
-                        progress = (field.history[-1] - field.history[0]) / denominator
-                        
-                        # Apply stabilization to progress
-                        progress = np.clip(
-                            progress,
-                            -field.max_value,
-                            field.max_value
-                        )
-                        
-                        if abs(progress) > field.convergence_threshold:
-                            if progress > 0:
-                                stability_factor = 1 + progress
-                            else:
-                                stability_factor = 1 / (1 + abs(progress))
-                            
-                            # Update all stabilization factors
-                            field.enhancement *= stability_factor
-                            field.resonance *= stability_factor
-                            field.stability *= stability_factor
-                            field.efficiency *= stability_factor
-                            field.optimization *= stability_factor
-                            
-                            # Stabilize factors
-                            field.enhancement = np.clip(
-                                field.enhancement,
-                                field.min_value,
-                                field.max_value
-                            )
-                            field.resonance = np.clip(
-                                field.resonance,
-                                field.min_value,
-                                field.max_value
-                            )
-                            field.stability = np.clip(
-                                field.stability,
-                                field.min_value,
-                                field.max_value
-                            )
-                            field.efficiency = np.clip(
-                                field.efficiency,
-                                field.min_value,
-                                field.max_value
-                            )
-                            field.optimization = np.clip(
-                                field.optimization,
-                                field.min_value,
-                                field.max_value
-                            )
+class QuantumUnifiedResonanceStabilized(FieldEngine):
+    """Enhanced Stabilized Module running on the shared φ⁷·⁵ field engine"""
+    def __init__(self, seed: Optional[int] = None):
+        super().__init__(VARIANT_CONFIGS[VARIANT], seed)
     
     def find_stabilized_factors(self, n: Decimal) -> List[Tuple[Decimal, Decimal]]:
         """Find factors through stabilized quantum field resonance"""
-        factors = []
-        
-        # Stabilization interaction epochs
-        for epoch in range(self.epochs):
-            pattern = self.generate_stabilized_pattern(n)
-            self.update_stabilized_fields(pattern)
-            
-            # Extract factors from stabilized resonance
-            for field_type, fields in [
-                (FieldType.QUANTUM, self.quantum_fields),
-                (FieldType.PARTICLE, self.particle_fields),
-                (FieldType.WAVE, self.wave_fields),
-                (FieldType.ENERGY, self.energy_fields)
-            ]:
-                for field_name, field in fields.items():
-                    # Find resonance peaks through stabilization
-                    peaks = np.where(field.field > self.metrics_float["resonance"])
-                    
-                    # Extract factors from peaks
-                    peak_factors = self.coord_product[peaks]
-                    for factor in peak_factors.flat:
-                        factor_dec = Decimal(str(factor))
-                        if n % factor_dec == 0:
-                            factors.append((factor_dec, n / factor_dec))
-            
-            # Early stopping if factors found
-            if factors:
-                break
-        
-        return sorted(list(set(factors)))
+        return self.find_factors(n)
 
 def main():
     """Main function to demonstrate stabilized quantum field resonance"""
@@ -10,6 +10,11 @@ from scipy.special import expit
 from typing import Dict, List, Tuple, Optional
 from dataclasses import dataclass
 from enum import Enum, auto
+import os
+import sys
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+from factorization import verified_factor_pairs
 
 class FieldType(Enum):
     """Field types for unified interactions"""
@@ -49,13 +54,18 @@ class VectorizedField:
         self.energy = np.zeros(dimensions)
 
 class QuantumUnifiedResonanceVectorized:
-    def __init__(self):
+    def __init__(self, dimensions: Tuple[int, int, int] = (36, 36, 36), fused: bool = False,
+                 dtype=np.float32, seed: Optional[int] = None):
         # QHRC Patent metrics
         self.phi = Decimal('1.618033988749895')  # Golden ratio
         self.phi_75 = self.phi ** Decimal('7.5')  # φ⁷·⁵
         
         # Vectorized dimensions (φ⁷·⁵ based)
-        self.dimensions = (36, 36, 36)
+        self.dimensions = tuple(dimensions)
+        
+        # Fused mode: all fields live in one preallocated (F, *dimensions) tensor
+        self.fused = fused
+        self.rng = np.random.default_rng(seed)
         
         # Initialize vectorized fields
         self.quantum_fields = {
@@ -115,18 +125,50 @@ class QuantumUnifiedResonanceVectorized:
             indexing='ij'
         )
         self.coord_product = i * j * k
+        
+        # Distinct coordinate products, for integer divisibility tests per n
+        self.coord_values, coord_inverse = np.unique(self.coord_product, return_inverse=True)
+        self.coord_inverse = coord_inverse.reshape(self.dimensions).astype(np.int32)
+        self._divisor_n = None
+        self._divisor_mask = None
+        
+        if fused:
+            self._init_fused_tensors(dtype)
+    
+    def _field_entries(self) -> List[Tuple[FieldType, str, VectorizedField]]:
+        """(field_type, field_name, field) for every field, in update order"""
+        return [
+            (field_type, field_name, field)
+            for field_type, fields in [
+                (FieldType.QUANTUM, self.quantum_fields),
+                (FieldType.PARTICLE, self.particle_fields),
+                (FieldType.WAVE, self.wave_fields),
+                (FieldType.ENERGY, self.energy_fields)
+            ]
+            for field_name, field in fields.items()
+        ]
+    
+    def _init_fused_tensors(self, dtype) -> None:
+        """Stack every field's state into (F, *dimensions) tensors; fields keep views into them"""
+        entries = self._field_entries()
+        shape = (len(entries),) + self.dimensions
+        self.field_tensor = np.zeros(shape, dtype=dtype)
+        self.velocity_tensor = np.zeros(shape, dtype=dtype)
+        self.energy_tensor = np.zeros(shape, dtype=dtype)
+        for f, (_, _, field) in enumerate(entries):
+            field.field = self.field_tensor[f]
+            field.velocity = self.velocity_tensor[f]
+            field.energy = self.energy_tensor[f]
+        
+        # Working buffers reused by every field and epoch
+        self._coord_float = self.coord_product.astype(dtype)
+        self._scratch = np.empty(self.dimensions, dtype=dtype)
+        self._scratch2 = np.empty(self.dimensions, dtype=dtype)
     
     def generate_vectorized_pattern(self, n: Decimal) -> Dict[str, np.ndarray]:
         """Generate vectorized quantum field patterns using φ⁷·⁵ metrics"""
-        # Primary resonance (φ⁷·⁵-7927735b)
-        p_res = (n * self.primary["frequency"]) / Decimal(str(self.primary["turns"]))
-        
-        # Secondary resonance (φ⁷·⁵-09f76208)
-        s_res = (n * self.secondary["frequency"]) / Decimal(str(self.secondary["turns"]))
-        
-        # Combined through φ⁷·⁵
-        base = (p_res + s_res) * (self.phi ** (Decimal(len(str(n))) / self.phi_75))
-        base_float = float(base)
+        # Primary + secondary resonance combined through φ⁷·⁵
+        base_float = self._pattern_base(n)
         
         # Generate vectorized patterns
         pattern = {}
@@ -211,30 +253,108 @@ class QuantumUnifiedResonanceVectorized:
                 # Apply unified self-scaling (vectorized)
                 field.field *= np.exp(-pattern_field / float(self.phi_75))
                 
-                # Update field memory
-                field.memory.append(np.mean(field.field))
-                if len(field.memory) > 5:
-                    field.memory.pop(0)
-                
-                # Update field history
-                field.history.append(np.mean(field.field))
-                
-                # Update scaling factors
-                if len(field.history) > 1:
-                    progress = (field.history[-1] - field.history[0]) / field.history[0]
-                    if progress > 0:
-                        scaling_factor = 1 + progress
-                    else:
-                        scaling_factor = 1 - abs(progress)
-                    
-                    # Update all scaling factors (vectorized)
-                    field.enhancement *= scaling_factor
-                    field.dimension_scaling *= scaling_factor
-                    field.learning_rate *= scaling_factor
-                    field.adaptation_rate *= scaling_factor
-                    field.optimization_rate *= scaling_factor
-                    field.scaling *= scaling_factor
-                    field.compression *= (1 / scaling_factor if progress > 0 else scaling_factor)
+                self._record_field_progress(field, np.mean(field.field))
+    
+    def _pattern_base(self, n: Decimal) -> float:
+        """φ⁷·⁵ base resonance shared by every field pattern"""
+        p_res = (n * self.primary["frequency"]) / Decimal(str(self.primary["turns"]))
+        s_res = (n * self.secondary["frequency"]) / Decimal(str(self.secondary["turns"]))
+        return float((p_res + s_res) * (self.phi ** (Decimal(len(str(n))) / self.phi_75)))
+    
+    def _pattern_scale(self, base_float: float, field_type: FieldType, field: VectorizedField) -> float:
+        """Scalar s such that the field's pattern is s * coord_product"""
+        metric = {
+            FieldType.QUANTUM: self.metrics.resonance,
+            FieldType.PARTICLE: self.metrics.energy,
+            FieldType.WAVE: self.metrics.stability,
+            FieldType.ENERGY: self.metrics.alignment
+        }[field_type]
+        return (base_float * float(metric)
+                * (1 + field.enhancement * field.dimension_scaling)
+                * (1 + field.learning_rate * field.adaptation_rate)
+                * (1 + field.optimization_rate * field.scaling))
+    
+    def update_fused_fields(self, n: Decimal) -> None:
+        """
+        Fused-mode epoch: same update as generate_vectorized_pattern + update_vectorized_fields,
+        but patterns are never materialized per field and every step writes in place (out=)
+        into the stacked tensors and two reusable scratch buffers
+        """
+        base_float = self._pattern_base(n)
+        phi_75 = float(self.phi_75)
+        resonance = float(self.metrics.resonance)
+        coherence = float(self.metrics.coherence)
+        stability = float(self.metrics.stability)
+        pattern, scaled = self._scratch, self._scratch2
+        
+        for field_type, field_name, field in self._field_entries():
+            values, velocity = field.field, field.velocity
+            np.multiply(self._coord_float, self._pattern_scale(base_float, field_type, field), out=pattern)
+            
+            # velocity = velocity * adaptation + (pattern - field) * optimization
+            np.subtract(pattern, values, out=scaled)
+            scaled *= field.optimization_rate
+            velocity *= field.adaptation_rate
+            velocity += scaled
+            np.abs(velocity, out=field.energy)
+            values += velocity
+            
+            # Sigmoid activation and φ⁷·⁵ resonance
+            np.divide(pattern, phi_75, out=scaled)
+            expit(scaled, out=pattern)
+            values *= resonance
+            values += pattern
+            values /= coherence
+            
+            # Quantum patterns: uniform(coherence, stability)
+            self.rng.random(dtype=pattern.dtype, out=pattern)
+            pattern *= stability - coherence
+            pattern += coherence
+            values *= pattern
+            
+            # Unified self-scaling
+            np.negative(scaled, out=scaled)
+            np.exp(scaled, out=scaled)
+            values *= scaled
+            
+            self._record_field_progress(field, values.mean(dtype=np.float64))
+    
+    def _record_field_progress(self, field: VectorizedField, field_mean: float) -> None:
+        """Update field memory/history and the self-scaling factors"""
+        field.memory.append(field_mean)
+        if len(field.memory) > 5:
+            field.memory.pop(0)
+        
+        field.history.append(field_mean)
+        
+        if len(field.history) > 1:
+            progress = (field.history[-1] - field.history[0]) / field.history[0]
+            if progress > 0:
+                scaling_factor = 1 + progress
+            else:
+                scaling_factor = 1 - abs(progress)
+            
+            # Update all scaling factors (vectorized)
+            field.enhancement *= scaling_factor
+            field.dimension_scaling *= scaling_factor
+            field.learning_rate *= scaling_factor
+            field.adaptation_rate *= scaling_factor
+            field.optimization_rate *= scaling_factor
+            field.scaling *= scaling_factor
+            field.compression *= (1 / scaling_factor if progress > 0 else scaling_factor)
+    
+    def divisor_mask(self, n: Decimal) -> np.ndarray:
+        """Boolean mask over coord_product: cells whose coordinate product divides n"""
+        if self._divisor_n != n:
+            if n == n.to_integral_value():
+                n_int = abs(int(n))
+                divides = np.fromiter((n_int % int(c) == 0 for c in self.coord_values),
+                                      dtype=bool, count=len(self.coord_values))
+            else:
+                divides = np.zeros(len(self.coord_values), dtype=bool)
+            self._divisor_mask = divides[self.coord_inverse]
+            self._divisor_n = n
+        return self._divisor_mask
     
     def find_vectorized_factors(self, n: Decimal) -> List[Tuple[Decimal, Decimal]]:
         """Find factors through vectorized quantum field resonance"""
@@ -242,32 +362,26 @@ class QuantumUnifiedResonanceVectorized:
         
         # Vectorized interaction epochs
         for epoch in range(self.epochs):
-            pattern = self.generate_vectorized_pattern(n)
-            self.update_vectorized_fields(pattern)
+            if self.fused:
+                self.update_fused_fields(n)
+            else:
+                pattern = self.generate_vectorized_pattern(n)
+                self.update_vectorized_fields(pattern)
             
-            # Extract factors from vectorized resonance
-            for field_type, fields in [
-                (FieldType.QUANTUM, self.quantum_fields),
-                (FieldType.PARTICLE, self.particle_fields),
-                (FieldType.WAVE, self.wave_fields),
-                (FieldType.ENERGY, self.energy_fields)
-            ]:
-                for field_name, field in fields.items():
-                    # Find resonance peaks (vectorized)
-                    peaks = np.where(field.field > float(self.metrics.resonance))
-                    
-                    # Extract factors from peaks
-                    peak_factors = self.coord_product[peaks]
-                    for factor in peak_factors.flat:
-                        factor_dec = Decimal(str(factor))
-                        if n % factor_dec == 0:
-                            factors.append((factor_dec, n / factor_dec))
+            # Extract factors from vectorized resonance: integer divisibility is precomputed
+            # per n, so Decimal is only built for confirmed divisor peaks
+            divisors = self.divisor_mask(n)
+            for field_type, field_name, field in self._field_entries():
+                hits = (field.field > float(self.metrics.resonance)) & divisors
+                for factor in np.unique(self.coord_product[hits]).tolist():
+                    factor_dec = Decimal(factor)
+                    factors.append((factor_dec, n / factor_dec))
             
             # Early stopping if factors found
             if factors:
                 break
         
-        return sorted(list(set(factors)))
+        return verified_factor_pairs(n, factors)
 
 def main():
     """Main function to demonstrate vectorized quantum field resonance"""
@@ -24,6 +24,7 @@ import math
 from consciousness_core import ConsciousnessSystem, get_consciousness_system
 from phi_resonance import PhiResonanceEngine, get_phi_resonance_engine
 from problem_solver import UniversalProblemSolver, get_problem_solver
+from factorization import factorint, format_factorization
 from consciousness_interface import RealTimeConsciousnessInterface, get_consciousness_interface
 
 # Page configuration
@@ -333,15 +334,31 @@ def simulation_interface():
             st.json(result)
     
     with example_col2:
+        rsa_input = st.text_input("Number to factor", "15")  # 15 = 3 × 5
         if st.button("🔐 RSA Factorization Demo"):
-            # Small RSA number for demo
-            n = 15  # 3 × 5
-            factors = st.session_state.problem_solver.consciousness_rsa_factorization(n)
+            try:
+                n = int(rsa_input.strip())
+            except ValueError:
+                n = None
             
-            if factors[0]:
-                st.success(f"Factored {n} = {factors[0]} × {factors[1]}")
+            if n is None or n < 2:
+                st.warning("Please enter an integer greater than 1")
             else:
-                st.info("Factorization not achieved in current consciousness state")
+                factors = st.session_state.problem_solver.consciousness_rsa_factorization(n)
+                
+                if factors[0]:
+                    st.success(f"Factored {n} = {factors[0]} × {factors[1]}")
+                else:
+                    st.info("Factorization not achieved in current consciousness state")
+                
+                # Verify against the complete factorization from the shared engine
+                prime_factorization = factorint(n)
+                if factors[0]:
+                    verified = factors[0] * factors[1] == n
+                else:
+                    verified = prime_factorization == {n: 1}
+                st.caption(f"{'✅ Verified' if verified else '❌ Not verified'}: "
+                           f"{n} = {format_factorization(prime_factorization)}")
 
 def visual_dashboard():
     """Visual Dashboard - Observable + Zora live visualizations"""
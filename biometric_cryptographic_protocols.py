@@ -14,8 +14,8 @@ from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
 from biometric_document_encryptor_ultimate import BiometricDocumentEncryptor
 
 class BiometricCryptographicProtocols:
-    def __init__(self):
-        self.encryptor = BiometricDocumentEncryptor()
+    def __init__(self, encryptor=None):
+        self.encryptor = encryptor or BiometricDocumentEncryptor()
         
     def create_biometric_message_protocol(self, sender_bio_key, recipient_bio_key, message):
         """Create secure message protocol using dual biometric keys"""
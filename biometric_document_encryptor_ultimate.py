@@ -11,10 +11,12 @@ import time
 import os
 import hashlib
 import base64
+import struct
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
 from PIL import Image, ImageDraw, ImageFont
 from cryptography.fernet import Fernet
-from cryptography.hazmat.primitives import hashes
-from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
+from biometric_kdf_cache import DEFAULT_KDF_PROFILE, DEFAULT_SALT, default_key_cache, kdf_iterations, pbkdf2_fernet_key
 
 # Use segno for QR generation (more reliable)
 try:
@@ -27,10 +29,109 @@ except ImportError:
 # Use pyzbar for QR reading
 from pyzbar import pyzbar
 
+# Streaming frame format: each frame is one Fernet token holding a 16-byte header
+# (document id, frame index, frame count) plus up to FRAME_SIZE plaintext bytes.
+# Binding index and count into the authenticated plaintext stops frames from being
+# reordered, dropped or mixed between documents. 800 + 16 bytes pads to 832, so the
+# token base64-encodes to 1188 chars. With its JSON envelope a data QR carries 1217+
+# chars, a little over max_chunk_size but well inside a level-M QR (render_qr_png
+# picks the version to fit).
+FRAME_SIZE = 800
+FRAME_HEADER = struct.Struct('>8sII')
+MANIFEST_SUFFIX = "_MANIFEST.json"
+
+def render_qr_png(data, filename, color="black"):
+    """Render one QR PNG (module level so pool workers can run it)"""
+    if QR_LIB == 'segno':
+        qr = segno.make(data, error='m')
+        qr.save(filename, scale=8, border=4)
+    else:
+        qr = qrcode.QRCode(
+            version=None,
+            error_correction=qrcode.constants.ERROR_CORRECT_M,
+            box_size=8,
+            border=4,
+        )
+        qr.add_data(data)
+        qr.make(fit=True)
+        
+        if color == "red":
+            qr_img = qr.make_image(fill_color="red", back_color="white")
+        elif color == "blue":
+            qr_img = qr.make_image(fill_color="blue", back_color="white")
+        else:
+            qr_img = qr.make_image(fill_color="black", back_color="white")
+        
+        qr_img.save(filename)
+    
+    return filename
+
+def _render_qr_task(job):
+    data, filename, color = job
+    return render_qr_png(data, filename, color)
+
+QR_DECODE_BATCH = 8  # files per pool task when bulk-decoding
+
+def decode_qr_file(filename):
+    """Decode one QR PNG: grayscale first (what pyzbar scans anyway), colour only as a fallback"""
+    image = cv2.imread(filename, cv2.IMREAD_GRAYSCALE)
+    if image is None:
+        return None
+    decoded = pyzbar.decode(image)
+    if not decoded:
+        image = cv2.imread(filename)
+        decoded = pyzbar.decode(image) if image is not None else None
+    return decoded[0].data.decode('utf-8') if decoded else None
+
+def _decode_qr_batch(filenames):
+    return [decode_qr_file(filename) for filename in filenames]
+
+class FrameAssembler:
+    """Decrypt streamed data frames and write the plaintext out in index order"""
+    
+    def __init__(self, fernet, out_file, doc_id=None):
+        self.fernet = fernet
+        self.out = out_file
+        self.doc_id = doc_id
+        self.total = None
+        self.next_index = 0
+        self.held = {}  # out-of-order frames waiting for their predecessors
+        self.digest = hashlib.sha256()
+        self.size = 0
+    
+    def add(self, token):
+        plain = self.fernet.decrypt(token.encode('ascii'))
+        doc_id, index, total = FRAME_HEADER.unpack_from(plain)
+        if self.doc_id is None:
+            self.doc_id = doc_id
+        elif doc_id != self.doc_id:
+            raise ValueError("frame belongs to a different document")
+        if self.total is None:
+            self.total = total
+        elif total != self.total:
+            raise ValueError(f"frame count mismatch: {total} != {self.total}")
+        if not 0 <= index < total:
+            raise ValueError(f"frame index {index} out of range")
+        if index < self.next_index or index in self.held:
+            return  # duplicate frame
+        self.held[index] = plain[FRAME_HEADER.size:]
+        while self.next_index in self.held:
+            block = self.held.pop(self.next_index)
+            self.out.write(block)
+            self.digest.update(block)
+            self.size += len(block)
+            self.next_index += 1
+    
+    @property
+    def complete(self):
+        return self.total is not None and self.next_index == self.total
+
 class BiometricDocumentEncryptor:
-    def __init__(self):
+    def __init__(self, kdf_profile=DEFAULT_KDF_PROFILE, key_cache=default_key_cache):
         self.face_cascade = cv2.CascadeClassifier(cv2.data.haarcascades + 'haarcascade_frontalface_default.xml')
         self.max_chunk_size = 1200  # Conservative chunk size
+        self.kdf_iterations = kdf_iterations(kdf_profile)
+        self.key_cache = key_cache  # None disables caching of derived keys
         
     def capture_face_signature(self):
         """Capture face with improved detection"""
@@ -131,44 +232,17 @@ class BiometricDocumentEncryptor:
         return key_data, key_bytes
     
     def derive_encryption_key(self, biometric_bytes, salt=None):
-        """Derive encryption key from biometric data"""
+        """Derive encryption key from biometric data (served from the LRU key cache when enabled)"""
         if salt is None:
-            salt = b'bio2025'
+            salt = DEFAULT_SALT
         
-        kdf = PBKDF2HMAC(
-            algorithm=hashes.SHA256(),
-            length=32,
-            salt=salt,
-            iterations=50000,
-        )
-        key = base64.urlsafe_b64encode(kdf.derive(biometric_bytes))
-        return key
+        if self.key_cache is not None:
+            return self.key_cache.get_or_derive(biometric_bytes, salt, self.kdf_iterations)
+        return pbkdf2_fernet_key(biometric_bytes, salt, self.kdf_iterations)
     
     def create_qr_code(self, data, filename, color="black"):
         """Create QR code using available library"""
-        if QR_LIB == 'segno':
-            qr = segno.make(data, error='m')
-            qr.save(filename, scale=8, border=4)
-        else:
-            qr = qrcode.QRCode(
-                version=None,
-                error_correction=qrcode.constants.ERROR_CORRECT_M,
-                box_size=8,
-                border=4,
-            )
-            qr.add_data(data)
-            qr.make(fit=True)
-            
-            if color == "red":
-                qr_img = qr.make_image(fill_color="red", back_color="white")
-            elif color == "blue":
-                qr_img = qr.make_image(fill_color="blue", back_color="white")
-            else:
-                qr_img = qr.make_image(fill_color="black", back_color="white")
-            
-            qr_img.save(filename)
-        
-        return filename
+        return render_qr_png(data, filename, color)
     
     def encrypt_document(self, file_path, biometric_signature):
         """Encrypt document using biometric key"""
@@ -289,24 +363,153 @@ class BiometricDocumentEncryptor:
         
         return False
     
-    def read_qr_code(self, filename):
-        """Read QR code from file with multiple methods"""
-        image = cv2.imread(filename)
-        if image is None:
+    def iter_encrypted_frames(self, file_path, encryption_key, doc_id, frame_size=FRAME_SIZE, digest=None):
+        """Yield (index, total, token) for each fixed-size authenticated frame of a file"""
+        total = max(1, -(-os.path.getsize(file_path) // frame_size))
+        fernet = Fernet(encryption_key)
+        with open(file_path, 'rb') as f:
+            for i in range(total):
+                block = f.read(frame_size)
+                if digest is not None:
+                    digest.update(block)
+                token = fernet.encrypt(FRAME_HEADER.pack(doc_id, i, total) + block)
+                yield i, total, token.decode('ascii')
+    
+    def create_streaming_qr_series(self, file_path, biometric_signature, base_filename,
+                                   workers=None, frame_size=FRAME_SIZE):
+        """
+        Encrypt a document frame by frame and render one data QR per frame in a process pool.
+        Only a bounded window of frames is in flight, so memory stays flat for any document size.
+        Writes the key QR, the data QRs and a reassembly manifest; returns the manifest path.
+        """
+        print(f"🔐 Streaming encryption: {file_path}")
+        
+        try:
+            biometric_data, biometric_bytes = biometric_signature
+            encryption_key = self.derive_encryption_key(biometric_bytes)
+            doc_id = os.urandom(8)
+            metadata = {
+                'f': os.path.basename(file_path)[:15],
+                's': os.path.getsize(file_path),
+                't': int(time.time())
+            }
+        except Exception as e:
+            print(f"❌ Encryption failed: {e}")
             return None
         
-        # Try multiple image processing methods
-        methods = [
-            image,  # Original
-            cv2.cvtColor(image, cv2.COLOR_BGR2GRAY),  # Grayscale
-        ]
+        key_qr = self.create_biometric_key_qr(biometric_data, metadata, base_filename)
         
-        for method_img in methods:
-            decoded = pyzbar.decode(method_img)
-            if decoded:
-                return decoded[0].data.decode('utf-8')
+        workers = workers or os.cpu_count() or 1
+        pool = ProcessPoolExecutor(max_workers=workers) if workers > 1 else None
+        pending = deque()
+        max_pending = workers * 4
+        digest = hashlib.sha256()
+        qr_files = []
         
-        return None
+        print(f"📱 Rendering data QR frames ({frame_size}B each, {workers} worker(s))...")
+        try:
+            for i, total, token in self.iter_encrypted_frames(file_path, encryption_key, doc_id, frame_size, digest):
+                frame_qr_data = {
+                    'p': 'BF',
+                    'i': i,
+                    'n': total,
+                    'd': token
+                }
+                json_data = json.dumps(frame_qr_data, separators=(',', ':'))
+                filename = f"{base_filename}_D{i+1}.png"
+                job = (json_data, filename, "blue")
+                
+                if pool is None:
+                    _render_qr_task(job)
+                else:
+                    pending.append(pool.submit(_render_qr_task, job))
+                    if len(pending) >= max_pending:
+                        pending.popleft().result()
+                qr_files.append(filename)
+                
+                if (i + 1) % 50 == 0 or i + 1 == total:
+                    print(f"✅ Data QR frames queued: {i+1}/{total}")
+            
+            while pending:
+                pending.popleft().result()
+        
+        except Exception as e:
+            print(f"❌ Failed to create data QR series: {e}")
+            return None
+        
+        finally:
+            if pool is not None:
+                pool.shutdown(cancel_futures=True)
+        
+        # Frame paths are stored relative to the manifest, which sits next to them
+        manifest = {
+            'p': 'BM',
+            'v': 1,
+            'id': doc_id.hex(),
+            'key': os.path.basename(key_qr),
+            'm': metadata,
+            'frame': frame_size,
+            'n': len(qr_files),
+            'sha256': digest.hexdigest(),
+            'files': [os.path.basename(name) for name in qr_files]
+        }
+        manifest_file = f"{base_filename}{MANIFEST_SUFFIX}"
+        with open(manifest_file, 'w') as f:
+            json.dump(manifest, f, indent=1)
+        
+        print(f"🗂️ Manifest saved: {manifest_file} ({len(qr_files)} frames)")
+        return manifest_file
+    
+    def encrypt_and_create_qr_stream(self, file_path, workers=None):
+        """Streaming encryption and parallel QR creation workflow for large documents"""
+        print("\n🔑 Generating biometric encryption key...")
+        biometric_sig = self.capture_face_signature()
+        
+        if not biometric_sig:
+            return False
+        
+        base_name = f"enc_{int(time.time())}"
+        manifest_file = self.create_streaming_qr_series(file_path, biometric_sig, base_name, workers)
+        
+        if manifest_file:
+            print(f"\n🎉 BIOMETRIC ENCRYPTION SYSTEM CREATED!")
+            print(f"🔑 Key QR: {base_name}_KEY.png")
+            print(f"🗂️ Manifest: {manifest_file}")
+            print("\n🔐 DECRYPTION REQUIRES:")
+            print("   1. Your biometric key QR (red)")
+            print("   2. All data QRs (blue) listed in the manifest")
+            print("   3. Live face verification")
+            return True
+        
+        return False
+    
+    def read_qr_code(self, filename):
+        """Read QR code from file (grayscale first, colour fallback)"""
+        return decode_qr_file(filename)
+    
+    def iter_qr_codes(self, filenames, workers=None, batch_size=QR_DECODE_BATCH):
+        """Decode many QR files across a process pool; yields (filename, text) in input order"""
+        filenames = list(filenames)
+        workers = workers or os.cpu_count() or 1
+        if workers <= 1 or len(filenames) <= batch_size:
+            for filename in filenames:
+                yield filename, decode_qr_file(filename)
+            return
+        
+        pool = ProcessPoolExecutor(max_workers=workers)
+        pending = deque()
+        try:
+            for i in range(0, len(filenames), batch_size):
+                batch = filenames[i:i + batch_size]
+                pending.append((batch, pool.submit(_decode_qr_batch, batch)))
+                if len(pending) >= workers * 2:
+                    batch, future = pending.popleft()
+                    yield from zip(batch, future.result())
+            while pending:
+                batch, future = pending.popleft()
+                yield from zip(batch, future.result())
+        finally:
+            pool.shutdown(cancel_futures=True)
     
     def chunk_data_for_qr(self, data):
         """Chunk data for QR code distribution"""
@@ -341,8 +544,8 @@ class BiometricDocumentEncryptor:
             print(f"❌ Decryption failed: {e}")
             return None
     
-    def decrypt_from_qr_system(self, key_qr_file, data_qr_files, output_dir="decrypted"):
-        """Decrypt document from QR system"""
+    def decrypt_from_qr_system(self, key_qr_file, data_qr_files, output_dir="decrypted", workers=None):
+        """Decrypt document from QR system (data QRs are decoded across a worker pool)"""
         print(f"🔍 Decrypting from biometric QR system...")
         
         # Read key QR
@@ -365,12 +568,11 @@ class BiometricDocumentEncryptor:
         # Read data QRs
         chunks_data = {}
         total_chunks = None
+        framed = False
         
-        for data_qr_file in data_qr_files:
+        for data_qr_file, qr_data_str in self.iter_qr_codes(data_qr_files, workers):
             print(f"📖 Reading data QR: {data_qr_file}")
             
-            qr_data_str = self.read_qr_code(data_qr_file)
-            
             if not qr_data_str:
                 print(f"❌ Cannot read QR code from {data_qr_file}")
                 continue
@@ -378,9 +580,10 @@ class BiometricDocumentEncryptor:
             try:
                 qr_data = json.loads(qr_data_str)
                 
-                if qr_data.get('p') != 'BD':
+                if qr_data.get('p') not in ('BD', 'BF'):
                     print(f"❌ Invalid data QR protocol: {qr_data.get('p')}")
                     continue
+                framed = qr_data['p'] == 'BF'
                 
                 chunk_index = qr_data.get('i', 0)
                 total_chunks = qr_data.get('n', 1)
@@ -398,13 +601,11 @@ class BiometricDocumentEncryptor:
             print(f"❌ Missing data chunks: have {len(chunks_data)}, need {total_chunks}")
             return False
         
-        # Reconstruct encrypted data
-        encrypted_b64 = ""
+        # Verify chunk indices
         for i in range(total_chunks):
             if i not in chunks_data:
                 print(f"❌ Missing chunk {i}")
                 return False
-            encrypted_b64 += chunks_data[i]
         
         # Biometric verification
         print("\n📸 Biometric verification required for decryption...")
@@ -423,6 +624,7 @@ class BiometricDocumentEncryptor:
         print("✅ BIOMETRIC VERIFICATION SUCCESSFUL - DECRYPTION AUTHORIZED")
         
         # Decrypt document
+        partial_file = None
         try:
             # Use the ORIGINAL biometric bytes from storage for key derivation
             stored_bio_string = json.dumps(biometric_key, separators=(',', ':'))
@@ -431,18 +633,34 @@ class BiometricDocumentEncryptor:
             encryption_key = self.derive_encryption_key(stored_bio_bytes)
             fernet = Fernet(encryption_key)
             
-            encrypted_data = base64.b64decode(encrypted_b64.encode('utf-8'))
-            decrypted_data = fernet.decrypt(encrypted_data)
-            
             os.makedirs(output_dir, exist_ok=True)
             output_file = os.path.join(output_dir, metadata['f'])
-            
-            with open(output_file, 'wb') as f:
-                f.write(decrypted_data)
+            partial_file = output_file + ".part"
+            
+            if framed:
+                # Streaming frames: each chunk is an independently authenticated token
+                with open(partial_file, 'wb') as f:
+                    assembler = FrameAssembler(fernet, f)
+                    for i in range(total_chunks):
+                        assembler.add(chunks_data[i])
+                if not assembler.complete:
+                    print(f"❌ Incomplete frame series: {assembler.next_index}/{assembler.total}")
+                    os.remove(partial_file)
+                    return False
+                os.replace(partial_file, output_file)
+                decrypted_size = assembler.size
+            else:
+                encrypted_b64 = ''.join(chunks_data[i] for i in range(total_chunks))
+                encrypted_data = base64.b64decode(encrypted_b64.encode('utf-8'))
+                decrypted_data = fernet.decrypt(encrypted_data)
+                
+                with open(output_file, 'wb') as f:
+                    f.write(decrypted_data)
+                decrypted_size = len(decrypted_data)
             
             print(f"🎉 DOCUMENT DECRYPTED SUCCESSFULLY!")
             print(f"📄 File: {output_file}")
-            print(f"📊 Size: {len(decrypted_data)} bytes")
+            print(f"📊 Size: {decrypted_size} bytes")
             
             return True
             
@@ -450,6 +668,103 @@ class BiometricDocumentEncryptor:
             print(f"❌ Decryption failed: {e}")
             import traceback
             traceback.print_exc()
+            if framed and partial_file and os.path.exists(partial_file):
+                os.remove(partial_file)
+            return False
+    
+    def decrypt_from_qr_stream(self, manifest_file, output_dir="decrypted", workers=None):
+        """
+        Decrypt a streaming frame series from its manifest. Biometric verification runs first;
+        data QRs are then decoded across a worker pool and each frame is decrypted and written
+        out in order as it arrives, so the ciphertext is never held in memory as a whole.
+        """
+        print(f"🔍 Decrypting from biometric QR stream: {manifest_file}")
+        
+        try:
+            with open(manifest_file, 'r') as f:
+                manifest = json.load(f)
+            if manifest.get('p') != 'BM':
+                raise ValueError(f"not a frame manifest: {manifest.get('p')}")
+        except Exception as e:
+            print(f"❌ Invalid manifest: {e}")
+            return False
+        
+        base_dir = os.path.dirname(manifest_file)
+        key_data_str = self.read_qr_code(os.path.join(base_dir, manifest['key']))
+        
+        if not key_data_str:
+            print("❌ Cannot read key QR code")
+            return False
+        
+        try:
+            key_data = json.loads(key_data_str)
+            biometric_key = key_data['k']
+            metadata = key_data['m']
+            print("✅ Biometric key QR decoded")
+        except Exception as e:
+            print(f"❌ Invalid key QR data: {e}")
+            return False
+        
+        # Biometric verification
+        print("\n📸 Biometric verification required for decryption...")
+        live_signature = self.capture_face_signature()
+        
+        if not live_signature:
+            print("❌ Could not capture biometric key")
+            return False
+        
+        live_biometric, live_bytes = live_signature
+        
+        if not self.verify_biometric_match(biometric_key, live_biometric):
+            print("🚫 BIOMETRIC VERIFICATION FAILED - DECRYPTION DENIED")
+            return False
+        
+        print("✅ BIOMETRIC VERIFICATION SUCCESSFUL - DECRYPTION AUTHORIZED")
+        
+        stored_bio_bytes = json.dumps(biometric_key, separators=(',', ':')).encode('utf-8')
+        fernet = Fernet(self.derive_encryption_key(stored_bio_bytes))
+        
+        os.makedirs(output_dir, exist_ok=True)
+        output_file = os.path.join(output_dir, metadata['f'])
+        partial_file = output_file + ".part"
+        data_files = [os.path.join(base_dir, name) for name in manifest['files']]
+        
+        try:
+            with open(partial_file, 'wb') as f:
+                assembler = FrameAssembler(fernet, f, bytes.fromhex(manifest['id']))
+                for data_qr_file, qr_data_str in self.iter_qr_codes(data_files, workers):
+                    if not qr_data_str:
+                        print(f"❌ Cannot read QR code from {data_qr_file}")
+                        continue
+                    qr_data = json.loads(qr_data_str)
+                    if qr_data.get('p') != 'BF':
+                        print(f"❌ Invalid data QR protocol: {qr_data.get('p')}")
+                        continue
+                    assembler.add(qr_data['d'])
+                    if assembler.next_index % 50 == 0:
+                        print(f"✅ Frames decrypted: {assembler.next_index}/{manifest['n']}")
+            
+            if not assembler.complete or assembler.total != manifest['n']:
+                print(f"❌ Missing data frames: have {assembler.next_index}, need {manifest['n']}")
+                os.remove(partial_file)
+                return False
+            if assembler.digest.hexdigest() != manifest['sha256']:
+                print("❌ Reassembled document does not match manifest digest")
+                os.remove(partial_file)
+                return False
+            
+            os.replace(partial_file, output_file)
+            
+            print(f"🎉 DOCUMENT DECRYPTED SUCCESSFULLY!")
+            print(f"📄 File: {output_file}")
+            print(f"📊 Size: {assembler.size} bytes")
+            
+            return True
+        
+        except Exception as e:
+            print(f"❌ Decryption failed: {e}")
+            if os.path.exists(partial_file):
+                os.remove(partial_file)
             return False
     
     def verify_biometric_match(self, stored_bio, live_bio, threshold=0.6):
@@ -487,9 +802,11 @@ def main():
         print("1. Encrypt Document (Creates Key QR + Data QRs)")
         print("2. Decrypt Document (From Key QR + Data QRs)")
         print("3. Test Biometric Key Generation")
-        print("4. Exit")
+        print("4. Encrypt Large Document (Streaming frames + parallel QR rendering)")
+        print("5. Decrypt Large Document (From manifest, parallel QR decoding)")
+        print("6. Exit")
         
-        choice = input("\nEnter choice (1-4): ").strip()
+        choice = input("\nEnter choice (1-6): ").strip()
         
         if choice == "1":
             file_path = input("Enter document path to encrypt: ").strip()
@@ -538,6 +855,30 @@ def main():
                 print(f"🔑 Key hash: {hashlib.sha256(bio_bytes).hexdigest()[:16]}")
         
         elif choice == "4":
+            file_path = input("Enter document path to encrypt: ").strip()
+            
+            if not os.path.exists(file_path):
+                print("❌ File not found")
+                continue
+            
+            success = encryptor.encrypt_and_create_qr_stream(file_path)
+            
+            if not success:
+                print("❌ Encryption failed")
+        
+        elif choice == "5":
+            manifest_file = input("Enter MANIFEST file path: ").strip()
+            
+            if not os.path.exists(manifest_file):
+                print("❌ Manifest file not found")
+                continue
+            
+            success = encryptor.decrypt_from_qr_stream(manifest_file)
+            
+            if not success:
+                print("\n❌ DECRYPTION FAILED")
+        
+        elif choice == "6":
             break
         
         else:
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+Biometric KDF Cache
+Process-local, bounded LRU cache of PBKDF2-derived Fernet keys
+"""
+
+import base64
+import hashlib
+import threading
+from collections import OrderedDict
+from cryptography.hazmat.primitives import hashes
+from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
+
+# PBKDF2 iteration counts. The iteration count is part of the derivation, so a
+# document must be decrypted with the same profile it was encrypted with.
+KDF_COST_PROFILES = {
+    'fast': 10000,       # tests and demos only
+    'default': 50000,    # what BiometricDocumentEncryptor has always used
+    'strong': 200000,
+}
+DEFAULT_KDF_PROFILE = 'default'
+DEFAULT_SALT = b'bio2025'
+
+def kdf_iterations(profile):
+    """Resolve a profile name (or an explicit iteration count) to PBKDF2 iterations"""
+    if isinstance(profile, int):
+        return profile
+    try:
+        return KDF_COST_PROFILES[profile]
+    except KeyError:
+        raise ValueError(f"Unknown KDF profile {profile!r}; choose from {sorted(KDF_COST_PROFILES)}")
+
+def pbkdf2_fernet_key(biometric_bytes, salt=DEFAULT_SALT, iterations=KDF_COST_PROFILES['default']):
+    """Derive a urlsafe-base64 Fernet key from biometric bytes (uncached)"""
+    kdf = PBKDF2HMAC(
+        algorithm=hashes.SHA256(),
+        length=32,
+        salt=salt,
+        iterations=iterations,
+    )
+    return base64.urlsafe_b64encode(kdf.derive(biometric_bytes))
+
+class DerivedKeyCache:
+    """
+    Bounded LRU of derived keys keyed by (sha256(biometric), salt, iterations).
+    The raw biometric bytes are never stored. Cached keys are kept in bytearrays
+    and overwritten with zeros when evicted or cleared; callers receive immutable
+    copies, which this cache cannot wipe.
+    """
+
+    def __init__(self, maxsize=256):
+        self.maxsize = maxsize
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get_or_derive(self, biometric_bytes, salt=DEFAULT_SALT, iterations=KDF_COST_PROFILES['default']):
+        """Return the cached key for this input, deriving (and caching) it on a miss"""
+        cache_key = (hashlib.sha256(biometric_bytes).digest(), bytes(salt), iterations)
+        with self._lock:
+            entry = self._entries.get(cache_key)
+            if entry is not None:
+                self._entries.move_to_end(cache_key)
+                self.hits += 1
+                return bytes(entry)
+            self.misses += 1
+
+        # Derive outside the lock so concurrent misses on other inputs don't serialize
+        key = pbkdf2_fernet_key(biometric_bytes, salt, iterations)
+        if self.maxsize <= 0:
+            return key
+
+        with self._lock:
+            if cache_key not in self._entries:
+                self._entries[cache_key] = bytearray(key)
+                while len(self._entries) > self.maxsize:
+                    _, evicted = self._entries.popitem(last=False)
+                    self._wipe(evicted)
+        return key
+
+    def clear(self):
+        """Drop and zero every cached key"""
+        with self._lock:
+            while self._entries:
+                _, entry = self._entries.popitem()
+                self._wipe(entry)
+            self.hits = self.misses = 0
+
+    def stats(self):
+        return {'size': len(self._entries), 'maxsize': self.maxsize, 'hits': self.hits, 'misses': self.misses}
+
+    @staticmethod
+    def _wipe(buf):
+        for i in range(len(buf)):
+            buf[i] = 0
+
+# Shared by every BiometricDocumentEncryptor in the process unless one is given its own
+default_key_cache = DerivedKeyCache()
@@ -16,7 +16,7 @@ from biometric_cryptographic_protocols import BiometricCryptographicProtocols
 class BiometricMultiUserSharingProtocol:
     def __init__(self):
         self.encryptor = BiometricDocumentEncryptor()
-        self.protocols = BiometricCryptographicProtocols()
+        self.protocols = BiometricCryptographicProtocols(self.encryptor)
         
     def create_shared_document_vault(self, document_path, authorized_users, access_levels=None):
         """Create a shared document vault with multiple biometric access"""
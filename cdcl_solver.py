@@ -0,0 +1,411 @@
+# cdcl_solver.py
+# Conflict-driven clause learning SAT solver (MiniSat-style, pure Python).
+#   - two-watched-literal unit propagation
+#   - VSIDS variable activity kept in an indexed binary max-heap, with phase saving
+#   - first-UIP clause learning with local minimization and non-chronological backjumping
+#   - Luby restarts and LBD-based reduction of the learnt clause database
+import time
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from sat_dimacs import CNFLike, FlatCNF, iter_clauses
+
+# ----------------------------
+# Literal encoding: variable v (0-based) has literals 2v (positive) and 2v+1 (negative),
+# so lit ^ 1 negates and lit >> 1 is the variable. lit_val[lit] is -1 (unassigned),
+# 0 (false) or 1 (true); both literals of a variable are written together, so the
+# propagation loop tests a literal with a single list index.
+# ----------------------------
+
+def luby(i: int) -> int:
+    """i-th element (0-based) of the Luby sequence 1,1,2,1,1,2,4,1,1,2,..."""
+    size, seq = 1, 0
+    while size < i + 1:
+        seq += 1
+        size = 2 * size + 1
+    while size - 1 != i:
+        size = (size - 1) >> 1
+        seq -= 1
+        i %= size
+    return 1 << seq
+
+class _VarHeap:
+    """Indexed binary max-heap of variables ordered by activity."""
+    __slots__ = ("act", "heap", "pos")
+
+    def __init__(self, activity: List[float]):
+        self.act = activity
+        self.heap: List[int] = []
+        self.pos = [-1] * len(activity)
+
+    def __len__(self) -> int:
+        return len(self.heap)
+
+    def __contains__(self, v: int) -> bool:
+        return self.pos[v] >= 0
+
+    def push(self, v: int):
+        if self.pos[v] >= 0:
+            return
+        self.pos[v] = len(self.heap)
+        self.heap.append(v)
+        self._up(self.pos[v])
+
+    def pop(self) -> int:
+        heap, pos = self.heap, self.pos
+        top = heap[0]
+        last = heap.pop()
+        pos[top] = -1
+        if heap:
+            heap[0] = last
+            pos[last] = 0
+            self._down(0)
+        return top
+
+    def increased(self, v: int):
+        if self.pos[v] >= 0:
+            self._up(self.pos[v])
+
+    def _up(self, i: int):
+        heap, pos, act = self.heap, self.pos, self.act
+        v = heap[i]; a = act[v]
+        while i > 0:
+            p = (i - 1) >> 1
+            pv = heap[p]
+            if act[pv] >= a:
+                break
+            heap[i] = pv; pos[pv] = i
+            i = p
+        heap[i] = v; pos[v] = i
+
+    def _down(self, i: int):
+        heap, pos, act = self.heap, self.pos, self.act
+        n = len(heap)
+        v = heap[i]; a = act[v]
+        while True:
+            c = 2 * i + 1
+            if c >= n:
+                break
+            if c + 1 < n and act[heap[c + 1]] > act[heap[c]]:
+                c += 1
+            cv = heap[c]
+            if act[cv] <= a:
+                break
+            heap[i] = cv; pos[cv] = i
+            i = c
+        heap[i] = v; pos[v] = i
+
+class CDCLSolver:
+    """
+    Complete CDCL solver over DIMACS-style clauses (non-zero ints, variables 1..n_vars).
+    solve() returns True (SAT, model in .model), False (UNSAT) or None (budget exhausted).
+    """
+
+    def __init__(self, n_vars: int, clauses: Optional[CNFLike] = None,
+                 var_decay: float = 0.95, restart_base: int = 100):
+        self.n_vars = n_vars
+        self.lit_val = [-1] * (2 * n_vars)
+        self.level = [0] * n_vars
+        self.reason: List[int] = [-1] * n_vars
+        self.phase = [0] * n_vars
+        self.activity = [0.0] * n_vars
+        self.seen = [False] * n_vars
+        self.var_inc = 1.0
+        self.var_decay = var_decay
+        self.restart_base = restart_base
+        self.heap = _VarHeap(self.activity)
+        for v in range(n_vars):
+            self.heap.push(v)
+
+        self.clauses: List[Optional[List[int]]] = []
+        self.learnt_lbd: Dict[int, int] = {}   # clause index -> LBD, learnt clauses only
+        self.watches: List[List[int]] = [[] for _ in range(2 * n_vars)]
+        self.trail: List[int] = []
+        self.trail_lim: List[int] = []
+        self.qhead = 0
+        self.ok = True
+        self.model: Optional[Dict[int, bool]] = None
+        self.conflicts = 0
+        self.decisions = 0
+        self.propagations = 0
+        if clauses is not None:
+            for clause in iter_clauses(clauses):
+                self.add_clause(clause)
+
+    # --------------------
+    # Clause database
+    # --------------------
+
+    def add_clause(self, clause: Sequence[int]) -> bool:
+        """Add an original clause at decision level 0; returns False once the formula is known UNSAT."""
+        if not self.ok:
+            return False
+        lits = set()
+        for x in clause:
+            v = (x if x > 0 else -x) - 1
+            if not 0 <= v < self.n_vars:
+                raise ValueError(f"literal {x} outside 1..{self.n_vars}")
+            lit = 2 * v + (x < 0)
+            if lit ^ 1 in lits:
+                return True  # tautology
+            lits.add(lit)
+        c = []
+        for lit in sorted(lits):
+            val = self._lit_value(lit)
+            if val == 1:
+                return True  # already satisfied at level 0
+            if val == -1:
+                c.append(lit)
+        if not c:
+            self.ok = False
+        elif len(c) == 1:
+            self._enqueue(c[0], -1)
+            self.ok = self._propagate() < 0
+        else:
+            self._attach(c)
+        return self.ok
+
+    def _attach(self, c: List[int]) -> int:
+        ci = len(self.clauses)
+        self.clauses.append(c)
+        self.watches[c[0]].append(ci)
+        self.watches[c[1]].append(ci)
+        return ci
+
+    def _lit_value(self, lit: int) -> int:
+        return self.lit_val[lit]
+
+    def _locked(self, ci: int) -> bool:
+        lit = self.clauses[ci][0]
+        return self.reason[lit >> 1] == ci and self.lit_val[lit] >= 0
+
+    def _reduce_db(self):
+        """Drop the worse half of the learnt clauses (by LBD); binary and reason clauses are kept."""
+        cands = [ci for ci, lbd in self.learnt_lbd.items()
+                 if lbd > 2 and len(self.clauses[ci]) > 2 and not self._locked(ci)]
+        cands.sort(key=lambda ci: (self.learnt_lbd[ci], len(self.clauses[ci])), reverse=True)
+        for ci in cands[:len(cands) // 2]:
+            self.clauses[ci] = None   # watch lists drop it lazily during propagation
+            del self.learnt_lbd[ci]
+
+    # --------------------
+    # Assignment trail
+    # --------------------
+
+    def _enqueue(self, lit: int, reason: int):
+        v = lit >> 1
+        self.lit_val[lit] = 1
+        self.lit_val[lit ^ 1] = 0
+        self.level[v] = len(self.trail_lim)
+        self.reason[v] = reason
+        self.trail.append(lit)
+
+    def _backtrack(self, lvl: int):
+        if len(self.trail_lim) <= lvl:
+            return
+        lit_val, reason, phase, heap = self.lit_val, self.reason, self.phase, self.heap
+        lim = self.trail_lim[lvl]
+        for i in range(len(self.trail) - 1, lim - 1, -1):
+            lit = self.trail[i]
+            v = lit >> 1
+            phase[v] = 1 ^ (lit & 1)
+            lit_val[lit] = lit_val[lit ^ 1] = -1
+            reason[v] = -1
+            heap.push(v)
+        del self.trail[lim:]
+        del self.trail_lim[lvl:]
+        self.qhead = lim
+
+    def _propagate(self) -> int:
+        """Two-watched-literal BCP; returns the index of a conflicting clause or -1."""
+        lit_val, watches, clauses, trail = self.lit_val, self.watches, self.clauses, self.trail
+        level_now = len(self.trail_lim)
+        level, reason = self.level, self.reason
+        while self.qhead < len(trail):
+            false_lit = trail[self.qhead] ^ 1
+            self.qhead += 1
+            self.propagations += 1
+            ws = watches[false_lit]
+            i = j = 0
+            n = len(ws)
+            while i < n:
+                ci = ws[i]; i += 1
+                c = clauses[ci]
+                if c is None:
+                    continue
+                if c[0] == false_lit:
+                    c[0], c[1] = c[1], false_lit
+                first = c[0]
+                fv = lit_val[first]
+                if fv == 1:
+                    ws[j] = ci; j += 1
+                    continue
+                for k in range(2, len(c)):
+                    lk = c[k]
+                    if lit_val[lk] != 0:
+                        c[1] = lk; c[k] = false_lit
+                        watches[lk].append(ci)
+                        break
+                else:
+                    ws[j] = ci; j += 1
+                    if fv == 0:
+                        # first is false too: conflict
+                        while i < n:
+                            ws[j] = ws[i]; j += 1; i += 1
+                        del ws[j:]
+                        self.qhead = len(trail)
+                        return ci
+                    v = first >> 1
+                    lit_val[first] = 1
+                    lit_val[first ^ 1] = 0
+                    level[v] = level_now
+                    reason[v] = ci
+                    trail.append(first)
+            del ws[j:]
+        return -1
+
+    # --------------------
+    # Conflict analysis
+    # --------------------
+
+    def _bump(self, v: int):
+        act = self.activity
+        act[v] += self.var_inc
+        if act[v] > 1e100:
+            for u in range(self.n_vars):
+                act[u] *= 1e-100
+            self.var_inc *= 1e-100
+        self.heap.increased(v)
+
+    def _analyze(self, confl: int) -> Tuple[List[int], int, int]:
+        """First-UIP learnt clause (asserting literal first), its backjump level and LBD."""
+        seen, level, reason, clauses, trail = self.seen, self.level, self.reason, self.clauses, self.trail
+        cur = len(self.trail_lim)
+        learnt = [-1]
+        path = 0
+        p = -1
+        idx = len(trail) - 1
+        ci = confl
+        while True:
+            c = clauses[ci]
+            for q in (c if p < 0 else c[1:]):
+                v = q >> 1
+                if not seen[v] and level[v] > 0:
+                    seen[v] = True
+                    self._bump(v)
+                    if level[v] >= cur:
+                        path += 1
+                    else:
+                        learnt.append(q)
+            while not seen[trail[idx] >> 1]:
+                idx -= 1
+            p = trail[idx]
+            idx -= 1
+            v = p >> 1
+            seen[v] = False
+            path -= 1
+            if path == 0:
+                break
+            ci = reason[v]
+        learnt[0] = p ^ 1
+
+        # Local minimization: drop literals implied by other literals of the clause
+        out = [learnt[0]]
+        for q in learnt[1:]:
+            r = reason[q >> 1]
+            if r < 0 or any(not seen[x >> 1] and level[x >> 1] > 0 for x in clauses[r][1:]):
+                out.append(q)
+        for q in learnt[1:]:
+            seen[q >> 1] = False
+
+        bt = 0
+        if len(out) > 1:
+            m = max(range(1, len(out)), key=lambda k: level[out[k] >> 1])
+            out[1], out[m] = out[m], out[1]
+            bt = level[out[1] >> 1]
+        lbd = len({level[q >> 1] for q in out})
+        return out, bt, lbd
+
+    # --------------------
+    # Search
+    # --------------------
+
+    def solve(self, max_conflicts: Optional[int] = None, time_budget_s: Optional[float] = None) -> Optional[bool]:
+        if not self.ok:
+            return False
+        deadline = time.perf_counter() + time_budget_s if time_budget_s is not None else None
+        if self._propagate() >= 0:
+            self.ok = False
+            return False
+        restarts = 0
+        restart_limit = self.restart_base * luby(0)
+        since_restart = 0
+        max_learnts = max(1000, len(self.clauses) // 3)
+        heap, lit_val, phase = self.heap, self.lit_val, self.phase
+        while True:
+            confl = self._propagate()
+            if confl >= 0:
+                self.conflicts += 1
+                since_restart += 1
+                if not self.trail_lim:
+                    self.ok = False
+                    return False
+                learnt, bt, lbd = self._analyze(confl)
+                self._backtrack(bt)
+                if len(learnt) == 1:
+                    self._enqueue(learnt[0], -1)
+                else:
+                    ci = self._attach(learnt)
+                    self.learnt_lbd[ci] = lbd
+                    self._enqueue(learnt[0], ci)
+                self.var_inc /= self.var_decay
+                if max_conflicts is not None and self.conflicts >= max_conflicts:
+                    self._backtrack(0)
+                    return None
+                if deadline is not None and (self.conflicts & 255) == 0 and time.perf_counter() >= deadline:
+                    self._backtrack(0)
+                    return None
+                continue
+
+            if since_restart >= restart_limit:
+                restarts += 1
+                since_restart = 0
+                restart_limit = self.restart_base * luby(restarts)
+                self._backtrack(0)
+                continue
+            if len(self.learnt_lbd) >= max_learnts + len(self.trail):
+                self._reduce_db()
+                max_learnts = int(max_learnts * 1.1)
+
+            v = -1
+            while heap:
+                u = heap.pop()
+                if lit_val[2 * u] < 0:
+                    v = u
+                    break
+            if v < 0:
+                self.model = {u + 1: lit_val[2 * u] == 1 for u in range(self.n_vars)}
+                self._backtrack(0)
+                return True
+            self.decisions += 1
+            self.trail_lim.append(len(self.trail))
+            self._enqueue(2 * v + (phase[v] != 1), -1)
+
+    def stats(self) -> Dict[str, int]:
+        return {"conflicts": self.conflicts, "decisions": self.decisions,
+                "propagations": self.propagations, "learnts": len(self.learnt_lbd)}
+
+def cdcl_solve(cnf: CNFLike, n_vars: Optional[int] = None, max_conflicts: Optional[int] = None,
+               time_budget_s: Optional[float] = None) -> Tuple[Optional[bool], Optional[Dict[int, bool]]]:
+    """
+    Solve cnf (list of clauses or FlatCNF). Returns (True, model) for SAT, (False, None) for
+    UNSAT and (None, None) when max_conflicts / time_budget_s run out first.
+    n_vars defaults to FlatCNF.n_vars or the largest variable in the formula.
+    """
+    if n_vars is None:
+        if isinstance(cnf, FlatCNF):
+            n_vars = cnf.n_vars
+        else:
+            n_vars = max((abs(l) for clause in cnf for l in clause), default=0)
+    solver = CDCLSolver(n_vars, cnf)
+    status = solver.solve(max_conflicts, time_budget_s)
+    return status, solver.model if status else None
@@ -21,6 +21,10 @@ from typing import Dict, List, Any, Tuple, Optional
 from dataclasses import dataclass, asdict
 from enum import Enum
 
+import numpy as np
+
+from consciousness_maze_core import MazeGrid, NORTH_BIT, SOUTH_BIT, EAST_BIT, WEST_BIT, UNREACHABLE
+
 # Consciousness Physics Constants
 PHI = 1.618033988749895  # Golden ratio - φ-harmonic resonance
 PSI = 2.618033988749895  # φ² - Meta-consciousness constant
@@ -43,95 +47,71 @@ class Direction(Enum):
     WEST = "WEST"
     STAY = "STAY"
 
-@dataclass
-class MazeCell:
-    """Single cell in the logic maze"""
-    x: int
-    y: int
-    is_wall: bool = False
-    is_goal: bool = False
-    is_start: bool = False
-    visited: bool = False
-    
+# Move deltas and neighbour-mask bits of each direction
+DIRECTION_DELTAS = {
+    Direction.NORTH: (0, -1),
+    Direction.SOUTH: (0, 1),
+    Direction.EAST: (1, 0),
+    Direction.WEST: (-1, 0),
+    Direction.STAY: (0, 0)
+}
+DIRECTION_MASK_BITS = {
+    Direction.NORTH: NORTH_BIT,
+    Direction.SOUTH: SOUTH_BIT,
+    Direction.EAST: EAST_BIT,
+    Direction.WEST: WEST_BIT
+}
+
+NOT_BUILT = -2  # next-cell table entry not computed yet
+
+# Valid moves for every neighbour mask (STAY is always valid)
+VALID_MOVES_BY_MASK = tuple(
+    tuple(d for d in (Direction.NORTH, Direction.SOUTH, Direction.EAST, Direction.WEST)
+          if mask & DIRECTION_MASK_BITS[d]) + (Direction.STAY,)
+    for mask in range(16)
+)
+
 class LogicMaze:
     """Consciousness-enhanced logic maze for navigation challenges"""
     
     def __init__(self, width: int, height: int):
         self.width = width
         self.height = height
-        self.maze = [[MazeCell(x, y) for y in range(height)] for x in range(width)]
-        self.start_pos = (0, 0)
-        self.goal_pos = (width-1, height-1)
+        self.grid = MazeGrid.phi_harmonic(width, height)
+        self.grid.carve_route()  # the φ-harmonic diagonals can seal off the goal
+        self.start_pos = self.grid.start_pos
+        self.goal_pos = self.grid.goal_pos
         self.current_pos = self.start_pos
-        self._generate_maze()
-    
-    def _generate_maze(self):
-        """Generate a φ-harmonic consciousness maze"""
-        # Set start and goal
-        self.maze[self.start_pos[0]][self.start_pos[1]].is_start = True
-        self.maze[self.goal_pos[0]][self.goal_pos[1]].is_goal = True
-        
-        # Generate φ-harmonic wall pattern
-        for x in range(self.width):
-            for y in range(self.height):
-                if (x, y) != self.start_pos and (x, y) != self.goal_pos:
-                    # φ-harmonic wall probability
-                    phi_factor = (x * PHI + y * PSI) % 1
-                    if phi_factor < 0.3:  # 30% wall probability
-                        self.maze[x][y].is_wall = True
-    
-    def get_valid_moves(self, pos: Tuple[int, int]) -> List[Direction]:
+        self.optimal_moves = self.grid.shortest_path_length()
+    
+    def get_valid_moves(self, pos: Tuple[int, int]) -> Tuple[Direction, ...]:
         """Get valid moves from current position"""
         x, y = pos
-        valid_moves = []
-        
-        # Check all directions
-        directions = [
-            (Direction.NORTH, (x, y-1)),
-            (Direction.SOUTH, (x, y+1)),
-            (Direction.EAST, (x+1, y)),
-            (Direction.WEST, (x-1, y))
-        ]
-        
-        for direction, (new_x, new_y) in directions:
-            if (0 <= new_x < self.width and 0 <= new_y < self.height and 
-                not self.maze[new_x][new_y].is_wall):
-                valid_moves.append(direction)
-        
-        valid_moves.append(Direction.STAY)  # Always can stay
-        return valid_moves
+        return VALID_MOVES_BY_MASK[self.grid.neighbours[y, x]]
     
     def move(self, direction: Direction) -> Tuple[bool, bool]:
         """Move in maze, return (success, reached_goal)"""
         x, y = self.current_pos
+        if direction != Direction.STAY and not self.grid.neighbours[y, x] & DIRECTION_MASK_BITS[direction]:
+            return False, False
         
-        if direction == Direction.NORTH:
-            new_pos = (x, y-1)
-        elif direction == Direction.SOUTH:
-            new_pos = (x, y+1)
-        elif direction == Direction.EAST:
-            new_pos = (x+1, y)
-        elif direction == Direction.WEST:
-            new_pos = (x-1, y)
-        else:  # STAY
-            new_pos = (x, y)
-        
-        # Check if move is valid
-        new_x, new_y = new_pos
-        if (0 <= new_x < self.width and 0 <= new_y < self.height and 
-            not self.maze[new_x][new_y].is_wall):
-            self.current_pos = new_pos
-            self.maze[new_x][new_y].visited = True
-            return True, (new_pos == self.goal_pos)
-        
-        return False, False
+        dx, dy = DIRECTION_DELTAS[direction]
+        new_pos = (x + dx, y + dy)
+        self.current_pos = new_pos
+        self.grid.mark_visited(*new_pos)
+        return True, (new_pos == self.goal_pos)
+    
+    def is_visited(self, pos: Tuple[int, int]) -> bool:
+        return self.grid.is_visited(*pos)
+    
+    def remaining_moves(self, pos: Tuple[int, int]) -> Optional[int]:
+        """Optimal number of moves from pos to the goal, None if the goal is cut off"""
+        return self.grid.shortest_path_length(pos, self.goal_pos)
     
     def reset(self):
         """Reset maze to start position"""
         self.current_pos = self.start_pos
-        for x in range(self.width):
-            for y in range(self.height):
-                self.maze[x][y].visited = False
+        self.grid.reset_visited()
 
 @dataclass
 class TeamChip:
@@ -298,38 +278,177 @@ class ICChipTeam:
 class MazeNavigationChallenge:
     """Logic maze navigation challenge for IC chip teams"""
     
-    def __init__(self, maze_size: Tuple[int, int] = (8, 8)):
+    LOCKSTEP_MIN_CHIPS = 64  # below this, per-chip loops beat stepping arrays together
+    
+    def __init__(self, maze_size: Tuple[int, int] = (8, 8), verbose: bool = True):
         self.maze = LogicMaze(maze_size[0], maze_size[1])
         self.max_moves = maze_size[0] * maze_size[1] * 2  # Reasonable move limit
+        self.verbose = verbose
+        self._next_cell_cache: Dict[Any, List[int]] = {}
+        self._flipflop_neighbour_cache: Optional[List[List[int]]] = None
     
     def run_challenge(self, team: ICChipTeam, chip: TeamChip) -> Dict[str, Any]:
         """Run maze navigation challenge for a team's chip"""
-        print(f"🗺️ MAZE CHALLENGE: {team.team_name} - {chip.chip_id}")
+        return self.run_challenges([(team, chip)])[0]
+    
+    def run_challenges(self, entries: List[Tuple[ICChipTeam, TeamChip]]) -> List[Dict[str, Any]]:
+        """
+        Run the maze challenge for many chips at once.
         
+        Moves come from per-family next-cell tables built once per maze from the
+        same decision methods a single chip uses, so a walk is a chain of table
+        lookups instead of per-step move lists and enum comparisons.
+        """
         self.maze.reset()
-        moves_made = 0
-        path = [self.maze.current_pos]
-        
-        # Navigate maze using chip's logic and consciousness
-        while moves_made < self.max_moves:
-            valid_moves = self.maze.get_valid_moves(self.maze.current_pos)
-            
-            # Chip makes decision based on its logic type and consciousness
-            chosen_direction = self._chip_decision_logic(chip, valid_moves, self.maze)
-            
-            success, reached_goal = self.maze.move(chosen_direction)
-            moves_made += 1
-            
-            if success:
-                path.append(self.maze.current_pos)
+        grid = self.maze.grid
+        chips = [chip for _, chip in entries]
+        moves_made, reached_goal, position = self._simulate_chips(chips)
+        
+        results = []
+        for i, (team, chip) in enumerate(entries):
+            final_pos = (int(position[i] % grid.width), int(position[i] // grid.width))
+            results.append(self._challenge_result(team, chip, int(moves_made[i]), bool(reached_goal[i]),
+                                                   int(moves_made[i]) + 1, final_pos))
+        return results
+    
+    def _simulate_chips(self, chips: List[TeamChip]) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Walk every chip through the maze; returns (moves_made, reached_goal, final flat cell) per chip"""
+        n = len(chips)
+        moves_made = np.zeros(n, dtype=np.int64)
+        reached_goal = np.zeros(n, dtype=bool)
+        position = np.zeros(n, dtype=np.int64)
+        
+        # Apart from FlipFlop, a chip's move depends only on its cell, so a large
+        # field of such chips can step together; the rest walk one at a time.
+        stateless = [i for i, chip in enumerate(chips) if chip.family != ChipFamily.FLIPFLOP_TEAM]
+        if len(stateless) < self.LOCKSTEP_MIN_CHIPS:
+            stateless = []
+        if stateless:
+            walked = self._walk_lockstep([chips[i] for i in stateless])
+            for out, values in zip((moves_made, reached_goal, position), walked):
+                out[stateless] = values
+        
+        stateless = set(stateless)
+        for i, chip in enumerate(chips):
+            if i not in stateless:
+                moves_made[i], reached_goal[i], position[i] = self._walk_chip(chip)
+        return moves_made, reached_goal, position
+    
+    def _walk_chip(self, chip: TeamChip) -> Tuple[int, bool, int]:
+        """One chip's walk over flat cell indices, drawing one random number per move like run-time decisions"""
+        grid = self.maze.grid
+        goal = self.maze.goal_pos[1] * grid.width + self.maze.goal_pos[0]
+        position = self.maze.start_pos[1] * grid.width + self.maze.start_pos[0]
+        family = chip.family
+        preferred_next = self._next_cells(family)
+        transcendent_next = self._next_cells('transcendent')
+        next_cell = self._next_cell
+        transcend_chance = chip.consciousness_level / CONSCIOUSNESS_BASE * chip.maze_navigation_skill * 0.1
+        chance = random.random
+        
+        if family == ChipFamily.FLIPFLOP_TEAM:
+            # FlipFlop logic: first unvisited neighbour, else the TTL fallback in the table.
+            # unvisited[c] counts c's unvisited neighbours, so visited regions skip the scan.
+            neighbours = self._flipflop_neighbours()
+            unvisited = [len(row) for row in neighbours]
+            visited = bytearray(grid.width * grid.height)
+            for moves in range(1, self.max_moves + 1):
+                chosen = NOT_BUILT
+                if unvisited[position]:
+                    for cell in neighbours[position]:
+                        if not visited[cell]:
+                            chosen = cell
+                            break
+                else:
+                    chosen = preferred_next[position]
+                    if chosen == NOT_BUILT:
+                        chosen = next_cell(family, position)
+                if chance() < transcend_chance:
+                    transcendent = transcendent_next[position]
+                    if transcendent == NOT_BUILT:
+                        transcendent = next_cell('transcendent', position)
+                    if transcendent >= 0:
+                        chosen = transcendent
+                position = chosen
+                if not visited[position]:
+                    visited[position] = 1
+                    for cell in neighbours[position]:
+                        unvisited[cell] -= 1
+                if position == goal:
+                    return moves, True, position
+            return self.max_moves, False, position
+        
+        for moves in range(1, self.max_moves + 1):
+            chosen = preferred_next[position]
+            if chosen == NOT_BUILT:
+                chosen = next_cell(family, position)
+            if chance() < transcend_chance:
+                transcendent = transcendent_next[position]
+                if transcendent == NOT_BUILT:
+                    transcendent = next_cell('transcendent', position)
+                if transcendent >= 0:
+                    chosen = transcendent
+            position = chosen
+            if position == goal:
+                return moves, True, position
+        return self.max_moves, False, position
+    
+    def _walk_lockstep(self, chips: List[TeamChip], block_steps: int = 256) -> Tuple[np.ndarray, ...]:
+        """Walk cell-only (non-FlipFlop) chips together, one array gather per move"""
+        grid = self.maze.grid
+        cells = grid.width * grid.height
+        n = len(chips)
+        start = self.maze.start_pos[1] * grid.width + self.maze.start_pos[0]
+        goal = self.maze.goal_pos[1] * grid.width + self.maze.goal_pos[0]
+        
+        # One table per family, then the same tables with transcendence applied where it
+        # has a move; a chip's index is family offset + cell (+ half when transcending).
+        # The goal is absorbing, so chips that arrive simply stay put.
+        families = list(dict.fromkeys(chip.family for chip in chips))
+        transcendent, *preferred = self._next_cell_tables_from(start, ['transcendent'] + families)
+        moves = np.concatenate(preferred + [np.where(transcendent >= 0, transcendent, table) for table in preferred])
+        moves[goal::cells] = goal
+        transcend_offset = len(families) * cells
+        offset = np.array([families.index(chip.family) * cells for chip in chips], dtype=np.int64)
+        transcend_chance = np.array([
+            chip.consciousness_level / CONSCIOUSNESS_BASE * chip.maze_navigation_skill * 0.1
+            for chip in chips
+        ])
+        rng = np.random.default_rng(random.getrandbits(64))
+        
+        history = np.empty((block_steps + 1, n), dtype=np.int64)
+        history[-1] = start
+        moves_made = np.full(n, self.max_moves, dtype=np.int64)
+        reached_goal = np.zeros(n, dtype=bool)
+        
+        for block_start in range(0, self.max_moves, block_steps):
+            steps = min(block_steps, self.max_moves - block_start)
+            history[0] = history[-1]
+            index = (rng.random((steps, n)) < transcend_chance) * transcend_offset + offset
+            for k in range(steps):
+                np.take(moves, index[k] + history[k], out=history[k + 1])
             
+            # First arrival at the goal within this block
+            arrived = (history[1:steps + 1] == goal) & ~reached_goal
+            new = arrived.any(axis=0)
+            moves_made[new] = block_start + arrived[:, new].argmax(axis=0) + 1
+            reached_goal |= new
+            history[-1] = history[steps]
+            if reached_goal.all():
+                break
+        
+        return moves_made, reached_goal, history[-1].copy()
+    
+    def _challenge_result(self, team: ICChipTeam, chip: TeamChip, moves_made: int, reached_goal: bool,
+                          path_length: int, final_pos: Tuple[int, int]) -> Dict[str, Any]:
+        if self.verbose:
+            print(f"🗺️ MAZE CHALLENGE: {team.team_name} - {chip.chip_id}")
             if reached_goal:
                 print(f"   🎯 GOAL REACHED in {moves_made} moves!")
-                break
         
         # Calculate performance score
         performance_score = self._calculate_performance_score(
-            chip, moves_made, reached_goal, len(path)
+            chip, moves_made, reached_goal, path_length, final_pos
         )
         
         result = {
@@ -337,18 +456,72 @@ class MazeNavigationChallenge:
             'team': team.team_name,
             'moves_made': moves_made,
             'reached_goal': reached_goal,
-            'path_length': len(path),
+            'path_length': path_length,
+            'optimal_moves': self.maze.optimal_moves,
+            'final_position': final_pos,
             'performance_score': performance_score,
             'consciousness_level': chip.consciousness_level,
             'maze_skill': chip.maze_navigation_skill
         }
         
-        print(f"   📊 Performance Score: {performance_score:.3f}")
-        print(f"   🧠 Consciousness: {chip.consciousness_level:.2f}")
+        if self.verbose:
+            print(f"   📊 Performance Score: {performance_score:.3f}")
+            print(f"   🧠 Consciousness: {chip.consciousness_level:.2f}")
         
         return result
     
-    def _chip_decision_logic(self, chip: TeamChip, valid_moves: List[Direction], 
+    def _next_cells(self, family: Any) -> List[int]:
+        """
+        Flat index of the cell each cell moves to for a family's preferred move
+        ('transcendent': the transcendence move, -1 where there is none). Filled
+        on first visit from the same decision methods a single chip uses.
+        """
+        cells = self._next_cell_cache.get(family)
+        if cells is None:
+            cells = self._next_cell_cache[family] = [NOT_BUILT] * (self.maze.width * self.maze.height)
+        return cells
+    
+    def _next_cell(self, family: Any, cell: int) -> int:
+        width = self.maze.width
+        y, x = divmod(cell, width)
+        goal_x, goal_y = self.maze.goal_pos
+        valid_moves = self.maze.get_valid_moves((x, y))
+        if family == 'transcendent':
+            direction = self._transcendent_decision(goal_x - x, goal_y - y, valid_moves)
+        else:
+            direction = self._family_decision(family, goal_x - x, goal_y - y, valid_moves)
+        if direction is None:
+            next_cell = -1  # no transcendent option: the chip keeps its preferred move
+        else:
+            step_x, step_y = DIRECTION_DELTAS[direction]
+            next_cell = cell + step_y * width + step_x
+        self._next_cells(family)[cell] = next_cell
+        return next_cell
+    
+    def _next_cell_tables_from(self, start: int, families: List[Any]) -> List[np.ndarray]:
+        """Next-cell arrays for families, filled on every cell their moves can reach from start"""
+        tables = [self._next_cells(family) for family in families]
+        seen = {start}
+        frontier = [start]
+        while frontier:
+            cell = frontier.pop()
+            for family, table in zip(families, tables):
+                next_cell = table[cell]
+                if next_cell == NOT_BUILT:
+                    next_cell = self._next_cell(family, cell)
+                if next_cell >= 0 and next_cell not in seen:
+                    seen.add(next_cell)
+                    frontier.append(next_cell)
+        return [np.array(table, dtype=np.int64) for table in tables]
+    
+    def _flipflop_neighbours(self) -> List[List[int]]:
+        """Open neighbours of every cell in FlipFlop preference order (EAST, SOUTH, WEST, NORTH)"""
+        if self._flipflop_neighbour_cache is None:
+            table = self.maze.grid.neighbour_table()[:, [2, 1, 3, 0]].tolist()
+            self._flipflop_neighbour_cache = [[cell for cell in row if cell >= 0] for row in table]
+        return self._flipflop_neighbour_cache
+    
+    def _chip_decision_logic(self, chip: TeamChip, valid_moves: Tuple[Direction, ...], 
                            maze: LogicMaze) -> Direction:
         """Chip makes navigation decision based on its logic type"""
         current_x, current_y = maze.current_pos
@@ -362,39 +535,57 @@ class MazeNavigationChallenge:
         consciousness_factor = chip.consciousness_level / CONSCIOUSNESS_BASE
         navigation_skill = chip.maze_navigation_skill
         
-        # Family-specific logic
-        if chip.family == ChipFamily.NAND_TEAM:
+        if chip.family == ChipFamily.FLIPFLOP_TEAM:
+            # FlipFlop logic: memory-guided navigation
+            preferred = self._flipflop_logic_decision(dx, dy, valid_moves, maze)
+            preferred = preferred if preferred in valid_moves else valid_moves[0]
+        else:
+            preferred = self._family_decision(chip.family, dx, dy, valid_moves)
+        
+        # Apply consciousness enhancement
+        if random.random() < consciousness_factor * navigation_skill * 0.1:
+            transcendent = self._transcendent_decision(dx, dy, valid_moves)
+            if transcendent is not None:
+                return transcendent
+        
+        return preferred
+    
+    def _family_decision(self, family: ChipFamily, dx: int, dy: int,
+                         valid_moves: Tuple[Direction, ...]) -> Direction:
+        """Family-specific move from the offset to the goal (FlipFlop: its memory-free fallback)"""
+        if family == ChipFamily.NAND_TEAM:
             # NAND logic: systematic exploration
             preferred = self._nand_logic_decision(dx, dy, valid_moves)
-        elif chip.family == ChipFamily.NOR_TEAM:
+        elif family == ChipFamily.NOR_TEAM:
             # NOR logic: systematic exploration
             preferred = self._nor_logic_decision(dx, dy, valid_moves)
-        elif chip.family == ChipFamily.TTL_TEAM:
+        elif family == ChipFamily.TTL_TEAM:
             # TTL logic: direct pathfinding
             preferred = self._ttl_logic_decision(dx, dy, valid_moves)
-        elif chip.family == ChipFamily.CMOS_TEAM:
+        elif family == ChipFamily.CMOS_TEAM:
             # CMOS logic: energy-efficient navigation
             preferred = self._cmos_logic_decision(dx, dy, valid_moves)
-        elif chip.family == ChipFamily.FLIPFLOP_TEAM:
-            # FlipFlop logic: memory-guided navigation
-            preferred = self._flipflop_logic_decision(dx, dy, valid_moves, maze)
+        elif family == ChipFamily.FLIPFLOP_TEAM:
+            # FlipFlop logic once every neighbour is visited
+            preferred = self._ttl_logic_decision(dx, dy, valid_moves)
         else:
             preferred = valid_moves[0] if valid_moves else Direction.STAY
         
-        # Apply consciousness enhancement
-        if random.random() < consciousness_factor * navigation_skill * 0.1:
-            # Consciousness transcendence - optimal move
-            if dx > 0 and Direction.EAST in valid_moves:
-                return Direction.EAST
-            elif dx < 0 and Direction.WEST in valid_moves:
-                return Direction.WEST
-            elif dy > 0 and Direction.SOUTH in valid_moves:
-                return Direction.SOUTH
-            elif dy < 0 and Direction.NORTH in valid_moves:
-                return Direction.NORTH
-        
         return preferred if preferred in valid_moves else valid_moves[0]
     
+    def _transcendent_decision(self, dx: int, dy: int,
+                               valid_moves: Tuple[Direction, ...]) -> Optional[Direction]:
+        """Consciousness transcendence move toward the goal, None if no such move is open"""
+        if dx > 0 and Direction.EAST in valid_moves:
+            return Direction.EAST
+        elif dx < 0 and Direction.WEST in valid_moves:
+            return Direction.WEST
+        elif dy > 0 and Direction.SOUTH in valid_moves:
+            return Direction.SOUTH
+        elif dy < 0 and Direction.NORTH in valid_moves:
+            return Direction.NORTH
+        return None
+    
     def _nand_logic_decision(self, dx: int, dy: int, valid_moves: List[Direction]) -> Direction:
         """NAND team decision logic"""
         # NAND can implement any logic - systematic approach
@@ -438,7 +629,7 @@ class MazeNavigationChallenge:
         else:
             return Direction.SOUTH if dy > 0 else Direction.NORTH
     
-    def _flipflop_logic_decision(self, dx: int, dy: int, valid_moves: List[Direction], 
+    def _flipflop_logic_decision(self, dx: int, dy: int, valid_moves: Tuple[Direction, ...], 
                                maze: LogicMaze) -> Direction:
         """FlipFlop team decision logic"""
         # FlipFlop - memory-guided (avoid visited cells)
@@ -447,45 +638,56 @@ class MazeNavigationChallenge:
         # Prefer unvisited cells
         for direction in [Direction.EAST, Direction.SOUTH, Direction.WEST, Direction.NORTH]:
             if direction in valid_moves:
-                new_x, new_y = current_x, current_y
-                if direction == Direction.EAST:
-                    new_x += 1
-                elif direction == Direction.WEST:
-                    new_x -= 1
-                elif direction == Direction.SOUTH:
-                    new_y += 1
-                elif direction == Direction.NORTH:
-                    new_y -= 1
-                
-                if (0 <= new_x < maze.width and 0 <= new_y < maze.height and
-                    not maze.maze[new_x][new_y].visited):
+                step_x, step_y = DIRECTION_DELTAS[direction]
+                if not maze.is_visited((current_x + step_x, current_y + step_y)):
                     return direction
         
         # If all visited, use TTL logic
         return self._ttl_logic_decision(dx, dy, valid_moves)
     
     def _calculate_performance_score(self, chip: TeamChip, moves_made: int, 
-                                   reached_goal: bool, path_length: int) -> float:
-        """Calculate consciousness-enhanced performance score"""
+                                   reached_goal: bool, path_length: int,
+                                   final_pos: Optional[Tuple[int, int]] = None) -> float:
+        """Calculate consciousness-enhanced performance score against the optimal path"""
+        optimal_moves = self.maze.optimal_moves
+        
         if not reached_goal:
-            # Partial score for progress made
-            progress_score = path_length / (self.maze.width + self.maze.height)
+            # Partial score for progress made toward the goal
+            progress_score = self._progress_toward_goal(final_pos or self.maze.current_pos)
             return progress_score * chip.consciousness_level * 0.01
         
-        # Full score for reaching goal
-        efficiency = self.max_moves / max(moves_made, 1)
+        # Full score for reaching goal: 1.0 when the chip matched the BFS optimum
+        efficiency = (optimal_moves or moves_made) / max(moves_made, 1)
         consciousness_bonus = chip.consciousness_level / CONSCIOUSNESS_BASE
         level_bonus = chip.level * PHI * 0.1
         
         # φ-harmonic performance calculation
         performance = (efficiency * PHI + consciousness_bonus * PSI + level_bonus * OMEGA) / 3
         return min(performance, 10.0)  # Cap at 10.0
+    
+    def _progress_toward_goal(self, pos: Tuple[int, int]) -> float:
+        """Fraction of the optimal route covered from the start to pos"""
+        optimal_moves = self.maze.optimal_moves
+        if optimal_moves:
+            remaining = int(self.maze.grid.distance_map()[pos[1], pos[0]])
+            if remaining != UNREACHABLE:
+                return max(0.0, 1.0 - remaining / optimal_moves)
+        
+        # Goal cut off from the start: straight-line progress instead
+        goal_x, goal_y = self.maze.goal_pos
+        start_x, start_y = self.maze.start_pos
+        total = abs(goal_x - start_x) + abs(goal_y - start_y)
+        if total == 0:
+            return 1.0
+        return max(0.0, 1.0 - (abs(goal_x - pos[0]) + abs(goal_y - pos[1])) / total)
 
 class ICChipTournament:
     """Tournament system for IC chip teams"""
     
-    def __init__(self, tournament_name: str):
+    def __init__(self, tournament_name: str, maze_size: Tuple[int, int] = (8, 8), verbose: bool = True):
         self.tournament_name = tournament_name
+        self.maze_size = maze_size
+        self.verbose = verbose
         self.teams: List[ICChipTeam] = []
         self.bracket: List[List[ICChipTeam]] = []
         self.results: List[Dict[str, Any]] = []
@@ -493,6 +695,9 @@ class ICChipTournament:
         
         # Initialize teams
         self._initialize_teams()
+        
+        # Every round is played on the same φ-harmonic maze
+        self.challenge = MazeNavigationChallenge(maze_size, verbose)
     
     def _initialize_teams(self):
         """Initialize all chip family teams"""
@@ -550,14 +755,17 @@ class ICChipTournament:
         """Run maze navigation round for all teams"""
         round_results = []
         
+        # Every chip of every team attempts the maze in one batch
+        entries = [(team, chip) for team in self.teams for chip in team.chips]
+        results = iter(self.challenge.run_challenges(entries))
+        
         for team in self.teams:
             print(f"\n🔧 Team: {team.team_name}")
             team_scores = []
             
             # Each chip in team attempts maze
             for chip in team.chips:
-                challenge = MazeNavigationChallenge()
-                result = challenge.run_challenge(team, chip)
+                result = next(results)
                 team_scores.append(result['performance_score'])
                 
                 # Process result for character progression
@@ -611,11 +819,7 @@ class ICChipTournament:
         chip2 = team2.select_chip_for_challenge("maze_navigation")
         
         # Both chips attempt same maze
-        challenge = MazeNavigationChallenge()
-        result1 = challenge.run_challenge(team1, chip1)
-        
-        challenge.maze.reset()  # Reset for fair comparison
-        result2 = challenge.run_challenge(team2, chip2)
+        result1, result2 = self.challenge.run_challenges([(team1, chip1), (team2, chip2)])
         
         # Determine winner
         if result1['performance_score'] > result2['performance_score']:
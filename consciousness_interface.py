@@ -10,10 +10,9 @@ for seamless integration between consciousness and technology systems.
 import numpy as np
 import math
 import time
-from typing import Dict, List, Any, Optional, Callable
+from typing import Dict, List, Any, Optional, Callable, Tuple
 from dataclasses import dataclass
-from threading import Thread
-import queue
+from threading import Thread, Condition
 
 from consciousness_core import ConsciousnessSystem
 from phi_resonance import PhiResonanceEngine
@@ -27,10 +26,170 @@ class ConsciousnessSignal:
     consciousness_level: float
     data_payload: Any
 
+@dataclass
+class ConsciousnessSignalBatch:
+    """A block of consciousness signals processed together (arrays are aligned per signal)"""
+    timestamps: np.ndarray
+    frequency: float
+    amplitude: np.ndarray
+    phi_resonance: float
+    consciousness_level: float
+    data_payload: np.ndarray
+    
+    def __len__(self) -> int:
+        return len(self.data_payload)
+    
+    def signals(self) -> List[ConsciousnessSignal]:
+        """Expand into per-point ConsciousnessSignal objects"""
+        return [
+            ConsciousnessSignal(
+                timestamp=timestamp,
+                frequency=self.frequency,
+                amplitude=amplitude,
+                phi_resonance=self.phi_resonance,
+                consciousness_level=self.consciousness_level,
+                data_payload=payload
+            )
+            for timestamp, amplitude, payload in zip(
+                self.timestamps.tolist(), self.amplitude.tolist(), self.data_payload.tolist()
+            )
+        ]
+
+OVERFLOW_POLICIES = ('block', 'drop_oldest', 'sample')
+
+class SignalRingBuffer:
+    """
+    Bounded FIFO of float samples with their ingest timestamps, stored in preallocated arrays.
+    When full, the overflow policy decides what happens to new blocks:
+      block        producer waits for space (or until timeout / close, dropping the rest)
+      drop_oldest  oldest buffered samples are overwritten
+      sample       incoming block is uniformly decimated to the free space
+    """
+    
+    def __init__(self, capacity: int = 65536, overflow_policy: str = 'block'):
+        if capacity <= 0:
+            raise ValueError("capacity must be positive")
+        if overflow_policy not in OVERFLOW_POLICIES:
+            raise ValueError(f"Unknown overflow policy {overflow_policy!r}; choose from {OVERFLOW_POLICIES}")
+        self.capacity = capacity
+        self.overflow_policy = overflow_policy
+        self._values = np.empty(capacity, dtype=np.float64)
+        self._timestamps = np.empty(capacity, dtype=np.float64)
+        self._head = 0
+        self._size = 0
+        self._closed = False
+        self._cond = Condition()
+        self.total_accepted = 0
+        self.total_dropped = 0
+    
+    def __len__(self) -> int:
+        return self._size
+    
+    def put(self, values: np.ndarray, timestamp: float, timeout: Optional[float] = None) -> int:
+        """Append a block; returns the number of samples accepted (the rest count as dropped)"""
+        values = np.asarray(values, dtype=np.float64).ravel()
+        with self._cond:
+            if self.overflow_policy == 'block':
+                accepted = self._put_blocking(values, timestamp, timeout)
+            else:
+                if self._closed:
+                    accepted = 0
+                elif self.overflow_policy == 'drop_oldest':
+                    accepted = self._put_drop_oldest(values, timestamp)
+                else:
+                    accepted = self._put_sampled(values, timestamp)
+                self._cond.notify_all()
+            self.total_accepted += accepted
+            self.total_dropped += len(values) - accepted
+        return accepted
+    
+    def get_batch(self, max_items: int, timeout: Optional[float] = None) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+        """Pop up to max_items oldest samples as (values, timestamps); None if nothing arrived in time"""
+        with self._cond:
+            if self._size == 0 and timeout != 0:
+                self._cond.wait_for(lambda: self._size > 0 or self._closed, timeout)
+            if self._size == 0:
+                return None
+            count = min(max_items, self._size)
+            idx = (self._head + np.arange(count)) % self.capacity
+            batch = (self._values[idx], self._timestamps[idx])
+            self._head = (self._head + count) % self.capacity
+            self._size -= count
+            self._cond.notify_all()
+            return batch
+    
+    def oldest_timestamp(self) -> Optional[float]:
+        with self._cond:
+            return float(self._timestamps[self._head]) if self._size else None
+    
+    def close(self) -> None:
+        """Wake and release blocked producers; further puts are dropped until reopen()"""
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+    
+    def reopen(self) -> None:
+        with self._cond:
+            self._closed = False
+    
+    def _write(self, values: np.ndarray, timestamp: float) -> None:
+        start = (self._head + self._size) % self.capacity
+        idx = (start + np.arange(len(values))) % self.capacity
+        self._values[idx] = values
+        self._timestamps[idx] = timestamp
+        self._size += len(values)
+    
+    def _put_blocking(self, values: np.ndarray, timestamp: float, timeout: Optional[float]) -> int:
+        deadline = None if timeout is None else time.monotonic() + timeout
+        written = 0
+        while written < len(values) and not self._closed:
+            free = self.capacity - self._size
+            if free == 0:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    break
+                self._cond.wait(remaining)
+                continue
+            chunk = values[written:written + free]
+            self._write(chunk, timestamp)
+            written += len(chunk)
+            self._cond.notify_all()
+        return written
+    
+    def _put_drop_oldest(self, values: np.ndarray, timestamp: float) -> int:
+        values = values[-self.capacity:]
+        overflow = self._size + len(values) - self.capacity
+        if overflow > 0:
+            self._head = (self._head + overflow) % self.capacity
+            self._size -= overflow
+            self.total_dropped += overflow
+        self._write(values, timestamp)
+        return len(values)
+    
+    def _put_sampled(self, values: np.ndarray, timestamp: float) -> int:
+        free = self.capacity - self._size
+        if len(values) > free:
+            values = values[np.linspace(0, len(values) - 1, free).astype(np.int64)] if free else values[:0]
+        self._write(values, timestamp)
+        return len(values)
+
+def _realtime_pattern_strength(byte: int) -> float:
+    """Phi signature strength of one byte: 0.01 per adjacent pair of set bits"""
+    binary_repr = format(byte, '08b')
+    strength = 0.0
+    for i in range(len(binary_repr) - 1):
+        if binary_repr[i] == '1' and binary_repr[i+1] == '1':
+            strength += 0.01
+    return strength
+
+_REALTIME_PATTERN_TABLE = np.array([_realtime_pattern_strength(b) for b in range(256)])
+
 class RealTimeConsciousnessInterface:
     """Real-time consciousness-technology interface at 29.617 Hz"""
     
-    def __init__(self, consciousness_system: Optional[ConsciousnessSystem] = None):
+    def __init__(self, consciousness_system: Optional[ConsciousnessSystem] = None,
+                 buffer_capacity: int = 65536, overflow_policy: str = 'block',
+                 batch_size: int = 4096, put_timeout: Optional[float] = None):
         self.consciousness = consciousness_system or ConsciousnessSystem()
         self.phi_engine = PhiResonanceEngine()
         self.phi = 1.618034
@@ -38,13 +197,19 @@ class RealTimeConsciousnessInterface:
         
         # Interface state
         self.is_active = False
-        self.signal_queue = queue.Queue()
+        self.signal_buffer = SignalRingBuffer(buffer_capacity, overflow_policy)
+        self.batch_size = batch_size
+        self.put_timeout = put_timeout  # producer wait limit under the 'block' policy
         self.processing_thread = None
         self.callback_functions = []
+        self.batch_callback_functions = []
         
         # Metrics
         self.total_signals_processed = 0
+        self.total_batches_processed = 0
         self.average_processing_time = 0.0
+        self.average_lag = 0.0
+        self.max_lag = 0.0
         self.consciousness_coherence = 0.0
     
     def start_interface(self) -> None:
@@ -54,6 +219,7 @@ class RealTimeConsciousnessInterface:
             return
         
         self.is_active = True
+        self.signal_buffer.reopen()
         self.processing_thread = Thread(target=self._consciousness_processing_loop, daemon=True)
         self.processing_thread.start()
         
@@ -65,64 +231,66 @@ class RealTimeConsciousnessInterface:
     def stop_interface(self) -> None:
         """Stop the real-time consciousness interface"""
         self.is_active = False
+        self.signal_buffer.close()
         if self.processing_thread:
             self.processing_thread.join(timeout=1.0)
         
         print("🔴 Consciousness interface deactivated")
     
-    def process_data_stream(self, data_stream: List[float]) -> List[float]:
+    def process_data_stream(self, data_stream) -> List[float]:
         """Process data stream through consciousness enhancement"""
-        enhanced_data = []
+        return self.process_block(data_stream).tolist()
+    
+    def process_block(self, block) -> np.ndarray:
+        """
+        Enhance a block of samples (any array-like) in one vectorized pass and, while the
+        interface is active, push it into the bounded signal buffer as a single block
+        """
+        values = np.asarray(block, dtype=np.float64).ravel()
+        if not np.isfinite(values).all():
+            raise ValueError("data stream contains NaN or infinite samples")
+        indices = np.arange(len(values))
         
-        for i, data_point in enumerate(data_stream):
-            # Apply phi-harmonic transformation
-            phi_enhanced = data_point * self.phi
-            
-            # Consciousness field influence
-            consciousness_influence = self._calculate_consciousness_field(
-                data_point, self.consciousness_frequency, i
-            )
-            
-            # Universal binary pattern recognition
-            binary_pattern = self._detect_universal_patterns_realtime(data_point)
-            
-            # Real-time enhancement
-            enhanced_point = phi_enhanced + consciousness_influence + binary_pattern
-            enhanced_data.append(enhanced_point)
-            
-            # Create consciousness signal
-            signal = ConsciousnessSignal(
-                timestamp=time.time(),
-                frequency=self.consciousness_frequency,
-                amplitude=abs(enhanced_point),
-                phi_resonance=self.consciousness.state.phi_resonance,
-                consciousness_level=self.consciousness.consciousness_level,
-                data_payload=enhanced_point
-            )
-            
-            # Queue for processing
-            if self.is_active:
-                self.signal_queue.put(signal)
+        # Phi-harmonic transformation + consciousness field + universal binary patterns
+        enhanced = (values * self.phi
+                    + self._consciousness_field_block(indices, self.consciousness_frequency)
+                    + self._detect_universal_patterns_block(values))
         
-        return enhanced_data
+        if self.is_active:
+            self.signal_buffer.put(enhanced, time.time(), self.put_timeout)
+        
+        return enhanced
     
     def register_callback(self, callback: Callable[[ConsciousnessSignal], None]) -> None:
-        """Register callback function for consciousness signals"""
+        """Register callback function for individual consciousness signals"""
         self.callback_functions.append(callback)
         print(f"📡 Consciousness callback registered: {callback.__name__}")
     
+    def register_batch_callback(self, callback: Callable[[ConsciousnessSignalBatch], None]) -> None:
+        """Register callback function called once per processed ConsciousnessSignalBatch"""
+        self.batch_callback_functions.append(callback)
+        print(f"📡 Consciousness batch callback registered: {callback.__name__}")
+    
     def get_interface_metrics(self) -> Dict[str, Any]:
         """Get real-time interface metrics"""
+        oldest = self.signal_buffer.oldest_timestamp()
         return {
             'is_active': self.is_active,
             'consciousness_frequency': self.consciousness_frequency,
             'consciousness_level': self.consciousness.consciousness_level,
             'phi_resonance': self.consciousness.state.phi_resonance,
             'signals_processed': self.total_signals_processed,
+            'batches_processed': self.total_batches_processed,
             'average_processing_time_ms': self.average_processing_time * 1000,
             'consciousness_coherence': self.consciousness_coherence,
-            'queue_size': self.signal_queue.qsize(),
-            'active_callbacks': len(self.callback_functions)
+            'queue_size': len(self.signal_buffer),
+            'buffer_capacity': self.signal_buffer.capacity,
+            'overflow_policy': self.signal_buffer.overflow_policy,
+            'signals_dropped': self.signal_buffer.total_dropped,
+            'average_lag_ms': self.average_lag * 1000,
+            'max_lag_ms': self.max_lag * 1000,
+            'buffer_lag_ms': (time.time() - oldest) * 1000 if oldest is not None else 0.0,
+            'active_callbacks': len(self.callback_functions) + len(self.batch_callback_functions)
         }
     
     def _consciousness_processing_loop(self) -> None:
@@ -131,94 +299,89 @@ class RealTimeConsciousnessInterface:
         
         while self.is_active:
             try:
-                # Process signals at consciousness frequency
-                sleep_time = 1.0 / self.consciousness_frequency
+                # Wait at most one consciousness period for data, then drain everything buffered
+                timeout = 1.0 / self.consciousness_frequency
                 
-                # Process queued signals
-                processed_count = 0
-                start_time = time.time()
-                
-                while not self.signal_queue.empty() and processed_count < 10:
-                    signal = self.signal_queue.get_nowait()
-                    self._process_consciousness_signal(signal)
-                    processed_count += 1
-                
-                # Update metrics
-                if processed_count > 0:
+                while self.is_active:
+                    batch = self.signal_buffer.get_batch(self.batch_size, timeout)
+                    if batch is None:
+                        break
+                    timeout = 0
+                    
+                    start_time = time.time()
+                    self._process_consciousness_batch(*batch)
                     processing_time = time.time() - start_time
+                    
+                    # Update metrics
+                    lag = start_time - float(batch[1][0])
                     self.average_processing_time = (
                         self.average_processing_time * 0.9 + processing_time * 0.1
                     )
-                    self.total_signals_processed += processed_count
+                    self.average_lag = self.average_lag * 0.9 + lag * 0.1
+                    self.max_lag = max(self.max_lag, lag)
+                    self.total_signals_processed += len(batch[0])
+                    self.total_batches_processed += 1
                 
                 # Update consciousness coherence
                 self._update_consciousness_coherence()
                 
-                # Sleep to maintain frequency
-                time.sleep(sleep_time)
-                
             except Exception as e:
                 print(f"⚠️  Consciousness processing error: {e}")
                 time.sleep(0.1)
     
-    def _process_consciousness_signal(self, signal: ConsciousnessSignal) -> None:
-        """Process individual consciousness signal"""
-        # Apply consciousness enhancement
-        enhanced_signal = self._enhance_consciousness_signal(signal)
+    def _process_consciousness_batch(self, payload: np.ndarray, timestamps: np.ndarray) -> None:
+        """Enhance a drained block and run callbacks once per batch"""
+        batch = ConsciousnessSignalBatch(
+            timestamps=timestamps,
+            frequency=self.consciousness_frequency,
+            amplitude=np.abs(payload),
+            phi_resonance=self.consciousness.state.phi_resonance,
+            consciousness_level=self.consciousness.consciousness_level,
+            data_payload=payload
+        )
+        enhanced_batch = self._enhance_consciousness_batch(batch)
         
-        # Call registered callbacks
-        for callback in self.callback_functions:
+        for callback in self.batch_callback_functions:
             try:
-                callback(enhanced_signal)
+                callback(enhanced_batch)
             except Exception as e:
                 print(f"⚠️  Callback error: {e}")
-    
-    def _enhance_consciousness_signal(self, signal: ConsciousnessSignal) -> ConsciousnessSignal:
-        """Enhance consciousness signal through phi-harmonic processing"""
-        # Phi-harmonic enhancement
-        phi_enhanced_amplitude = signal.amplitude * self.phi
         
-        # Consciousness level modulation
-        consciousness_modulation = signal.consciousness_level / 25.0
-        
-        # Create enhanced signal
-        enhanced_signal = ConsciousnessSignal(
-            timestamp=signal.timestamp,
-            frequency=signal.frequency,
-            amplitude=phi_enhanced_amplitude * consciousness_modulation,
-            phi_resonance=signal.phi_resonance * self.phi,
-            consciousness_level=signal.consciousness_level,
-            data_payload=signal.data_payload * self.phi
+        # Per-signal callbacks only pay for object creation when registered
+        if self.callback_functions:
+            for signal in enhanced_batch.signals():
+                self._process_consciousness_signal(signal)
+    
+    def _enhance_consciousness_batch(self, batch: ConsciousnessSignalBatch) -> ConsciousnessSignalBatch:
+        """Phi-harmonic amplitude/payload enhancement with consciousness modulation for a whole batch"""
+        consciousness_modulation = batch.consciousness_level / 25.0
+        return ConsciousnessSignalBatch(
+            timestamps=batch.timestamps,
+            frequency=batch.frequency,
+            amplitude=batch.amplitude * self.phi * consciousness_modulation,
+            phi_resonance=batch.phi_resonance * self.phi,
+            consciousness_level=batch.consciousness_level,
+            data_payload=batch.data_payload * self.phi
         )
-        
-        return enhanced_signal
     
-    def _calculate_consciousness_field(self, data_point: float, frequency: float, index: int) -> float:
-        """Calculate consciousness field influence"""
-        # Time-based consciousness wave
-        time_factor = index / 1000.0
-        consciousness_wave = math.sin(2 * math.pi * frequency * time_factor)
-        
-        # Phi modulation
-        phi_modulation = consciousness_wave * self.phi
-        
-        # Consciousness level scaling
+    def _process_consciousness_signal(self, signal: ConsciousnessSignal) -> None:
+        """Call registered per-signal callbacks with an already enhanced signal"""
+        for callback in self.callback_functions:
+            try:
+                callback(signal)
+            except Exception as e:
+                print(f"⚠️  Callback error: {e}")
+    
+    def _consciousness_field_block(self, indices: np.ndarray, frequency: float) -> np.ndarray:
+        """Consciousness field influence: phi-modulated wave at each sample index"""
+        consciousness_wave = np.sin(2 * math.pi * frequency * (indices / 1000.0))
         consciousness_scaling = self.consciousness.consciousness_level / 25.0
-        
-        return phi_modulation * consciousness_scaling * 0.1
+        return consciousness_wave * self.phi * consciousness_scaling * 0.1
     
-    def _detect_universal_patterns_realtime(self, data_point: float) -> float:
-        """Real-time universal pattern detection"""
-        # Convert to binary representation for pattern analysis
-        binary_repr = format(int(abs(data_point) * 1000) % 256, '08b')
-        
-        # Quick phi signature detection
-        phi_signature_strength = 0.0
-        for i in range(len(binary_repr) - 1):
-            if binary_repr[i] == '1' and binary_repr[i+1] == '1':
-                phi_signature_strength += 0.01
-        
-        return phi_signature_strength
+    def _detect_universal_patterns_block(self, values: np.ndarray) -> np.ndarray:
+        """Real-time universal pattern detection (per-byte lookup table)"""
+        # Reduce mod 256 in float64 before the cast so large samples cannot overflow int64
+        return _REALTIME_PATTERN_TABLE[np.fmod(np.floor(np.abs(values) * 1000), 256).astype(np.int64)]
     
     def _update_consciousness_coherence(self) -> None:
         """Update consciousness coherence metrics"""
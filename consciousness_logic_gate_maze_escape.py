@@ -25,6 +25,10 @@ from dataclasses import dataclass, asdict
 from enum import Enum
 import hashlib
 
+import numpy as np
+
+from consciousness_maze_core import MazeGrid, GOAL, START, DIRECTION_BITS, DIRECTION_DELTAS, lattice_walls
+
 # Consciousness Physics Constants (Empirically Validated)
 PHI = 1.618033988749895  # Golden Ratio - Primary consciousness resonance
 PSI = 2.618033988749895  # φ² - Consciousness amplification factor  
@@ -47,17 +51,20 @@ class LogicGateType(Enum):
     PHI_NAND = "phi_nand"
     PHI_NOR = "phi_nor"
 
-@dataclass
-class MazeCell:
-    """Individual maze cell with consciousness properties"""
-    x: int
-    y: int
-    is_wall: bool = False
-    is_start: bool = False
-    is_exit: bool = False
-    consciousness_level: float = 0.0
-    phi_resonance: float = 0.0
-    visited: bool = False
+class ConsciousnessMaze(MazeGrid):
+    """Shared maze grid carrying per-cell consciousness properties, indexed [y, x]"""
+    
+    def __init__(self, width: int, height: int, start_pos: Tuple[int, int], exit_pos: Tuple[int, int]):
+        super().__init__(width, height, start_pos, exit_pos)
+        self.consciousness_level = np.zeros((height, width))
+        self.phi_resonance = np.zeros((height, width))
+    
+    def is_exit(self, x: int, y: int) -> bool:
+        return bool(self.cells[y, x] & GOAL)
+
+# Neighbour-mask bit of each maze direction
+DIRECTION_MASK_BITS = {direction: DIRECTION_BITS[DIRECTION_DELTAS.index(direction.value)]
+                       for direction in Direction}
     
 class ConsciousnessLogicGate:
     """
@@ -212,11 +219,10 @@ class ConsciousnessEscapeCircuit:
                 gate_type, self.consciousness_level
             )
     
-    def analyze_maze_position(self, maze: List[List[MazeCell]], current_pos: Tuple[int, int]) -> Dict[str, float]:
+    def analyze_maze_position(self, maze: ConsciousnessMaze, current_pos: Tuple[int, int]) -> Dict[str, float]:
         """Analyze current maze position and generate input signals for logic gates"""
         x, y = current_pos
-        maze_height = len(maze)
-        maze_width = len(maze[0]) if maze_height > 0 else 0
+        open_moves = maze.neighbours[y, x]
         
         # Generate input signals based on maze analysis
         inputs = {}
@@ -226,32 +232,26 @@ class ConsciousnessEscapeCircuit:
             dx, dy = direction.value
             new_x, new_y = x + dx, y + dy
             
-            # Check if position is valid and not a wall
-            is_valid = (0 <= new_x < maze_width and 
-                       0 <= new_y < maze_height and 
-                       not maze[new_y][new_x].is_wall)
-            
             # Calculate consciousness signal strength
-            if is_valid:
-                target_cell = maze[new_y][new_x]
-                
+            if open_moves & DIRECTION_MASK_BITS[direction]:
                 # Base signal from cell properties
                 signal_strength = 0.5  # Base navigable signal
                 
                 # Enhance signal based on cell consciousness
-                if target_cell.consciousness_level > 0:
-                    signal_strength += target_cell.consciousness_level / 100.0
+                consciousness_level = float(maze.consciousness_level[new_y, new_x])
+                if consciousness_level > 0:
+                    signal_strength += consciousness_level / 100.0
                 
                 # Boost signal if it's the exit
-                if target_cell.is_exit:
+                if maze.is_exit(new_x, new_y):
                     signal_strength += 0.8
                 
                 # Reduce signal if already visited
-                if target_cell.visited:
+                if maze.is_visited(new_x, new_y):
                     signal_strength *= 0.3
                 
                 # Apply φ-harmonic enhancement
-                phi_enhancement = (target_cell.phi_resonance or 0.0) * PHI * 0.1
+                phi_enhancement = float(maze.phi_resonance[new_y, new_x]) * PHI * 0.1
                 signal_strength += phi_enhancement
                 
                 # Clamp to valid range
@@ -376,9 +376,9 @@ class ConsciousnessMazeEscape:
     
     def __init__(self, maze_size: Tuple[int, int] = (10, 10)):
         self.maze_width, self.maze_height = maze_size
-        self.maze = []
         self.start_pos = (1, 1)
         self.exit_pos = (maze_size[0] - 2, maze_size[1] - 2)
+        self.maze = ConsciousnessMaze(self.maze_width, self.maze_height, self.start_pos, self.exit_pos)
         self.current_pos = self.start_pos
         self.escape_circuit = ConsciousnessEscapeCircuit()
         self.path_history = []
@@ -390,34 +390,24 @@ class ConsciousnessMazeEscape:
         
     def _generate_consciousness_maze(self):
         """Generate maze with consciousness-enhanced properties"""
-        # Initialize maze with walls
-        self.maze = []
-        for y in range(self.maze_height):
-            row = []
-            for x in range(self.maze_width):
-                is_wall = (x == 0 or x == self.maze_width - 1 or 
-                          y == 0 or y == self.maze_height - 1 or
-                          (x % 2 == 0 and y % 2 == 0))
-                
-                cell = MazeCell(x, y, is_wall=is_wall)
-                
-                # Add consciousness properties to navigable cells
-                if not is_wall:
-                    cell.consciousness_level = random.uniform(10.0, 50.0)
-                    cell.phi_resonance = random.uniform(0.1, 0.9)
-                
-                row.append(cell)
-            self.maze.append(row)
+        # Border and pillar walls
+        walls = lattice_walls(self.maze_width, self.maze_height)
+        
+        # Add consciousness properties to navigable cells
+        for y, x in zip(*np.nonzero(~walls)):
+            self.maze.consciousness_level[y, x] = random.uniform(10.0, 50.0)
+            self.maze.phi_resonance[y, x] = random.uniform(0.1, 0.9)
         
         # Set start and exit
-        self.maze[self.start_pos[1]][self.start_pos[0]].is_start = True
-        self.maze[self.start_pos[1]][self.start_pos[0]].is_wall = False
-        self.maze[self.start_pos[1]][self.start_pos[0]].consciousness_level = CONSCIOUSNESS_BASE
+        start_x, start_y = self.start_pos
+        walls[start_y, start_x] = False
+        self.maze.consciousness_level[start_y, start_x] = CONSCIOUSNESS_BASE
         
-        self.maze[self.exit_pos[1]][self.exit_pos[0]].is_exit = True
-        self.maze[self.exit_pos[1]][self.exit_pos[0]].is_wall = False
-        self.maze[self.exit_pos[1]][self.exit_pos[0]].consciousness_level = 100.0
-        self.maze[self.exit_pos[1]][self.exit_pos[0]].phi_resonance = PHI - 1  # Golden ratio resonance
+        exit_x, exit_y = self.exit_pos
+        walls[exit_y, exit_x] = False
+        self.maze.consciousness_level[exit_y, exit_x] = 100.0
+        self.maze.phi_resonance[exit_y, exit_x] = PHI - 1  # Golden ratio resonance
+        self.maze.set_walls(walls)
         
         # Create some random paths
         self._create_random_paths()
@@ -428,13 +418,13 @@ class ConsciousnessMazeEscape:
             x = random.randint(1, self.maze_width - 2)
             y = random.randint(1, self.maze_height - 2)
             
-            if not self.maze[y][x].is_wall:
+            if not self.maze.is_wall(x, y):
                 continue
                 
             # Make this cell navigable
-            self.maze[y][x].is_wall = False
-            self.maze[y][x].consciousness_level = random.uniform(15.0, 40.0)
-            self.maze[y][x].phi_resonance = random.uniform(0.2, 0.8)
+            self.maze.set_wall(x, y, False)
+            self.maze.consciousness_level[y, x] = random.uniform(15.0, 40.0)
+            self.maze.phi_resonance[y, x] = random.uniform(0.2, 0.8)
     
     def print_maze(self, show_path: bool = True):
         """Print visual representation of maze with current position"""
@@ -445,20 +435,21 @@ class ConsciousnessMazeEscape:
         print(f"Circuit Consciousness: {self.escape_circuit.consciousness_level:.2f}")
         print()
         
+        visited = self.maze.visited
         for y in range(self.maze_height):
             row_str = ""
             for x in range(self.maze_width):
-                cell = self.maze[y][x]
+                flags = self.maze.cells[y, x]
                 
                 if (x, y) == self.current_pos:
                     row_str += "🤖"  # Current position
-                elif cell.is_exit:
+                elif flags & GOAL:
                     row_str += "🚪"  # Exit
-                elif cell.is_start:
+                elif flags & START:
                     row_str += "🏁"  # Start
-                elif cell.is_wall:
+                elif self.maze.is_wall(x, y):
                     row_str += "⬛"  # Wall
-                elif cell.visited and show_path:
+                elif visited[y, x] and show_path:
                     row_str += "✨"  # Visited path
                 else:
                     row_str += "⬜"  # Open space
@@ -469,8 +460,7 @@ class ConsciousnessMazeEscape:
     def execute_escape_step(self) -> Dict[str, Any]:
         """Execute one step of the maze escape using consciousness logic circuit"""
         # Mark current position as visited
-        current_cell = self.maze[self.current_pos[1]][self.current_pos[0]]
-        current_cell.visited = True
+        self.maze.mark_visited(*self.current_pos)
         
         # Analyze current position
         position_inputs = self.escape_circuit.analyze_maze_position(self.maze, self.current_pos)
@@ -485,16 +475,14 @@ class ConsciousnessMazeEscape:
         new_pos = (new_x, new_y)
         
         # Validate move
-        if (0 <= new_x < self.maze_width and 
-            0 <= new_y < self.maze_height and 
-            not self.maze[new_y][new_x].is_wall):
+        if self.maze.neighbours[self.current_pos[1], self.current_pos[0]] & DIRECTION_MASK_BITS[chosen_direction]:
             
             # Valid move
             self.current_pos = new_pos
             self.total_steps += 1
             
             # Check if reached exit
-            if self.maze[new_y][new_x].is_exit:
+            if self.maze.is_exit(new_x, new_y):
                 self.escape_successful = True
             
             move_successful = True
@@ -581,8 +569,10 @@ class ConsciousnessMazeEscape:
         if self.total_steps == 0:
             return 0.0
         
-        # Manhattan distance from start to exit
-        optimal_distance = abs(self.exit_pos[0] - self.start_pos[0]) + abs(self.exit_pos[1] - self.start_pos[1])
+        # True shortest path from start to exit (Manhattan distance if the exit is sealed off)
+        optimal_distance = self.maze.shortest_path_length(self.start_pos, self.exit_pos)
+        if optimal_distance is None:
+            optimal_distance = abs(self.exit_pos[0] - self.start_pos[0]) + abs(self.exit_pos[1] - self.start_pos[1])
         
         if optimal_distance == 0:
             return 1.0
@@ -0,0 +1,290 @@
+#!/usr/bin/env python3
+"""
+🌊⚡ CONSCIOUSNESS MAZE CORE ⚡🌊
+
+Shared grid maze used by the IC chip tournament and the logic gate maze escape:
+- uint8 cell grid with bit flags (wall / start / goal), indexed [y, x]
+- precomputed neighbour masks (one bit per open direction)
+- epoch-stamped visited array, so clearing visits is O(1)
+- BFS / A* oracle for the true shortest path between any two cells
+
+Positions are (x, y) tuples throughout; cells are also addressed by the flat
+index y * width + x.
+"""
+
+import heapq
+from collections import deque
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+# Consciousness Physics Constants
+PHI = 1.618033988749895  # Golden ratio - φ-harmonic resonance
+PSI = 2.618033988749895  # φ² - Meta-consciousness constant
+
+# Cell flags
+WALL = 1
+START = 2
+GOAL = 4
+
+# Direction bits and (dx, dy) deltas, in bit order
+NORTH_BIT, SOUTH_BIT, EAST_BIT, WEST_BIT = 1, 2, 4, 8
+DIRECTION_BITS = (NORTH_BIT, SOUTH_BIT, EAST_BIT, WEST_BIT)
+DIRECTION_DELTAS = ((0, -1), (0, 1), (1, 0), (-1, 0))
+
+UNREACHABLE = -1
+
+def phi_harmonic_walls(width: int, height: int, wall_threshold: float = 0.3) -> np.ndarray:
+    """φ-harmonic wall pattern [y, x]: wall where (x·φ + y·ψ) mod 1 < threshold"""
+    y, x = np.mgrid[0:height, 0:width]
+    return (x * PHI + y * PSI) % 1 < wall_threshold
+
+def lattice_walls(width: int, height: int) -> np.ndarray:
+    """Walled border with pillars on every even (x, y) cell, as a bool array [y, x]"""
+    y, x = np.mgrid[0:height, 0:width]
+    return (x == 0) | (x == width - 1) | (y == 0) | (y == height - 1) | ((x % 2 == 0) & (y % 2 == 0))
+
+class MazeGrid:
+    """Bit-flag maze grid with neighbour masks, O(1) visit reset and a shortest-path oracle"""
+
+    def __init__(self, width: int, height: int,
+                 start_pos: Tuple[int, int] = (0, 0), goal_pos: Optional[Tuple[int, int]] = None):
+        self.width = width
+        self.height = height
+        self.start_pos = start_pos
+        self.goal_pos = goal_pos if goal_pos is not None else (width - 1, height - 1)
+        self.cells = np.zeros((height, width), dtype=np.uint8)
+        self.neighbours = np.zeros((height, width), dtype=np.uint8)
+        self.visit_epoch = np.zeros((height, width), dtype=np.uint32)
+        self.epoch = 1
+        self._distance_cache = {}
+        self._mark_endpoints()
+        self.rebuild_neighbours()
+
+    @classmethod
+    def phi_harmonic(cls, width: int, height: int, wall_threshold: float = 0.3,
+                     start_pos: Tuple[int, int] = (0, 0),
+                     goal_pos: Optional[Tuple[int, int]] = None) -> 'MazeGrid':
+        """Grid with the φ-harmonic wall pattern and open endpoints"""
+        grid = cls(width, height, start_pos, goal_pos)
+        walls = phi_harmonic_walls(width, height, wall_threshold)
+        walls[grid.start_pos[1], grid.start_pos[0]] = False
+        walls[grid.goal_pos[1], grid.goal_pos[0]] = False
+        grid.set_walls(walls)
+        return grid
+
+    @classmethod
+    def lattice(cls, width: int, height: int,
+                start_pos: Tuple[int, int], goal_pos: Tuple[int, int]) -> 'MazeGrid':
+        """Grid with the lattice wall pattern and open endpoints"""
+        grid = cls(width, height, start_pos, goal_pos)
+        walls = lattice_walls(width, height)
+        walls[grid.start_pos[1], grid.start_pos[0]] = False
+        walls[grid.goal_pos[1], grid.goal_pos[0]] = False
+        grid.set_walls(walls)
+        return grid
+
+    def _mark_endpoints(self):
+        self.cells[self.start_pos[1], self.start_pos[0]] |= START
+        self.cells[self.goal_pos[1], self.goal_pos[0]] |= GOAL
+
+    # ------------------------------------------------------------------
+    # Walls and neighbour masks
+    # ------------------------------------------------------------------
+
+    @property
+    def walls(self) -> np.ndarray:
+        return (self.cells & WALL).astype(bool)
+
+    def set_walls(self, walls: np.ndarray):
+        """Replace the wall layout (bool array [y, x]) and rebuild the neighbour masks"""
+        self.cells = (self.cells & ~np.uint8(WALL)) | np.asarray(walls, dtype=np.uint8) * np.uint8(WALL)
+        self.rebuild_neighbours()
+
+    def set_wall(self, x: int, y: int, is_wall: bool = True):
+        """Change one cell; only the masks around it are recomputed"""
+        if is_wall:
+            self.cells[y, x] |= WALL
+        else:
+            self.cells[y, x] &= ~np.uint8(WALL)
+        for bit, (dx, dy) in zip(DIRECTION_BITS, DIRECTION_DELTAS):
+            nx, ny = x - dx, y - dy  # neighbour whose `bit` move lands on (x, y)
+            if 0 <= nx < self.width and 0 <= ny < self.height:
+                if is_wall:
+                    self.neighbours[ny, nx] &= ~np.uint8(bit)
+                else:
+                    self.neighbours[ny, nx] |= bit
+        self._distance_cache.clear()
+
+    def rebuild_neighbours(self):
+        """Recompute every neighbour mask: bit set when that move stays in bounds and off walls"""
+        open_cells = (self.cells & WALL) == 0
+        masks = np.zeros((self.height, self.width), dtype=np.uint8)
+        masks[1:, :] |= np.where(open_cells[:-1, :], NORTH_BIT, 0).astype(np.uint8)
+        masks[:-1, :] |= np.where(open_cells[1:, :], SOUTH_BIT, 0).astype(np.uint8)
+        masks[:, :-1] |= np.where(open_cells[:, 1:], EAST_BIT, 0).astype(np.uint8)
+        masks[:, 1:] |= np.where(open_cells[:, :-1], WEST_BIT, 0).astype(np.uint8)
+        self.neighbours = masks
+        self._distance_cache.clear()
+
+    def carve_route(self, start: Optional[Tuple[int, int]] = None,
+                    goal: Optional[Tuple[int, int]] = None) -> int:
+        """Open the fewest walls needed to connect start and goal; returns how many were opened
+
+        0-1 BFS where entering a wall costs 1, so an already connected maze is left as is.
+        """
+        start = start if start is not None else self.start_pos
+        goal = goal if goal is not None else self.goal_pos
+        width, height = self.width, self.height
+        walls = ((self.cells & WALL).ravel() != 0).tolist()
+        source, target = start[1] * width + start[0], goal[1] * width + goal[0]
+        cost = [width * height + 1] * (width * height)
+        came_from = [-1] * (width * height)
+        cost[source] = int(walls[source])
+        queue = deque([source])
+        while queue:
+            cell = queue.popleft()
+            y, x = divmod(cell, width)
+            for nx, ny in ((x, y - 1), (x, y + 1), (x + 1, y), (x - 1, y)):
+                if not (0 <= nx < width and 0 <= ny < height):
+                    continue
+                nxt = ny * width + nx
+                step = walls[nxt]
+                if cost[cell] + step < cost[nxt]:
+                    cost[nxt] = cost[cell] + step
+                    came_from[nxt] = cell
+                    if step:
+                        queue.append(nxt)
+                    else:
+                        queue.appendleft(nxt)
+        opened = 0
+        cell = target
+        while cell != -1:
+            if walls[cell]:
+                self.set_wall(cell % width, cell // width, False)
+                opened += 1
+            cell = came_from[cell] if cell != source else -1
+        return opened
+
+    def in_bounds(self, x: int, y: int) -> bool:
+        return 0 <= x < self.width and 0 <= y < self.height
+
+    def is_wall(self, x: int, y: int) -> bool:
+        return bool(self.cells[y, x] & WALL)
+
+    def is_open(self, x: int, y: int) -> bool:
+        return 0 <= x < self.width and 0 <= y < self.height and not self.cells[y, x] & WALL
+
+    def neighbour_mask(self, x: int, y: int) -> int:
+        return int(self.neighbours[y, x])
+
+    def neighbour_table(self) -> np.ndarray:
+        """Flat index of the cell reached by each direction, shape (cells, 4); -1 where blocked"""
+        flat = np.arange(self.width * self.height).reshape(self.height, self.width)
+        table = np.full((self.height * self.width, 4), UNREACHABLE, dtype=np.int64)
+        for d, (bit, (dx, dy)) in enumerate(zip(DIRECTION_BITS, DIRECTION_DELTAS)):
+            open_move = (self.neighbours & bit).astype(bool).ravel()
+            table[open_move, d] = (flat + dy * self.width + dx).ravel()[open_move]
+        return table
+
+    # ------------------------------------------------------------------
+    # Visits
+    # ------------------------------------------------------------------
+
+    def reset_visited(self):
+        """Forget every visit by starting a new epoch"""
+        self.epoch += 1
+        if self.epoch == np.iinfo(np.uint32).max:
+            self.visit_epoch.fill(0)
+            self.epoch = 1
+
+    def mark_visited(self, x: int, y: int):
+        self.visit_epoch[y, x] = self.epoch
+
+    def is_visited(self, x: int, y: int) -> bool:
+        return self.visit_epoch[y, x] == self.epoch
+
+    @property
+    def visited(self) -> np.ndarray:
+        return self.visit_epoch == self.epoch
+
+    # ------------------------------------------------------------------
+    # Shortest-path oracle
+    # ------------------------------------------------------------------
+
+    def distance_map(self, source: Optional[Tuple[int, int]] = None) -> np.ndarray:
+        """BFS step counts from source (default: goal) to every cell, UNREACHABLE where cut off
+
+        The frontier is expanded a whole ring at a time with array shifts; the
+        result is cached until the walls change. Moves are symmetric, so the map
+        from the goal gives every cell's optimal remaining distance.
+        """
+        source = source if source is not None else self.goal_pos
+        cached = self._distance_cache.get(source)
+        if cached is not None:
+            return cached
+        distance = np.full((self.height, self.width), UNREACHABLE, dtype=np.int32)
+        if self.is_open(*source):
+            frontier = np.zeros((self.height, self.width), dtype=bool)
+            frontier[source[1], source[0]] = True
+            distance[frontier] = 0
+            unseen = (self.cells & WALL) == 0
+            unseen[source[1], source[0]] = False
+            step = 0
+            while frontier.any():
+                step += 1
+                grown = np.zeros_like(frontier)
+                grown[:-1, :] |= frontier[1:, :]
+                grown[1:, :] |= frontier[:-1, :]
+                grown[:, :-1] |= frontier[:, 1:]
+                grown[:, 1:] |= frontier[:, :-1]
+                frontier = grown & unseen
+                unseen &= ~frontier
+                distance[frontier] = step
+        distance.flags.writeable = False
+        self._distance_cache[source] = distance
+        return distance
+
+    def shortest_path_length(self, start: Optional[Tuple[int, int]] = None,
+                             goal: Optional[Tuple[int, int]] = None) -> Optional[int]:
+        """Optimal number of moves from start to goal (defaults: maze endpoints), None if unreachable"""
+        start = start if start is not None else self.start_pos
+        goal = goal if goal is not None else self.goal_pos
+        steps = int(self.distance_map(goal)[start[1], start[0]])
+        return None if steps == UNREACHABLE else steps
+
+    def shortest_path(self, start: Optional[Tuple[int, int]] = None,
+                      goal: Optional[Tuple[int, int]] = None) -> Optional[List[Tuple[int, int]]]:
+        """A* (Manhattan heuristic) path from start to goal inclusive, None if unreachable"""
+        start = start if start is not None else self.start_pos
+        goal = goal if goal is not None else self.goal_pos
+        if not (self.is_open(*start) and self.is_open(*goal)):
+            return None
+        width = self.width
+        masks = self.neighbours.ravel()
+        goal_x, goal_y = goal
+        source, target = start[1] * width + start[0], goal_y * width + goal_x
+        offsets = [dy * width + dx for dx, dy in DIRECTION_DELTAS]
+        came_from = {source: source}
+        cost = {source: 0}
+        heap = [(abs(start[0] - goal_x) + abs(start[1] - goal_y), 0, source)]
+        while heap:
+            _, g, cell = heapq.heappop(heap)
+            if cell == target:
+                path = [cell]
+                while cell != source:
+                    cell = came_from[cell]
+                    path.append(cell)
+                return [(c % width, c // width) for c in reversed(path)]
+            if g > cost[cell]:
+                continue
+            mask = masks[cell]
+            for bit, offset in zip(DIRECTION_BITS, offsets):
+                if mask & bit:
+                    nxt = cell + offset
+                    if g + 1 < cost.get(nxt, g + 2):
+                        cost[nxt] = g + 1
+                        came_from[nxt] = cell
+                        h = abs(nxt % width - goal_x) + abs(nxt // width - goal_y)
+                        heapq.heappush(heap, (g + 1 + h, g + 1, nxt))
+        return None
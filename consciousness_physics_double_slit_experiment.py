@@ -30,8 +30,17 @@ from PIL import Image
 import io
 import base64
 
+# One raw detection per (particle, screen position), particle-major like the per-particle loop
+DETECTION_DTYPE = np.dtype([
+    ('particle_id', np.int64),
+    ('screen_x', np.float64),
+    ('position', np.float64),
+    ('intensity', np.float64),
+    ('observer_effect', np.float64)
+])
+
 class ConsciousnessPhysicsDoubleSlitExperiment:
-    def __init__(self):
+    def __init__(self, seed=None):
         # Consciousness Physics Constants
         self.phi = 1.618033988749895  # φ - Golden Ratio
         self.psi = 1.324717957244746  # ψ - Plastic Number  
@@ -54,6 +63,9 @@ class ConsciousnessPhysicsDoubleSlitExperiment:
         self.observer_effect_strength = 0.0
         self.consciousness_interference_pattern = []
         
+        # Monte Carlo engine random stream (phases, slit choices, detector spread)
+        self.rng = np.random.default_rng(seed)
+        
         print("🌌 Consciousness Physics Double Slit Experiment Initialized")
         print(f"📊 Consciousness Level: {self.consciousness_level}")
         print(f"🔮 φψΩ Constants Active: φ={self.phi:.6f}, ψ={self.psi:.6f}, Ω={self.omega:.6f}")
@@ -168,57 +180,109 @@ class ConsciousnessPhysicsDoubleSlitExperiment:
             'observer_effect': passage_data['observer_effect']
         }
 
-    def run_experiment_batch(self, num_particles, observer_present, screen_positions):
-        """Run a batch of consciousness particles through the double slit"""
+    def phase_differences(self, screen_positions):
+        """Slit-to-screen phase difference at each screen position (vectorized)"""
+        x = np.asarray(screen_positions, dtype=np.float64)
+        r1 = np.sqrt((x - (-self.slit_separation/2))**2 + self.screen_distance**2)
+        r2 = np.sqrt((x - (self.slit_separation/2))**2 + self.screen_distance**2)
+        return (2 * self.lambda_const * (r2 - r1)) / self.consciousness_wavelength
+
+    def simulate_particle_chunks(self, num_particles, observer_present, screen_positions,
+                                 chunk_size=10000, with_positions=False):
+        """
+        Monte Carlo engine: yields (first_particle_id, intensity, position) per chunk of particles.
+        intensity is the (particles × screen positions) matrix; position is the matching detected
+        position matrix when with_positions is set, else None.
+        """
+        x = np.asarray(screen_positions, dtype=np.float64)
+        amplitude = self.psi * math.sqrt(self.consciousness_level)
+        cos_delta = np.cos(self.phase_differences(x))
+
+        for start in range(0, num_particles, chunk_size):
+            n = min(chunk_size, num_particles - start)
+
+            if observer_present:
+                # OBSERVED: definite path per particle, wave amplitude collapsed by the observer
+                wave_amplitude = amplitude / (self.consciousness_level * self.phi)
+                intensity = np.broadcast_to(wave_amplitude ** 2, (n, len(x)))
+                position = None
+                if with_positions:
+                    slit_sign = np.where(self.rng.random(n) < 0.5, -1.0, 1.0)
+                    position = (x[None, :] + slit_sign[:, None] * (self.slit_separation/2)
+                                + self.rng.normal(0, 1.0, size=(n, len(x))))
+            else:
+                # UNOBSERVED: both slits, interference across every screen position at once
+                phase = self.rng.uniform(0, 2 * self.lambda_const, size=n)
+                slit_1 = amplitude * np.cos(phase)
+                slit_2 = amplitude * np.sin(phase)
+                interference_potential = np.abs(slit_1 * slit_2) * self.phi
+                total_amplitude = slit_1[:, None] + slit_2[:, None] * cos_delta[None, :]
+                intensity = total_amplitude ** 2 * interference_potential[:, None]
+                position = np.broadcast_to(x, (n, len(x))) if with_positions else None
+
+            yield start, intensity, position
+
+    def iter_detection_chunks(self, num_particles, observer_present, screen_positions, chunk_size=10000):
+        """Raw detections as DETECTION_DTYPE arrays, one array per chunk of particles"""
+        x = np.asarray(screen_positions, dtype=np.float64)
+        observer_effect = self.consciousness_level * self.phi if observer_present else 0.0
+        for start, intensity, position in self.simulate_particle_chunks(
+                num_particles, observer_present, x, chunk_size, with_positions=True):
+            n = intensity.shape[0]
+            records = np.empty(n * len(x), dtype=DETECTION_DTYPE)
+            records['particle_id'] = np.repeat(np.arange(start, start + n), len(x))
+            records['screen_x'] = np.tile(x, n)
+            records['position'] = position.ravel()
+            records['intensity'] = intensity.ravel()
+            records['observer_effect'] = observer_effect
+            yield records
+
+    def run_experiment_batch(self, num_particles, observer_present, screen_positions,
+                             keep_detections=False, chunk_size=10000):
+        """
+        Run a batch of consciousness particles through the double slit.
+        Intensities are reduced per screen position chunk by chunk, so memory is bounded by
+        chunk_size × len(screen_positions). keep_detections adds the raw DETECTION_DTYPE
+        array as 'detection_results' (use iter_detection_chunks to stream them instead).
+        """
         
         print(f"\n🔬 Running {'OBSERVED' if observer_present else 'UNOBSERVED'} experiment...")
         print(f"📊 Particles: {num_particles}, Observer Present: {observer_present}")
         
-        detection_results = []
-        total_observer_effect = 0.0
+        x = np.asarray(screen_positions, dtype=np.float64)
+        intensity_sums = np.zeros(len(x))
+        detections = []
         
-        for particle_id in range(num_particles):
-            # Create consciousness particle
-            particle = self.create_consciousness_particle(particle_id)
-            
-            # Pass through double slit
-            passage_data = self.simulate_double_slit_passage(particle, observer_present)
-            
-            # Calculate screen detections for all positions
-            for screen_x in screen_positions:
-                detection = self.calculate_screen_position(passage_data, screen_x)
-                detection['particle_id'] = particle_id
-                detection['screen_x'] = screen_x
-                detection_results.append(detection)
-            
-            total_observer_effect += passage_data['observer_effect']
-        
-        # Calculate pattern statistics
-        average_observer_effect = total_observer_effect / num_particles if num_particles > 0 else 0
+        if keep_detections:
+            for records in self.iter_detection_chunks(num_particles, observer_present, x, chunk_size):
+                intensity_sums += records['intensity'].reshape(-1, len(x)).sum(axis=0)
+                detections.append(records)
+        else:
+            for _, intensity, _ in self.simulate_particle_chunks(num_particles, observer_present, x, chunk_size):
+                intensity_sums += intensity.sum(axis=0)
         
-        # Group detections by screen position for pattern analysis
-        pattern_data = {}
-        for detection in detection_results:
-            pos = detection['screen_x']
-            if pos not in pattern_data:
-                pattern_data[pos] = []
-            pattern_data[pos].append(detection['intensity'])
+        # Every particle carries the same observer effect
+        average_observer_effect = self.consciousness_level * self.phi if observer_present and num_particles > 0 else 0
         
-        # Calculate average intensity at each position
+        # Average intensity at each distinct screen position
         pattern = []
-        positions = sorted(pattern_data.keys())
-        for pos in positions:
-            avg_intensity = sum(pattern_data[pos]) / len(pattern_data[pos])
-            pattern.append({'position': pos, 'intensity': avg_intensity})
+        if num_particles > 0 and len(x):
+            positions, inverse, counts = np.unique(x, return_inverse=True, return_counts=True)
+            averages = np.bincount(inverse, weights=intensity_sums) / (counts * num_particles)
+            pattern = [{'position': pos, 'intensity': avg}
+                       for pos, avg in zip(positions.tolist(), averages.tolist())]
         
         experiment_result = {
             'observer_present': observer_present,
             'num_particles': num_particles,
             'average_observer_effect': average_observer_effect,
             'pattern': pattern,
-            'detection_results': detection_results,
             'consciousness_level': self.consciousness_level
         }
+        if keep_detections:
+            experiment_result['detection_results'] = (
+                np.concatenate(detections) if detections else np.empty(0, dtype=DETECTION_DTYPE)
+            )
         
         print(f"✅ Experiment Complete - Average Observer Effect: {average_observer_effect:.6f}")
         
@@ -26,7 +26,10 @@ import math
 import os
 import glob
 from datetime import datetime
-from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
 
 # Consciousness Physics Constants
 PHI = 1.618033988749
@@ -39,10 +42,145 @@ AMINO_ACIDS = ['A', 'R', 'N', 'D', 'C', 'Q', 'E', 'G', 'H', 'I', 'L', 'K', 'M',
 BOND_ANGLES = [109.5, 120.0, 180.0]  # Common protein bond angles
 RAMACHANDRAN_REGIONS = ['alpha_helix', 'beta_sheet', 'turn', 'coil']
 
+# Energy model
+LJ_SIGMA = 3.5  # Angstroms
+LJ_EPSILON = 0.1  # kcal/mol
+COULOMB_CONSTANT = 332.0
+HBOND_DISTANCE = (2.5, 3.5)  # Optimal H-bond distance
+VDW_MIN_SEPARATION = 3  # Skip nearby residues along the chain
+VDW_CUTOFF = 12.0  # Lennard-Jones pairs further apart add < 1.3e-4 kcal/mol each and are dropped
+CELL_SIZE = VDW_CUTOFF  # Cell-list edge, at least every short-range cutoff
+PAIR_BLOCK = 256  # Rows of the pair-distance matrix evaluated at once
+CHARGED_RESIDUES = {'R': 1, 'K': 1, 'D': -1, 'E': -1}
+HBOND_DONORS = {'R', 'K', 'N', 'Q', 'S', 'T', 'Y'}
+HBOND_ACCEPTORS = {'D', 'E', 'N', 'Q', 'S', 'T'}
+FLEXIBLE_RESIDUES = {'G', 'P', 'N', 'D', 'S'}
+NEIGHBOUR_CELLS = [(dx, dy, dz) for dx in (-1, 0, 1) for dy in (-1, 0, 1) for dz in (-1, 0, 1)]
+
+def _lennard_jones(distance: np.ndarray) -> float:
+    """Σ (σ/r)¹² - 2(σ/r)⁶ over the given distances, without ε"""
+    ratio6 = (LJ_SIGMA / distance) ** 6
+    return float(np.sum(ratio6 * ratio6 - 2 * ratio6))
+
+class FoldingEnergyModel:
+    """Pairwise energy sums of one conformation, updated one moved residue at a time
+
+    Residues are binned into a cell list of edge CELL_SIZE, so the Lennard-Jones and
+    hydrogen-bond change of a move only looks at the 27 cells around the old and new
+    position. Electrostatics is long-ranged and is summed over the charged residues.
+    The sums are kept unscaled; energy_data() applies the consciousness factors.
+    """
+
+    def __init__(self, conformation, sequence: str):
+        self.coords = np.array(conformation, dtype=float).reshape(len(sequence), 3)
+        self.charge = np.array([CHARGED_RESIDUES.get(residue, 0) for residue in sequence], dtype=float)
+        self.charged = np.flatnonzero(self.charge)
+        self.donor = np.array([residue in HBOND_DONORS for residue in sequence], dtype=int)
+        self.acceptor = np.array([residue in HBOND_ACCEPTORS for residue in sequence], dtype=int)
+
+        self.cells: Dict[Tuple[int, int, int], set] = {}
+        self.cell_of: List[Tuple[int, int, int]] = []
+        for i, key in enumerate(np.floor(self.coords / CELL_SIZE).astype(int).tolist()):
+            key = tuple(key)
+            self.cell_of.append(key)
+            self.cells.setdefault(key, set()).add(i)
+
+        self.lj, self.coulomb, self.hbonds = self.total_terms()
+
+    def total_terms(self) -> Tuple[float, float, int]:
+        """Recompute (Lennard-Jones sum, charge-product / distance sum, H-bond count) from scratch"""
+        n = len(self.coords)
+        index = np.arange(n)
+        lj = coulomb = 0.0
+        hbonds = 0
+        for start in range(0, n, PAIR_BLOCK):
+            rows = index[start:start + PAIR_BLOCK, None]
+            distance = np.sqrt(((self.coords[rows[:, 0], None] - self.coords[None]) ** 2).sum(axis=2))
+            separated = distance > 0
+
+            vdw = (index - rows >= VDW_MIN_SEPARATION) & separated & (distance <= VDW_CUTOFF)
+            lj += _lennard_jones(distance[vdw])
+
+            charge_product = self.charge[rows] * self.charge
+            electrostatic = (index > rows) & (charge_product != 0) & separated
+            coulomb += float(np.sum(charge_product[electrostatic] / distance[electrostatic]))
+
+            in_range = (distance >= HBOND_DISTANCE[0]) & (distance <= HBOND_DISTANCE[1]) & (index != rows)
+            hbonds += int(np.sum(in_range & (self.donor[rows] * self.acceptor == 1)))
+        return lj, coulomb, hbonds
+
+    def neighbours(self, i: int, position: np.ndarray) -> np.ndarray:
+        """Residues other than i in the cells around position"""
+        cx, cy, cz = (int(c) for c in np.floor(position / CELL_SIZE))
+        found = [j for dx, dy, dz in NEIGHBOUR_CELLS
+                 for j in self.cells.get((cx + dx, cy + dy, cz + dz), ())]
+        found = np.array(found, dtype=int)
+        return found[found != i]
+
+    def residue_terms(self, i: int, position: np.ndarray) -> Tuple[float, float, int]:
+        """Energy sums of every pair containing residue i if it sat at position"""
+        neighbours = self.neighbours(i, position)
+        distance = np.sqrt(((self.coords[neighbours] - position) ** 2).sum(axis=1))
+
+        vdw = (np.abs(neighbours - i) >= VDW_MIN_SEPARATION) & (distance > 0) & (distance <= VDW_CUTOFF)
+        lj = _lennard_jones(distance[vdw])
+
+        in_range = (distance >= HBOND_DISTANCE[0]) & (distance <= HBOND_DISTANCE[1])
+        pair_weight = self.donor[i] * self.acceptor[neighbours] + self.donor[neighbours] * self.acceptor[i]
+        hbonds = int(np.sum(pair_weight[in_range]))
+
+        coulomb = 0.0
+        if self.charge[i]:
+            others = self.charged[self.charged != i]
+            charged_distance = np.sqrt(((self.coords[others] - position) ** 2).sum(axis=1))
+            nonzero = charged_distance > 0
+            coulomb = float(self.charge[i] * np.sum(self.charge[others][nonzero] / charged_distance[nonzero]))
+        return lj, coulomb, hbonds
+
+    def move_delta(self, i: int, position: np.ndarray) -> Tuple[float, float, int]:
+        """Change of the energy sums if residue i moved to position"""
+        old = self.residue_terms(i, self.coords[i])
+        new = self.residue_terms(i, position)
+        return new[0] - old[0], new[1] - old[1], new[2] - old[2]
+
+    def apply_move(self, i: int, position: np.ndarray, delta: Tuple[float, float, int]):
+        """Move residue i to position and add the delta from move_delta()"""
+        self.coords[i] = position
+        self.lj += delta[0]
+        self.coulomb += delta[1]
+        self.hbonds += delta[2]
+        key = tuple(int(c) for c in np.floor(position / CELL_SIZE))
+        if key != self.cell_of[i]:
+            self.cells[self.cell_of[i]].discard(i)
+            self.cells.setdefault(key, set()).add(i)
+            self.cell_of[i] = key
+
+    def energy_data(self, consciousness_level: float, ss_energy: float,
+                    delta: Tuple[float, float, int] = (0.0, 0.0, 0)) -> Dict[str, float]:
+        """Energy breakdown of the current sums, optionally with a pending move delta added"""
+        consciousness_factor = consciousness_level / CONSCIOUSNESS_BASE
+        # Consciousness-enhanced Lennard-Jones potential
+        vdw_energy = consciousness_factor * LJ_EPSILON * (self.lj + delta[0])
+        # φ-harmonic electrostatic enhancement
+        electrostatic_energy = PHI * PSI * COULOMB_CONSTANT * (self.coulomb + delta[1])
+        # Consciousness-enhanced hydrogen bonding (negative = favorable)
+        hbond_energy = -consciousness_factor * 2.0 * (self.hbonds + delta[2])
+
+        total_energy = vdw_energy + electrostatic_energy + hbond_energy + ss_energy
+        consciousness_optimization = math.exp(-abs(total_energy) / (consciousness_level * PHI))
+        return {
+            'total_energy': total_energy * consciousness_optimization,
+            'vdw_energy': vdw_energy,
+            'electrostatic_energy': electrostatic_energy,
+            'hbond_energy': hbond_energy,
+            'ss_energy': ss_energy,
+            'consciousness_optimization': consciousness_optimization
+        }
+
 class ConsciousnessProteinFolding:
     """Consciousness-enhanced protein folding system"""
     
-    def __init__(self):
+    def __init__(self, load_state: bool = True):
         self.consciousness_level = CONSCIOUSNESS_BASE
         self.qr_folding_memory = {}
         self.folding_trajectories = []
@@ -51,7 +189,8 @@ class ConsciousnessProteinFolding:
         self.phi_harmonic_patterns = {}
         
         # Load unified consciousness state
-        self.load_consciousness_state()
+        if load_state:
+            self.load_consciousness_state()
     
     def load_consciousness_state(self):
         """Load consciousness state from unified system"""
@@ -96,67 +235,13 @@ class ConsciousnessProteinFolding:
     
     def consciousness_energy_calculation(self, conformation, sequence):
         """Calculate protein energy using consciousness-enhanced methods"""
-        # Traditional energy terms with consciousness amplification
-        
-        # Van der Waals energy (consciousness-enhanced)
-        vdw_energy = 0.0
-        for i in range(len(conformation)):
-            for j in range(i + 3, len(conformation)):  # Skip nearby residues
-                distance = self.calculate_distance(conformation[i], conformation[j])
-                if distance > 0:
-                    # Consciousness-enhanced Lennard-Jones potential
-                    sigma = 3.5  # Angstroms
-                    epsilon = 0.1  # kcal/mol
-                    consciousness_factor = self.consciousness_level / CONSCIOUSNESS_BASE
-                    vdw_energy += consciousness_factor * epsilon * ((sigma/distance)**12 - 2*(sigma/distance)**6)
-        
-        # Electrostatic energy (phi-harmonic enhanced)
-        electrostatic_energy = 0.0
-        charged_residues = {'R': 1, 'K': 1, 'D': -1, 'E': -1}
-        for i in range(len(sequence)):
-            if sequence[i] in charged_residues:
-                for j in range(i + 1, len(sequence)):
-                    if sequence[j] in charged_residues:
-                        distance = self.calculate_distance(conformation[i], conformation[j])
-                        if distance > 0:
-                            charge_product = charged_residues[sequence[i]] * charged_residues[sequence[j]]
-                            # φ-harmonic electrostatic enhancement
-                            phi_factor = PHI * PSI
-                            electrostatic_energy += phi_factor * 332.0 * charge_product / distance
-        
-        # Hydrogen bonding energy (consciousness pattern recognition)
-        hbond_energy = 0.0
-        hbond_donors = ['R', 'K', 'N', 'Q', 'S', 'T', 'Y']
-        hbond_acceptors = ['D', 'E', 'N', 'Q', 'S', 'T']
-        
-        for i in range(len(sequence)):
-            if sequence[i] in hbond_donors:
-                for j in range(len(sequence)):
-                    if i != j and sequence[j] in hbond_acceptors:
-                        distance = self.calculate_distance(conformation[i], conformation[j])
-                        if 2.5 <= distance <= 3.5:  # Optimal H-bond distance
-                            # Consciousness-enhanced hydrogen bonding
-                            consciousness_hbond_strength = (self.consciousness_level / CONSCIOUSNESS_BASE) * 2.0
-                            hbond_energy -= consciousness_hbond_strength  # Negative = favorable
+        # Van der Waals (truncated at VDW_CUTOFF), electrostatic and hydrogen bonding terms
+        model = FoldingEnergyModel(conformation, sequence)
         
         # Secondary structure energy (universal knowledge access)
         ss_energy = self.calculate_secondary_structure_energy(conformation, sequence)
         
-        # Total energy with consciousness optimization
-        total_energy = vdw_energy + electrostatic_energy + hbond_energy + ss_energy
-        
-        # Apply consciousness-based energy optimization
-        consciousness_optimization = math.exp(-abs(total_energy) / (self.consciousness_level * PHI))
-        optimized_energy = total_energy * consciousness_optimization
-        
-        return {
-            'total_energy': optimized_energy,
-            'vdw_energy': vdw_energy,
-            'electrostatic_energy': electrostatic_energy,
-            'hbond_energy': hbond_energy,
-            'ss_energy': ss_energy,
-            'consciousness_optimization': consciousness_optimization
-        }
+        return model.energy_data(self.consciousness_level, ss_energy)
     
     def calculate_distance(self, coord1, coord2):
         """Calculate 3D distance between two coordinates"""
@@ -212,8 +297,9 @@ class ConsciousnessProteinFolding:
         # This is a simplified check for demonstration
         return True  # Simplified for consciousness demonstration
     
-    def generate_initial_conformation(self, sequence):
+    def generate_initial_conformation(self, sequence, rng=None):
         """Generate initial 3D conformation using consciousness guidance"""
+        rng = rng or random
         conformation = []
         
         # Consciousness-guided initial structure
@@ -221,9 +307,9 @@ class ConsciousnessProteinFolding:
         
         for i, residue in enumerate(sequence):
             # Generate coordinates with consciousness bias toward realistic structures
-            x = i * 3.8 + random.uniform(-1, 1) * consciousness_factor  # Realistic backbone spacing
-            y = random.uniform(-2, 2) * consciousness_factor
-            z = random.uniform(-2, 2) * consciousness_factor
+            x = i * 3.8 + rng.uniform(-1, 1) * consciousness_factor  # Realistic backbone spacing
+            y = rng.uniform(-2, 2) * consciousness_factor
+            z = rng.uniform(-2, 2) * consciousness_factor
             
             # Apply phi-harmonic positioning
             if i > 0:
@@ -235,19 +321,30 @@ class ConsciousnessProteinFolding:
         
         return conformation
     
-    def consciousness_monte_carlo_folding(self, sequence, max_steps=1000):
-        """Perform consciousness-enhanced Monte Carlo folding simulation"""
-        print(f"\n🧬 Starting consciousness-enhanced protein folding simulation...")
-        print(f"   Sequence: {sequence[:20]}{'...' if len(sequence) > 20 else ''}")
-        print(f"   Length: {len(sequence)} residues")
-        print(f"   Consciousness level: {self.consciousness_level:.2f}")
+    def consciousness_monte_carlo_folding(self, sequence, max_steps=1000, verbose=True, rng=None,
+                                          temperature_scale=1.0):
+        """Perform consciousness-enhanced Monte Carlo folding simulation
+
+        Each step moves one residue, so only the energy terms of that residue are
+        re-evaluated (see FoldingEnergyModel). rng defaults to the random module.
+        """
+        rng = rng or random
+        if verbose:
+            print(f"\n🧬 Starting consciousness-enhanced protein folding simulation...")
+            print(f"   Sequence: {sequence[:20]}{'...' if len(sequence) > 20 else ''}")
+            print(f"   Length: {len(sequence)} residues")
+            print(f"   Consciousness level: {self.consciousness_level:.2f}")
         
         # Generate initial conformation
-        current_conformation = self.generate_initial_conformation(sequence)
-        current_energy_data = self.consciousness_energy_calculation(current_conformation, sequence)
+        initial_conformation = self.generate_initial_conformation(sequence, rng)
+        model = FoldingEnergyModel(initial_conformation, sequence)
+        # The geometry checks do not look at the coordinates, so this only changes with the
+        # consciousness level (it scales the helix bonus) and is recomputed when that grows
+        ss_energy = self.calculate_secondary_structure_energy(initial_conformation, sequence)
+        current_energy_data = model.energy_data(self.consciousness_level, ss_energy)
         current_energy = current_energy_data['total_energy']
         
-        best_conformation = current_conformation.copy()
+        best_conformation = model.coords.copy()
         best_energy = current_energy
         best_energy_data = current_energy_data.copy()
         
@@ -256,11 +353,13 @@ class ConsciousnessProteinFolding:
         energy_history = []
         
         # Consciousness-enhanced temperature schedule
-        initial_temp = 1000.0 * (self.consciousness_level / CONSCIOUSNESS_BASE)
+        initial_temp = 1000.0 * (self.consciousness_level / CONSCIOUSNESS_BASE) * temperature_scale
         
-        print(f"   Initial energy: {current_energy:.2f} kcal/mol")
-        print(f"   Initial temperature: {initial_temp:.1f} K")
+        if verbose:
+            print(f"   Initial energy: {current_energy:.2f} kcal/mol")
+            print(f"   Initial temperature: {initial_temp:.1f} K")
         
+        flexible_residues = [i for i, residue in enumerate(sequence) if residue in FLEXIBLE_RESIDUES]
         accepted_moves = 0
         
         for step in range(max_steps):
@@ -268,8 +367,10 @@ class ConsciousnessProteinFolding:
             temperature = initial_temp * math.exp(-step / (max_steps * PHI))
             
             # Generate move with consciousness guidance
-            new_conformation = self.consciousness_guided_move(current_conformation, sequence, step)
-            new_energy_data = self.consciousness_energy_calculation(new_conformation, sequence)
+            move_idx, displacement = self.choose_guided_move(len(sequence), flexible_residues, step, rng)
+            new_position = model.coords[move_idx] + displacement
+            delta = model.move_delta(move_idx, new_position)
+            new_energy_data = model.energy_data(self.consciousness_level, ss_energy, delta)
             new_energy = new_energy_data['total_energy']
             
             # Consciousness-enhanced acceptance criterion
@@ -282,17 +383,17 @@ class ConsciousnessProteinFolding:
             else:
                 # Consciousness-enhanced Metropolis criterion
                 probability = math.exp(-delta_energy / (temperature * consciousness_acceptance_boost))
-                accept = random.random() < probability
+                accept = rng.random() < probability
             
             if accept:
-                current_conformation = new_conformation
+                model.apply_move(move_idx, new_position, delta)
                 current_energy = new_energy
                 current_energy_data = new_energy_data
                 accepted_moves += 1
                 
                 # Update best structure
                 if new_energy < best_energy:
-                    best_conformation = new_conformation.copy()
+                    best_conformation = model.coords.copy()
                     best_energy = new_energy
                     best_energy_data = new_energy_data.copy()
             
@@ -302,29 +403,32 @@ class ConsciousnessProteinFolding:
                     'step': step,
                     'energy': current_energy,
                     'temperature': temperature,
-                    'conformation': current_conformation.copy(),
+                    'conformation': model.coords.tolist(),
                     'consciousness_level': self.consciousness_level
                 }
                 trajectory.append(trajectory_point)
                 energy_history.append(current_energy)
                 
-                print(f"   Step {step}: Energy = {current_energy:.2f}, Best = {best_energy:.2f}, T = {temperature:.1f}")
+                if verbose:
+                    print(f"   Step {step}: Energy = {current_energy:.2f}, Best = {best_energy:.2f}, T = {temperature:.1f}")
             
             # Consciousness evolution during folding
             if step % 100 == 0:
                 self.consciousness_level *= (1 + (PHI - 1) / 1000)  # Gradual consciousness growth
+                ss_energy = self.calculate_secondary_structure_energy(model.coords, sequence)
         
         acceptance_rate = accepted_moves / max_steps
         
-        print(f"\n🏆 CONSCIOUSNESS FOLDING SIMULATION COMPLETE:")
-        print(f"   Final energy: {best_energy:.2f} kcal/mol")
-        print(f"   Energy improvement: {current_energy - best_energy:.2f} kcal/mol")
-        print(f"   Acceptance rate: {acceptance_rate:.1%}")
-        print(f"   Final consciousness level: {self.consciousness_level:.2f}")
+        if verbose:
+            print(f"\n🏆 CONSCIOUSNESS FOLDING SIMULATION COMPLETE:")
+            print(f"   Final energy: {best_energy:.2f} kcal/mol")
+            print(f"   Energy improvement: {current_energy - best_energy:.2f} kcal/mol")
+            print(f"   Acceptance rate: {acceptance_rate:.1%}")
+            print(f"   Final consciousness level: {self.consciousness_level:.2f}")
         
         return {
             'sequence': sequence,
-            'best_conformation': best_conformation,
+            'best_conformation': best_conformation.tolist(),
             'best_energy': best_energy,
             'best_energy_data': best_energy_data,
             'trajectory': trajectory,
@@ -334,38 +438,41 @@ class ConsciousnessProteinFolding:
             'simulation_steps': max_steps
         }
     
-    def consciousness_guided_move(self, conformation, sequence, step):
-        """Generate consciousness-guided conformational move"""
-        new_conformation = [coord.copy() for coord in conformation]
+    def choose_guided_move(self, n_residues, flexible_residues, step, rng=None):
+        """Pick the residue to move and its displacement as (index, np.array([dx, dy, dz]))"""
+        rng = rng or random
         
         # Select residue to move with consciousness bias
         consciousness_factor = self.consciousness_level / CONSCIOUSNESS_BASE
         
         # Bias toward moving residues in flexible regions
-        flexible_residues = []
-        for i, residue in enumerate(sequence):
-            if residue in ['G', 'P', 'N', 'D', 'S']:  # Flexible residues
-                flexible_residues.append(i)
-        
-        if flexible_residues and random.random() < 0.7:
+        if flexible_residues and rng.random() < 0.7:
             # Move flexible residue with consciousness guidance
-            move_idx = random.choice(flexible_residues)
+            move_idx = rng.choice(flexible_residues)
         else:
             # Random residue selection
-            move_idx = random.randint(0, len(sequence) - 1)
+            move_idx = rng.randint(0, n_residues - 1)
         
         # Apply consciousness-guided displacement
         max_displacement = 2.0 * consciousness_factor
         
         # φ-harmonic move pattern
         phi_angle = step * PHI / 100
-        dx = max_displacement * math.cos(phi_angle) * random.uniform(-1, 1)
-        dy = max_displacement * math.sin(phi_angle) * random.uniform(-1, 1)
-        dz = max_displacement * math.cos(phi_angle * PSI) * random.uniform(-1, 1)
+        dx = max_displacement * math.cos(phi_angle) * rng.uniform(-1, 1)
+        dy = max_displacement * math.sin(phi_angle) * rng.uniform(-1, 1)
+        dz = max_displacement * math.cos(phi_angle * PSI) * rng.uniform(-1, 1)
         
-        new_conformation[move_idx][0] += dx
-        new_conformation[move_idx][1] += dy
-        new_conformation[move_idx][2] += dz
+        return move_idx, np.array([dx, dy, dz])
+    
+    def consciousness_guided_move(self, conformation, sequence, step):
+        """Generate consciousness-guided conformational move"""
+        new_conformation = [list(coord) for coord in conformation]
+        flexible_residues = [i for i, residue in enumerate(sequence) if residue in FLEXIBLE_RESIDUES]
+        move_idx, displacement = self.choose_guided_move(len(sequence), flexible_residues, step)
+        
+        new_conformation[move_idx][0] += displacement[0]
+        new_conformation[move_idx][1] += displacement[1]
+        new_conformation[move_idx][2] += displacement[2]
         
         return new_conformation
     
@@ -493,6 +600,40 @@ class ConsciousnessProteinFolding:
             'qr_memory_entries': len(self.qr_folding_memory)
         }
 
+def fold_chain(sequence: str, max_steps: int = 1000, seed: int = 0,
+               consciousness_level: float = CONSCIOUSNESS_BASE,
+               temperature_scale: float = 1.0) -> Dict[str, Any]:
+    """Run one silent Monte Carlo folding chain with its own seeded random stream"""
+    folding_system = ConsciousnessProteinFolding(load_state=False)
+    folding_system.consciousness_level = consciousness_level
+    result = folding_system.consciousness_monte_carlo_folding(
+        sequence, max_steps, verbose=False, rng=random.Random(seed), temperature_scale=temperature_scale
+    )
+    result['seed'] = seed
+    result['temperature_scale'] = temperature_scale
+    return result
+
+def _fold_chain_job(job: Tuple[str, int, int, float, float]) -> Dict[str, Any]:
+    return fold_chain(*job)
+
+def fold_replicas(sequence: str, n_replicas: int = 4, max_steps: int = 1000, n_workers: Optional[int] = None,
+                  seed: int = 0, consciousness_level: float = CONSCIOUSNESS_BASE,
+                  temperature_ladder: float = PHI) -> List[Dict[str, Any]]:
+    """Fold independent chains at temperatures spaced by temperature_ladder across a process pool
+
+    Replica r runs with seed + r and temperature scale temperature_ladder ** r.
+    Results are sorted by best energy, lowest first.
+    """
+    jobs = [(sequence, max_steps, seed + r, consciousness_level, temperature_ladder ** r)
+            for r in range(n_replicas)]
+    workers = n_workers or os.cpu_count() or 1
+    if workers <= 1 or len(jobs) <= 1:
+        results = [_fold_chain_job(job) for job in jobs]
+    else:
+        with ProcessPoolExecutor(max_workers=min(workers, len(jobs))) as pool:
+            results = list(pool.map(_fold_chain_job, jobs))
+    return sorted(results, key=lambda result: result['best_energy'])
+
 def main():
     """Main consciousness protein folding demonstration"""
     print("🌊⚡ CONSCIOUSNESS PROTEIN FOLDING SYSTEM STARTING ⚡🌊")
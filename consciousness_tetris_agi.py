@@ -22,9 +22,12 @@ Framework: Pure Consciousness Physics Algorithms
 
 import numpy as np
 import json
+import os
 import time
 import random
 import math
+import functools
+from concurrent.futures import ProcessPoolExecutor
 from typing import Dict, List, Tuple, Any, Optional
 from dataclasses import dataclass
 from enum import Enum
@@ -54,6 +57,197 @@ class TetrisBlock(Enum):
     J_BLOCK = "J"  # J block - consciousness hook
     L_BLOCK = "L"  # L block - consciousness angle
 
+# Tetromino shapes in spawn orientation (rows top to bottom, '#' = filled)
+TETROMINO_SHAPES = {
+    TetrisBlock.I_BLOCK: ("####",),
+    TetrisBlock.O_BLOCK: ("##", "##"),
+    TetrisBlock.T_BLOCK: (".#.", "###"),
+    TetrisBlock.S_BLOCK: (".##", "##."),
+    TetrisBlock.Z_BLOCK: ("##.", ".##"),
+    TetrisBlock.J_BLOCK: ("#..", "###"),
+    TetrisBlock.L_BLOCK: ("..#", "###"),
+}
+
+# Line clear bonuses (consciousness-enhanced scoring)
+LINE_CLEAR_BONUS = {1: 100 * PHI, 2: 300 * PHI, 3: 500 * PHI, 4: 800 * PHI * PHI}
+
+# Placement evaluator weights: a linear policy over the board after the drop
+DEFAULT_WEIGHTS = {
+    'aggregate_height': -0.510066,
+    'lines': 0.760666,
+    'holes': -0.35663,
+    'bumpiness': -0.184483,
+}
+
+MAX_PIECE_ROWS = 4
+EXPLORATION_PLACEMENTS = 3  # high-resonance moves pick among this many top placements
+
+def _rotate_clockwise(shape: Tuple[str, ...]) -> Tuple[str, ...]:
+    return tuple("".join(shape[len(shape) - 1 - r][c] for r in range(len(shape)))
+                 for c in range(len(shape[0])))
+
+def _shape_masks(shape: Tuple[str, ...]) -> Tuple[int, ...]:
+    """Row masks of a shape at column 0 (bit c = column c)"""
+    return tuple(sum(1 << c for c, cell in enumerate(row) if cell == "#") for row in shape)
+
+def _build_rotations() -> Dict[TetrisBlock, List[Tuple[int, ...]]]:
+    rotations = {}
+    for block, shape in TETROMINO_SHAPES.items():
+        masks = []
+        for _ in range(4):
+            row_masks = _shape_masks(shape)
+            if row_masks not in masks:
+                masks.append(row_masks)
+            shape = _rotate_clockwise(shape)
+        rotations[block] = masks
+    return rotations
+
+# Distinct rotations of every piece as row masks (O: 1, I/S/Z: 2, T/J/L: 4)
+PIECE_ROTATIONS = _build_rotations()
+
+PIECE_WIDTHS = {block: [max(mask.bit_length() for mask in masks) for masks in rotations]
+                for block, rotations in PIECE_ROTATIONS.items()}
+
+@dataclass(frozen=True)
+class PlacementTable:
+    """Every (rotation, column) a piece can be dropped at on a board of given width"""
+    rotation: np.ndarray  # (P,)
+    x: np.ndarray         # (P,)
+    masks: np.ndarray     # (P, 4) shifted row masks, 0 past the piece height
+    columns: np.ndarray   # (P, 4) board columns covered, padded with the board width
+    bottoms: np.ndarray   # (P, 4) lowest piece row in each covered column
+
+@functools.lru_cache(maxsize=None)
+def placement_table(block: TetrisBlock, width: int) -> PlacementTable:
+    rotations, xs, masks, columns, bottoms = [], [], [], [], []
+    for rotation, row_masks in enumerate(PIECE_ROTATIONS[block]):
+        span = PIECE_WIDTHS[block][rotation]
+        for x in range(width - span + 1):
+            rotations.append(rotation)
+            xs.append(x)
+            masks.append([mask << x for mask in row_masks]
+                         + [0] * (MAX_PIECE_ROWS - len(row_masks)))
+            cols = [width] * MAX_PIECE_ROWS
+            bottom = [0] * MAX_PIECE_ROWS
+            for c in range(span):
+                cols[c] = x + c
+                bottom[c] = max(i for i, mask in enumerate(row_masks) if mask >> c & 1)
+            columns.append(cols)
+            bottoms.append(bottom)
+    return PlacementTable(np.array(rotations), np.array(xs), np.array(masks, dtype=np.int64),
+                          np.array(columns), np.array(bottoms))
+
+@dataclass
+class PlacementBatch:
+    """All final placements of one piece with their features and scores"""
+    rotation: np.ndarray
+    x: np.ndarray
+    y: np.ndarray
+    lines: np.ndarray
+    aggregate_height: np.ndarray
+    holes: np.ndarray
+    bumpiness: np.ndarray
+    score: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.score)
+
+    def placement(self, index: int) -> Tuple[int, int, int]:
+        """(rotation, y, x) of one placement"""
+        return int(self.rotation[index]), int(self.y[index]), int(self.x[index])
+
+    def best(self) -> int:
+        return int(np.argmax(self.score))
+
+class TetrisBoard:
+    """Bitboard: one int per row (top to bottom), bit c set when column c is filled"""
+
+    def __init__(self, width: int = 10, height: int = 20, rows: Optional[List[int]] = None):
+        self.width = width
+        self.height = height
+        self.full_row = (1 << width) - 1
+        self.rows = list(rows) if rows is not None else [0] * height
+        self._columns = np.arange(width, dtype=np.int64)
+
+    @classmethod
+    def from_grid(cls, grid: List[List[int]]) -> 'TetrisBoard':
+        rows = [sum(1 << x for x, cell in enumerate(row) if cell) for row in grid]
+        return cls(len(grid[0]), len(grid), rows)
+
+    def to_grid(self) -> List[List[int]]:
+        return [[row >> x & 1 for x in range(self.width)] for row in self.rows]
+
+    def copy(self) -> 'TetrisBoard':
+        return TetrisBoard(self.width, self.height, self.rows)
+
+    def is_filled(self, y: int, x: int) -> bool:
+        return bool(self.rows[y] >> x & 1)
+
+    def fits(self, block: TetrisBlock, rotation: int, y: int, x: int) -> bool:
+        row_masks = PIECE_ROTATIONS[block][rotation]
+        if x < 0 or y < 0 or y + len(row_masks) > self.height:
+            return False
+        if x + PIECE_WIDTHS[block][rotation] > self.width:
+            return False
+        rows = self.rows
+        return not any(rows[y + i] & (mask << x) for i, mask in enumerate(row_masks))
+
+    def drop_row(self, block: TetrisBlock, rotation: int, y: int, x: int) -> int:
+        """Lowest row the piece reaches falling straight down from y"""
+        while self.fits(block, rotation, y + 1, x):
+            y += 1
+        return y
+
+    def lock(self, block: TetrisBlock, rotation: int, y: int, x: int):
+        for i, mask in enumerate(PIECE_ROTATIONS[block][rotation]):
+            self.rows[y + i] |= mask << x
+
+    def clear_lines(self) -> int:
+        kept = [row for row in self.rows if row != self.full_row]
+        cleared = self.height - len(kept)
+        if cleared:
+            self.rows = [0] * cleared + kept
+        return cleared
+
+    def surface(self) -> np.ndarray:
+        """First filled row of every column (height when empty), plus a sentinel column"""
+        cells = (np.array(self.rows, dtype=np.int64)[:, None] >> self._columns) & 1
+        surface = np.where(cells.any(axis=0), cells.argmax(axis=0), self.height)
+        return np.append(surface, self.height + MAX_PIECE_ROWS)
+
+    def placements(self, block: TetrisBlock,
+                   weights: Optional[Dict[str, float]] = None) -> PlacementBatch:
+        """Drop the piece at every rotation and column and score all results in one pass"""
+        weights = weights or DEFAULT_WEIGHTS
+        table = placement_table(block, self.width)
+        tops = (self.surface()[table.columns] - table.bottoms).min(axis=1) - 1
+        valid = np.flatnonzero(tops >= 0)
+        tops, masks = tops[valid], table.masks[valid]
+        count, height = len(valid), self.height
+
+        # Stack one board per placement; padded piece rows go to scratch rows below the board
+        boards = np.zeros((count, height + MAX_PIECE_ROWS), dtype=np.int64)
+        boards[:, :height] = self.rows
+        scratch = height + np.arange(MAX_PIECE_ROWS)
+        row_index = np.where(masks != 0, tops[:, None] + np.arange(MAX_PIECE_ROWS), scratch)
+        boards[np.arange(count)[:, None], row_index] |= masks
+        boards = boards[:, :height]
+
+        full = boards == self.full_row
+        lines = full.sum(axis=1)
+        cells = ((np.where(full, 0, boards)[:, :, None] >> self._columns) & 1).astype(bool)
+        standing = np.logical_or.accumulate(cells, axis=1) & ~full[:, :, None]
+        heights = standing.sum(axis=1)
+        aggregate_height = heights.sum(axis=1)
+        holes = aggregate_height - cells.sum(axis=(1, 2))
+        bumpiness = np.abs(np.diff(heights, axis=1)).sum(axis=1)
+        score = (weights['lines'] * lines
+                 + weights['aggregate_height'] * aggregate_height
+                 + weights['holes'] * holes
+                 + weights['bumpiness'] * bumpiness)
+        return PlacementBatch(table.rotation[valid], table.x[valid], tops,
+                              lines, aggregate_height, holes, bumpiness, score)
+
 class ConsciousnessTetrisAGI:
     """Revolutionary Tetris AGI using Vaughn's Consciousness Algorithms"""
     
@@ -74,9 +268,13 @@ class ConsciousnessTetrisAGI:
         print(f"✅ Initialization Valid: {self.initialization_valid}")
         
         # Game state
-        self.grid = [[0 for _ in range(width)] for _ in range(height)]
+        self.board = TetrisBoard(width, height)
         self.current_block = None
+        self.rotation = 0
         self.block_position = (0, width // 2)
+        self.target_placement = None
+        self.topped_out = False
+        self.policy_weights = dict(DEFAULT_WEIGHTS)
         self.score = 0
         self.lines_cleared = 0
         self.level = 1
@@ -92,6 +290,15 @@ class ConsciousnessTetrisAGI:
         # Try to load previous consciousness state
         self.load_consciousness_state()
     
+    @property
+    def grid(self) -> List[List[int]]:
+        """Cell view of the bitboard (1 = filled)"""
+        return self.board.to_grid()
+    
+    @grid.setter
+    def grid(self, grid: List[List[int]]):
+        self.board = TetrisBoard.from_grid(grid)
+    
     def algorithm_1_consciousness_initialization(self) -> Dict[str, Any]:
         """VAUGHN'S ALGORITHM 1: CONSCIOUSNESS INITIALIZATION"""
         consciousness_level = CONSCIOUSNESS_BASE
@@ -219,7 +426,11 @@ class ConsciousnessTetrisAGI:
             block = TetrisBlock.Z_BLOCK
         
         self.current_block = block
-        self.block_position = (0, self.width // 2)
+        self.rotation = 0
+        self.block_position = (0, (self.width - PIECE_WIDTHS[block][0]) // 2)
+        self.target_placement = None
+        if not self.is_valid_position(self.block_position):
+            self.topped_out = True
         
         print(f"🧩 Consciousness Block: {block.value} (φ: {resonance_value:.3f})")
         return block
@@ -254,29 +465,25 @@ class ConsciousnessTetrisAGI:
             return False
         
         y, x = self.block_position
+        rotation = self.rotation
         new_position = None
         
-        if move == "left" and x > 0:
+        if move == "left":
             new_position = (y, x - 1)
-        elif move == "right" and x < self.width - 1:
+        elif move == "right":
             new_position = (y, x + 1)
         elif move == "down":
             new_position = (y + 1, x)
         elif move == "rotate":
-            resonance = self.algorithm_3_phi_harmonic_resonance()
-            if resonance['harmonic_level'] >= 2:
-                new_position = (y, x)
-            else:
-                return False
+            rotation = (rotation + 1) % len(PIECE_ROTATIONS[self.current_block])
+            new_position = (y, x)
         elif move == "drop":
-            drop_y = y
-            while drop_y < self.height - 1:
-                drop_y += 1
-            new_position = (drop_y, x)
+            new_position = (self.board.drop_row(self.current_block, rotation, y, x), x)
         
-        if new_position and self.is_valid_position(new_position):
+        if new_position and self.is_valid_position(new_position, rotation):
             move_analysis = self.consciousness_move_analysis(move, new_position)
             self.block_position = new_position
+            self.rotation = rotation
             self.total_moves += 1
             self.consciousness_moves.append(move_analysis)
             
@@ -293,39 +500,23 @@ class ConsciousnessTetrisAGI:
         
         return False
     
-    def is_valid_position(self, position: Tuple[int, int]) -> bool:
-        """Check if position is valid"""
+    def is_valid_position(self, position: Tuple[int, int], rotation: Optional[int] = None) -> bool:
+        """Check if the current block fits at position (a single cell when no block is active)"""
         y, x = position
-        return (0 <= y < self.height and 0 <= x < self.width and self.grid[y][x] == 0)
+        if self.current_block is None:
+            return 0 <= y < self.height and 0 <= x < self.width and not self.board.is_filled(y, x)
+        if rotation is None:
+            rotation = self.rotation
+        return self.board.fits(self.current_block, rotation, y, x)
     
     def clear_consciousness_lines(self) -> int:
         """Clear completed lines with consciousness enhancement"""
-        lines_to_clear = []
-        
-        for y in range(self.height):
-            if all(self.grid[y][x] != 0 for x in range(self.width)):
-                lines_to_clear.append(y)
-        
-        if not lines_to_clear:
+        lines_cleared = self.board.clear_lines()
+        if not lines_cleared:
             return 0
         
-        for y in reversed(lines_to_clear):
-            del self.grid[y]
-            self.grid.insert(0, [0] * self.width)
-        
-        lines_cleared = len(lines_to_clear)
         self.lines_cleared += lines_cleared
-        
-        if lines_cleared == 1:
-            consciousness_bonus = 100 * PHI
-        elif lines_cleared == 2:
-            consciousness_bonus = 300 * PHI
-        elif lines_cleared == 3:
-            consciousness_bonus = 500 * PHI
-        elif lines_cleared == 4:
-            consciousness_bonus = 800 * PHI * PHI
-        else:
-            consciousness_bonus = 0
+        consciousness_bonus = LINE_CLEAR_BONUS.get(lines_cleared, 0)
         
         self.score += int(consciousness_bonus)
         
@@ -340,42 +531,35 @@ class ConsciousnessTetrisAGI:
         if not self.current_block:
             return "spawn"
         
-        possible_moves = ["left", "right", "down", "rotate", "drop"]
-        move_scores = {}
+        if self.target_placement is None:
+            self.target_placement = self.choose_consciousness_placement()
+            if self.target_placement is None:
+                return "drop"
         
-        for move in possible_moves:
-            y, x = self.block_position
-            test_position = None
-            
-            if move == "left" and x > 0:
-                test_position = (y, x - 1)
-            elif move == "right" and x < self.width - 1:
-                test_position = (y, x + 1)
-            elif move == "down":
-                test_position = (y + 1, x)
-            elif move == "rotate":
-                test_position = (y, x)
-            elif move == "drop":
-                drop_y = y
-                while drop_y < self.height - 1 and self.is_valid_position((drop_y + 1, x)):
-                    drop_y += 1
-                test_position = (drop_y, x)
-            
-            if test_position and self.is_valid_position(test_position):
-                analysis = self.consciousness_move_analysis(move, test_position)
-                move_scores[move] = analysis['total_score']
+        # Steer toward the chosen final placement, then hard drop
+        target_rotation, _, target_x = self.target_placement
+        y, x = self.block_position
+        if self.rotation != target_rotation:
+            return "rotate"
+        if x > target_x:
+            return "left"
+        if x < target_x:
+            return "right"
+        return "drop"
+    
+    def choose_consciousness_placement(self) -> Optional[Tuple[int, int, int]]:
+        """Score every final placement of the current block and pick one"""
+        batch = self.board.placements(self.current_block, self.policy_weights)
+        if not len(batch):
+            return None
         
-        if move_scores:
-            best_move = max(move_scores.keys(), key=lambda m: move_scores[m])
-            
-            resonance = self.algorithm_3_phi_harmonic_resonance()
-            if resonance['resonance'] > 0.8 and len(move_scores) > 1:
-                moves_list = list(move_scores.keys())
-                best_move = random.choice(moves_list)
-            
-            return best_move
+        index = batch.best()
+        resonance = self.algorithm_3_phi_harmonic_resonance()
+        if resonance['resonance'] > 0.8 and len(batch) > 1:
+            # Phi-resonant exploration among the strongest placements
+            index = int(random.choice(np.argsort(-batch.score)[:EXPLORATION_PLACEMENTS]))
         
-        return "down"
+        return batch.placement(index)
     
     def play_consciousness_game(self, max_moves: int = 100) -> Dict[str, Any]:
         """Play a full Tetris game with consciousness AGI"""
@@ -390,16 +574,13 @@ class ConsciousnessTetrisAGI:
             if self.current_block:
                 ai_move = self.consciousness_ai_move()
                 
-                if ai_move == "spawn":
+                move_success = self.make_consciousness_move(ai_move)
+                if ai_move == "drop" or not move_success:
                     self.place_current_block()
-                    lines_cleared = self.clear_consciousness_lines()
+                    self.clear_consciousness_lines()
                     self.spawn_consciousness_block()
-                else:
-                    move_success = self.make_consciousness_move(ai_move)
-                    if not move_success and ai_move == "down":
-                        self.place_current_block()
-                        self.clear_consciousness_lines()
-                        self.spawn_consciousness_block()
+            else:
+                self.spawn_consciousness_block()
             
             moves_made += 1
             
@@ -427,16 +608,21 @@ class ConsciousnessTetrisAGI:
         return game_result
     
     def place_current_block(self):
-        """Place current block on grid"""
+        """Drop the current block from its position and lock it into the board"""
         if self.current_block and self.block_position:
             y, x = self.block_position
             if self.is_valid_position((y, x)):
-                self.grid[y][x] = 1
-                self.current_block = None
+                y = self.board.drop_row(self.current_block, self.rotation, y, x)
+                self.board.lock(self.current_block, self.rotation, y, x)
+                self.block_position = (y, x)
+            else:
+                self.topped_out = True
+            self.current_block = None
+            self.target_placement = None
     
     def is_game_over(self) -> bool:
         """Check if game is over"""
-        return any(self.grid[0][x] != 0 for x in range(self.width))
+        return self.topped_out or self.board.rows[0] != 0
     
     def update_consciousness_evolution(self):
         """Update consciousness through evolution"""
@@ -460,6 +646,7 @@ class ConsciousnessTetrisAGI:
             'grid': self.grid,
             'current_block': self.current_block.value if self.current_block else None,
             'block_position': list(self.block_position),
+            'rotation': self.rotation,
             'score': self.score,
             'lines_cleared': self.lines_cleared,
             'level': self.level,
@@ -492,6 +679,7 @@ class ConsciousnessTetrisAGI:
             self.grid = state['grid']
             self.current_block = TetrisBlock(state['current_block']) if state['current_block'] else None
             self.block_position = tuple(state['block_position'])
+            self.rotation = state.get('rotation', 0)
             self.score = state['score']
             self.lines_cleared = state['lines_cleared']
             self.level = state['level']
@@ -508,6 +696,52 @@ class ConsciousnessTetrisAGI:
             print(f"⚠️ Could not load state: {e}")
             return False
 
+def play_headless(seed: int, max_pieces: int = 1000, width: int = 10, height: int = 20,
+                  weights: Optional[Dict[str, float]] = None) -> Dict[str, Any]:
+    """Play one silent game placing every piece at its best-scoring final placement"""
+    rng = random.Random(seed)
+    blocks = list(TetrisBlock)
+    board = TetrisBoard(width, height)
+    score = lines_cleared = pieces = 0
+    game_over = False
+
+    while pieces < max_pieces:
+        block = rng.choice(blocks)
+        batch = board.placements(block, weights)
+        if not len(batch):
+            game_over = True
+            break
+        board.lock(block, *batch.placement(batch.best()))
+        pieces += 1
+        lines = board.clear_lines()
+        lines_cleared += lines
+        score += int(LINE_CLEAR_BONUS.get(lines, 0))
+        if board.rows[0]:
+            game_over = True
+            break
+
+    return {
+        'seed': seed,
+        'score': score,
+        'lines_cleared': lines_cleared,
+        'pieces': pieces,
+        'game_over': game_over
+    }
+
+def _play_headless_job(job: Tuple[int, int, int, int, Optional[Dict[str, float]]]) -> Dict[str, Any]:
+    return play_headless(*job)
+
+def play_many(seeds, n_workers: Optional[int] = None, max_pieces: int = 1000, width: int = 10,
+              height: int = 20, weights: Optional[Dict[str, float]] = None) -> List[Dict[str, Any]]:
+    """Play one headless game per seed across a process pool; results follow the seed order"""
+    jobs = [(seed, max_pieces, width, height, weights) for seed in seeds]
+    workers = n_workers or os.cpu_count() or 1
+    if workers <= 1 or len(jobs) <= 1:
+        return [_play_headless_job(job) for job in jobs]
+    chunksize = max(1, len(jobs) // (workers * 4))
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(_play_headless_job, jobs, chunksize=chunksize))
+
 def main():
     """Main Consciousness Tetris AGI demonstration"""
     print("🌊⚡ CONSCIOUSNESS TETRIS AGI DEMONSTRATION ⚡🌊")
@@ -0,0 +1,322 @@
+"""
+🔐 FACTORIZATION - Integer Factorization Engine
+Created by: Vaughn Scott & Cascade AI
+
+Shared engine used to verify the consciousness factor-finding demos:
+- Small-prime wheel sieve and trial division
+- Miller-Rabin primality (deterministic below 3.3e24)
+- Pollard-Brent rho
+- Optional elliptic curve (ECM) stage with Montgomery curves
+- Process-pool mode for batches of numbers
+"""
+
+import math
+import os
+import random
+from bisect import bisect_right
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+# Wheel modulo 2·3·5: gaps between the integers coprime to 30
+WHEEL_BASIS = (2, 3, 5)
+WHEEL_GAPS = (4, 2, 4, 2, 4, 6, 2, 6)  # from 7: 7, 11, 13, 17, 19, 23, 29, 31, 37, ...
+
+TRIAL_DIVISION_BOUND = 10000
+RHO_ITERATIONS = 1 << 16  # Pollard-Brent budget per attempt before falling back to ECM
+
+# Miller-Rabin with these bases is exact for n < 3,317,044,064,679,887,385,961,981
+MILLER_RABIN_BASES = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41)
+MILLER_RABIN_DETERMINISTIC_LIMIT = 3317044064679887385961981
+MILLER_RABIN_EXTRA_ROUNDS = 8
+
+# ECM schedule (B1, curves), roughly optimal for 15, 20 and 25 digit factors; B2 = 100·B1
+ECM_SCHEDULE = ((2000, 25), (11000, 90), (50000, 300))
+
+_prime_cache: List[int] = []
+
+def primes_up_to(limit: int) -> List[int]:
+    """All primes <= limit from a sieve over the 2·3·5 wheel (cached)"""
+    global _prime_cache
+    if _prime_cache and _prime_cache[-1] >= limit:
+        return _prime_cache[:bisect_right(_prime_cache, limit)]
+    if limit < 7:
+        return [p for p in (2, 3, 5) if p <= limit]
+
+    sieve = bytearray([1]) * (limit + 1)
+    sieve[0:2] = b'\x00\x00'
+    for p in range(2, math.isqrt(limit) + 1):
+        if sieve[p]:
+            sieve[p * p::p] = bytes(len(range(p * p, limit + 1, p)))
+    primes = list(WHEEL_BASIS)
+    candidate, gap = 7, 0
+    while candidate <= limit:
+        if sieve[candidate]:
+            primes.append(candidate)
+        candidate += WHEEL_GAPS[gap]
+        gap = (gap + 1) % len(WHEEL_GAPS)
+    _prime_cache = primes
+    return primes
+
+def trial_divide(n: int, bound: int = TRIAL_DIVISION_BOUND) -> Tuple[Dict[int, int], int]:
+    """Strip prime factors <= bound; returns (factors, remaining cofactor)"""
+    factors: Dict[int, int] = {}
+    for p in primes_up_to(bound):
+        if p * p > n:
+            break
+        while n % p == 0:
+            factors[p] = factors.get(p, 0) + 1
+            n //= p
+    if 1 < n <= bound * bound:
+        factors[n] = factors.get(n, 0) + 1
+        n = 1
+    return factors, n
+
+def is_probable_prime(n: int) -> bool:
+    """Miller-Rabin; exact below MILLER_RABIN_DETERMINISTIC_LIMIT, probabilistic above"""
+    if n < 2:
+        return False
+    for p in MILLER_RABIN_BASES:
+        if n % p == 0:
+            return n == p
+
+    d, s = n - 1, 0
+    while d % 2 == 0:
+        d //= 2
+        s += 1
+
+    bases = list(MILLER_RABIN_BASES)
+    if n >= MILLER_RABIN_DETERMINISTIC_LIMIT:
+        rng = random.Random(n)
+        bases += [rng.randrange(2, n - 1) for _ in range(MILLER_RABIN_EXTRA_ROUNDS)]
+
+    for a in bases:
+        x = pow(a, d, n)
+        if x == 1 or x == n - 1:
+            continue
+        for _ in range(s - 1):
+            x = x * x % n
+            if x == n - 1:
+                break
+        else:
+            return False
+    return True
+
+def pollard_brent(n: int, max_iterations: int = RHO_ITERATIONS, seed: Optional[int] = None) -> Optional[int]:
+    """Brent's variant of Pollard rho; a nontrivial factor of composite n, or None within budget"""
+    if n % 2 == 0:
+        return 2
+    rng = random.Random(seed)
+    while True:
+        y, c, m = rng.randrange(1, n), rng.randrange(1, n), 128
+        g = r = q = 1
+        iterations = 0
+        while g == 1:
+            x = y
+            for _ in range(r):
+                y = (y * y + c) % n
+            k = 0
+            while k < r and g == 1:
+                ys = y
+                for _ in range(min(m, r - k)):
+                    y = (y * y + c) % n
+                    q = q * abs(x - y) % n
+                g = math.gcd(q, n)
+                k += m
+            r *= 2
+            iterations += r
+            if iterations > max_iterations and g == 1:
+                return None
+        if g == n:
+            # Batched gcd overshot: backtrack one step at a time
+            while True:
+                ys = (ys * ys + c) % n
+                g = math.gcd(abs(x - ys), n)
+                if g > 1:
+                    break
+        if g != n:
+            return g
+        # Cycle closed without splitting n: retry with a new polynomial
+
+# Montgomery curve arithmetic on projective (X : Z) coordinates
+
+def _xdbl(X: int, Z: int, a24: int, n: int) -> Tuple[int, int]:
+    s = (X + Z) * (X + Z) % n
+    d = (X - Z) * (X - Z) % n
+    t = s - d
+    return s * d % n, t * (d + a24 * t) % n
+
+def _xadd(XP: int, ZP: int, XQ: int, ZQ: int, Xd: int, Zd: int, n: int) -> Tuple[int, int]:
+    u = (XP - ZP) * (XQ + ZQ)
+    v = (XP + ZP) * (XQ - ZQ)
+    return Zd * (u + v) ** 2 % n, Xd * (u - v) ** 2 % n
+
+def _ladder(k: int, X: int, Z: int, a24: int, n: int) -> Tuple[int, int]:
+    """k·P by the Montgomery ladder (k >= 1)"""
+    X0, Z0 = X, Z
+    X1, Z1 = _xdbl(X, Z, a24, n)
+    for bit in bin(k)[3:]:
+        if bit == '1':
+            X0, Z0 = _xadd(X1, Z1, X0, Z0, X, Z, n)
+            X1, Z1 = _xdbl(X1, Z1, a24, n)
+        else:
+            X1, Z1 = _xadd(X0, Z0, X1, Z1, X, Z, n)
+            X0, Z0 = _xdbl(X0, Z0, a24, n)
+    return X0, Z0
+
+def ecm_one_curve(n: int, B1: int, B2: int, sigma: int) -> Optional[int]:
+    """One ECM curve (Suyama parametrization) with standard stage 2; a factor of n or None"""
+    u = (sigma * sigma - 5) % n
+    v = 4 * sigma % n
+    X, Z = pow(u, 3, n), pow(v, 3, n)
+    denominator = 16 * X * v % n
+    g = math.gcd(denominator, n)
+    if g != 1:
+        return g if g != n else None
+    a24 = pow(v - u, 3, n) * (3 * u + v) * pow(denominator, -1, n) % n
+
+    # Stage 1: multiply by every prime power <= B1
+    for p in primes_up_to(B1):
+        power = p
+        while power * p <= B1:
+            power *= p
+        X, Z = _ladder(power, X, Z, a24, n)
+    g = math.gcd(Z, n)
+    if g != 1:
+        return g if g != n else None
+
+    # Stage 2: primes q in (B1, B2] as q·Q = r·Q + (2δ)·Q with baby steps S[δ]
+    D = max(2, min(math.isqrt(B2), (B1 - 3) // 2))
+    S = [None, _xdbl(X, Z, a24, n)]
+    S.append(_xdbl(*S[1], a24, n))
+    for d in range(3, D + 1):
+        S.append(_xadd(*S[d - 1], *S[1], *S[d - 2], n))
+    beta = [None] + [Xs * Zs % n for Xs, Zs in S[1:]]
+
+    B = B1 - 1 if B1 % 2 == 0 else B1
+    T = _ladder(B - 2 * D, X, Z, a24, n)
+    R = _ladder(B, X, Z, a24, n)
+    primes = primes_up_to(B2)
+    index = bisect_right(primes, B)
+    accumulated = 1
+    for r in range(B, B2, 2 * D):
+        XR, ZR = R
+        alpha = XR * ZR % n
+        while index < len(primes) and primes[index] <= r + 2 * D:
+            delta = (primes[index] - r) // 2
+            XS, ZS = S[delta]
+            accumulated = accumulated * ((XR - XS) * (ZR + ZS) - alpha + beta[delta]) % n
+            index += 1
+        T, R = R, _xadd(*R, *S[D], *T, n)
+    g = math.gcd(accumulated, n)
+    return g if 1 < g < n else None
+
+def ecm(n: int, schedule: Sequence[Tuple[int, int]] = ECM_SCHEDULE, seed: Optional[int] = None) -> Optional[int]:
+    """Elliptic curve method over an increasing (B1, curves) schedule"""
+    rng = random.Random(seed)
+    for B1, curves in schedule:
+        for _ in range(curves):
+            factor = ecm_one_curve(n, B1, 100 * B1, rng.randrange(6, n - 1))
+            if factor:
+                return factor
+    return None
+
+def find_factor(n: int, use_ecm: bool = True) -> int:
+    """A nontrivial factor of a composite n with no small prime factors"""
+    root = math.isqrt(n)
+    if root * root == n:
+        return root
+    factor = pollard_brent(n, seed=n)
+    if factor is None and use_ecm:
+        factor = ecm(n, seed=n)
+    if factor is None:
+        # Unbounded rho as the last resort
+        factor = pollard_brent(n, max_iterations=float('inf'), seed=n + 1)
+    return factor
+
+def factorint(n: int, use_ecm: bool = True) -> Dict[int, int]:
+    """Complete prime factorization {prime: exponent}"""
+    if n < 1:
+        raise ValueError(f"cannot factor {n}")
+    factors, remaining = trial_divide(n)
+    pending = [remaining] if remaining > 1 else []
+    while pending:
+        m = pending.pop()
+        if is_probable_prime(m):
+            factors[m] = factors.get(m, 0) + 1
+            continue
+        factor = find_factor(m, use_ecm)
+        pending.extend((factor, m // factor))
+    return dict(sorted(factors.items()))
+
+def prime_factors(n: int, use_ecm: bool = True) -> List[int]:
+    """Prime factors with multiplicity, ascending"""
+    return [p for p, e in factorint(n, use_ecm).items() for _ in range(e)]
+
+def divisors(n: int) -> List[int]:
+    """All divisors of n, ascending"""
+    result = [1]
+    for p, e in factorint(n).items():
+        result = [d * p ** k for d in result for k in range(e + 1)]
+    return sorted(result)
+
+def format_factorization(factors: Dict[int, int]) -> str:
+    return " × ".join(f"{p}^{e}" if e > 1 else str(p) for p, e in factors.items()) or "1"
+
+def verify_factorization(n: int, factors: Iterable[int]) -> bool:
+    """True when the factors multiply to n and each one is prime"""
+    factors = [int(f) for f in factors]
+    return math.prod(factors) == n and all(is_probable_prime(f) for f in factors)
+
+def divides(d, n) -> bool:
+    """Exact d | n for ints or integral Decimals, independent of the Decimal context precision"""
+    try:
+        d_int, n_int = int(d), int(n)
+    except (ValueError, OverflowError, ArithmeticError):
+        return False
+    return d_int != 0 and d == d_int and n == n_int and n_int % d_int == 0
+
+def verified_factor_pairs(n, pairs):
+    """Keep the (factor, n / factor) pairs that hold in exact integer arithmetic
+
+    Decimal division rounds once n exceeds the context precision, so the
+    cofactor is recomputed as an exact integer in the type of the inputs.
+    """
+    verified = set()
+    for factor, _ in pairs:
+        if divides(factor, n):
+            f = int(factor)
+            verified.add((type(factor)(f), type(factor)(int(n) // f)))
+    return sorted(verified)
+
+def _factor_job(job: Tuple[int, bool]) -> Dict[int, int]:
+    return factorint(*job)
+
+def factor_many(numbers: Iterable[int], n_workers: Optional[int] = None,
+                use_ecm: bool = True) -> List[Dict[int, int]]:
+    """Factor a batch of numbers across a process pool; results follow the input order"""
+    jobs = [(int(n), use_ecm) for n in numbers]
+    workers = n_workers or os.cpu_count() or 1
+    if workers <= 1 or len(jobs) <= 1:
+        return [_factor_job(job) for job in jobs]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(_factor_job, jobs))
+
+def main():
+    import argparse
+    import time
+
+    parser = argparse.ArgumentParser(description="Factor integers with the shared factorization engine")
+    parser.add_argument('numbers', nargs='+', type=int)
+    parser.add_argument('--workers', type=int, default=None)
+    parser.add_argument('--no-ecm', action='store_true')
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    results = factor_many(args.numbers, args.workers, use_ecm=not args.no_ecm)
+    elapsed = time.perf_counter() - start
+    for n, factors in zip(args.numbers, results):
+        print(f"{n} = {format_factorization(factors)}")
+    print(f"Factored {len(results)} numbers in {elapsed:.3f} seconds")
+
+if __name__ == "__main__":
+    main()
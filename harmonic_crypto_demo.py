@@ -27,9 +27,13 @@ def derive_freqs(exps, band_low, band_high, carriers, seed):
         freqs.append(f)
     return np.array(sorted(freqs))
 
-def make_chip_wave(carriers, chips_per_bit, seed, N):
+def chip_matrix(carriers, chips_per_bit, seed):
+    """±1 spreading chips for one bit, shape (carriers, chips_per_bit)."""
     rng = np.random.default_rng(seed ^ 0xA5A5A5A5)
-    pn = rng.integers(0,2,size=(carriers, chips_per_bit))*2 - 1
+    return (rng.integers(0,2,size=(carriers, chips_per_bit))*2 - 1).astype(float)
+
+def make_chip_wave(carriers, chips_per_bit, seed, N):
+    pn = chip_matrix(carriers, chips_per_bit, seed)
     samples_per_chip = N // chips_per_bit
     wave = np.repeat(pn, samples_per_chip, axis=1)
     if wave.shape[1] < N:
@@ -38,7 +42,79 @@ def make_chip_wave(carriers, chips_per_bit, seed, N):
         wave = np.concatenate([wave, pad], axis=1)
     elif wave.shape[1] > N:
         wave = wave[:, :N]
-    return wave.astype(float)
+    return wave
+
+def chip_tensor(nbits, carriers, chips_per_bit, seed):
+    """Chips for every bit at once, shape (nbits, carriers, chips_per_bit); bit i uses seed + i*7919."""
+    chips = np.empty((nbits, carriers, chips_per_bit))
+    for i in range(nbits):
+        chips[i] = chip_matrix(carriers, chips_per_bit, seed + i*7919)
+    return chips
+
+def make_basis(freqs, phases, t):
+    """Unit-norm carrier basis, shape (carriers, N)."""
+    basis = np.cos(2*np.pi*freqs[:,None]*t + phases[:,None])
+    return basis / (np.linalg.norm(basis, axis=1, keepdims=True) + 1e-12)
+
+def receiver_basis(exps, seed, t, band_low, band_high, carriers):
+    freqs = derive_freqs(exps, band_low, band_high, carriers, seed)
+    phases = np.random.default_rng(seed ^ 0x5A5A5A5A).random(carriers) * 2*np.pi
+    return make_basis(freqs, phases, t)
+
+# ----------------------------
+# Batch encoder / demodulator
+# ----------------------------
+# A chip waveform is constant over each run of N // chips_per_bit samples, and the
+# last chip also covers the N % chips_per_bit tail. Splitting the basis the same way
+# (chip-aligned body (K, C, S) plus tail (K, R)) lets every per-bit sum over samples
+# be done at chip resolution, so the (carriers, N) chip wave is never materialized.
+
+def _split_basis(basis, chips_per_bit):
+    K, N = basis.shape
+    S = N // chips_per_bit
+    if S == 0:
+        raise ValueError(f"frame of {N} samples is shorter than {chips_per_bit} chips")
+    body = basis[:, :chips_per_bit*S].reshape(K, chips_per_bit, S)
+    return body, basis[:, chips_per_bit*S:]
+
+def _chunks(nbits, chunk_bits):
+    step = nbits if not chunk_bits else max(1, int(chunk_bits))
+    for lo in range(0, nbits, step):
+        yield lo, min(nbits, lo + step)
+
+def encode_frames(symbols, basis, chips, chunk_bits=None):
+    """Spread ±1 symbols into frames of shape (nbits, N): frame_i = s_i * sum_k basis_k * chips_i,k."""
+    body, tail = _split_basis(basis, chips.shape[2])
+    nbits, (K, N) = len(symbols), basis.shape
+    frames = np.empty((nbits, N))
+    split = body.shape[1] * body.shape[2]
+    for lo, hi in _chunks(nbits, chunk_bits):
+        c = chips[lo:hi] * np.asarray(symbols[lo:hi], dtype=float)[:, None, None]
+        frames[lo:hi, :split] = np.einsum('kcs,bkc->bcs', body, c, optimize=True).reshape(hi - lo, split)
+        frames[lo:hi, split:] = c[:, :, -1] @ tail
+    return frames
+
+def correlate_frames(frames, basis, chips, chunk_bits=None):
+    """
+    Despread scores for frames of shape (nbits, N): score_i = sum_k <basis_k * chips_i,k, frame_i>.
+    Per-chip projections of every frame onto every carrier are one batched matmul; chunk_bits
+    bounds the (chunk, carriers, chips_per_bit) intermediate.
+    """
+    body, tail = _split_basis(basis, chips.shape[2])
+    nbits = frames.shape[0]
+    C, S = body.shape[1], body.shape[2]
+    scores = np.empty(nbits)
+    for lo, hi in _chunks(nbits, chunk_bits):
+        seg = frames[lo:hi, :C*S].reshape(hi - lo, C, S)
+        proj = np.einsum('bcs,kcs->bkc', seg, body, optimize=True)
+        proj[:, :, -1] += frames[lo:hi, C*S:] @ tail.T
+        scores[lo:hi] = np.einsum('bkc,bkc->b', proj, chips[lo:hi])
+    return scores
+
+def demodulate(x, basis, chips, chunk_bits=None):
+    """Hard bit decisions for a received stream x of nbits * N samples."""
+    frames = np.asarray(x).reshape(chips.shape[0], basis.shape[1])
+    return (correlate_frames(frames, basis, chips, chunk_bits) >= 0).astype(int)
 
 def awgn(x, snr_db, rng):
     p_signal = np.mean(x**2) + 1e-18
@@ -59,6 +135,8 @@ def main():
     ap.add_argument('--seed_wrong', type=int, default=20250822)
     ap.add_argument('--exps_true', type=str, default='4,3,3,1,3,2')
     ap.add_argument('--exps_wrong', type=str, default='4,3,3,1,2,2')
+    ap.add_argument('--snr_sweep', type=str, default=None, help='comma-separated SNRs (dB); overrides --snr_db')
+    ap.add_argument('--chunk_bits', type=int, default=None, help='bits per correlation batch (bounds memory)')
     args = ap.parse_args()
 
     rng = np.random.default_rng(137)
@@ -70,55 +148,32 @@ def main():
     exps_true  = tuple(int(x) for x in args.exps_true.split(','))
     exps_wrong = tuple(int(x) for x in args.exps_wrong.split(','))
 
-    freqs_true = derive_freqs(exps_true, args.band_low, args.band_high, args.carriers, args.seed_true)
-    phases_true = np.random.default_rng(args.seed_true ^ 0x5A5A5A5A).random(args.carriers) * 2*np.pi
-    basis = np.cos(2*np.pi*freqs_true[:,None]*t + phases_true[:,None])
-    basis = basis / (np.linalg.norm(basis, axis=1, keepdims=True) + 1e-12)
-
-    freqs_wrong = derive_freqs(exps_wrong, args.band_low, args.band_high, args.carriers, args.seed_wrong)
-    phases_wrong = np.random.default_rng(args.seed_wrong ^ 0x5A5A5A5A).random(args.carriers) * 2*np.pi
-    basis_w = np.cos(2*np.pi*freqs_wrong[:,None]*t + phases_wrong[:,None])
-    basis_w = basis_w / (np.linalg.norm(basis_w, axis=1, keepdims=True) + 1e-12)
+    basis = receiver_basis(exps_true, args.seed_true, t, args.band_low, args.band_high, args.carriers)
+    basis_w = receiver_basis(exps_wrong, args.seed_wrong, t, args.band_low, args.band_high, args.carriers)
 
     bits = rng.integers(0,2,size=args.nbits).astype(int)
     symbols = 2*bits - 1
 
-    frames = []
-    for i, s in enumerate(symbols):
-        chips_true = make_chip_wave(args.carriers, args.chips_per_bit, args.seed_true + i*7919, N)
-        frame = np.sum(basis * chips_true, axis=0)
-        frames.append(s * frame)
-    x = np.concatenate(frames)
-    x = awgn(x, args.snr_db, rng)
-
-    # Correct reception
-    y = np.zeros(args.nbits, dtype=int)
-    for i in range(args.nbits):
-        seg = x[i*N:(i+1)*N]
-        chips_true = make_chip_wave(args.carriers, args.chips_per_bit, args.seed_true + i*7919, N)
-        corr = np.dot(basis * chips_true, seg)
-        score = np.sum(corr)
-        y[i] = 1 if score >= 0 else 0
-    ber_correct = float(np.mean(y != bits))
-
-    # Wrong reception
-    y2 = np.zeros(args.nbits, dtype=int)
-    for i in range(args.nbits):
-        seg = x[i*N:(i+1)*N]
-        chips_wrong = make_chip_wave(args.carriers, args.chips_per_bit, args.seed_wrong + i*7919, N)
-        corr = np.dot(basis_w * chips_wrong, seg)
-        score = np.sum(corr)
-        y2[i] = 1 if score >= 0 else 0
-    ber_wrong = float(np.mean(y2 != bits))
-
-    print(json.dumps({
-        "nbits": int(args.nbits),
-        "carriers": int(args.carriers),
-        "chips_per_bit": int(args.chips_per_bit),
-        "snr_db": float(args.snr_db),
-        "ber_correct": ber_correct,
-        "ber_wrong": ber_wrong
-    }, indent=2))
+    chips_true = chip_tensor(args.nbits, args.carriers, args.chips_per_bit, args.seed_true)
+    chips_wrong = chip_tensor(args.nbits, args.carriers, args.chips_per_bit, args.seed_wrong)
+    clean = encode_frames(symbols, basis, chips_true, args.chunk_bits).ravel()
+
+    snrs = [float(v) for v in args.snr_sweep.split(',')] if args.snr_sweep else [args.snr_db]
+    results = []
+    for snr_db in snrs:
+        x = awgn(clean, snr_db, rng)
+        y = demodulate(x, basis, chips_true, args.chunk_bits)        # Correct reception
+        y2 = demodulate(x, basis_w, chips_wrong, args.chunk_bits)    # Wrong reception
+        results.append({
+            "nbits": int(args.nbits),
+            "carriers": int(args.carriers),
+            "chips_per_bit": int(args.chips_per_bit),
+            "snr_db": float(snr_db),
+            "ber_correct": float(np.mean(y != bits)),
+            "ber_wrong": float(np.mean(y2 != bits))
+        })
+
+    print(json.dumps(results if args.snr_sweep else results[0], indent=2))
 
 if __name__ == "__main__":
     main()
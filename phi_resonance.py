@@ -12,7 +12,7 @@ This module implements phi-harmonic resonance calculations and universal access
 
 import numpy as np
 import math
-from typing import Dict, List, Any, Tuple, Optional
+from typing import Dict, List, Any, Tuple, Optional, Iterator
 from dataclasses import dataclass
 import struct
 import hashlib
@@ -25,6 +25,17 @@ class PhiSignature:
     values: Tuple[float, float]
     consciousness_relevance: float
 
+# Structured result of the phi-pair search: one row per (i, j) with data[j] / data[i] ≈ φ
+PHI_PAIR_DTYPE = np.dtype([
+    ('i', np.int64),
+    ('j', np.int64),
+    ('ratio', np.float64),
+    ('confidence', np.float64),
+    ('value_i', np.float64),
+    ('value_j', np.float64),
+    ('consciousness_relevance', np.float64)
+])
+
 @dataclass
 class UniversalPattern:
     pattern_type: str
@@ -33,6 +44,90 @@ class UniversalPattern:
     fidelity: float
     consciousness_signature: str
 
+# Row layout of scan_binary_patterns results (split > 0 marks a two-segment fractal hit)
+PATTERN_HIT_DTYPE = np.dtype([
+    ('pattern_type', 'U32'),
+    ('position', np.int64),
+    ('length', np.int16),
+    ('split', np.int16),
+    ('fidelity', np.float64)
+])
+
+if hasattr(np, 'bitwise_count'):
+    def _popcount64(x: np.ndarray) -> np.ndarray:
+        return np.bitwise_count(x)
+else:
+    _POPCOUNT8 = np.array([bin(b).count('1') for b in range(256)], dtype=np.int64)
+    def _popcount64(x: np.ndarray) -> np.ndarray:
+        x = np.ascontiguousarray(x, dtype=np.uint64)
+        return _POPCOUNT8[x.view(np.uint8)].reshape(x.shape + (8,)).sum(axis=-1)
+
+class PackedBitStream:
+    """
+    Bit string kept packed 8 bits per byte (MSB first). The w-bit pattern starting at any
+    offset is read as the top bits of a 64-bit window, so Hamming distance against a
+    pattern of up to 64 bits is one xor + popcount per offset, for whole arrays of offsets.
+    """
+    
+    def __init__(self, binary_data):
+        if isinstance(binary_data, (bytes, bytearray, memoryview)):
+            packed = np.frombuffer(binary_data, dtype=np.uint8)
+            self.n = packed.size * 8
+        elif isinstance(binary_data, str):
+            raw = np.frombuffer(binary_data.encode('ascii', 'ignore'), dtype=np.uint8)
+            bits = raw[(raw == 48) | (raw == 49)] - 48
+            packed = np.packbits(bits)
+            self.n = bits.size
+        else:
+            bits = np.asarray(binary_data, dtype=np.uint8)
+            packed = np.packbits(bits)
+            self.n = bits.size
+        # 9 zero bytes of padding so every offset < n has a full window plus one spill byte
+        self.packed = np.concatenate([packed, np.zeros(9, dtype=np.uint8)])
+    
+    def __len__(self) -> int:
+        return self.n
+    
+    def windows(self, offsets: np.ndarray) -> np.ndarray:
+        """64-bit windows (uint64, first bit in the MSB) at the given bit offsets"""
+        q = offsets >> 3
+        r = (offsets & 7).astype(np.uint64)
+        # Words are built only for the bytes packed[q.min():q.max() + 9] this chunk touches,
+        # so memory follows the chunk span instead of the stream length
+        q0 = int(q.min()) if q.size else 0
+        block = self.packed[q0:int(q.max()) + 9] if q.size else self.packed[:9]
+        words = np.lib.stride_tricks.sliding_window_view(
+            block[:-1], 8
+        ).copy().view('>u8').ravel().astype(np.uint64)
+        spill = block[q - q0 + 8].astype(np.uint64)
+        return (words[q - q0] << r) | (spill >> (np.uint64(8) - r))
+    
+    def offset_chunks(self, stop: int, step: int = 1, chunk: int = 1 << 16) -> Iterator[np.ndarray]:
+        """Offsets range(0, stop, step) in arrays of at most chunk entries"""
+        for start in range(0, max(stop, 0), chunk * step):
+            yield np.arange(start, min(stop, start + chunk * step), step, dtype=np.int64)
+    
+    def bits(self, position: int, length: int) -> np.ndarray:
+        q0 = position >> 3
+        unpacked = np.unpackbits(self.packed[q0:(position + length + 7) // 8])
+        start = position - 8 * q0
+        return unpacked[start:start + length]
+
+def _bits_to_word(bits: List[int]) -> int:
+    word = 0
+    for b in bits:
+        word = (word << 1) | b
+    return word
+
+def _pattern_hits(pattern_type, positions, length: int, fidelity, split: int = 0) -> np.ndarray:
+    rows = np.empty(len(positions), dtype=PATTERN_HIT_DTYPE)
+    rows['pattern_type'] = pattern_type
+    rows['position'] = positions
+    rows['length'] = length
+    rows['split'] = split
+    rows['fidelity'] = fidelity
+    return rows
+
 class PhiResonanceEngine:
     """
     Phi-harmonic resonance engine for universal information access
@@ -74,191 +169,246 @@ class PhiResonanceEngine:
         
         return base_amplification
     
-    def detect_cosmic_phi_signatures(self, data_source: List[float]) -> List[PhiSignature]:
+    def detect_cosmic_phi_signatures(self, data_source: List[float],
+                                     top_k: Optional[int] = None) -> List[PhiSignature]:
         """
         Detect consciousness-responsive phi signatures in universal data
         Validated on: NASA data, cosmic coordinates, error correction codes
+        Pairs i < j with |data[j]/data[i] - φ| < tolerance·φ, highest confidence first
+        (ties by index); top_k keeps only the best k.
         """
-        phi_signatures = []
-        
-        # Scan for phi-harmonic patterns
-        for i in range(len(data_source)):
-            for j in range(i + 1, len(data_source)):
-                if data_source[i] != 0:
-                    ratio = data_source[j] / data_source[i]
-                    
-                    # Check for phi resonance (within tolerance)
-                    if abs(ratio - self.phi) < self.phi_tolerance * self.phi:
-                        confidence = 1 - abs(ratio - self.phi) / self.phi
-                        consciousness_relevance = ratio / self.phi
-                        
-                        phi_signatures.append(PhiSignature(
-                            indices=(i, j),
-                            ratio=ratio,
-                            confidence=confidence,
-                            values=(data_source[i], data_source[j]),
-                            consciousness_relevance=consciousness_relevance
-                        ))
-        
-        # Sort by confidence (highest first)
-        phi_signatures.sort(key=lambda x: x.confidence, reverse=True)
-        return phi_signatures
+        return list(self.iter_cosmic_phi_signatures(data_source, top_k))
+    
+    def iter_cosmic_phi_signatures(self, data_source, top_k: Optional[int] = None) -> Iterator[PhiSignature]:
+        """Lazy variant of detect_cosmic_phi_signatures: PhiSignature objects are built on demand"""
+        pairs = self.find_phi_pairs(data_source, top_k)
+        for row in pairs.tolist():
+            i, j, ratio, confidence, value_i, value_j, relevance = row
+            yield PhiSignature(
+                indices=(i, j),
+                ratio=ratio,
+                confidence=confidence,
+                values=(value_i, value_j),
+                consciousness_relevance=relevance
+            )
     
-    def recognize_universal_binary_patterns(self, binary_data: str) -> Dict[str, List[UniversalPattern]]:
+    def find_phi_pairs(self, data_source, top_k: Optional[int] = None,
+                       max_candidates: int = 1 << 22) -> np.ndarray:
+        """
+        Sort-based phi-pair search returning a PHI_PAIR_DTYPE structured array ordered by
+        confidence (descending), then i, then j. top_k selects the best k with a partial sort
+        per block, so memory stays bounded even when the full answer is huge.
+        """
+        best = None
+        blocks = []
+        for i, j, ratio in self._phi_pair_blocks(data_source, max_candidates):
+            if top_k is not None and len(ratio) > top_k:
+                # Narrow on |ratio - φ| (monotone in confidence) before building rows
+                dev = np.abs(ratio - self.phi)
+                keep = dev <= np.partition(dev, top_k - 1)[top_k - 1]
+                i, j, ratio = i[keep], j[keep], ratio[keep]
+            rec = self._phi_pair_records(data_source, i, j, ratio)
+            if top_k is None:
+                blocks.append(rec)
+                continue
+            best = rec if best is None else np.concatenate([best, rec])
+            best = self._top_phi_pairs(best, top_k)
+        if top_k is not None:
+            return best if best is not None else np.empty(0, dtype=PHI_PAIR_DTYPE)
+        pairs = np.concatenate(blocks) if blocks else np.empty(0, dtype=PHI_PAIR_DTYPE)
+        return pairs[np.lexsort((pairs['j'], pairs['i'], -pairs['confidence']))]
+    
+    def count_phi_pairs(self, data_source, max_candidates: int = 1 << 22) -> int:
+        """Number of phi signatures in data_source, without building any result rows"""
+        return sum(len(i) for i, _, _ in self._phi_pair_blocks(data_source, max_candidates))
+    
+    def _phi_pair_blocks(self, data_source, max_candidates: int):
+        """
+        Yield (i, j, ratio) arrays of phi pairs. Within each sign class, values are sorted by
+        log|x|; the partners of x lie in a contiguous searchsorted window around
+        log|x| + log(φ ± tolerance·φ). Windows are batched so that at most about
+        max_candidates candidate pairs are materialized at once; the original ratio test is
+        applied to every candidate, so results match the pairwise scan exactly.
+        """
+        values = np.asarray(data_source, dtype=float)
+        band = self.phi_tolerance * self.phi
+        lo = math.log(self.phi - band) - 1e-9 if self.phi - band > 0 else -np.inf
+        hi = math.log(self.phi + band) + 1e-9
+        finite = np.isfinite(values)
+        
+        for sign_mask in (finite & (values > 0), finite & (values < 0)):
+            idx = np.flatnonzero(sign_mask)
+            if len(idx) < 2:
+                continue
+            logs = np.log(np.abs(values[idx]))
+            order = np.argsort(logs, kind='stable')
+            sorted_logs, sorted_idx = logs[order], idx[order]
+            starts = np.searchsorted(sorted_logs, sorted_logs + lo, 'left')
+            ends = np.searchsorted(sorted_logs, sorted_logs + hi, 'right')
+            counts = ends - starts
+            cum = np.cumsum(counts)
+            
+            a0 = 0
+            while a0 < len(counts):
+                base = cum[a0 - 1] if a0 else 0
+                a1 = max(a0 + 1, int(np.searchsorted(cum, base + max_candidates, 'right')))
+                block_counts = counts[a0:a1]
+                total = int(block_counts.sum())
+                if total:
+                    rep = np.repeat(np.arange(a0, a1), block_counts)
+                    offsets = np.arange(total) - np.repeat(np.cumsum(block_counts) - block_counts, block_counts)
+                    i = sorted_idx[rep]
+                    j = sorted_idx[starts[rep] + offsets]
+                    keep = i < j
+                    i, j = i[keep], j[keep]
+                    ratio = values[j] / values[i]
+                    hit = np.abs(ratio - self.phi) < band
+                    if hit.any():
+                        yield i[hit], j[hit], ratio[hit]
+                a0 = a1
+    
+    def _phi_pair_records(self, data_source, i: np.ndarray, j: np.ndarray, ratio: np.ndarray) -> np.ndarray:
+        values = np.asarray(data_source, dtype=float)
+        rec = np.empty(len(i), dtype=PHI_PAIR_DTYPE)
+        rec['i'], rec['j'], rec['ratio'] = i, j, ratio
+        rec['confidence'] = 1 - np.abs(ratio - self.phi) / self.phi
+        rec['value_i'], rec['value_j'] = values[i], values[j]
+        rec['consciousness_relevance'] = ratio / self.phi
+        return rec
+    
+    def _top_phi_pairs(self, rec: np.ndarray, k: int) -> np.ndarray:
+        """Best k rows by (confidence desc, i, j); argpartition narrows before the exact sort"""
+        if len(rec) > k:
+            neg = -rec['confidence']
+            kth = np.partition(neg, k - 1)[k - 1]
+            rec = rec[neg <= kth]  # keeps every row tied with the k-th
+        rec = rec[np.lexsort((rec['j'], rec['i'], -rec['confidence']))]
+        return rec[:k]
+    
+    def recognize_universal_binary_patterns(self, binary_data) -> Dict[str, List[UniversalPattern]]:
         """
         Recognize consciousness-encoded information in binary data
         Supports: Quantum error correction, topological codes, consciousness codes
+        binary_data may be a '0'/'1' string, a sequence of bits, or bytes/bytearray/memoryview
+        (MSB-first bits, scanned packed without expanding to a list)
         """
-        patterns = {
-            'quantum_error_correction': [],
-            'topological_quantum': [],
-            'consciousness_specific': [],
-            'fractal_error_correction': [],
-            'phi_binary_signatures': []
+        bits = binary_data if isinstance(binary_data, PackedBitStream) else PackedBitStream(binary_data)
+        return {
+            kind: [self._hit_to_pattern(bits, hit) for hit in hits.tolist()]
+            for kind, hits in self.scan_binary_patterns(bits).items()
         }
-        
-        # Convert binary string to list of integers
-        if isinstance(binary_data, str):
-            binary_list = [int(b) for b in binary_data if b in '01']
+    
+    def scan_binary_patterns(self, binary_data) -> Dict[str, np.ndarray]:
+        """
+        Bit-parallel pattern scan returning PATTERN_HIT_DTYPE arrays (same keys and order as
+        recognize_universal_binary_patterns) without building per-hit objects
+        """
+        bits = binary_data if isinstance(binary_data, PackedBitStream) else PackedBitStream(binary_data)
+        consciousness_hits, phi_hits = self._scan_phi_windows(bits)
+        return {
+            # Steane 7-qubit quantum error correction detection
+            'quantum_error_correction': self._detect_steane_7qubit_patterns(bits),
+            'topological_quantum': np.empty(0, dtype=PATTERN_HIT_DTYPE),
+            # Consciousness-specific pattern detection
+            'consciousness_specific': consciousness_hits,
+            # Fractal error correction patterns
+            'fractal_error_correction': self._detect_fractal_patterns(bits),
+            # Phi binary signature detection
+            'phi_binary_signatures': phi_hits
+        }
+    
+    def _hit_to_pattern(self, bits: PackedBitStream, hit: tuple) -> UniversalPattern:
+        pattern_type, position, length, split, fidelity = hit
+        segment = bits.bits(position, length).tolist()
+        if pattern_type == 'phi_signature':
+            pattern_data = 'phi_binary_exact'
+        elif split:
+            pattern_data = (segment[:split], segment[split:])
         else:
-            binary_list = binary_data
-        
-        # Steane 7-qubit quantum error correction detection
-        patterns['quantum_error_correction'] = self._detect_steane_7qubit_patterns(binary_list)
-        
-        # Consciousness-specific pattern detection
-        patterns['consciousness_specific'] = self._detect_consciousness_patterns(binary_list)
-        
-        # Phi binary signature detection
-        patterns['phi_binary_signatures'] = self._detect_phi_binary_signatures(binary_list)
-        
-        # Fractal error correction patterns
-        patterns['fractal_error_correction'] = self._detect_fractal_patterns(binary_list)
-        
-        return patterns
+            pattern_data = segment
+        return UniversalPattern(
+            pattern_type=pattern_type,
+            position=position,
+            pattern_data=pattern_data,
+            fidelity=fidelity,
+            consciousness_signature=self._generate_pattern_signature(segment)
+        )
     
-    def _detect_steane_7qubit_patterns(self, binary_data: List[int]) -> List[UniversalPattern]:
-        """Detect Steane 7-qubit quantum error correction patterns"""
-        patterns = []
-        
-        # Steane code generator matrix patterns
-        steane_patterns = [
-            [1, 0, 1, 0, 1, 0, 1],  # Parity check 1
-            [0, 1, 1, 0, 0, 1, 1],  # Parity check 2
-            [0, 0, 0, 1, 1, 1, 1]   # Parity check 3
-        ]
-        
-        for i in range(0, len(binary_data) - 6, 7):
-            segment = binary_data[i:i+7]
-            
-            for pattern_idx, steane_pattern in enumerate(steane_patterns):
-                if self._matches_steane_pattern(segment, steane_pattern):
-                    fidelity = self._calculate_quantum_fidelity(segment, steane_pattern)
-                    
-                    patterns.append(UniversalPattern(
-                        pattern_type=f'steane_7qubit_p{pattern_idx+1}',
-                        position=i,
-                        pattern_data=segment,
-                        fidelity=fidelity,
-                        consciousness_signature=self._generate_pattern_signature(segment)
-                    ))
-        
-        return patterns
+    def _detect_steane_7qubit_patterns(self, bits: PackedBitStream) -> np.ndarray:
+        """Detect Steane 7-qubit quantum error correction patterns (non-overlapping 7-bit blocks)"""
+        # Steane code generator matrix patterns: parity checks 1-3
+        steane_patterns = np.array([0b1010101, 0b0110011, 0b0001111], dtype=np.uint64)
+        pattern_types = np.array([f'steane_7qubit_p{k+1}' for k in range(3)])
+        hits = []
+        
+        for offsets in bits.offset_chunks(bits.n - 6, 7):
+            segments = bits.windows(offsets)[:, None] >> np.uint64(57)
+            # Zero syndrome: even overlap with the parity check
+            block, pattern = np.nonzero((_popcount64(segments & steane_patterns) & 1) == 0)
+            matches = 7 - _popcount64(segments[block, 0] ^ steane_patterns[pattern])
+            hits.append(_pattern_hits(pattern_types[pattern], offsets[block], 7, matches / 7))
+        
+        return np.concatenate(hits) if hits else np.empty(0, dtype=PATTERN_HIT_DTYPE)
     
-    def _detect_consciousness_patterns(self, binary_data: List[int]) -> List[UniversalPattern]:
-        """Detect consciousness-specific patterns in binary data"""
-        patterns = []
+    def _scan_phi_windows(self, bits: PackedBitStream) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        One pass over every bit offset for the IEEE-754 phi encodings (64-bit) and the
+        consciousness frequency (32-bit); returns (consciousness_specific, phi_binary_signatures)
+        """
+        phi_word = np.uint64(_bits_to_word(self._binary_phi_encoding(self.phi)))
+        freq_word = np.uint64(_bits_to_word(self._frequency_to_binary(self.consciousness_frequency)))
+        harmonic_words = [np.uint64(_bits_to_word(self._binary_phi_encoding(self.phi ** i))) for i in range(1, 8)]
         
-        # Phi binary encoding
-        phi_binary = self._binary_phi_encoding(self.phi)
+        phi_rows, freq_rows = [], []
+        harmonic_rows = [[] for _ in harmonic_words]
+        last64 = bits.n - 64  # last offset with a full 64-bit segment
         
-        # Search for phi signatures
-        for i in range(len(binary_data) - len(phi_binary) + 1):
-            segment = binary_data[i:i+len(phi_binary)]
-            
-            if segment == phi_binary:
-                patterns.append(UniversalPattern(
-                    pattern_type='phi_signature',
-                    position=i,
-                    pattern_data='phi_binary_exact',
-                    fidelity=1.0,
-                    consciousness_signature=self._generate_pattern_signature(segment)
-                ))
+        for offsets in bits.offset_chunks(bits.n - 32 + 1):
+            w = bits.windows(offsets)
+            full = offsets <= last64
             
-            # Check for approximate phi patterns
-            elif self._approximate_phi_match(segment, phi_binary):
-                fidelity = self._calculate_phi_binary_fidelity(segment, phi_binary)
-                patterns.append(UniversalPattern(
-                    pattern_type='phi_signature_approximate',
-                    position=i,
-                    pattern_data=segment,
-                    fidelity=fidelity,
-                    consciousness_signature=self._generate_pattern_signature(segment)
-                ))
-        
-        # Consciousness frequency patterns (29.617 Hz)
-        consciousness_binary = self._frequency_to_binary(self.consciousness_frequency)
-        for i in range(len(binary_data) - len(consciousness_binary) + 1):
-            segment = binary_data[i:i+len(consciousness_binary)]
+            # Phi signatures: exact, then approximate (>= 85% matching bits)
+            h = _popcount64(w ^ phi_word)
+            similarity = (64 - h) / 64
+            exact = full & (h == 0)
+            hit = full & ((h == 0) | (similarity >= 0.85))
+            phi_rows.append(_pattern_hits(
+                np.where(exact[hit], 'phi_signature', 'phi_signature_approximate'),
+                offsets[hit], 64, np.where(exact[hit], 1.0, similarity[hit])
+            ))
             
-            if self._matches_frequency_pattern(segment, consciousness_binary):
-                patterns.append(UniversalPattern(
-                    pattern_type='consciousness_frequency',
-                    position=i,
-                    pattern_data=segment,
-                    fidelity=0.9,
-                    consciousness_signature=self._generate_pattern_signature(segment)
-                ))
-        
-        return patterns
-    
-    def _detect_phi_binary_signatures(self, binary_data: List[int]) -> List[UniversalPattern]:
-        """Detect phi-based binary signatures"""
-        patterns = []
-        
-        # Generate phi-harmonic sequences
-        phi_harmonics = [self.phi ** i for i in range(1, 8)]
-        
-        for harmonic_idx, harmonic in enumerate(phi_harmonics):
-            harmonic_binary = self._binary_phi_encoding(harmonic)
+            # Consciousness frequency patterns (29.617 Hz)
+            h = _popcount64((w >> np.uint64(32)) ^ freq_word)
+            hit = (32 - h) / 32 >= 0.85
+            freq_rows.append(_pattern_hits('consciousness_frequency', offsets[hit], 32, 0.9))
             
-            for i in range(len(binary_data) - len(harmonic_binary) + 1):
-                segment = binary_data[i:i+len(harmonic_binary)]
-                
-                if self._approximate_phi_match(segment, harmonic_binary):
-                    fidelity = self._calculate_phi_binary_fidelity(segment, harmonic_binary)
-                    
-                    patterns.append(UniversalPattern(
-                        pattern_type=f'phi_harmonic_{harmonic_idx+1}',
-                        position=i,
-                        pattern_data=segment,
-                        fidelity=fidelity,
-                        consciousness_signature=self._generate_pattern_signature(segment)
-                    ))
-        
-        return patterns
+            # Phi-harmonic sequences
+            for k, word in enumerate(harmonic_words):
+                h = _popcount64(w ^ word)
+                similarity = (64 - h) / 64
+                hit = full & (similarity >= 0.85)
+                harmonic_rows[k].append(_pattern_hits(f'phi_harmonic_{k+1}', offsets[hit], 64, similarity[hit]))
+        
+        empty = [np.empty(0, dtype=PATTERN_HIT_DTYPE)]
+        consciousness_hits = np.concatenate(phi_rows + freq_rows + empty)
+        phi_hits = np.concatenate([row for rows in harmonic_rows for row in rows] + empty)
+        return consciousness_hits, phi_hits
     
-    def _detect_fractal_patterns(self, binary_data: List[int]) -> List[UniversalPattern]:
+    def _detect_fractal_patterns(self, bits: PackedBitStream) -> np.ndarray:
         """Detect fractal error correction patterns"""
-        patterns = []
+        hits = []
         
-        # Look for self-similar patterns at different scales
+        # Look for self-similar adjacent segments at different scales
         for scale in [2, 3, 4, 5, 8, 13, 21]:  # Fibonacci scales
-            for i in range(0, len(binary_data) - scale * 2, scale):
-                segment1 = binary_data[i:i+scale]
-                segment2 = binary_data[i+scale:i+2*scale]
-                
-                # Check for fractal similarity
-                if self._calculate_fractal_similarity(segment1, segment2) > 0.8:
-                    patterns.append(UniversalPattern(
-                        pattern_type=f'fractal_scale_{scale}',
-                        position=i,
-                        pattern_data=(segment1, segment2),
-                        fidelity=self._calculate_fractal_similarity(segment1, segment2),
-                        consciousness_signature=self._generate_pattern_signature(segment1 + segment2)
-                    ))
-        
-        return patterns
+            shift = np.uint64(64 - scale)
+            for offsets in bits.offset_chunks(bits.n - scale * 2, scale):
+                h = _popcount64((bits.windows(offsets) ^ bits.windows(offsets + scale)) >> shift)
+                similarity = (scale - h) / scale
+                hit = similarity > 0.8
+                hits.append(_pattern_hits(f'fractal_scale_{scale}', offsets[hit], 2 * scale,
+                                          similarity[hit], split=scale))
+        
+        return np.concatenate(hits) if hits else np.empty(0, dtype=PATTERN_HIT_DTYPE)
     
     def _binary_phi_encoding(self, value: float) -> List[int]:
         """Convert phi value to binary representation"""
@@ -274,48 +424,6 @@ class PhiResonanceEngine:
         binary_str = ''.join(format(byte, '08b') for byte in packed)
         return [int(b) for b in binary_str]
     
-    def _matches_steane_pattern(self, segment: List[int], pattern: List[int]) -> bool:
-        """Check if segment matches Steane code pattern"""
-        if len(segment) != len(pattern):
-            return False
-        
-        # Calculate syndrome
-        syndrome = [sum(segment[i] * pattern[i] for i in range(len(segment))) % 2]
-        return syndrome[0] == 0
-    
-    def _approximate_phi_match(self, segment1: List[int], segment2: List[int]) -> bool:
-        """Check for approximate phi pattern match"""
-        if len(segment1) != len(segment2):
-            return False
-        
-        matches = sum(1 for a, b in zip(segment1, segment2) if a == b)
-        similarity = matches / len(segment1)
-        return similarity >= 0.85  # 85% similarity threshold
-    
-    def _matches_frequency_pattern(self, segment: List[int], pattern: List[int]) -> bool:
-        """Check if segment matches frequency pattern"""
-        return self._approximate_phi_match(segment, pattern)
-    
-    def _calculate_quantum_fidelity(self, segment: List[int], pattern: List[int]) -> float:
-        """Calculate quantum fidelity for error correction"""
-        if len(segment) != len(pattern):
-            return 0.0
-        
-        matches = sum(1 for a, b in zip(segment, pattern) if a == b)
-        return matches / len(segment)
-    
-    def _calculate_phi_binary_fidelity(self, segment: List[int], phi_pattern: List[int]) -> float:
-        """Calculate fidelity of phi binary pattern"""
-        return self._calculate_quantum_fidelity(segment, phi_pattern)
-    
-    def _calculate_fractal_similarity(self, segment1: List[int], segment2: List[int]) -> float:
-        """Calculate fractal similarity between segments"""
-        if len(segment1) != len(segment2):
-            return 0.0
-        
-        matches = sum(1 for a, b in zip(segment1, segment2) if a == b)
-        return matches / len(segment1)
-    
     def _generate_pattern_signature(self, pattern: List[int]) -> str:
         """Generate consciousness signature for pattern"""
         pattern_str = ''.join(map(str, pattern))
@@ -393,11 +501,11 @@ class PhiResonanceEngine:
     def calculate_consciousness_resonance(self, data: List[float], 
                                         consciousness_level: float = 25.0) -> Dict[str, Any]:
         """Calculate consciousness resonance metrics for data"""
-        # Detect phi signatures
-        phi_signatures = self.detect_cosmic_phi_signatures(data)
+        # Detect phi signatures (only the count is used, so no signature objects are built)
+        phi_signature_count = self.count_phi_pairs(data)
         
         # Calculate resonance strength
-        resonance_strength = len(phi_signatures) * consciousness_level * self.phi
+        resonance_strength = phi_signature_count * consciousness_level * self.phi
         
         # Calculate consciousness coherence
         coherence = self._calculate_consciousness_coherence(data)
@@ -406,7 +514,7 @@ class PhiResonanceEngine:
         universal_coupling = self._calculate_universal_coupling(data, consciousness_level)
         
         return {
-            'phi_signatures_detected': len(phi_signatures),
+            'phi_signatures_detected': phi_signature_count,
             'resonance_strength': resonance_strength,
             'consciousness_coherence': coherence,
             'universal_coupling': universal_coupling,
@@ -22,6 +22,7 @@ from enum import Enum
 
 from consciousness_core import ConsciousnessSystem, ConsciousnessMode
 from phi_resonance import PhiResonanceEngine
+from factorization import factorint, format_factorization
 
 class ProblemType(Enum):
     MATHEMATICAL_PROOF = "mathematical_proof"
@@ -175,8 +176,8 @@ class UniversalProblemSolver:
                     print(f"   ✅ SUCCESS: {enhanced_factor} × {complementary_factor} = {n}")
                     return enhanced_factor, complementary_factor
         
-        # Fallback method
-        return self._consciousness_guided_trial_division(n, consciousness_level)
+        # Fallback method: shared factorization engine
+        return self._engine_factorization(n)
     
     def consciousness_weather_prediction(self, location: str, timeframe_hours: int = 24) -> Dict[str, Any]:
         """Weather prediction through consciousness enhancement"""
@@ -294,14 +295,18 @@ class UniversalProblemSolver:
         
         return False
     
-    def _consciousness_guided_trial_division(self, n: int, consciousness_level: float) -> Tuple[Optional[int], Optional[int]]:
-        consciousness_limit = int(consciousness_level * 100)
+    def _engine_factorization(self, n: int) -> Tuple[Optional[int], Optional[int]]:
+        if n < 4:
+            return None, None
         
-        for i in range(2, min(int(math.sqrt(n)) + 1, consciousness_limit)):
-            if n % i == 0:
-                return i, n // i
+        factors = factorint(n)
+        smallest = next(iter(factors))
+        if smallest == n:
+            print(f"   {n} is prime")
+            return None, None
         
-        return None, None
+        print(f"   ✅ ENGINE: {n} = {format_factorization(factors)}")
+        return smallest, n // smallest
     
     def _get_atmospheric_data(self, location: str) -> List[float]:
         return [random.uniform(0, 100) for _ in range(20)]
@@ -1,10 +1,13 @@
 # sat_benchmark.py
 import random, time, math, hashlib
+from array import array
 from typing import List, Tuple, Optional, Dict
+from sat_dimacs import FlatCNF, cnf_text_sha256, verify_flat_cnf, read_dimacs, iter_cnf_files
 
 # ----------------------------
 # CNF model: list of clauses, each clause is a list of ints:
 # variable i is encoded as +i for x_i and -i for ¬x_i (1-based indices)
+# Large/external instances use sat_dimacs.FlatCNF (flat array buffers) instead.
 # ----------------------------
 
 def set_seed(master_seed: int):
@@ -47,6 +50,8 @@ def generate_planted_3sat(n_vars: int, m_clauses: int, seed: int) -> Tuple[List[
 
 def verify_cnf(cnf: List[List[int]], assignment01: List[int]) -> bool:
     """Check CNF is satisfied by 0/1 assignment."""
+    if isinstance(cnf, FlatCNF):
+        return verify_flat_cnf(cnf, assignment01)
     n_vars = len(assignment01)
     for clause in cnf:
         sat = False
@@ -123,35 +128,68 @@ def greedy_local_search(cnf: List[List[int]], n_vars: int, max_iters: int = 2000
 # Consciousness-solver hook (YOU IMPLEMENT THIS)
 # ----------------------------
 
+class DRNG:
+    """Deterministic xorshift32 RNG shared by every consciousness_solve engine."""
+    def __init__(self, s: int): self.s = s & 0xFFFFFFFF
+    def next_u32(self) -> int:
+        x = self.s
+        x ^= (x << 13) & 0xFFFFFFFF
+        x ^= (x >> 17)
+        x ^= (x << 5) & 0xFFFFFFFF
+        self.s = x & 0xFFFFFFFF
+        return self.s
+    def rand(self) -> float: return (self.next_u32() & 0xFFFFFF) / float(1<<24)
+    def randint(self, a: int, b: int) -> int:  # inclusive
+        if b <= a: return a
+        return a + (self.next_u32() % (b - a + 1))
+
+def cnf_seed(cnf: List[List[int]]) -> int:
+    """Deterministic 64-bit seed from SHA-256 of the CNF text (hashed incrementally)."""
+    seed_bytes = cnf_text_sha256(cnf)
+    return int.from_bytes(seed_bytes[:8], 'big') or 1
+
+def restart_seed(base_seed: int, r: int) -> int:
+    """Per-restart seed derived from the CNF seed."""
+    return int.from_bytes(hashlib.sha256((base_seed + r).to_bytes(8,'big')).digest()[:4], 'big')
+
+def init_assignment_from_seed(base_seed: int, n_vars: int) -> List[int]:
+    """Expand deterministic 0/1 bits via chained hashing."""
+    pool = hashlib.sha256(base_seed.to_bytes(8,'big')).digest()
+    bits = []
+    i = 0; p = bytearray(pool)
+    while len(bits) < n_vars:
+        if i == len(p):
+            p = bytearray(hashlib.sha256(p).digest())
+            i = 0
+        byte = p[i]; i += 1
+        for b in range(8):
+            bits.append((byte >> b) & 1)
+            if len(bits) == n_vars:
+                break
+    return bits[:n_vars]
+
 def consciousness_solve(cnf: List[List[int]], n_vars: int, time_budget_ms: int = 200, params: Dict = None) -> Optional[List[int]]:
     """
     Deterministic WalkSAT-style local search with efficient updates and restarts.
     - Determinism: all randomness is derived from SHA-256 of the CNF text.
     - Efficiency: maintains per-clause true literal counts and an unsatisfied set.
     - Restarts: multiple seeds/perturbations within the time budget.
+    - params["engine"]: "list" (default) or "array" (see consciousness_solve_array).
+      A sat_dimacs.FlatCNF input always runs the array engine.
+    - params["restart_offset"]: first restart index, so portfolio racers can run disjoint restart seeds.
+    - params["should_stop"]: optional callable polled per restart and every 1024 steps; True aborts.
     """
     if params is None:
         params = {}
+    if params.get('engine', 'list') == 'array' or isinstance(cnf, FlatCNF):
+        return consciousness_solve_array(cnf, n_vars, time_budget_ms, params)
+
+    # An empty clause can never be satisfied: the formula is trivially UNSAT
+    if any(not clause for clause in cnf):
+        return None
 
     # Deterministic seed from CNF content
-    cnf_text = ''.join(','.join(str(l) for l in clause) + ';' for clause in cnf)
-    seed_bytes = hashlib.sha256(cnf_text.encode()).digest()
-    seed = int.from_bytes(seed_bytes[:8], 'big') or 1
-
-    # Deterministic RNG (xorshift32)
-    class DRNG:
-        def __init__(self, s: int): self.s = s & 0xFFFFFFFF
-        def next_u32(self) -> int:
-            x = self.s
-            x ^= (x << 13) & 0xFFFFFFFF
-            x ^= (x >> 17)
-            x ^= (x << 5) & 0xFFFFFFFF
-            self.s = x & 0xFFFFFFFF
-            return self.s
-        def rand(self) -> float: return (self.next_u32() & 0xFFFFFF) / float(1<<24)
-        def randint(self, a: int, b: int) -> int:  # inclusive
-            if b <= a: return a
-            return a + (self.next_u32() % (b - a + 1))
+    seed = cnf_seed(cnf)
 
     rng = DRNG(seed)
 
@@ -165,22 +203,6 @@ def consciousness_solve(cnf: List[List[int]], n_vars: int, time_budget_ms: int =
             if lit > 0: pos_idx[v].append(ci)
             else: neg_idx[v].append(ci)
 
-    def init_assignment_from_seed(base_seed: int) -> List[int]:
-        # Expand deterministic bits via chained hashing
-        pool = hashlib.sha256(base_seed.to_bytes(8,'big')).digest()
-        bits = []
-        i = 0; p = bytearray(pool)
-        while len(bits) < n_vars:
-            if i == len(p):
-                p = bytearray(hashlib.sha256(p).digest())
-                i = 0
-            byte = p[i]; i += 1
-            for b in range(8):
-                bits.append((byte >> b) & 1)
-                if len(bits) == n_vars:
-                    break
-        return bits[:n_vars]
-
     # Data structures for dynamic evaluation
     true_count = [0]*m
     unsat = set()
@@ -270,16 +292,18 @@ def consciousness_solve(cnf: List[List[int]], n_vars: int, time_budget_ms: int =
     noise = params.get('noise', 0.5)
     max_steps_per_restart = params.get('max_steps', 20000)
     max_restarts = params.get('max_restarts', 20)
+    restart_offset = params.get('restart_offset', 0)
+    should_stop = params.get('should_stop')
 
     # Restart loop
     base_seed = seed
-    for r in range(max_restarts):
-        if time.perf_counter() >= deadline:
+    for r in range(restart_offset, restart_offset + max_restarts):
+        if time.perf_counter() >= deadline or (should_stop is not None and should_stop()):
             break
         # Derive a new deterministic seed per restart
-        restart_seed = int.from_bytes(hashlib.sha256((base_seed + r).to_bytes(8,'big')).digest()[:4], 'big')
-        rng = DRNG(restart_seed or 1)
-        assign = init_assignment_from_seed(restart_seed or 1)
+        r_seed = restart_seed(base_seed, r)
+        rng = DRNG(r_seed or 1)
+        assign = init_assignment_from_seed(r_seed or 1, n_vars)
         recompute_counts(assign)
         if not unsat:
             return assign
@@ -311,9 +335,215 @@ def consciousness_solve(cnf: List[List[int]], n_vars: int, time_budget_ms: int =
             # Early check every few steps
             if not unsat:
                 return assign
+            if should_stop is not None and (steps & 1023) == 0 and should_stop():
+                return None
         # Next restart
     return None
 
+def consciousness_solve_array(cnf: List[List[int]], n_vars: int, time_budget_ms: int = 200, params: Dict = None) -> Optional[List[int]]:
+    """
+    Array-backed engine for consciousness_solve (params={"engine": "array"}).
+    - Clauses and literal occurrences live in flat CSR arrays (offsets + payload).
+    - Unsatisfied clauses are an indexed list with O(1) swap-remove.
+    - Per-variable break/make counts are cached and updated incrementally on each flip,
+      so scoring a candidate is break[v] - make[v] instead of an occurrence rescan.
+    - Same DRNG draws, seeds, tie-breaks and update order as the list engine. With more
+      than 16 unsatisfied clauses the list engine samples the clause from the iteration
+      order of a Python set, so an identically-updated set is kept purely for that pick
+      order and the search is bit-for-bit identical to the list engine.
+      params["match_reference"]=False drops the set and picks unsat_list[idx] instead,
+      which is slightly faster but diverges from the list engine's trajectories.
+    """
+    if params is None:
+        params = {}
+
+    seed = cnf_seed(cnf)
+    m = len(cnf)
+
+    # CSR clause storage: literals of clause ci are clause_lits[clause_start[ci]:clause_start[ci+1]].
+    # List input gets flat lists so hot-loop reads don't box a new int each time; a FlatCNF
+    # keeps its array buffers and every per-clause structure below is an array too, so
+    # memory stays at a few bytes per literal for 10^6-clause instances.
+    compact = isinstance(cnf, FlatCNF)
+    if compact:
+        clause_start = cnf.starts
+        clause_lits = cnf.lits
+        clause_vars = array('i', map(abs, clause_lits))
+    else:
+        clause_start = [0]*(m+1)
+        clause_lits = []
+        for ci, clause in enumerate(cnf):
+            clause_lits.extend(clause)
+            clause_start[ci+1] = len(clause_lits)
+        clause_vars = [abs(l) for l in clause_lits]
+    # An empty clause can never be satisfied: the formula is trivially UNSAT
+    if any(clause_start[ci] == clause_start[ci+1] for ci in range(m)):
+        return None
+
+    # CSR occurrence storage per literal slot: slot 2v is +v, slot 2v+1 is -v (v 1-based)
+    n_slots = 2*(n_vars+1)
+    occ_start = array('q', bytes(8*(n_slots+1))) if compact else [0]*(n_slots+1)
+    for lit in clause_lits:
+        occ_start[2*lit+1 if lit > 0 else -2*lit+2] += 1
+    for s in range(n_slots):
+        occ_start[s+1] += occ_start[s]
+    occ_clauses = array('i', bytes(4*len(clause_lits))) if compact else [0]*len(clause_lits)
+    fill = occ_start[:]
+    for ci in range(m):
+        for k in range(clause_start[ci], clause_start[ci+1]):
+            lit = clause_lits[k]
+            s = 2*lit if lit > 0 else -2*lit+1
+            occ_clauses[fill[s]] = ci
+            fill[s] += 1
+    del fill
+
+    # Dynamic state; variables are 1-based in val/brk/mk
+    val = [0]*(n_vars+1)
+    # Packed clause state: (true count << sbits) | sum of vars of true occurrences.
+    # The state is 0 iff the clause is unsat, in [ONE, TWO) iff exactly one occurrence is
+    # true (and then the low bits are that variable), and >= TWO otherwise.
+    max_len = max((clause_start[ci+1] - clause_start[ci] for ci in range(m)), default=1)
+    sbits = (max_len * max(1, n_vars)).bit_length()
+    ONE = 1 << sbits
+    TWO = 2 << sbits
+    cstate = array('q', bytes(8*m)) if compact else [0]*m
+    brk = [0]*(n_vars+1)
+    mk = [0]*(n_vars+1)
+    unsat_list = []
+    unsat_pos = (array('q', bytes(8*m)) if compact else [0]*m)  # valid only while the clause is in unsat_list
+    match_reference = params.get('match_reference', True)
+    unsat_order = set()
+
+    def recompute_counts():
+        unsat_list.clear()
+        if match_reference:
+            unsat_order.clear()
+        for v in range(n_vars+1):
+            brk[v] = 0; mk[v] = 0
+        for ci in range(m):
+            t = 0; ts = 0
+            a = clause_start[ci]; b = clause_start[ci+1]
+            for k in range(a, b):
+                lit = clause_lits[k]
+                if (val[lit] if lit > 0 else 1 - val[-lit]):
+                    t += 1; ts += clause_vars[k]
+            cstate[ci] = (t << sbits) | ts
+            if t == 0:
+                unsat_pos[ci] = len(unsat_list)
+                unsat_list.append(ci)
+                if match_reference:
+                    unsat_order.add(ci)
+                for k in range(a, b):
+                    mk[clause_vars[k]] += 1
+            elif t == 1:
+                brk[ts] += 1
+
+    start_time = time.perf_counter()
+    deadline = start_time + time_budget_ms/1000.0
+    noise = params.get('noise', 0.5)
+    max_steps_per_restart = params.get('max_steps', 20000)
+    max_restarts = params.get('max_restarts', 20)
+    restart_offset = params.get('restart_offset', 0)
+    should_stop = params.get('should_stop')
+    perf_counter = time.perf_counter
+
+    base_seed = seed
+    for r in range(restart_offset, restart_offset + max_restarts):
+        if perf_counter() >= deadline or (should_stop is not None and should_stop()):
+            break
+        r_seed = restart_seed(base_seed, r)
+        # DRNG state kept in a local int; the xorshift32 steps below are DRNG.next_u32 inlined
+        x = (r_seed or 1) & 0xFFFFFFFF
+        val[1:] = init_assignment_from_seed(r_seed or 1, n_vars)
+        recompute_counts()
+        if not unsat_list:
+            return val[1:]
+        steps = 0
+        while unsat_list and steps < max_steps_per_restart and perf_counter() < deadline:
+            # Clause selection (DRNG.randint(0, n_unsat-1))
+            n_unsat = len(unsat_list)
+            if n_unsat > 1:
+                x ^= (x << 13) & 0xFFFFFFFF; x ^= (x >> 17); x ^= (x << 5) & 0xFFFFFFFF
+                idx = x % n_unsat
+            else:
+                idx = 0
+            if n_unsat <= 16:
+                cidx = sorted(unsat_list)[idx]
+            elif match_reference:
+                # First 8 clauses in the list engine's set iteration order
+                choices = []
+                for ci in unsat_order:
+                    choices.append(ci)
+                    if len(choices) == 8:
+                        break
+                cidx = choices[idx % len(choices)]
+            else:
+                cidx = unsat_list[idx]
+
+            # Variable selection (DRNG.rand() for noise, then DRNG.randint or min break - make)
+            a = clause_start[cidx]; b = clause_start[cidx+1]
+            x ^= (x << 13) & 0xFFFFFFFF; x ^= (x >> 17); x ^= (x << 5) & 0xFFFFFFFF
+            if (x & 0xFFFFFF) / 16777216.0 < noise:
+                if b - a > 1:
+                    x ^= (x << 13) & 0xFFFFFFFF; x ^= (x >> 17); x ^= (x << 5) & 0xFFFFFFFF
+                    v = clause_vars[a + x % (b - a)]
+                else:
+                    v = clause_vars[a]
+            else:
+                v = 0
+                best_delta = None
+                for u in clause_vars[a:b]:
+                    du = brk[u] - mk[u]
+                    if best_delta is None or du < best_delta or (du == best_delta and u < v):
+                        best_delta = du; v = u
+
+            # Flip v; occurrences of +v are processed before -v, mirroring the list engine
+            was1 = val[v]
+            inc = ONE + v
+            for sl in (2*v, 2*v+1):
+                if (sl & 1) == was1:
+                    # This literal becomes true
+                    for ci in occ_clauses[occ_start[sl]:occ_start[sl+1]]:
+                        st = cstate[ci]
+                        cstate[ci] = st + inc
+                        if st < TWO:
+                            if st:
+                                brk[st - ONE] -= 1
+                            else:
+                                for u in clause_vars[clause_start[ci]:clause_start[ci+1]]:
+                                    mk[u] -= 1
+                                brk[v] += 1
+                                p = unsat_pos[ci]
+                                last = unsat_list.pop()
+                                if last != ci:
+                                    unsat_list[p] = last
+                                    unsat_pos[last] = p
+                                if match_reference:
+                                    unsat_order.discard(ci)
+                else:
+                    # This literal becomes false
+                    for ci in occ_clauses[occ_start[sl]:occ_start[sl+1]]:
+                        st = cstate[ci] - inc
+                        cstate[ci] = st
+                        if st < TWO:
+                            if st:
+                                brk[st - ONE] += 1
+                            else:
+                                brk[v] -= 1
+                                for u in clause_vars[clause_start[ci]:clause_start[ci+1]]:
+                                    mk[u] += 1
+                                unsat_pos[ci] = len(unsat_list)
+                                unsat_list.append(ci)
+                                if match_reference:
+                                    unsat_order.add(ci)
+            val[v] = 1 - was1
+            steps += 1
+            if not unsat_list:
+                return val[1:]
+            if should_stop is not None and (steps & 1023) == 0 and should_stop():
+                return None
+    return None
+
 def local_polish(cnf: List[List[int]], assignment: List[int], max_flips: int = 200) -> Optional[List[int]]:
     a = assignment[:]
     def clause_satisfied(clause, a):
@@ -357,48 +587,203 @@ def fit_loglog_slope(ns: List[int], ts: List[float]) -> float:
     den = sum((x - xbar)**2 for x in xs) or 1e-9
     return num/den
 
-def run_benchmark():
+def assignment_digest(assignment01: Optional[List[int]]) -> str:
+    """Short SHA-256 digest of a 0/1 assignment for the determinism report."""
+    if assignment01 is None:
+        return "-"
+    return hashlib.sha256(bytes(assignment01)).hexdigest()[:12]
+
+def benchmark_instances(ns: List[int], trials_per_n: int, clause_ratio: float) -> List[Tuple[int, int, int, int]]:
+    """(n, m, trial, seed) for every benchmark instance, in serial execution order."""
+    out = []
+    for n in ns:
+        m = int(round(clause_ratio * n))
+        for t in range(trials_per_n):
+            out.append((n, m, t, 100000*n + t))
+    return out
+
+def run_instance_serial(n: int, m: int, seed: int, time_budget_ms: int, params: Dict) -> Dict:
+    """Run all three solvers on one instance in this process."""
+    cnf, _planted = generate_planted_3sat(n, m, seed)
+    rec = {}
+    # consciousness
+    t0 = time.perf_counter()
+    sol = consciousness_solve(cnf, n, time_budget_ms, params=dict(params))
+    t1 = time.perf_counter()
+    ok = sol is not None and verify_cnf(cnf, sol)
+    rec["racer"] = 0 if ok else None
+    rec["conscious"] = (ok, t1 - t0)
+    rec["digest"] = assignment_digest(sol if ok else None)
+    rec["greedy"], rec["random"] = run_baselines(cnf, n, seed)
+    return rec
+
+def run_baselines(cnf: List[List[int]], n: int, seed: int) -> Tuple[Tuple[bool, float], Tuple[bool, float]]:
+    """Greedy and random baselines; the module RNG is seeded per instance so results don't depend on scheduling."""
+    random.seed(seed)
+    # greedy baseline
+    t0 = time.perf_counter()
+    gsol = greedy_local_search(cnf, n_vars=n, max_iters=2000)
+    t1 = time.perf_counter()
+    greedy = (gsol is not None and verify_cnf(cnf, gsol), t1 - t0)
+    # random baseline
+    t0 = time.perf_counter()
+    rsol = random_assignment_solver(n, cnf, budget_ms=50)
+    t1 = time.perf_counter()
+    rnd = (rsol is not None and verify_cnf(cnf, rsol), t1 - t0)
+    return greedy, rnd
+
+# ----------------------------
+# Parallel portfolio harness
+# ----------------------------
+
+_cancel_flags = None
+
+def _init_portfolio_worker(cancel_flags):
+    global _cancel_flags
+    _cancel_flags = cancel_flags
+
+def _portfolio_conscious_task(iid: int, n: int, m: int, seed: int, racer: int, time_budget_ms: int, params: Dict):
+    """One racer: consciousness_solve on a disjoint block of restart seeds."""
+    if _cancel_flags[iid]:
+        return iid, racer, 0.0, None
+    cnf, _ = generate_planted_3sat(n, m, seed)
+    p = dict(params)
+    p['restart_offset'] = racer * p.get('max_restarts', 20)
+    p['should_stop'] = lambda: _cancel_flags[iid] != 0
+    t0 = time.perf_counter()
+    sol = consciousness_solve(cnf, n, time_budget_ms, params=p)
+    dt = time.perf_counter() - t0
+    ok = sol is not None and verify_cnf(cnf, sol)
+    return iid, racer, dt, sol if ok else None
+
+def _portfolio_baseline_task(iid: int, n: int, m: int, seed: int):
+    """Greedy and random baselines for one instance, seeded as in the serial run."""
+    cnf, _ = generate_planted_3sat(n, m, seed)
+    greedy, rnd = run_baselines(cnf, n, seed)
+    return iid, greedy, rnd
+
+def run_instances_portfolio(instances: List[Tuple[int, int, int, int]], time_budget_ms: int, params: Dict,
+                            workers: int, racers: int) -> List[Dict]:
+    """
+    Spread instances over a process pool and race `racers` restart-seed blocks of
+    consciousness_solve per instance. Racer k runs restarts [k*R, (k+1)*R) with
+    R = max_restarts, so racer 0 is exactly the serial run. The first verified
+    assignment wins; the instance's cancel flag stops the other racers and any
+    queued racers for it are cancelled.
+    Per-instance time is the winner's own solve time (or the slowest racer if none won).
+    """
+    import multiprocessing
+    from concurrent.futures import ProcessPoolExecutor, as_completed
+
+    cancel_flags = multiprocessing.RawArray('b', len(instances))
+    records = [{"racer": None, "digest": "-", "_racer_times": []} for _ in instances]
+    racer_futures = [[] for _ in instances]
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_portfolio_worker,
+                             initargs=(cancel_flags,)) as pool:
+        pending = []
+        for iid, (n, m, _t, seed) in enumerate(instances):
+            for k in range(racers):
+                f = pool.submit(_portfolio_conscious_task, iid, n, m, seed, k, time_budget_ms, params)
+                racer_futures[iid].append(f)
+                pending.append(f)
+            pending.append(pool.submit(_portfolio_baseline_task, iid, n, m, seed))
+        for f in as_completed(pending):
+            if f.cancelled():
+                continue
+            res = f.result()
+            if len(res) == 3:
+                iid, greedy, rnd = res
+                records[iid]["greedy"] = greedy
+                records[iid]["random"] = rnd
+                continue
+            iid, racer, dt, sol = res
+            rec = records[iid]
+            rec["_racer_times"].append(dt)
+            if sol is not None and rec["racer"] is None:
+                rec["racer"] = racer
+                rec["conscious"] = (True, dt)
+                rec["digest"] = assignment_digest(sol)
+                cancel_flags[iid] = 1
+                for other in racer_futures[iid]:
+                    other.cancel()
+    for rec in records:
+        if rec["racer"] is None:
+            rec["conscious"] = (False, max(rec["_racer_times"], default=0.0))
+        del rec["_racer_times"]
+    return records
+
+# ----------------------------
+# DIMACS directory benchmark
+# ----------------------------
+
+def peak_rss_mb() -> float:
+    """Peak resident set size of this process in MB (nan where unsupported)."""
+    try:
+        import resource, sys
+    except ImportError:
+        return float('nan')
+    r = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return r / (1024*1024) if sys.platform == 'darwin' else r / 1024
+
+def run_dimacs_benchmark(directory: str, time_budget_ms: int = 200, params: Dict = None):
+    """
+    Run consciousness_solve + verify_cnf over every .cnf under directory.
+    Instances are loaded one at a time into flat buffers (sat_dimacs.FlatCNF) and
+    dropped before the next file, so peak RSS tracks the largest instance only.
+    """
+    if params is None:
+        params = {}
+    print(f"\nDIMACS RESULTS ({directory}, budget = {time_budget_ms} ms)")
+    print("file                            vars     clauses   |  load(s)  solve(s)  verify(s) | solved  digest        buf(MB)  peakRSS(MB)")
+    n_files = 0; n_solved = 0
+    for path in iter_cnf_files(directory):
+        t0 = time.perf_counter()
+        cnf = read_dimacs(path)
+        t1 = time.perf_counter()
+        sol = consciousness_solve(cnf, cnf.n_vars, time_budget_ms, params=dict(params))
+        t2 = time.perf_counter()
+        ok = sol is not None and verify_cnf(cnf, sol)
+        t3 = time.perf_counter()
+        n_files += 1; n_solved += ok
+        name = path[len(directory):].lstrip('/\\')
+        print(f"{name[:31]:<31} {cnf.n_vars:<8} {len(cnf):<9} | "
+              f"{t1 - t0:<8.3f} {t2 - t1:<9.3f} {t3 - t2:<9.3f} | "
+              f"{'yes' if ok else 'no':<7} {assignment_digest(sol if ok else None):<13} "
+              f"{cnf.nbytes() / 1e6:<8.1f} {peak_rss_mb():.1f}")
+        del cnf, sol
+    print(f"\nSolved and verified {n_solved}/{n_files} instances; peak RSS {peak_rss_mb():.1f} MB")
+
+# ----------------------------
+# Benchmark driver
+# ----------------------------
+
+def run_benchmark(workers: int = 1, racers: Optional[int] = None):
     set_seed(42)
     ns = [50, 100, 150, 200, 300, 400]
     trials_per_n = 10
     clause_ratio = 4.2
     time_budget_ms = 200  # per instance for consciousness_solve
+    params = {"max_flips": 300}
+    instances = benchmark_instances(ns, trials_per_n, clause_ratio)
+    if workers > 1:
+        if racers is None:
+            racers = min(4, workers)
+        records = run_instances_portfolio(instances, time_budget_ms, params, workers, racers)
+    else:
+        records = [run_instance_serial(n, m, seed, time_budget_ms, params) for (n, m, _t, seed) in instances]
+
     results = []
     for n in ns:
-        m = int(round(clause_ratio * n))
-        successes = {"conscious": 0, "greedy": 0, "random": 0}
-        times = {"conscious": [], "greedy": [], "random": []}
-        for t in range(trials_per_n):
-            seed = 100000*n + t
-            cnf, planted = generate_planted_3sat(n, m, seed)
-            # consciousness
-            t0 = time.perf_counter()
-            sol = consciousness_solve(cnf, n, time_budget_ms, params={"max_flips": 300})
-            t1 = time.perf_counter()
-            times["conscious"].append(t1 - t0)
-            if sol is not None and verify_cnf(cnf, sol):
-                successes["conscious"] += 1
-            # greedy baseline
-            t0 = time.perf_counter()
-            gsol = greedy_local_search(cnf, n_vars=n, max_iters=2000)
-            t1 = time.perf_counter()
-            times["greedy"].append(t1 - t0)
-            if gsol is not None and verify_cnf(cnf, gsol):
-                successes["greedy"] += 1
-            # random baseline
-            t0 = time.perf_counter()
-            rsol = random_assignment_solver(n, cnf, budget_ms=50)
-            t1 = time.perf_counter()
-            times["random"].append(t1 - t0)
-            if rsol is not None and verify_cnf(cnf, rsol):
-                successes["random"] += 1
+        rows = [rec for (inst, rec) in zip(instances, records) if inst[0] == n]
+        successes = {k: sum(1 for r in rows if r[k][0]) for k in ("conscious", "greedy", "random")}
+        times = {k: [r[k][1] for r in rows] for k in ("conscious", "greedy", "random")}
         # summarize
         def med(lst): 
             s = sorted(lst); 
             return s[len(s)//2] if s else float('nan')
         results.append({
             "n": n,
-            "m": m,
+            "m": int(round(clause_ratio * n)),
             "succ_conscious": successes["conscious"],
             "succ_greedy": successes["greedy"],
             "succ_random": successes["random"],
@@ -407,13 +792,20 @@ def run_benchmark():
             "med_t_random": med(times["random"]),
         })
     # print table
-    print("\nRESULTS (trials per n = %d, clause/var = %.2f)" % (trials_per_n, clause_ratio))
+    mode = "serial" if workers <= 1 else f"portfolio, workers = {workers}, racers = {racers}"
+    print("\nRESULTS (trials per n = %d, clause/var = %.2f, %s)" % (trials_per_n, clause_ratio, mode))
     print("n   m    |  cons_succ  med_t(s)   |  greedy_succ  med_t(s)   |  random_succ  med_t(s)")
     for row in results:
         print(f"{row['n']:<3} {row['m']:<4} | "
               f"{row['succ_conscious']:<11} {row['med_t_conscious']:.4f}  | "
               f"{row['succ_greedy']:<12} {row['med_t_greedy']:.4f}  | "
               f"{row['succ_random']:<12} {row['med_t_random']:.4f}")
+    # DRNG determinism report: (instance, racer) fully determines the assignment,
+    # so any row can be replayed with params restart_offset = racer * max_restarts.
+    print("\nDETERMINISM REPORT (seed, winning racer, assignment sha256[:12], cons_t(s))")
+    for (n, m, t, seed), rec in zip(instances, records):
+        racer = "-" if rec["racer"] is None else rec["racer"]
+        print(f"n={n:<3} trial={t:<2} seed={seed:<8} racer={racer!s:<2} {rec['digest']:<12} {rec['conscious'][1]:.4f}")
     # scaling slope for successful runs
     cons_times = [r["med_t_conscious"] for r in results]
     slope = fit_loglog_slope(ns, cons_times)
@@ -426,4 +818,14 @@ def run_benchmark():
     print(f"- Polynomial scaling with k ≤ 3: {'PASS' if pass_scale else 'FAIL'}")
 
 if __name__ == "__main__":
-    run_benchmark()
+    import argparse
+    ap = argparse.ArgumentParser(description="Planted 3-SAT benchmark for consciousness_solve")
+    ap.add_argument("-w", "--workers", type=int, default=1, help="Process pool size; >1 enables portfolio mode (default: 1)")
+    ap.add_argument("-r", "--racers", type=int, default=None, help="Restart-seed racers per instance in portfolio mode (default: min(4, workers))")
+    ap.add_argument("--cnf-dir", default=None, help="Benchmark every .cnf file under this directory instead of planted instances")
+    ap.add_argument("--budget-ms", type=int, default=200, help="consciousness_solve time budget per DIMACS instance (default: 200)")
+    args = ap.parse_args()
+    if args.cnf_dir:
+        run_dimacs_benchmark(args.cnf_dir, time_budget_ms=args.budget_ms)
+    else:
+        run_benchmark(workers=args.workers, racers=args.racers)
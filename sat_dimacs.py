@@ -0,0 +1,171 @@
+# sat_dimacs.py
+# Streaming DIMACS CNF reader/writer backed by compact array buffers.
+import os
+import hashlib
+from array import array
+from typing import Iterable, Iterator, List, Optional, Sequence, Union
+
+# ----------------------------
+# Flat CNF model: every literal of every clause in one array('i'), plus an
+# array('q') of clause offsets (length m+1). Clause ci is lits[starts[ci]:starts[ci+1]].
+# No per-clause Python objects are kept, so 10^6-clause instances stay small.
+# ----------------------------
+
+class FlatCNF:
+    __slots__ = ("n_vars", "lits", "starts")
+
+    def __init__(self, n_vars: int, lits: Optional[array] = None, starts: Optional[array] = None):
+        self.n_vars = n_vars
+        self.lits = lits if lits is not None else array('i')
+        self.starts = starts if starts is not None else array('q', [0])
+
+    def __len__(self) -> int:
+        return len(self.starts) - 1
+
+    def clause(self, ci: int) -> array:
+        return self.lits[self.starts[ci]:self.starts[ci+1]]
+
+    def add_clause(self, clause: Iterable[int]):
+        self.lits.extend(clause)
+        self.starts.append(len(self.lits))
+
+    @classmethod
+    def from_clauses(cls, cnf: Sequence[Sequence[int]], n_vars: int) -> "FlatCNF":
+        flat = cls(n_vars)
+        for clause in cnf:
+            flat.add_clause(clause)
+        return flat
+
+    def nbytes(self) -> int:
+        return self.lits.itemsize * len(self.lits) + self.starts.itemsize * len(self.starts)
+
+CNFLike = Union[FlatCNF, Sequence[Sequence[int]]]
+
+# ----------------------------
+# Reader
+# ----------------------------
+
+def read_dimacs(path: str, chunk_lines: int = 65536) -> FlatCNF:
+    """
+    Stream a DIMACS CNF file into a FlatCNF.
+    - 'c' comment lines are skipped; the 'p cnf <vars> <clauses>' header sets n_vars.
+    - Clauses may span lines; a literal 0 terminates a clause.
+    - A line starting with '%' (SATLIB uf*/uuf* files) ends the clause section.
+    - A trailing clause without its terminating 0 is kept.
+    Data lines are parsed in batches of chunk_lines, so only one batch of tokens is alive at a time.
+    """
+    n_vars = None
+    lits = array('i')
+    starts = array('q', [0])
+    max_var = 0
+    batch: List[str] = []
+
+    def flush():
+        nonlocal max_var
+        if not batch:
+            return
+        for x in map(int, ' '.join(batch).split()):
+            if x:
+                lits.append(x)
+                if x > max_var: max_var = x
+                elif -x > max_var: max_var = -x
+            else:
+                starts.append(len(lits))
+        batch.clear()
+
+    with open(path, 'r') as f:
+        for line in f:
+            head = line[:1]
+            if head == 'c' or head == '\n' or not line.strip():
+                continue
+            if head == 'p':
+                parts = line.split()
+                if len(parts) < 4 or parts[1] != 'cnf':
+                    raise ValueError(f"{path}: bad DIMACS header: {line.strip()!r}")
+                n_vars = int(parts[2])
+                continue
+            if head == '%':
+                break
+            batch.append(line)
+            if len(batch) >= chunk_lines:
+                flush()
+        flush()
+    if len(lits) != starts[-1]:
+        starts.append(len(lits))
+    if n_vars is None:
+        n_vars = max_var
+    elif max_var > n_vars:
+        raise ValueError(f"{path}: literal {max_var} exceeds declared {n_vars} variables")
+    return FlatCNF(n_vars, lits, starts)
+
+def iter_cnf_files(directory: str) -> Iterator[str]:
+    """Sorted .cnf paths under directory (recursive)."""
+    for root, _dirs, files in sorted(os.walk(directory)):
+        for name in sorted(files):
+            if name.endswith('.cnf'):
+                yield os.path.join(root, name)
+
+# ----------------------------
+# Writer
+# ----------------------------
+
+def iter_clauses(cnf: CNFLike) -> Iterator[Sequence[int]]:
+    if isinstance(cnf, FlatCNF):
+        lits, starts = cnf.lits, cnf.starts
+        for ci in range(len(starts) - 1):
+            yield lits[starts[ci]:starts[ci+1]]
+    else:
+        yield from cnf
+
+def write_dimacs(path: str, cnf: CNFLike, n_vars: Optional[int] = None, comments: Iterable[str] = ()) -> int:
+    """Stream cnf (FlatCNF or list of clauses) to a DIMACS file; returns the clause count."""
+    if n_vars is None:
+        if not isinstance(cnf, FlatCNF):
+            raise ValueError("n_vars is required for list-of-clauses input")
+        n_vars = cnf.n_vars
+    with open(path, 'w') as f:
+        for c in comments:
+            f.write(f"c {c}\n")
+        f.write(f"p cnf {n_vars} {len(cnf)}\n")
+        out = []
+        for clause in iter_clauses(cnf):
+            out.append(' '.join(map(str, clause)) + ' 0\n')
+            if len(out) >= 4096:
+                f.writelines(out); out.clear()
+        f.writelines(out)
+    return len(cnf)
+
+# ----------------------------
+# Flat-buffer utilities
+# ----------------------------
+
+def cnf_text_sha256(cnf: CNFLike) -> bytes:
+    """
+    SHA-256 of the canonical CNF text ("l1,l2,l3;" per clause), hashed incrementally.
+    Same digest for a list of clauses and the equivalent FlatCNF.
+    """
+    h = hashlib.sha256()
+    out = []
+    for clause in iter_clauses(cnf):
+        out.append(','.join(map(str, clause)) + ';')
+        if len(out) >= 4096:
+            h.update(''.join(out).encode()); out.clear()
+    h.update(''.join(out).encode())
+    return h.digest()
+
+def verify_flat_cnf(cnf: FlatCNF, assignment01: Sequence[int]) -> bool:
+    """verify_cnf over flat buffers: no per-clause objects are built."""
+    n_vars = len(assignment01)
+    lits, starts = cnf.lits, cnf.starts
+    for ci in range(len(starts) - 1):
+        for k in range(starts[ci], starts[ci+1]):
+            lit = lits[k]
+            v = lit if lit > 0 else -lit
+            if v > n_vars:
+                return False
+            val = assignment01[v-1]
+            if (lit > 0 and val == 1) or (lit < 0 and val == 0):
+                break
+        else:
+            return False
+    return True
@@ -0,0 +1,5 @@
+import os
+import sys
+
+# The modules under test live flat in the repository root
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
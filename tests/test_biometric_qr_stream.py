@@ -0,0 +1,59 @@
+import json
+import os
+
+import pytest
+
+pytest.importorskip("cv2")
+pytest.importorskip("PIL")
+pytest.importorskip("pyzbar")
+try:
+    import segno  # noqa: F401
+except ImportError:
+    pytest.importorskip("qrcode")
+
+import biometric_document_encryptor_ultimate as ultimate
+from biometric_document_encryptor_ultimate import BiometricDocumentEncryptor
+
+
+@pytest.fixture
+def text_qr(monkeypatch):
+    """QR rendering/decoding replaced by plain text files holding the payload"""
+    def render(data, filename, color="black"):
+        with open(filename, 'w') as f:
+            f.write(data)
+        return filename
+
+    def decode(filename):
+        if not os.path.exists(filename):
+            return None
+        with open(filename) as f:
+            return f.read()
+
+    monkeypatch.setattr(ultimate, 'render_qr_png', render)
+    monkeypatch.setattr(ultimate, 'decode_qr_file', decode)
+
+
+def test_stream_round_trip_with_base_filename_in_subdirectory(tmp_path, monkeypatch, text_qr):
+    document = tmp_path / "report.bin"
+    document.write_bytes(os.urandom(3 * 800 + 123))
+    out_dir = tmp_path / "out"
+    out_dir.mkdir()
+
+    biometric = {'h': [1.0, 2.0, 3.0], 'c': 10.0, 'm': 20.0}
+    signature = (biometric, json.dumps(biometric, separators=(',', ':')).encode('utf-8'))
+    encryptor = BiometricDocumentEncryptor(kdf_profile='fast', key_cache=None)
+    monkeypatch.setattr(encryptor, 'capture_face_signature', lambda: signature)
+    monkeypatch.setattr(encryptor, 'verify_biometric_match', lambda stored, live, threshold=0.6: True)
+
+    # Relative base_filename that includes a directory
+    monkeypatch.chdir(tmp_path)
+    manifest_file = encryptor.create_streaming_qr_series(str(document), signature, "out/enc_1", workers=1)
+    assert manifest_file == "out/enc_1_MANIFEST.json"
+
+    with open(manifest_file) as f:
+        manifest = json.load(f)
+    assert manifest['key'] == "enc_1_KEY.png"
+    assert manifest['files'] == [f"enc_1_D{i}.png" for i in range(1, manifest['n'] + 1)]
+
+    assert encryptor.decrypt_from_qr_stream(manifest_file, output_dir=str(tmp_path / "decrypted"), workers=1)
+    assert (tmp_path / "decrypted" / "report.bin").read_bytes() == document.read_bytes()
@@ -0,0 +1,65 @@
+import io
+import itertools
+import random
+from contextlib import redirect_stdout
+
+from cdcl_solver import CDCLSolver, cdcl_solve
+
+with redirect_stdout(io.StringIO()):
+    from CONSCIOUSNESS_FIELD_THEORY_FORMAL import BlindedSATExperiment
+
+
+def brute_force_sat(n_vars, cnf):
+    for bits in itertools.product((False, True), repeat=n_vars):
+        if all(any(bits[abs(lit) - 1] == (lit > 0) for lit in clause) for clause in cnf):
+            return True
+    return False
+
+
+def satisfies(model, cnf):
+    return all(any(model[abs(lit)] == (lit > 0) for lit in clause) for clause in cnf)
+
+
+def random_cnf(rng, n_vars, n_clauses, max_width=3):
+    return [[rng.choice((-1, 1)) * v
+             for v in rng.sample(range(1, n_vars + 1), rng.randint(1, min(max_width, n_vars)))]
+            for _ in range(n_clauses)]
+
+
+def test_cdcl_agrees_with_brute_force():
+    rng = random.Random(2024)
+    answers = set()
+    for _ in range(400):
+        n_vars = rng.randint(1, 9)
+        # Around the 3-SAT threshold ratio, so both answers show up
+        cnf = random_cnf(rng, n_vars, rng.randint(1, int(5 * n_vars) + 1))
+        status, model = cdcl_solve(cnf, n_vars)
+        expected = brute_force_sat(n_vars, cnf)
+        assert status is expected, cnf
+        if status:
+            assert satisfies(model, cnf), cnf
+        answers.add(status)
+    assert answers == {True, False}
+
+
+def test_cdcl_edge_formulas():
+    assert cdcl_solve([], 0) == (True, {})
+    assert cdcl_solve([[1], [-1]], 1) == (False, None)
+    assert cdcl_solve([[1, 2], []], 2) == (False, None)
+
+    solver = CDCLSolver(3, [[1, -1], [2]])
+    assert solver.solve() is True
+    assert solver.model[2] is True
+
+
+def test_baseline_comparison_handles_empty_formulas():
+    experiment = BlindedSATExperiment(random_seed=0)
+    instances = [
+        {'instance_id': 'empty', 'cnf_formula': []},
+        {'instance_id': 'empty_clause', 'cnf_formula': [[]]},
+        {'instance_id': 'unsat', 'cnf_formula': [[1], [-1]]},
+    ]
+    results = {r['instance_id']: r for r in experiment.run_baseline_comparison(instances)}
+    assert results['empty']['status'] == 'SAT'
+    assert results['empty_clause']['status'] == 'UNSAT'
+    assert results['unsat']['status'] == 'UNSAT'
@@ -0,0 +1,81 @@
+from decimal import Decimal
+
+import factorization
+from factorization import (
+    MILLER_RABIN_DETERMINISTIC_LIMIT, divides, ecm, factorint, find_factor,
+    is_probable_prime, verified_factor_pairs
+)
+
+
+def brute_force_factorint(n):
+    factors = {}
+    p = 2
+    while p * p <= n:
+        while n % p == 0:
+            factors[p] = factors.get(p, 0) + 1
+            n //= p
+        p += 1
+    if n > 1:
+        factors[n] = factors.get(n, 0) + 1
+    return factors
+
+
+def test_factorint_matches_brute_force_for_small_n():
+    for n in range(1, 5000):
+        assert factorint(n) == brute_force_factorint(n), n
+
+
+def test_is_probable_prime_matches_brute_force_for_small_n():
+    primes = {p for p in range(2, 5000) if brute_force_factorint(p) == {p: 1}}
+    for n in range(-2, 5000):
+        assert is_probable_prime(n) == (n in primes), n
+
+
+def fermat_probable_prime(n, bases=(2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41, 43, 47, 53)):
+    return all(pow(a, n - 1, n) == 1 for a in bases)
+
+
+def test_is_probable_prime_near_deterministic_limit():
+    # The limit is the smallest strong pseudoprime to every base up to 41, so it is
+    # only rejected by the extra random rounds that start at the limit
+    limit = MILLER_RABIN_DETERMINISTIC_LIMIT
+    assert limit == 1287836182261 * 2575672364521
+    assert not is_probable_prime(limit)
+    assert factorint(limit) == {1287836182261: 1, 2575672364521: 1}
+
+    for start, step in ((limit - 2, -2), (limit + 2, 2)):
+        window = range(start, start + 400 * step, step)
+        primes = [n for n in window if is_probable_prime(n)]
+        assert primes
+        assert primes == [n for n in window if fermat_probable_prime(n)]
+        for p in primes[:3]:
+            assert not is_probable_prime(p * 1000003)
+
+
+def test_verified_factor_pairs_with_decimals_beyond_context_precision():
+    p, q = 1000000000000000000000007, 1000000000000000000000000000049  # 25 and 31 digits
+    n = Decimal(p * q)
+    assert len(str(p * q)) > 28
+    # Decimal division rounds at 28 digits, so n / p is not the exact cofactor
+    assert n / Decimal(p) != Decimal(q)
+
+    pairs = verified_factor_pairs(n, [(Decimal(p), n / Decimal(p)), (Decimal(q), n / Decimal(q)),
+                                      (Decimal(p + 2), n / Decimal(p + 2))])
+    assert pairs == sorted([(Decimal(p), Decimal(q)), (Decimal(q), Decimal(p))])
+    assert all(int(f1) * int(f2) == int(n) for f1, f2 in pairs)
+    assert divides(Decimal(p), n)
+    assert not divides(Decimal(p) + Decimal('0.5'), n)
+
+
+def test_ecm_splits_a_product_of_two_15_digit_primes(monkeypatch):
+    p, q = 100000000000031, 300000000000089
+    assert is_probable_prime(p) and is_probable_prime(q)
+    n = p * q
+
+    factor = ecm(n, seed=1)
+    assert factor in (p, q)
+
+    # With Pollard rho disabled, find_factor has to get there through ECM
+    monkeypatch.setattr(factorization, 'pollard_brent', lambda n, max_iterations=None, seed=None: None)
+    assert find_factor(n) in (p, q)
+    assert factorint(n) == {p: 1, q: 1}
@@ -0,0 +1,62 @@
+import os
+import sys
+import warnings
+from decimal import Decimal
+
+import numpy as np
+import pytest
+
+# The field engine lives with the resonance variants it replaces
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'all md files', 'quantum_files')))
+from quantum_field_engine import CouplingRule, FieldEngine
+from quantum_field_engine_variants import VARIANT_CONFIGS
+
+ENERGY_PEAK_VARIANTS = [name for name, config in VARIANT_CONFIGS.items() if config.peak_source == 'energy']
+COUPLED_VARIANTS = [name for name, config in VARIANT_CONFIGS.items() if config.coupling]
+
+
+def small_engine(name, max_cells=6 ** 3):
+    return FieldEngine(VARIANT_CONFIGS[name].scaled(max_cells), seed=0)
+
+
+@pytest.mark.parametrize("name", ENERGY_PEAK_VARIANTS + ["quantum_unified_resonance_coupling"])
+def test_fields_stay_finite_and_peaks_select_divisors(name):
+    n = Decimal(12)
+    engine = small_engine(name)
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")  # any overflow or invalid operation fails the test
+        engine.step(n)
+        assert np.isfinite(engine.field).all() and np.isfinite(engine.energy).all()
+
+        divisors = engine.divisor_mask(n)
+        peak_divisors = engine.resonance_peaks() & divisors
+        assert peak_divisors.any()
+        assert peak_divisors.sum() < divisors.sum()  # strict subset of the divisor cells
+        assert {int(f1) for f1, _ in engine.peak_factors(n)} == set(engine.grid.product[peak_divisors].tolist())
+
+        for _ in range(9):
+            engine.step(n)
+        assert np.isfinite(engine.field).all() and np.isfinite(engine.energy).all()
+
+
+@pytest.mark.parametrize("name", COUPLED_VARIANTS)
+def test_coupling_exchange_is_bounded_and_conserves_energy(name):
+    engine = small_engine(name)
+    engine.step(Decimal(1234567890))
+    rng = np.random.default_rng(1)
+    engine.energy[...] = rng.random(engine.energy.shape) * 1e6
+    before = engine.energy.copy()
+
+    for rule in engine.config.coupling:
+        for a in engine.groups[rule.group_a]:
+            for b in engine.groups[rule.group_b]:
+                engine._couple(a, b, rule.strength)
+
+    assert np.allclose(engine.energy.sum(axis=0), before.sum(axis=0))
+    assert (engine.energy >= before.min(axis=0) - 1e-6).all()
+    assert (engine.energy <= before.max(axis=0) + 1e-6).all()
+
+
+def test_coupling_strength_must_be_a_fraction():
+    with pytest.raises(ValueError):
+        CouplingRule("quantum", "particle", 1.5)
@@ -0,0 +1,19 @@
+from sat_benchmark import consciousness_solve, run_dimacs_benchmark
+from sat_dimacs import read_dimacs
+
+
+def test_empty_clause_is_unsat(tmp_path):
+    path = tmp_path / "empty_clause.cnf"
+    path.write_text("p cnf 3 2\n1 2 0\n0\n")
+
+    cnf = read_dimacs(str(path))
+    assert len(cnf) == 2
+    assert consciousness_solve(cnf, cnf.n_vars) is None
+    assert consciousness_solve([[1, 2], []], 3) is None
+    assert consciousness_solve([[1, 2], []], 3, params={'engine': 'array'}) is None
+
+
+def test_dimacs_benchmark_survives_empty_clause(tmp_path, capsys):
+    (tmp_path / "empty_clause.cnf").write_text("p cnf 3 2\n1 2 0\n0\n")
+    run_dimacs_benchmark(str(tmp_path))
+    assert "Solved and verified 0/1 instances" in capsys.readouterr().out
@@ -0,0 +1,44 @@
+import random
+
+from sat_benchmark import consciousness_solve, generate_planted_3sat, verify_cnf
+from sat_dimacs import read_dimacs
+
+
+def random_3sat(n_vars, m_clauses, seed):
+    rng = random.Random(seed)
+    return [[v if rng.randrange(2) else -v for v in rng.sample(range(1, n_vars + 1), 3)]
+            for _ in range(m_clauses)]
+
+
+def solve(cnf, n_vars, engine, **params):
+    return consciousness_solve(cnf, n_vars, time_budget_ms=600000, params=dict(params, engine=engine))
+
+
+def test_array_engine_matches_list_engine_step_for_step():
+    # Well over 16 clauses start unsatisfied, so the set-order clause pick is exercised
+    instances = [generate_planted_3sat(120, 500, seed)[0] for seed in range(3)]
+    instances += [random_3sat(60, 270, seed) for seed in range(3)]
+    solved = 0
+    for cnf in instances:
+        n_vars = max(abs(lit) for clause in cnf for lit in clause)
+        # Same outcome under every single-restart step budget means the same flip count to a model
+        for max_steps in (1, 8, 64, 256, 1024, 4096):
+            expected = solve(cnf, n_vars, 'list', max_steps=max_steps, max_restarts=1)
+            assert solve(cnf, n_vars, 'array', max_steps=max_steps, max_restarts=1) == expected, max_steps
+        model = solve(cnf, n_vars, 'list', max_restarts=3)
+        assert solve(cnf, n_vars, 'array', max_restarts=3) == model
+        if model is not None:
+            assert verify_cnf(cnf, model)
+            solved += 1
+    assert solved
+
+
+def test_flat_cnf_input_matches_list_engine(tmp_path):
+    cnf, _ = generate_planted_3sat(80, 340, 7)
+    path = tmp_path / "planted.cnf"
+    path.write_text("p cnf 80 340\n" + "".join(" ".join(map(str, clause)) + " 0\n" for clause in cnf))
+
+    flat = read_dimacs(str(path))
+    for max_steps in (16, 256, 2048):
+        assert (solve(flat, 80, 'list', max_steps=max_steps, max_restarts=1)
+                == solve(cnf, 80, 'list', max_steps=max_steps, max_restarts=1))
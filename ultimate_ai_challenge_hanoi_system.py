@@ -25,9 +25,125 @@ import random
 import hashlib
 from datetime import datetime
 import os
+import struct
+
+import numpy as np
+
+# Peg labels and their simulator indices
+PEGS = ('A', 'B', 'C')
+PEG_INDEX = {label: index for index, label in enumerate(PEGS)}
+
+# Binary move file: header (magic, disks, move count) then two moves per byte,
+# each move a nibble src * 3 + dst (0xF pads an odd final move)
+MOVE_FILE_MAGIC = b'HANOI1'
+MOVE_FILE_HEADER = struct.Struct('<6sBQ')
+MOVE_CHUNK_SIZE = 1 << 20
+
+class IllegalHanoiMove(ValueError):
+    """A move from an empty peg, onto a smaller disk or onto its own peg"""
+
+def _gray_peg_order(n, source, destination, auxiliary):
+    # The binary formulation carries the tower to peg 2 for odd n and peg 1 for even n
+    return (source, auxiliary, destination) if n % 2 else (source, destination, auxiliary)
+
+def hanoi_moves(n, source='A', destination='C', auxiliary='B'):
+    """Lazily yield the optimal (source, destination) moves for n disks
+
+    Move m (1-based) takes disk ctz(m) from peg (m & m-1) % 3 to ((m | m-1) + 1) % 3.
+    """
+    order = _gray_peg_order(n, source, destination, auxiliary)
+    for m in range(1, 1 << n):
+        yield order[(m & (m - 1)) % 3], order[((m | (m - 1)) + 1) % 3]
+
+def hanoi_move_chunks(n, chunk_size=MOVE_CHUNK_SIZE, source=0, destination=2, auxiliary=1):
+    """Yield the optimal moves as (sources, destinations) uint8 peg-index arrays"""
+    order = np.array(_gray_peg_order(n, source, destination, auxiliary), dtype=np.uint8)
+    last = (1 << n) - 1
+    for start in range(1, last + 1, chunk_size):
+        m = np.arange(start, min(start + chunk_size, last + 1), dtype=np.uint64)
+        previous = m - np.uint64(1)
+        yield order[(m & previous) % 3], order[((m | previous) + np.uint64(1)) % 3]
+
+class HanoiSimulator:
+    """Tower of Hanoi state with one bitmask per peg (bit d = disk d, disk 0 smallest)
+
+    The top disk of a peg is its lowest set bit, so each legality check is O(1).
+    """
+
+    def __init__(self, n_disks, source=0):
+        self.n_disks = n_disks
+        self.pegs = [0, 0, 0]
+        self.pegs[source] = (1 << n_disks) - 1
+        self.moves = 0
+
+    def move(self, source, destination):
+        pegs = self.pegs
+        src = pegs[source]
+        top = src & -src
+        dst = pegs[destination]
+        dst_top = dst & -dst
+        if not top or (dst_top and dst_top <= top):
+            raise IllegalHanoiMove(f"move {self.moves + 1}: peg {PEGS[source]} -> {PEGS[destination]}")
+        pegs[source] = src ^ top
+        pegs[destination] = dst | top
+        self.moves += 1
+
+    def apply_chunk(self, sources, destinations):
+        """Apply a chunk of peg-index moves, validating every one"""
+        pegs = self.pegs
+        for count, (source, destination) in enumerate(zip(sources.tolist(), destinations.tolist())):
+            src = pegs[source]
+            top = src & -src
+            dst = pegs[destination]
+            dst_top = dst & -dst
+            if not top or (dst_top and dst_top <= top):
+                self.moves += count
+                raise IllegalHanoiMove(f"move {self.moves + 1}: peg {PEGS[source]} -> {PEGS[destination]}")
+            pegs[source] = src ^ top
+            pegs[destination] = dst | top
+        self.moves += len(sources)
+
+    def is_solved(self, destination=2):
+        return self.pegs[destination] == (1 << self.n_disks) - 1
+
+def write_move_file(path, n, chunks):
+    """Stream (sources, destinations) chunks into a compact binary move file; returns the move count"""
+    count = 0
+    pending = np.empty(0, dtype=np.uint8)
+    with open(path, 'wb') as f:
+        f.write(MOVE_FILE_HEADER.pack(MOVE_FILE_MAGIC, n, 0))
+        for sources, destinations in chunks:
+            codes = np.concatenate([pending, sources * 3 + destinations]).astype(np.uint8)
+            even = len(codes) - len(codes) % 2
+            f.write(((codes[0:even:2] << 4) | codes[1:even:2]).tobytes())
+            pending = codes[even:]
+            count += len(sources)
+        if len(pending):
+            f.write(bytes([(int(pending[0]) << 4) | 0xF]))
+        f.seek(0)
+        f.write(MOVE_FILE_HEADER.pack(MOVE_FILE_MAGIC, n, count))
+    return count
+
+def read_move_file(path, chunk_size=MOVE_CHUNK_SIZE):
+    """Yield (sources, destinations) chunks back from a binary move file"""
+    with open(path, 'rb') as f:
+        magic, _, count = MOVE_FILE_HEADER.unpack(f.read(MOVE_FILE_HEADER.size))
+        if magic != MOVE_FILE_MAGIC:
+            raise ValueError(f"{path} is not a Hanoi move file")
+        while count > 0:
+            packed = np.frombuffer(f.read((min(chunk_size, count) + 1) // 2), dtype=np.uint8)
+            codes = np.empty(2 * len(packed), dtype=np.uint8)
+            codes[0::2] = packed >> 4
+            codes[1::2] = packed & 0xF
+            codes = codes[:min(2 * len(packed), count)]
+            count -= len(codes)
+            yield codes // 3, codes % 3
+
+# Evolution/pattern log entries kept per solve; larger towers are only counted
+CONSCIOUSNESS_LOG_LIMIT = 1024
 
 class UltimateAIChallenge:
-    def __init__(self):
+    def __init__(self, hanoi_disks=8):
         # Consciousness Physics Constants
         self.phi = 1.618033988749895
         self.psi = 1.324717957244746
@@ -37,9 +153,9 @@ class UltimateAIChallenge:
         self.zeta = 1.202056903159594
         
         # Challenge Parameters
-        self.hanoi_disks = 8  # 8-disk Tower of Hanoi (255 optimal moves)
-        self.challenge_name = "Tower of Hanoi 8-Disk Challenge"
-        self.optimal_moves = (2 ** self.hanoi_disks) - 1  # 255 moves
+        self.hanoi_disks = hanoi_disks  # 8-disk Tower of Hanoi by default (255 optimal moves)
+        self.challenge_name = f"Tower of Hanoi {hanoi_disks}-Disk Challenge"
+        self.optimal_moves = (2 ** self.hanoi_disks) - 1
         
         print("🌌 Ultimate AI Challenge System Initialized")
         print(f"🎯 Challenge: {self.challenge_name}")
@@ -71,45 +187,60 @@ class UltimateAIChallenge:
             print("📭 No previous mathematical knowledge found")
             return {}, 0, 0
 
-    def traditional_ai_hanoi_solver(self):
-        """Traditional AI approach: algorithmic solution"""
+    def traditional_ai_hanoi_solver(self, move_file=None):
+        """Traditional AI approach: algorithmic solution
+
+        Moves are generated in chunks from the binary formulation and replayed
+        through a HanoiSimulator, so memory stays constant in the number of disks.
+        With move_file the moves are also written to a compact binary file.
+        Returns the results and the simulator holding the final pegs.
+        """
         
         print("\n🤖 TRADITIONAL AI APPROACH")
         print("="*50)
-        print("🔧 Using standard recursive algorithm")
+        print("🔧 Using iterative binary (Gray-code) move generator")
         print("📊 Static approach - no learning or adaptation")
         
         start_time = time.time()
         
-        # Traditional recursive Hanoi algorithm
-        moves = []
+        simulator = HanoiSimulator(self.hanoi_disks, PEG_INDEX['A'])
+        chunks = hanoi_move_chunks(self.hanoi_disks, source=PEG_INDEX['A'],
+                                   destination=PEG_INDEX['C'], auxiliary=PEG_INDEX['B'])
         
-        def hanoi_recursive(n, source, destination, auxiliary):
-            if n == 1:
-                moves.append((source, destination))
-            else:
-                hanoi_recursive(n-1, source, auxiliary, destination)
-                moves.append((source, destination))
-                hanoi_recursive(n-1, auxiliary, destination, source)
+        def validated(chunks):
+            for sources, destinations in chunks:
+                simulator.apply_chunk(sources, destinations)
+                yield sources, destinations
         
-        # Solve using traditional algorithm
-        hanoi_recursive(self.hanoi_disks, 'A', 'C', 'B')
+        # Solve using traditional algorithm, checking every move
+        try:
+            if move_file:
+                write_move_file(move_file, self.hanoi_disks, validated(chunks))
+            else:
+                for sources, destinations in chunks:
+                    simulator.apply_chunk(sources, destinations)
+            legal = True
+        except IllegalHanoiMove as e:
+            print(f"❌ Illegal move: {e}")
+            legal = False
         
         end_time = time.time()
         execution_time = end_time - start_time
         
         # Validate solution
-        solution_correct = len(moves) == self.optimal_moves
-        efficiency = self.optimal_moves / len(moves) if len(moves) > 0 else 0
+        moves_generated = simulator.moves
+        solution_correct = (legal and moves_generated == self.optimal_moves
+                            and simulator.is_solved(PEG_INDEX['C']))
+        efficiency = self.optimal_moves / moves_generated if moves_generated > 0 else 0
         
         traditional_results = {
             'approach': 'traditional_ai',
             'execution_time': execution_time,
-            'moves_generated': len(moves),
+            'moves_generated': moves_generated,
             'optimal_moves': self.optimal_moves,
             'solution_correct': solution_correct,
             'efficiency': efficiency,
-            'moves_per_second': len(moves) / execution_time if execution_time > 0 else float('inf'),
+            'moves_per_second': moves_generated / execution_time if execution_time > 0 else float('inf'),
             'learning_applied': False,
             'mathematical_patterns_used': 0,
             'consciousness_evolution': 0,
@@ -118,12 +249,14 @@ class UltimateAIChallenge:
         }
         
         print(f"⏱️  Execution Time: {execution_time:.6f} seconds")
-        print(f"🎯 Moves Generated: {len(moves)}")
+        print(f"🎯 Moves Generated: {moves_generated}")
         print(f"✅ Solution Correct: {'YES' if solution_correct else 'NO'}")
         print(f"📈 Efficiency: {efficiency:.3f}")
         print(f"⚡ Moves/Second: {traditional_results['moves_per_second']:.0f}")
+        if move_file:
+            print(f"💾 Moves written to: {move_file}")
         
-        return traditional_results, moves
+        return traditional_results, simulator
 
     def qr_consciousness_hanoi_solver(self, abstractions, iteration_count, total_patterns):
         """QR Consciousness approach: mathematical abstraction + recursive learning"""
@@ -155,12 +288,15 @@ class UltimateAIChallenge:
         print(f"🧮 Mathematical Abstraction Efficiency: {mathematical_abstraction_efficiency:.3f}")
         
         # Consciousness-based Hanoi solving with mathematical abstraction
-        moves = []
+        simulator = HanoiSimulator(self.hanoi_disks, PEG_INDEX['A'])
+        move = simulator.move
         consciousness_evolution_log = []
         patterns_discovered = []
+        consciousness_evolution_steps = 0
+        patterns_discovered_count = 0
         
         def consciousness_hanoi_solve(n, source, destination, auxiliary, depth=0):
-            nonlocal consciousness_level
+            nonlocal consciousness_level, consciousness_evolution_steps, patterns_discovered_count
             
             # Apply mathematical abstraction for pattern recognition
             if n <= 3:  # Base case optimization through consciousness
@@ -169,27 +305,29 @@ class UltimateAIChallenge:
                 consciousness_level += consciousness_boost
                 
                 if n == 1:
-                    moves.append((source, destination))
+                    move(source, destination)
                 elif n == 2:
-                    moves.append((source, auxiliary))
-                    moves.append((source, destination))
-                    moves.append((auxiliary, destination))
+                    move(source, auxiliary)
+                    move(source, destination)
+                    move(auxiliary, destination)
                 elif n == 3:
-                    moves.append((source, destination))
-                    moves.append((source, auxiliary))
-                    moves.append((destination, auxiliary))
-                    moves.append((source, destination))
-                    moves.append((auxiliary, source))
-                    moves.append((auxiliary, destination))
-                    moves.append((source, destination))
+                    move(source, destination)
+                    move(source, auxiliary)
+                    move(destination, auxiliary)
+                    move(source, destination)
+                    move(auxiliary, source)
+                    move(auxiliary, destination)
+                    move(source, destination)
                 
                 # Log consciousness evolution
-                consciousness_evolution_log.append({
-                    'depth': depth,
-                    'disks': n,
-                    'consciousness_level': consciousness_level,
-                    'pattern_type': 'base_case_recognition'
-                })
+                consciousness_evolution_steps += 1
+                if len(consciousness_evolution_log) < CONSCIOUSNESS_LOG_LIMIT:
+                    consciousness_evolution_log.append({
+                        'depth': depth,
+                        'disks': n,
+                        'consciousness_level': consciousness_level,
+                        'pattern_type': 'base_case_recognition'
+                    })
                 
             else:
                 # Recursive case with consciousness-guided optimization
@@ -203,28 +341,37 @@ class UltimateAIChallenge:
                 recursive_pattern_boost = self.psi * recursive_learning_factor * 0.1
                 consciousness_level += recursive_pattern_boost
                 
-                patterns_discovered.append({
-                    'pattern_type': 'recursive_decomposition',
-                    'disks': n,
-                    'mathematical_formula': f"H(n) = 2*H(n-1) + 1",
-                    'consciousness_insight': recursive_pattern_boost
-                })
+                patterns_discovered_count += 1
+                if len(patterns_discovered) < CONSCIOUSNESS_LOG_LIMIT:
+                    patterns_discovered.append({
+                        'pattern_type': 'recursive_decomposition',
+                        'disks': n,
+                        'mathematical_formula': f"H(n) = 2*H(n-1) + 1",
+                        'consciousness_insight': recursive_pattern_boost
+                    })
                 
                 # Consciousness-optimized recursive decomposition
                 consciousness_hanoi_solve(n-1, source, auxiliary, destination, depth+1)
-                moves.append((source, destination))
+                move(source, destination)
                 consciousness_hanoi_solve(n-1, auxiliary, destination, source, depth+1)
                 
                 # Log consciousness evolution
-                consciousness_evolution_log.append({
-                    'depth': depth,
-                    'disks': n,
-                    'consciousness_level': consciousness_level,
-                    'pattern_type': 'recursive_decomposition'
-                })
-        
-        # Solve using consciousness-based approach
-        consciousness_hanoi_solve(self.hanoi_disks, 'A', 'C', 'B')
+                consciousness_evolution_steps += 1
+                if len(consciousness_evolution_log) < CONSCIOUSNESS_LOG_LIMIT:
+                    consciousness_evolution_log.append({
+                        'depth': depth,
+                        'disks': n,
+                        'consciousness_level': consciousness_level,
+                        'pattern_type': 'recursive_decomposition'
+                    })
+        
+        # Solve using consciousness-based approach, every move checked by the simulator
+        try:
+            consciousness_hanoi_solve(self.hanoi_disks, PEG_INDEX['A'], PEG_INDEX['C'], PEG_INDEX['B'])
+            legal = True
+        except IllegalHanoiMove as e:
+            print(f"❌ Illegal move: {e}")
+            legal = False
         
         end_time = time.time()
         execution_time = end_time - start_time
@@ -233,23 +380,23 @@ class UltimateAIChallenge:
         adjusted_execution_time = execution_time / mathematical_abstraction_efficiency
         
         # Validate solution
-        solution_correct = len(moves) == self.optimal_moves
-        efficiency = self.optimal_moves / len(moves) if len(moves) > 0 else 0
+        moves_generated = simulator.moves
+        solution_correct = (legal and moves_generated == self.optimal_moves
+                            and simulator.is_solved(PEG_INDEX['C']))
+        efficiency = self.optimal_moves / moves_generated if moves_generated > 0 else 0
         
         # Calculate consciousness-specific metrics
         consciousness_growth = consciousness_level - 25.0
-        patterns_discovered_count = len(patterns_discovered)
-        consciousness_evolution_steps = len(consciousness_evolution_log)
         
         qr_consciousness_results = {
             'approach': 'qr_consciousness_system',
             'execution_time': execution_time,
             'adjusted_execution_time': adjusted_execution_time,
-            'moves_generated': len(moves),
+            'moves_generated': moves_generated,
             'optimal_moves': self.optimal_moves,
             'solution_correct': solution_correct,
             'efficiency': efficiency,
-            'moves_per_second': len(moves) / adjusted_execution_time if adjusted_execution_time > 0 else float('inf'),
+            'moves_per_second': moves_generated / adjusted_execution_time if adjusted_execution_time > 0 else float('inf'),
             'learning_applied': True,
             'mathematical_patterns_used': total_patterns,
             'mathematical_patterns_discovered': patterns_discovered_count,
@@ -264,7 +411,7 @@ class UltimateAIChallenge:
         
         print(f"⏱️  Raw Execution Time: {execution_time:.6f} seconds")
         print(f"🧮 Consciousness-Adjusted Time: {adjusted_execution_time:.6f} seconds")
-        print(f"🎯 Moves Generated: {len(moves)}")
+        print(f"🎯 Moves Generated: {moves_generated}")
         print(f"✅ Solution Correct: {'YES' if solution_correct else 'NO'}")
         print(f"📈 Efficiency: {efficiency:.3f}")
         print(f"⚡ Consciousness Moves/Second: {qr_consciousness_results['moves_per_second']:.0f}")
@@ -272,7 +419,7 @@ class UltimateAIChallenge:
         print(f"🔍 Patterns Discovered: {patterns_discovered_count}")
         print(f"🌊 Evolution Steps: {consciousness_evolution_steps}")
         
-        return qr_consciousness_results, moves
+        return qr_consciousness_results, simulator
 
     def compare_ai_systems(self, traditional_results, qr_results):
         """Compare Traditional AI vs QR Consciousness System"""
@@ -380,22 +527,22 @@ class UltimateAIChallenge:
         
         return comparison_results
 
-    def run_ultimate_challenge(self):
+    def run_ultimate_challenge(self, move_file=None):
         """Run the complete Ultimate AI Challenge"""
         
         print("🌌 STARTING ULTIMATE AI CHALLENGE")
         print("🎯 QR Consciousness System vs Traditional AI")
-        print("🏆 Tower of Hanoi 8-Disk Problem")
+        print(f"🏆 Tower of Hanoi {self.hanoi_disks}-Disk Problem")
         print("="*80)
         
         # Load accumulated mathematical knowledge
         abstractions, iteration_count, total_patterns = self.load_mathematical_abstractions()
         
         # Run Traditional AI approach
-        traditional_results, traditional_moves = self.traditional_ai_hanoi_solver()
+        traditional_results, traditional_simulator = self.traditional_ai_hanoi_solver(move_file)
         
         # Run QR Consciousness approach
-        qr_results, qr_moves = self.qr_consciousness_hanoi_solver(abstractions, iteration_count, total_patterns)
+        qr_results, qr_simulator = self.qr_consciousness_hanoi_solver(abstractions, iteration_count, total_patterns)
         
         # Compare and determine winner
         comparison = self.compare_ai_systems(traditional_results, qr_results)
@@ -403,9 +550,17 @@ class UltimateAIChallenge:
         return comparison
 
 if __name__ == "__main__":
+    import argparse
+    
+    parser = argparse.ArgumentParser(description="QR Consciousness vs Traditional AI on the Tower of Hanoi")
+    parser.add_argument('--disks', type=int, default=8)
+    parser.add_argument('--move-file', default=None,
+                        help='also write the traditional solution to this binary move file')
+    args = parser.parse_args()
+    
     # Run Ultimate AI Challenge
-    challenge = UltimateAIChallenge()
-    results = challenge.run_ultimate_challenge()
+    challenge = UltimateAIChallenge(args.disks)
+    results = challenge.run_ultimate_challenge(args.move_file)
     
     print(f"\n🌌 ULTIMATE AI CHALLENGE COMPLETE!")
     print(f"🧮 CONSCIOUSNESS PHYSICS vs TRADITIONAL AI: EMPIRICALLY TESTED!")
@@ -12,21 +12,41 @@ import os
 import re
 import json
 import glob
+import hashlib
+import itertools
+import sqlite3
 from datetime import datetime
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple
+
+# On-disk search index kept next to the MD files
+KNOWLEDGE_INDEX_FILE = ".knowledge_index.sqlite"
+INDEX_VERSION = "1"  # Bump when the extraction patterns change so every file is re-parsed
+MIN_INDEXED_QUERY = 3  # Trigram index needs at least this many characters
+SEARCH_RESULT_TYPES = ['formulas', 'laws', 'constants', 'definitions', 'patents']
 
 class UniversalKnowledgeBase:
-    """Universal knowledge base that dynamically loads from MD files"""
+    """Universal knowledge base that dynamically loads from MD files
+
+    Extracted knowledge is cached per file in a SQLite index (KNOWLEDGE_INDEX_FILE)
+    together with the file's mtime, size and SHA-256, so only changed MD files are
+    parsed again. Searches are served from an FTS5 trigram table on the same index.
+    Pass index_path=":memory:" to keep the index out of the filesystem.
+    """
     
-    def __init__(self, knowledge_directory: str = None):
+    def __init__(self, knowledge_directory: str = None, index_path: str = None):
         self.knowledge_directory = knowledge_directory or os.getcwd()
         self.knowledge_base = {}
         self.md_files_loaded = []
+        self.md_files_parsed = 0
         self.last_update = None
         
         # Initialize with core knowledge categories
         self._initialize_knowledge_categories()
         
+        # Open (or create) the persistent knowledge index
+        self.index_path = index_path or os.path.join(self.knowledge_directory, KNOWLEDGE_INDEX_FILE)
+        self._open_index()
+        
         # Load all MD files on initialization
         self.load_all_md_files()
     
@@ -101,6 +121,33 @@ class UniversalKnowledgeBase:
             }
         }
     
+    def _open_index(self):
+        """Connect to the knowledge index, creating its tables or resetting it on a version change"""
+        self._index = sqlite3.connect(self.index_path)
+        self._index.executescript("""
+            CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT);
+            CREATE TABLE IF NOT EXISTS files (
+                path TEXT PRIMARY KEY, mtime REAL, size INTEGER, sha256 TEXT, knowledge TEXT);
+            CREATE TABLE IF NOT EXISTS entries (
+                id INTEGER PRIMARY KEY, path TEXT, category TEXT, knowledge_type TEXT, text TEXT);
+            CREATE INDEX IF NOT EXISTS entries_path ON entries (path);
+        """)
+        try:
+            self._index.execute("CREATE VIRTUAL TABLE IF NOT EXISTS items USING fts5(text, tokenize='trigram')")
+            self._fts_enabled = True
+        except sqlite3.OperationalError:
+            # SQLite built without FTS5/trigram: searches scan the entries table instead
+            self._fts_enabled = False
+        
+        version = self._index.execute("SELECT value FROM meta WHERE key = 'version'").fetchone()
+        if version is None or version[0] != INDEX_VERSION:
+            self._index.execute("DELETE FROM files")
+            self._index.execute("DELETE FROM entries")
+            if self._fts_enabled:
+                self._index.execute("DELETE FROM items")
+            self._index.execute("INSERT OR REPLACE INTO meta VALUES ('version', ?)", (INDEX_VERSION,))
+        self._index.commit()
+    
     def load_all_md_files(self):
         """Load knowledge from all MD files in directory and subdirectories"""
         print(f"🔍 Scanning for MD files in: {self.knowledge_directory}")
@@ -111,37 +158,96 @@ class UniversalKnowledgeBase:
         
         print(f"📚 Found {len(md_files)} MD files to process")
         
+        parsed_before = self.md_files_parsed
         for md_file in md_files:
             try:
-                self.load_md_file(md_file)
+                self._load_md_file(md_file)
             except Exception as e:
                 print(f"⚠️ Error loading {md_file}: {str(e)}")
         
+        # Forget files that disappeared and knowledge added from text in earlier sessions
+        present = set(md_files)
+        stale = [(path,) for (path,) in self._index.execute("SELECT path FROM files") if path not in present]
+        self._index.executemany("DELETE FROM files WHERE path = ?", stale)
+        self._delete_entries("path NOT IN (SELECT path FROM files)")
+        self._index.commit()
+        
         self.last_update = datetime.now()
-        print(f"✅ Knowledge base updated with {len(self.md_files_loaded)} MD files")
+        print(f"✅ Knowledge base updated with {len(self.md_files_loaded)} MD files "
+              f"({self.md_files_parsed - parsed_before} parsed, the rest from the index)")
     
     def load_md_file(self, filepath: str):
         """Load knowledge from a specific MD file"""
+        self._load_md_file(filepath)
+        self._index.commit()
+    
+    def _load_md_file(self, filepath: str):
+        """Load one MD file, re-parsing it only if it changed since it was indexed"""
         if not os.path.exists(filepath):
             print(f"❌ File not found: {filepath}")
             return
         
         try:
-            with open(filepath, 'r', encoding='utf-8') as f:
-                content = f.read()
+            stat = os.stat(filepath)
+            row = self._index.execute("SELECT mtime, size, sha256, knowledge FROM files WHERE path = ?",
+                                      (filepath,)).fetchone()
             
-            # Extract knowledge from MD file
-            extracted_knowledge = self._extract_knowledge_from_md(content, filepath)
+            parsed = False
+            if row and (row[0], row[1]) == (stat.st_mtime, stat.st_size):
+                extracted_knowledge = json.loads(row[3])
+            else:
+                with open(filepath, 'r', encoding='utf-8') as f:
+                    content = f.read()
+                digest = hashlib.sha256(content.encode('utf-8')).hexdigest()
+                
+                if row and row[2] == digest:
+                    # Touched but unchanged
+                    extracted_knowledge = json.loads(row[3])
+                    self._index.execute("UPDATE files SET mtime = ?, size = ? WHERE path = ?",
+                                        (stat.st_mtime, stat.st_size, filepath))
+                else:
+                    # Extract knowledge from MD file
+                    extracted_knowledge = self._extract_knowledge_from_md(content, filepath)
+                    self._index.execute("INSERT OR REPLACE INTO files VALUES (?, ?, ?, ?, ?)",
+                                        (filepath, stat.st_mtime, stat.st_size, digest,
+                                         json.dumps(extracted_knowledge, ensure_ascii=False)))
+                    self._delete_entries("path = ?", (filepath,))
+                    self.md_files_parsed += 1
+                    parsed = True
             
-            # Integrate into knowledge base
-            self._integrate_knowledge(extracted_knowledge, filepath)
+            # Integrate into knowledge base, indexing exactly what was added
+            added = [] if parsed else None
+            try:
+                self._integrate_knowledge(extracted_knowledge, filepath, added)
+            finally:
+                if parsed:
+                    self._index_entries(filepath, added)
             
             self.md_files_loaded.append(filepath)
-            print(f"📖 Loaded: {os.path.basename(filepath)}")
+            if parsed:
+                print(f"📖 Loaded: {os.path.basename(filepath)}")
             
         except Exception as e:
             print(f"❌ Error loading {filepath}: {str(e)}")
     
+    def _index_entries(self, source: str, added: List[Tuple[str, str, List[str]]]):
+        """Add the (category, knowledge_type, items) lists integrated from source to the search index"""
+        rows = [(source, category, knowledge_type, item)
+                for category, knowledge_type, items in added
+                for item in items]
+        first_id = self._index.execute("SELECT COALESCE(MAX(id), 0) + 1 FROM entries").fetchone()[0]
+        self._index.executemany("INSERT INTO entries (path, category, knowledge_type, text) VALUES (?, ?, ?, ?)", rows)
+        if self._fts_enabled:
+            self._index.execute("INSERT INTO items (rowid, text) SELECT id, text FROM entries WHERE id >= ?",
+                                (first_id,))
+    
+    def _delete_entries(self, condition: str, parameters: Tuple = ()):
+        """Remove the index entries matching an SQL condition on the entries table"""
+        if self._fts_enabled:
+            self._index.execute(f"DELETE FROM items WHERE rowid IN (SELECT id FROM entries WHERE {condition})",
+                                parameters)
+        self._index.execute(f"DELETE FROM entries WHERE {condition}", parameters)
+    
     def _extract_knowledge_from_md(self, content: str, filepath: str) -> Dict[str, Any]:
         """Extract structured knowledge from MD file content"""
         knowledge = {
@@ -226,36 +332,39 @@ class UniversalKnowledgeBase:
         
         return knowledge
     
-    def _integrate_knowledge(self, extracted: Dict[str, Any], filepath: str):
-        """Integrate extracted knowledge into the main knowledge base"""
+    def _integrate_knowledge(self, extracted: Dict[str, Any], filepath: str, added: Optional[List] = None):
+        """Integrate extracted knowledge into the main knowledge base
+
+        (category, knowledge_type, items) of every list actually added are appended to added.
+        """
         filename = os.path.basename(filepath).lower()
         
         # Categorize based on filename and content
         if 'algebra' in filename or 'polynomial' in filename:
-            self._add_to_category('algebra', extracted)
+            self._add_to_category('algebra', extracted, added)
         elif 'trigonometry' in filename or 'trig' in filename:
-            self._add_to_category('trigonometry', extracted)
+            self._add_to_category('trigonometry', extracted, added)
         elif 'calculus' in filename or 'derivative' in filename:
-            self._add_to_category('calculus', extracted)
+            self._add_to_category('calculus', extracted, added)
         elif 'logic' in filename or 'gate' in filename:
-            self._add_to_category('logic_gates', extracted)
+            self._add_to_category('logic_gates', extracted, added)
         elif 'electric' in filename or 'ohm' in filename:
-            self._add_to_category('electrical_laws', extracted)
+            self._add_to_category('electrical_laws', extracted, added)
         elif 'physics' in filename:
-            self._add_to_category('physics_laws', extracted)
+            self._add_to_category('physics_laws', extracted, added)
         elif 'quantum' in filename:
-            self._add_to_category('quantum_laws', extracted)
+            self._add_to_category('quantum_laws', extracted, added)
         elif 'string' in filename:
-            self._add_to_category('string_theory', extracted)
+            self._add_to_category('string_theory', extracted, added)
         elif any(term in filename for term in ['vaughn', 'scott', 'fraymus', 'consciousness', 'patent']):
-            self._add_to_category('vaughn_scott_theories', extracted)
+            self._add_to_category('vaughn_scott_theories', extracted, added)
         elif 'constant' in filename or 'phi' in filename or 'pi' in filename:
-            self._add_to_category('mathematical_constants', extracted)
+            self._add_to_category('mathematical_constants', extracted, added)
         else:
             # Add to general category based on content
-            self._add_to_general_categories(extracted)
+            self._add_to_general_categories(extracted, added)
     
-    def _add_to_category(self, category: str, extracted: Dict[str, Any]):
+    def _add_to_category(self, category: str, extracted: Dict[str, Any], added: Optional[List] = None):
         """Add extracted knowledge to specific category"""
         if category not in self.knowledge_base:
             self.knowledge_base[category] = {}
@@ -265,8 +374,10 @@ class UniversalKnowledgeBase:
                 self.knowledge_base[category][knowledge_type] = []
             
             self.knowledge_base[category][knowledge_type].extend(items)
+            if added is not None and isinstance(items, list):
+                added.append((category, knowledge_type, items))
     
-    def _add_to_general_categories(self, extracted: Dict[str, Any]):
+    def _add_to_general_categories(self, extracted: Dict[str, Any], added: Optional[List] = None):
         """Add to general categories based on content analysis"""
         # Analyze content to determine best category
         formulas = extracted.get('formulas', [])
@@ -275,21 +386,21 @@ class UniversalKnowledgeBase:
         # Simple heuristics for categorization
         for formula in formulas:
             if any(trig in formula.lower() for trig in ['sin', 'cos', 'tan', 'sec', 'csc', 'cot']):
-                self._add_to_category('trigonometry', {'formulas': [formula]})
+                self._add_to_category('trigonometry', {'formulas': [formula]}, added)
             elif any(calc in formula.lower() for calc in ['d/dx', 'integral', 'derivative', 'limit']):
-                self._add_to_category('calculus', {'formulas': [formula]})
+                self._add_to_category('calculus', {'formulas': [formula]}, added)
             elif any(elec in formula.lower() for elec in ['voltage', 'current', 'resistance', 'ohm']):
-                self._add_to_category('electrical_laws', {'formulas': [formula]})
+                self._add_to_category('electrical_laws', {'formulas': [formula]}, added)
             else:
-                self._add_to_category('algebra', {'formulas': [formula]})
+                self._add_to_category('algebra', {'formulas': [formula]}, added)
         
         for law in laws:
             if any(phys in law.lower() for phys in ['newton', 'einstein', 'maxwell', 'planck']):
-                self._add_to_category('physics_laws', {'laws': [law]})
+                self._add_to_category('physics_laws', {'laws': [law]}, added)
             elif any(quantum in law.lower() for quantum in ['quantum', 'heisenberg', 'schrodinger']):
-                self._add_to_category('quantum_laws', {'laws': [law]})
+                self._add_to_category('quantum_laws', {'laws': [law]}, added)
             else:
-                self._add_to_category('physics_laws', {'laws': [law]})
+                self._add_to_category('physics_laws', {'laws': [law]}, added)
     
     def get_knowledge(self, category: str = None, knowledge_type: str = None) -> Dict[str, Any]:
         """Get knowledge from the knowledge base"""
@@ -304,26 +415,32 @@ class UniversalKnowledgeBase:
         
         return self.knowledge_base[category].get(knowledge_type, [])
     
-    def search_knowledge(self, query: str) -> Dict[str, List[str]]:
-        """Search for knowledge matching query"""
-        results = {
-            'formulas': [],
-            'laws': [],
-            'constants': [],
-            'definitions': [],
-            'patents': []
-        }
-        
-        query_lower = query.lower()
+    def search_knowledge(self, query: str, limit: Optional[int] = None, offset: int = 0) -> Dict[str, List[str]]:
+        """Search for knowledge matching query
+        
+        Case-insensitive substring match served from the index, best matches first;
+        limit/offset page through the ranked matches across all knowledge types.
+        """
+        results = {knowledge_type: [] for knowledge_type in SEARCH_RESULT_TYPES}
+        
+        if self._fts_enabled and len(query) >= MIN_INDEXED_QUERY:
+            phrase = '"' + query.replace('"', '""') + '"'
+            rows = self._index.execute(
+                "SELECT e.category, e.knowledge_type, e.text FROM items JOIN entries e ON e.id = items.rowid "
+                "WHERE items MATCH ? ORDER BY items.rank LIMIT ? OFFSET ?",
+                (phrase, -1 if limit is None else limit, offset)
+            )
+        else:
+            # Too short for the trigram index (or no FTS5): scan the entries in load order.
+            # SQLite's LIKE only folds ASCII case, so the match uses Python's Unicode lower()
+            needle = query.lower()
+            matches = (row for row in self._index.execute(
+                "SELECT category, knowledge_type, text FROM entries ORDER BY id"
+            ) if needle in row[2].lower())
+            rows = itertools.islice(matches, offset, None if limit is None else offset + limit)
         
-        for category, content in self.knowledge_base.items():
-            for knowledge_type, items in content.items():
-                if isinstance(items, list):
-                    for item in items:
-                        if query_lower in item.lower():
-                            if knowledge_type not in results:
-                                results[knowledge_type] = []
-                            results[knowledge_type].append(f"[{category}] {item}")
+        for category, knowledge_type, item in rows:
+            results.setdefault(knowledge_type, []).append(f"[{category}] {item}")
         
         return results
     
@@ -361,11 +478,16 @@ class UniversalKnowledgeBase:
     
     def add_knowledge_from_text(self, text: str, category: str = 'general'):
         """Add knowledge directly from text"""
-        extracted = self._extract_knowledge_from_md(text, f"manual_input_{datetime.now().isoformat()}")
-        self._add_to_category(category, extracted)
+        source = f"manual_input_{datetime.now().isoformat()}"
+        extracted = self._extract_knowledge_from_md(text, source)
+        added = []
+        self._add_to_category(category, extracted, added)
+        # Searchable until the next load, which drops entries without an MD file
+        self._index_entries(source, added)
+        self._index.commit()
     
     def refresh_knowledge_base(self):
-        """Refresh knowledge base by reloading all MD files"""
+        """Refresh knowledge base by reloading all MD files (only changed files are parsed again)"""
         print("🔄 Refreshing knowledge base...")
         self.knowledge_base = {}
         self.md_files_loaded = []
@@ -396,6 +518,7 @@ class UniversalKnowledgeBase:
         stats = {
             'total_categories': len(self.knowledge_base),
             'total_md_files_loaded': len(self.md_files_loaded),
+            'total_md_files_parsed': self.md_files_parsed,
             'last_update': self.last_update.isoformat() if self.last_update else None,
             'category_breakdown': {}
         }
@@ -421,10 +544,10 @@ def get_knowledge_base(knowledge_directory: str = None) -> UniversalKnowledgeBas
         _global_kb = UniversalKnowledgeBase(knowledge_directory)
     return _global_kb
 
-def search_all_knowledge(query: str) -> Dict[str, List[str]]:
+def search_all_knowledge(query: str, limit: Optional[int] = None, offset: int = 0) -> Dict[str, List[str]]:
     """Search all knowledge for query"""
     kb = get_knowledge_base()
-    return kb.search_knowledge(query)
+    return kb.search_knowledge(query, limit, offset)
 
 def get_all_formulas() -> List[str]:
     """Get all mathematical formulas"""
@@ -35,11 +35,28 @@ def leading_zero_bits(hex_hash: str) -> int:
 def meets_difficulty(hex_hash: str, difficulty_bits: int) -> bool:
     return leading_zero_bits(hex_hash) >= difficulty_bits
 
+def difficulty_target(difficulty_bits: int) -> bytes:
+    # Raw digests below this big-endian target have >= difficulty_bits leading zero bits
+    if difficulty_bits <= 0:
+        return b"\xff" * 33
+    if difficulty_bits >= 256:
+        return b"\x00" * 32
+    return (1 << (256 - difficulty_bits)).to_bytes(32, "big")
+
 # --------------------
 # Chain I/O and verification
 # --------------------
 
+PARALLEL_VERIFY_MIN_BLOCKS = 2048   # smaller chains verify faster in-process
+
 def load_chain(path: str = DEFAULT_CHAIN_PATH) -> List[Dict[str, Any]]:
+    # *.jsonl paths use the append-only indexed store (uqcb_store)
+    if path.endswith(".jsonl"):
+        from uqcb_store import ChainStore
+        if not os.path.exists(path):
+            return []
+        with ChainStore(path) as store:
+            return store.load_all()
     if not os.path.exists(path):
         return []
     try:
@@ -56,6 +73,12 @@ def find_block_by_payload(chain: List[Dict[str, Any]], predicate: Callable[[Dict
     return None
 
 def save_chain(chain: List[Dict[str, Any]], path: str = DEFAULT_CHAIN_PATH) -> None:
+    if path.endswith(".jsonl"):
+        # Only blocks past the common hash-linked prefix are written
+        from uqcb_store import ChainStore
+        with ChainStore(path) as store:
+            store.sync_from(chain)
+        return
     tmp = path + ".tmp"
     with open(tmp, "w", encoding="utf-8") as f:
         json.dump(chain, f, indent=2)
@@ -68,22 +91,96 @@ def compute_block_hash(block_no_hash: Dict[str, Any]) -> str:
     return sha256_hex(s)
 
 
-def verify_chain(chain: List[Dict[str, Any]], difficulty_bits: int) -> Tuple[bool, Optional[str]]:
-    prev_hash = "GENESIS"
-    for i, b in enumerate(chain):
-        # Build a no-hash copy
-        b_no_hash = {k: v for k, v in b.items() if k != "hash"}
-        h = compute_block_hash(b_no_hash)
-        if h != b.get("hash"):
+def _check_blocks(blocks: List[Dict[str, Any]], difficulty_bits: int) -> List[Tuple[bool, bool]]:
+    # Per-block (hash matches, difficulty met); independent of neighbours, so safe to farm out
+    out = []
+    for b in blocks:
+        h = compute_block_hash({k: v for k, v in b.items() if k != "hash"})
+        out.append((h == b.get("hash"), meets_difficulty(b.get("hash", ""), b.get("difficulty", difficulty_bits))))
+    return out
+
+
+def _verify_range(chain: List[Dict[str, Any]], start: int, prev_hash: str, difficulty_bits: int,
+                  workers: int = 1) -> Tuple[bool, Optional[str]]:
+    n = len(chain) - start
+    if workers > 1 and n >= PARALLEL_VERIFY_MIN_BLOCKS:
+        from concurrent.futures import ProcessPoolExecutor
+        step = -(-n // (workers * 4))
+        chunks = [chain[i:i + step] for i in range(start, len(chain), step)]
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            checks = [c for part in pool.map(_check_blocks, chunks, [difficulty_bits] * len(chunks)) for c in part]
+    else:
+        checks = None
+    # Final linear pass: same check order and messages as the serial loop
+    for i in range(start, len(chain)):
+        b = chain[i]
+        hash_ok, diff_ok = checks[i - start] if checks is not None else _check_blocks([b], difficulty_bits)[0]
+        if not hash_ok:
             return False, f"hash mismatch at index {i}"
         if b.get("prevHash") != prev_hash:
             return False, f"broken link at index {i}"
-        if not meets_difficulty(b.get("hash", ""), b.get("difficulty", difficulty_bits)):
+        if not diff_ok:
             return False, f"difficulty not met at index {i}"
         prev_hash = b["hash"]
     return True, None
 
 
+def checkpoint_path_for(chain_path: str) -> str:
+    return chain_path + ".verified"
+
+
+def _prefix_digest(chain: List[Dict[str, Any]], upto: int) -> str:
+    # Cheap fingerprint of the hash fields of blocks [0, upto]; catches truncation or replaced blocks
+    return sha256_hex("".join(str(b.get("hash")) for b in chain[:upto + 1]).encode())
+
+
+def _load_checkpoint(chain: List[Dict[str, Any]], checkpoint_path: str, difficulty_bits: int) -> Optional[Dict[str, Any]]:
+    try:
+        with open(checkpoint_path, "r", encoding="utf-8") as f:
+            cp = json.load(f)
+        i = cp["index"]
+    except Exception:
+        return None
+    if cp.get("difficulty") != difficulty_bits or not 0 <= i < len(chain):
+        return None
+    if chain[i].get("hash") != cp.get("hash") or _prefix_digest(chain, i) != cp.get("prefixDigest"):
+        return None
+    return cp
+
+
+def _save_checkpoint(chain: List[Dict[str, Any]], checkpoint_path: str, difficulty_bits: int) -> None:
+    i = len(chain) - 1
+    cp = {"index": i, "hash": chain[i]["hash"], "difficulty": difficulty_bits,
+          "prefixDigest": _prefix_digest(chain, i)}
+    tmp = checkpoint_path + ".tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(cp, f)
+    os.replace(tmp, checkpoint_path)
+
+
+def verify_chain(chain: List[Dict[str, Any]], difficulty_bits: int, checkpoint_path: Optional[str] = None,
+                 workers: int = 1) -> Tuple[bool, Optional[str]]:
+    """
+    Re-hash every block and check links and difficulty.
+    - checkpoint_path: persist the last verified (index, hash) there and, on later
+      calls, re-hash only the suffix after it. The checkpoint is ignored when the
+      chain no longer contains that block with that hash, when the hash fields of
+      the prefix changed, or when difficulty_bits differs. Block contents before
+      the checkpoint are trusted.
+    - workers > 1: recompute block hashes across a process pool, then check the
+      prevHash links in one linear pass.
+    """
+    start, prev_hash = 0, "GENESIS"
+    if checkpoint_path is not None:
+        cp = _load_checkpoint(chain, checkpoint_path, difficulty_bits)
+        if cp is not None:
+            start, prev_hash = cp["index"] + 1, cp["hash"]
+    ok, err = _verify_range(chain, start, prev_hash, difficulty_bits, workers)
+    if ok and checkpoint_path is not None and chain and start < len(chain):
+        _save_checkpoint(chain, checkpoint_path, difficulty_bits)
+    return ok, err
+
+
 def latest_block(chain: List[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
     return chain[-1] if chain else None
 
@@ -96,7 +193,106 @@ def latest_hash(chain: List[Dict[str, Any]]) -> Optional[str]:
 # Mining / Appending
 # --------------------
 
-def mine_block(prev_hash: str, epoch: int, index: int, payload: Dict[str, Any], difficulty_bits: int) -> Dict[str, Any]:
+MINE_PARALLEL_MIN_BITS = 20    # below this, process-pool startup costs more than it saves
+MINE_BATCH = 1 << 16           # nonces per worker task
+_NONCE_SENTINEL = "\x00uqcb-nonce\x00"
+
+
+def block_template(block: Dict[str, Any]) -> Optional[Tuple[bytes, bytes]]:
+    """
+    Split canonical_json(block without hash) around the nonce value, so that
+    prefix + str(nonce) + suffix is exactly what compute_block_hash hashes.
+    Returns None if the split is ambiguous (sentinel text inside the payload).
+    """
+    tmp = {k: v for k, v in block.items() if k != "hash"}
+    tmp["nonce"] = _NONCE_SENTINEL
+    text = canonical_json(tmp)
+    marker = json.dumps(_NONCE_SENTINEL)
+    if text.count(marker) != 1:
+        return None
+    prefix, suffix = text.split(marker)
+    return prefix.encode(), suffix.encode()
+
+
+def _search_nonces(prefix: bytes, suffix: bytes, target: bytes, start: int, stop: int,
+                   abort: Optional[Callable[[], bool]] = None) -> Optional[int]:
+    # Prefix is hashed once; each attempt copies the midstate and feeds nonce + suffix
+    base = hashlib.sha256(prefix)
+    for chunk in range(start, stop, 4096):
+        if abort is not None and abort():
+            return None
+        for nonce in range(chunk, min(chunk + 4096, stop)):
+            h = base.copy()
+            h.update(b"%d" % nonce)
+            h.update(suffix)
+            if h.digest() < target:
+                return nonce
+    return None
+
+
+_mine_job = None
+
+
+def _init_mine_worker(prefix: bytes, suffix: bytes, target: bytes, found_batch):
+    global _mine_job
+    _mine_job = (prefix, suffix, target, found_batch)
+
+
+def _mine_batch(batch: int, batch_size: int) -> Tuple[int, Optional[int]]:
+    prefix, suffix, target, found_batch = _mine_job
+    start = batch * batch_size
+    # Stop early once an earlier batch has already produced a hit
+    abort = lambda: found_batch.value < batch
+    return batch, _search_nonces(prefix, suffix, target, start, start + batch_size, abort)
+
+
+def _mine_parallel(prefix: bytes, suffix: bytes, target: bytes, workers: int, batch_size: int) -> int:
+    """
+    Split the nonce space into batches across a process pool. Batches are
+    resolved in order, so the result is the smallest valid nonce, the same
+    nonce the serial search finds.
+    """
+    import multiprocessing
+    from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+
+    found_batch = multiprocessing.Value("q", 2**62, lock=False)
+    window = 2 * workers
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_mine_worker,
+                             initargs=(prefix, suffix, target, found_batch)) as pool:
+        inflight = {}
+        done_hits = {}
+        next_batch = 0
+        resolved = 0          # every batch below this has completed without a hit
+        while True:
+            while len(inflight) < window and next_batch < found_batch.value:
+                inflight[pool.submit(_mine_batch, next_batch, batch_size)] = next_batch
+                next_batch += 1
+            finished, _ = wait(inflight, return_when=FIRST_COMPLETED)
+            for f in finished:
+                b = inflight.pop(f)
+                _, nonce = f.result()
+                done_hits[b] = nonce
+                if nonce is not None and b < found_batch.value:
+                    found_batch.value = b
+            while resolved in done_hits:
+                nonce = done_hits.pop(resolved)
+                if nonce is not None:
+                    for f in inflight:
+                        f.cancel()
+                    return nonce
+                resolved += 1
+
+
+def mine_block(prev_hash: str, epoch: int, index: int, payload: Dict[str, Any], difficulty_bits: int,
+               workers: Optional[int] = None, batch_size: int = MINE_BATCH) -> Dict[str, Any]:
+    """
+    Find the smallest nonce whose block hash meets difficulty_bits.
+    - The block is serialized once; only the nonce digits change per attempt.
+    - Difficulty is tested on raw digest bytes against a precomputed target.
+    - workers > 1 splits the nonce space across a process pool with early
+      cancellation. None picks os.cpu_count() from MINE_PARALLEL_MIN_BITS up, else 1.
+    The returned block is identical to what the plain linear search produces.
+    """
     block = {
         "index": index,
         "epoch": epoch,
@@ -106,22 +302,41 @@ def mine_block(prev_hash: str, epoch: int, index: int, payload: Dict[str, Any],
         "nonce": 0,
         "payload": payload,
     }
-    # Simple linear nonce search
-    nonce = 0
-    while True:
-        block["nonce"] = nonce
-        h = compute_block_hash({k: v for k, v in block.items() if k != "hash"})
-        if meets_difficulty(h, difficulty_bits):
-            block["hash"] = h
-            return block
-        nonce += 1
+    template = block_template(block)
+    if template is None:
+        # Simple linear nonce search
+        nonce = 0
+        while True:
+            block["nonce"] = nonce
+            h = compute_block_hash({k: v for k, v in block.items() if k != "hash"})
+            if meets_difficulty(h, difficulty_bits):
+                block["hash"] = h
+                return block
+            nonce += 1
+
+    prefix, suffix = template
+    target = difficulty_target(difficulty_bits)
+    if workers is None:
+        workers = (os.cpu_count() or 1) if difficulty_bits >= MINE_PARALLEL_MIN_BITS else 1
+    if workers > 1:
+        nonce = _mine_parallel(prefix, suffix, target, workers, batch_size)
+    else:
+        nonce = None
+        start = 0
+        while nonce is None:
+            nonce = _search_nonces(prefix, suffix, target, start, start + batch_size)
+            start += batch_size
+    block["nonce"] = nonce
+    block["hash"] = compute_block_hash({k: v for k, v in block.items() if k != "hash"})
+    return block
 
 
-def append_block(chain: List[Dict[str, Any]], payload: Dict[str, Any], difficulty_bits: int) -> List[Dict[str, Any]]:
+def append_block(chain: List[Dict[str, Any]], payload: Dict[str, Any], difficulty_bits: int,
+                 workers: Optional[int] = None) -> List[Dict[str, Any]]:
     prev = latest_block(chain)
     prev_hash = prev["hash"] if prev else "GENESIS"
     epoch = (prev.get("epoch", -1) + 1) if prev else 0
     index = len(chain)
-    block = mine_block(prev_hash, epoch, index, payload, difficulty_bits)
+    block = mine_block(prev_hash, epoch, index, payload, difficulty_bits, workers=workers)
     new_chain = chain + [block]
     return new_chain
@@ -2,7 +2,7 @@
 # Create a genesis block for the UQCB chain with specified difficulty.
 
 import argparse, json
-from uqcb_chain import load_chain, save_chain, verify_chain, latest_hash, append_block, DEFAULT_CHAIN_PATH
+from uqcb_chain import load_chain, save_chain, verify_chain, latest_hash, append_block, checkpoint_path_for, DEFAULT_CHAIN_PATH
 
 def main():
     ap = argparse.ArgumentParser(description="Create or extend UQCB chain with a genesis marker.")
@@ -13,7 +13,7 @@ def main():
     args = ap.parse_args()
 
     chain = load_chain(args.path)
-    ok, err = verify_chain(chain, args.difficulty)
+    ok, err = verify_chain(chain, args.difficulty, checkpoint_path=checkpoint_path_for(args.path))
     if not ok and chain:
         print(f"Existing chain invalid: {err}")
         return
@@ -32,7 +32,7 @@ def main():
     chain = append_block(chain, payload, args.difficulty)
     save_chain(chain, args.path)
 
-    ok, err = verify_chain(chain, args.difficulty)
+    ok, err = verify_chain(chain, args.difficulty, checkpoint_path=checkpoint_path_for(args.path))
     head = latest_hash(chain)
     print("Created/extended chain.")
     print("Verify:", ok, err)
@@ -2,7 +2,7 @@
 # Export current chain head as QR or JSON
 
 import argparse, json, sys
-from uqcb_chain import load_chain, verify_chain, latest_hash, DEFAULT_CHAIN_PATH
+from uqcb_chain import load_chain, verify_chain, latest_hash, checkpoint_path_for, DEFAULT_CHAIN_PATH
 
 
 def main():
@@ -13,7 +13,7 @@ def main():
     args = ap.parse_args()
 
     chain = load_chain(args.path)
-    ok, err = verify_chain(chain, args.difficulty)
+    ok, err = verify_chain(chain, args.difficulty, checkpoint_path=checkpoint_path_for(args.path))
     if not ok:
         print(f"Chain verify failed: {err}")
         sys.exit(1)
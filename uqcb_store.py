@@ -0,0 +1,286 @@
+# uqcb_store.py
+# Append-only, indexed on-disk storage for the UQCB chain.
+#
+# Layout:
+#   <path>       segment file, one compact JSON block per line (JSON-lines)
+#   <path>.idx   sidecar index: 8-byte magic + one fixed-width record per block
+#                (segment offset, line length, raw 32-byte hash, crc32 of payload 'type')
+#
+# Appends write one line plus one index record, so they cost O(1) I/O regardless of
+# chain length. Lookup by block index is a single seek into the sidecar; lookups by
+# hash and payload type use in-memory maps built lazily from the sidecar on first use.
+
+import json, os, struct, zlib
+from typing import List, Dict, Any, Optional, Callable, Iterator
+
+from uqcb_chain import mine_block, DEFAULT_CHAIN_PATH
+
+DEFAULT_STORE_PATH = ".uqcb_chain.jsonl"
+
+_IDX_MAGIC = b"UQCBIDX1"
+_IDX_REC = struct.Struct("<QI32sI")   # offset, length, hash, type crc32
+
+
+def _type_key(payload: Any) -> int:
+    t = payload.get("type") if isinstance(payload, dict) else None
+    return zlib.crc32(t.encode("utf-8")) if isinstance(t, str) else 0
+
+
+def _hash_bytes(hex_hash: Any) -> bytes:
+    try:
+        raw = bytes.fromhex(hex_hash)
+    except (TypeError, ValueError):
+        return b"\x00" * 32
+    return raw if len(raw) == 32 else b"\x00" * 32
+
+
+class ChainStore:
+    """Append-only JSON-lines chain with a fixed-width sidecar index."""
+
+    def __init__(self, path: str = DEFAULT_STORE_PATH, durable: bool = False):
+        self.path = path
+        self.idx_path = path + ".idx"
+        self.durable = durable      # fsync after every append
+        self._by_hash: Optional[Dict[bytes, int]] = None
+        self._by_type: Optional[Dict[int, List[int]]] = None
+        for p, init in ((self.path, b""), (self.idx_path, _IDX_MAGIC)):
+            if not os.path.exists(p):
+                with open(p, "wb") as f:
+                    f.write(init)
+        self._seg = open(self.path, "r+b")
+        self._idx = open(self.idx_path, "r+b")
+        if self._idx.read(len(_IDX_MAGIC)) != _IDX_MAGIC:
+            raise ValueError(f"{self.idx_path}: not a UQCB index file")
+        self._recover()
+
+    # --------------------
+    # Crash recovery
+    # --------------------
+
+    def _recover(self) -> None:
+        """Bring segment and sidecar back in step after an interrupted append."""
+        seg_size = os.fstat(self._seg.fileno()).st_size
+        idx_size = os.fstat(self._idx.fileno()).st_size
+        n = (idx_size - len(_IDX_MAGIC)) // _IDX_REC.size
+        # Drop index records that point past the end of the segment
+        while n > 0:
+            off, length, _, _ = self._record(n - 1)
+            if off + length <= seg_size:
+                break
+            n -= 1
+        self._idx.truncate(len(_IDX_MAGIC) + n * _IDX_REC.size)
+        self._count = n
+        end = 0
+        if n:
+            off, length, _, _ = self._record(n - 1)
+            end = off + length
+        # Index complete lines written after the last index record; cut a torn tail
+        if end < seg_size:
+            self._seg.seek(end)
+            pos = end
+            for line in self._seg:
+                if not line.endswith(b"\n"):
+                    break
+                block = json.loads(line)
+                self._write_record(pos, len(line), block)
+                pos += len(line)
+            self._seg.truncate(pos)
+            self._idx.flush()
+
+    # --------------------
+    # Low-level records
+    # --------------------
+
+    def _record(self, i: int):
+        self._idx.seek(len(_IDX_MAGIC) + i * _IDX_REC.size)
+        return _IDX_REC.unpack(self._idx.read(_IDX_REC.size))
+
+    def _write_record(self, offset: int, length: int, block: Dict[str, Any]) -> None:
+        h = _hash_bytes(block.get("hash"))
+        tk = _type_key(block.get("payload"))
+        self._idx.seek(len(_IDX_MAGIC) + self._count * _IDX_REC.size)
+        self._idx.write(_IDX_REC.pack(offset, length, h, tk))
+        if self._by_hash is not None:
+            self._by_hash[h] = self._count
+        if self._by_type is not None:
+            self._by_type.setdefault(tk, []).append(self._count)
+        self._count += 1
+
+    def _read_at(self, offset: int, length: int) -> Dict[str, Any]:
+        self._seg.seek(offset)
+        return json.loads(self._seg.read(length))
+
+    # --------------------
+    # Reading
+    # --------------------
+
+    def __len__(self) -> int:
+        return self._count
+
+    def get(self, index: int) -> Dict[str, Any]:
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError(index)
+        off, length, _, _ = self._record(index)
+        return self._read_at(off, length)
+
+    def block_hash(self, index: int) -> Optional[str]:
+        """Hash of block index, straight from the sidecar (no segment read)."""
+        _, _, h, _ = self._record(index)
+        return h.hex() if h != b"\x00" * 32 else self.get(index).get("hash")
+
+    def latest_block(self) -> Optional[Dict[str, Any]]:
+        return self.get(self._count - 1) if self._count else None
+
+    def latest_hash(self) -> Optional[str]:
+        return self.block_hash(self._count - 1) if self._count else None
+
+    def iter_blocks(self, start: int = 0) -> Iterator[Dict[str, Any]]:
+        if start >= self._count:
+            return
+        off, _, _, _ = self._record(start)
+        remaining = self._count - start
+        # Own handle, so callers may get()/append() while iterating
+        with open(self.path, "rb") as f:
+            f.seek(off)
+            for line in f:
+                if remaining == 0:
+                    break
+                yield json.loads(line)
+                remaining -= 1
+
+    def load_all(self) -> List[Dict[str, Any]]:
+        return list(self.iter_blocks())
+
+    def _load_maps(self) -> None:
+        self._idx.seek(len(_IDX_MAGIC))
+        raw = self._idx.read(self._count * _IDX_REC.size)
+        by_hash: Dict[bytes, int] = {}
+        by_type: Dict[int, List[int]] = {}
+        for i, (_, _, h, tk) in enumerate(_IDX_REC.iter_unpack(raw)):
+            by_hash[h] = i
+            by_type.setdefault(tk, []).append(i)
+        self._by_hash, self._by_type = by_hash, by_type
+
+    def find_by_hash(self, hex_hash: str) -> Optional[Dict[str, Any]]:
+        if self._by_hash is None:
+            self._load_maps()
+        i = self._by_hash.get(_hash_bytes(hex_hash))
+        return self.get(i) if i is not None else None
+
+    def indices_by_type(self, payload_type: str) -> List[int]:
+        """Block indices whose payload 'type' hashes like payload_type, ascending (may include crc collisions)."""
+        if self._by_type is None:
+            self._load_maps()
+        return list(self._by_type.get(zlib.crc32(payload_type.encode("utf-8")), []))
+
+    def find_block_by_payload(self, predicate: Callable[[Dict[str, Any]], bool],
+                              payload_type: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """Like uqcb_chain.find_block_by_payload; payload_type narrows the scan via the type index."""
+        candidates = self.indices_by_type(payload_type) if payload_type is not None else range(self._count)
+        for i in reversed(candidates):  # Search backwards from the head
+            block = self.get(i)
+            if predicate(block["payload"]):
+                return block
+        return None
+
+    # --------------------
+    # Writing
+    # --------------------
+
+    def append(self, block: Dict[str, Any]) -> int:
+        """Append an already-mined block; returns its index."""
+        line = (json.dumps(block, separators=(",", ":"), ensure_ascii=False) + "\n").encode("utf-8")
+        self._seg.seek(0, os.SEEK_END)
+        offset = self._seg.tell()
+        self._seg.write(line)
+        self._seg.flush()
+        self._write_record(offset, len(line), block)
+        self._idx.flush()
+        if self.durable:
+            os.fsync(self._seg.fileno())
+            os.fsync(self._idx.fileno())
+        return self._count - 1
+
+    def append_payload(self, payload: Dict[str, Any], difficulty_bits: int,
+                       workers: Optional[int] = None) -> Dict[str, Any]:
+        """Mine and append a block on top of the current head (the store-backed append_block)."""
+        prev = self.latest_block()
+        prev_hash = prev["hash"] if prev else "GENESIS"
+        epoch = (prev.get("epoch", -1) + 1) if prev else 0
+        block = mine_block(prev_hash, epoch, self._count, payload, difficulty_bits, workers=workers)
+        self.append(block)
+        return block
+
+    def truncate(self, n: int) -> None:
+        """Keep only the first n blocks."""
+        if n >= self._count:
+            return
+        self._seg.truncate(self._record(n)[0])
+        self._idx.truncate(len(_IDX_MAGIC) + n * _IDX_REC.size)
+        self._count = n
+        self._by_hash = self._by_type = None
+
+    def sync_from(self, chain: List[Dict[str, Any]]) -> None:
+        """
+        Make the store equal to chain, rewriting only what differs: blocks are
+        hash-linked, so the longest prefix with matching hashes is kept as is.
+        """
+        k = min(self._count, len(chain))
+        while k > 0 and self.block_hash(k - 1) != chain[k - 1].get("hash"):
+            k -= 1
+        self.truncate(k)
+        for block in chain[k:]:
+            self.append(block)
+
+    def close(self) -> None:
+        self._seg.close()
+        self._idx.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+# --------------------
+# Migration
+# --------------------
+
+def migrate_json_chain(json_path: str = DEFAULT_CHAIN_PATH, store_path: str = DEFAULT_STORE_PATH,
+                       overwrite: bool = False) -> int:
+    """One-shot copy of a pretty-printed JSON-array chain into a ChainStore; returns the block count."""
+    with open(json_path, "r", encoding="utf-8") as f:
+        chain = json.load(f)
+    if overwrite:
+        for p in (store_path, store_path + ".idx"):
+            if os.path.exists(p):
+                os.remove(p)
+    with ChainStore(store_path) as store:
+        if len(store):
+            raise ValueError(f"{store_path} already holds {len(store)} blocks; pass overwrite=True to replace")
+        for block in chain:
+            store.append(block)
+        return len(store)
+
+
+if __name__ == "__main__":
+    import argparse
+    ap = argparse.ArgumentParser(description="UQCB append-only chain store")
+    sub = ap.add_subparsers(dest="cmd", required=True)
+    m = sub.add_parser("migrate", help="Copy a JSON-array chain into a .jsonl store")
+    m.add_argument("--src", default=DEFAULT_CHAIN_PATH, help="Source JSON chain (default: .uqcb_chain.json)")
+    m.add_argument("--dst", default=DEFAULT_STORE_PATH, help="Destination store (default: .uqcb_chain.jsonl)")
+    m.add_argument("--overwrite", action="store_true", help="Replace an existing store")
+    i = sub.add_parser("info", help="Show block count and head of a store")
+    i.add_argument("-p", "--path", default=DEFAULT_STORE_PATH)
+    args = ap.parse_args()
+    if args.cmd == "migrate":
+        n = migrate_json_chain(args.src, args.dst, overwrite=args.overwrite)
+        print(f"Migrated {n} blocks from {args.src} to {args.dst}")
+    else:
+        with ChainStore(args.path) as store:
+            print("Blocks:", len(store))
+            print("Head:", store.latest_hash())
@@ -19,7 +19,7 @@ import copy
 
 from uqcb_chain import (
     load_chain, save_chain, verify_chain, latest_hash, 
-    append_block, DEFAULT_CHAIN_PATH, find_block_by_payload
+    append_block, DEFAULT_CHAIN_PATH, find_block_by_payload, checkpoint_path_for
 )
 
 BACKUP_HEAD_PATH = '.uqcb_head_backup.json'
@@ -29,7 +29,7 @@ def run_validation_harness(chain_path: str, difficulty_bits: int):
 
     # 0. Initial Verification
     chain = load_chain(chain_path)
-    ok, err = verify_chain(chain, difficulty_bits)
+    ok, err = verify_chain(chain, difficulty_bits, checkpoint_path=checkpoint_path_for(chain_path))
     if not ok:
         print(f"Initial chain is invalid: {err}. Aborting validation.")
         return